@@ -1,6 +1,7 @@
 from .qapi import create_app
 from .qdoc import QuipuDocument
 from .qembed import QuipuEmbeddings
+from .qlocal import LocalEmbeddings
 from .qvector import QuipuVector
 
-__all__ = ["create_app", "QuipuDocument", "QuipuVector", "QuipuEmbeddings"]
+__all__ = ["create_app", "QuipuDocument", "QuipuVector", "QuipuEmbeddings", "LocalEmbeddings"]
@@ -79,6 +79,80 @@ def test():
     subprocess.run([PYTHON_EXE, "-m", "pytest", "tests"], check=True)
 
 
+@main.command()
+@click.option("--docs", default=10000, help="The number of synthetic documents to index.")
+@click.option("--queries", default=100, help="The number of queries to run.")
+@click.option("--dim", default=384, type=click.Choice(["384", "768"]), help="The embedding dimension.")
+def bench(docs: int, queries: int, dim: str):
+    """Benchmark local embedding, indexing and search offline."""
+    import asyncio
+    import random
+    import tempfile
+    import time
+
+    import numpy as np
+
+    from .qindex import VectorIndex
+    from .qlocal import LocalEmbeddings
+
+    rng = random.Random(0)
+    words = [f"w{i}" for i in range(5000)]
+    texts = [" ".join(rng.choices(words, k=64)) for _ in range(docs)]
+    embeddings = LocalEmbeddings()
+    start = time.perf_counter()
+    vectors = asyncio.run(embeddings.encode(texts, dim=int(dim)))
+    elapsed = time.perf_counter() - start
+    print(f"Encoded {docs} texts in {elapsed:.2f}s ({docs / elapsed:.0f} texts/s)")
+    with tempfile.TemporaryDirectory() as root:
+        index = VectorIndex("bench", root)
+        try:
+            start = time.perf_counter()
+            index.add_many((str(i), vector) for i, vector in enumerate(vectors))
+            print(f"Indexed {docs} vectors in {time.perf_counter() - start:.2f}s")
+            start = time.perf_counter()
+            for vector in rng.sample(vectors, min(queries, docs)):
+                index.search(np.asarray(vector, dtype=np.float32), k=10)
+            latency = (time.perf_counter() - start) / min(queries, docs) * 1000
+            print(f"Searched with {latency:.2f}ms mean latency")
+        finally:
+            index.close()
+
+
+@main.command()
+@click.argument("namespace")
+@click.option("--recall", default=0.95, help="The recall@k to reach at the lowest latency.")
+@click.option("--k", default=10, help="The number of results the recall is measured on.")
+@click.option("--queries", default=200, help="The number of sampled queries.")
+@click.option("--apply/--dry-run", default=True, help="Switch the namespace to the chosen setting.")
+def tune(namespace: str, recall: float, k: int, queries: int, apply: bool):
+    """
+    Sweep HNSW parameters of a namespace for recall and latency offline.
+
+    The namespace databases are opened directly and RocksDB allows one
+    process per database, so stop the server first or use
+    POST /api/vector/{namespace}/tune while it runs.
+    """
+    from .qindex import VectorIndex
+    from .qtune import autotune
+
+    try:
+        with VectorIndex.lease(namespace) as index:
+            result = autotune(index, recall=recall, k=k, queries=queries, apply=apply)
+            index.save()
+    except RuntimeError as e:
+        raise click.ClickException(
+            f"{e}; stop the server or use POST /api/vector/{namespace}/tune"
+        ) from e
+    print(f"{'m':>4} {'ef':>5} {'recall':>8} {'p50 ms':>8} {'p99 ms':>8}")
+    for report in result["reports"]:
+        print(
+            f"{report['m']:>4} {report['ef']:>5} {report['recall']:>8.3f} "
+            f"{report['p50_ms']:>8.3f} {report['p99_ms']:>8.3f}"
+        )
+    chosen = result["chosen"]
+    print(f"Chosen m={chosen['m']} ef={chosen['ef']} ({'applied' if apply else 'dry run'})")
+
+
 @main.command()
 def lib():
     """Install RocksDB Storage Dependencies"""
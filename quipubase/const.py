@@ -1,3 +1,5 @@
+import os
+
 EXAMPLES = [
     {
         "title": "JobPosting",
@@ -55,3 +57,15 @@ SERVERS = [
     {"url": "https://db.indiecloud.co"},
     {"url": "http://localhost:5454"},
 ]
+
+SHARDS = int(os.environ.get("QUIPU_SHARDS", "1"))
+
+SHARD_NODES = os.environ.get("QUIPU_SHARD_NODES", "")
+
+EMBEDDINGS_PROVIDER = os.environ.get("QUIPU_EMBEDDINGS", "remote")
+
+MAX_UPLOAD_BYTES = int(os.environ.get("QUIPU_MAX_UPLOAD_BYTES", str(256 * 1024 * 1024)))
+
+MODEL_CACHE_SIZE = int(os.environ.get("QUIPU_MODEL_CACHE_SIZE", "1024"))
+
+MAX_OPEN_DATABASES = int(os.environ.get("QUIPU_MAX_OPEN_DATABASES", "1024"))
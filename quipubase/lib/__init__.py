@@ -1,4 +1,5 @@
 from ._base import RawDoc, to_base64, check_suffix
+from .load_csv import CsvLoader
 from .load_docx import DocxLoader
 from .load_pdf import PdfLoader
 from .load_pptx import PptxLoader
@@ -11,5 +12,6 @@ __all__ = [
     "PdfLoader",
     "PptxLoader",
     "ExcelLoader",
+    "CsvLoader",
     "check_suffix",
 ]
@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Generator, Literal, Union, TypeVar
 
 from fastapi import UploadFile
+from ..qchunk import CHUNK_TOKENS
 from httpx import get
 from pathlib import Path
 
@@ -31,11 +32,13 @@ def to_base64(image: Img, suffix: str) -> str:
 
 def check_suffix(
     file: UploadFile,
-) -> Literal[".docx", ".pdf", ".pptx", ".xlsx"]:
+) -> Literal[".docx", ".pdf", ".pptx", ".xlsx", ".csv"]:
     if not file.filename and not file.content_type:
         raise ValueError("Invalid file")
 
     if file.filename:
+        if file.filename.lower().endswith(".csv"):
+            return ".csv"
         if "docx" in file.filename:
             return ".docx"
         if "doc" in file.filename:
@@ -59,17 +62,41 @@ def check_suffix(
             return ".pdf"
         if "spreadsheet" in file.content_type:
             return ".xlsx"
+        if "csv" in file.content_type:
+            return ".csv"
     raise ValueError("Invalid file")
 
 
 @dataclass
 class RawDoc(ABC):
     file_path: str
+    chunk_tokens: int = CHUNK_TOKENS
 
     @abstractmethod
+    def extract(self) -> Generator[Union[str, bytes], None, None]:
+        """
+        Text chunks and images interleaved in document order, from a single
+        open of the file.
+        """
+
     def extract_text(self) -> Generator[str, None, None]:
-        pass
+        for item in self.extract():
+            if isinstance(item, str):
+                yield item
 
-    @abstractmethod
     def extract_image(self) -> Generator[bytes, None, None]:
-        pass
+        for item in self.extract():
+            if isinstance(item, bytes):
+                yield item
+
+    def pages(self) -> int:
+        """
+        The number of independently parseable units (pages, slides, sheets).
+        """
+        return 1
+
+    def extract_pages(self, start: int, stop: int) -> list[Union[str, bytes]]:
+        """
+        The text chunks and images of the units in `[start, stop)`, in document order.
+        """
+        return list(self.extract())
@@ -0,0 +1,46 @@
+import csv
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterator
+
+from ._base import RawDoc
+from .load_xlsx import header_of, records, row_blocks, row_span
+
+
+@dataclass
+class CsvLoader(RawDoc):
+    """
+    Streams CSV files through the same row records as `ExcelLoader`, a page
+    being a block of `ROWS_PER_PAGE` rows parsed with the header of the file.
+    """
+
+    def extract(self):
+        with open(self.file_path, newline="", encoding="utf-8-sig", errors="replace") as f:
+            yield from records(self.rows(f), Path(self.file_path).stem, self.chunk_tokens)
+
+    def pages(self) -> int:
+        with open(self.file_path, newline="", encoding="utf-8-sig", errors="replace") as f:
+            return max(1, len(row_blocks(sum(1 for _ in self.rows(f)))))
+
+    def extract_pages(self, start: int, stop: int):
+        items: list[Any] = []
+        with open(self.file_path, newline="", encoding="utf-8-sig", errors="replace") as f:
+            header_row, header = header_of(self.rows(f))
+            if header is None:
+                return items
+            first, last = row_span(start, stop)
+            rows = islice(self.rows(f), first - 1, last)
+            source = Path(self.file_path).stem
+            items.extend(records(rows, source, self.chunk_tokens, first, header, header_row))
+        return items
+
+    @staticmethod
+    def rows(f: Any) -> Iterator[list[str]]:
+        f.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(f.read(64 * 1024), delimiters=",;\t|")
+        except csv.Error:
+            dialect = csv.excel
+        f.seek(0)
+        return csv.reader(f, dialect)
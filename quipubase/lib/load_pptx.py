@@ -5,24 +5,30 @@ from ._base import RawDoc
 
 @dataclass
 class PptxLoader(RawDoc):
-    def extract_text(self):
-        prs = Presentation(self.file_path)
-        for slide in prs.slides:  # type: ignore
+    """
+    Walks the slides of a presentation, opened once per call so nothing
+    outlives the task in a long-lived parse worker.
+    """
+
+    def slides(self) -> list:  # type: ignore
+        return list(Presentation(self.file_path).slides)  # type: ignore
+
+    def extract(self):
+        yield from self.walk(self.slides())  # type: ignore
+
+    def pages(self) -> int:
+        return len(self.slides())
+
+    def extract_pages(self, start: int, stop: int):
+        return list(self.walk(self.slides()[start:stop]))
+
+    @staticmethod
+    def walk(slides):  # type: ignore
+        for slide in slides:  # type: ignore
             for shape in slide.shapes:  # type: ignore
                 if shape.has_text_frame:  # type: ignore
-                    text_frame = shape.text_frame  # type: ignore
-                    for paragraph in text_frame.paragraphs:  # type: ignore
+                    for paragraph in shape.text_frame.paragraphs:  # type: ignore
                         if paragraph.text:  # type: ignore
                             yield paragraph.text
-                        else:
-                            continue
-
-    def extract_image(self):
-        prs = Presentation(self.file_path)
-        for slide in prs.slides:  # type: ignore
-            for shape in slide.shapes:  # type: ignore
                 if shape.shape_type == 13:  # type: ignore
-                    image = shape.image  # type: ignore
-                    yield image.blob  # type: ignore
-                else:
-                    continue
+                    yield shape.image.blob  # type: ignore
@@ -1,10 +1,15 @@
 import json
+import zipfile
 from dataclasses import dataclass
+from typing import Any, Generator, Iterable, Optional, Sequence
 from openpyxl import load_workbook
+from ..qchunk import Record, count_tokens
 from ._base import RawDoc
 from datetime import datetime, date, time, timedelta
 from decimal import Decimal
 
+ROWS_PER_PAGE = 1000
+
 
 class JsonEncoder(json.JSONEncoder):
     def default(self, o: object) -> object:
@@ -21,26 +26,154 @@ class JsonEncoder(json.JSONEncoder):
         return super().default(o)
 
 
+def header_names(row: Sequence[Any]) -> list[str]:
+    """
+    Column names from a header row: blanks become `column_{n}` and repeated
+    names get a numeric suffix.
+    """
+    names: list[str] = []
+    for index, value in enumerate(row, start=1):
+        name = str(value).strip() if value is not None else ""
+        name = name or f"column_{index}"
+        candidate, suffix = name, 2
+        while candidate in names:
+            candidate, suffix = f"{name}_{suffix}", suffix + 1
+        names.append(candidate)
+    return names
+
+
+def header_of(rows: Iterable[Sequence[Any]]) -> tuple[int, Optional[list[str]]]:
+    """
+    Row number and column names of the first non-empty row, `(0, None)` when
+    there is none.
+    """
+    for number, row in enumerate(rows, start=1):
+        if any(value not in (None, "") for value in row):
+            return number, header_names(row)
+    return 0, None
+
+
+def row_blocks(count: int) -> range:
+    """
+    First row number of every page of `count` rows.
+    """
+    return range(1, count + 1, ROWS_PER_PAGE)
+
+
+def row_span(start: int, stop: int) -> tuple[int, int]:
+    """
+    First and last row numbers of the pages `start` to `stop`.
+    """
+    return start * ROWS_PER_PAGE + 1, stop * ROWS_PER_PAGE
+
+
+def records(
+    rows: Iterable[Sequence[Any]],
+    source: str,
+    budget: int,
+    start: int = 1,
+    header: Optional[list[str]] = None,
+    header_row: int = 0,
+) -> Generator[Record, None, None]:
+    """
+    Stream `rows`, numbered from `start`, as JSON records of as many rows as
+    fit in `budget` tokens (a row larger than that gets a record of its own),
+    skipping empty cells and rows. Rows are keyed by `header`, found at row
+    `header_row`, or else by the column names of the first non-empty row.
+    """
+    header = None if header is None else list(header)
+    batch: list[dict[str, Any]] = []
+    first = last = 0
+    empty = tokens = count_tokens(record(source, 0, 0, []))
+    for number, row in enumerate(rows, start=start):
+        if number <= header_row or not any(value not in (None, "") for value in row):
+            continue
+        if header is None:
+            header = header_names(row)
+            continue
+        if len(row) > len(header):
+            header += header_names([None] * len(row))[len(header) :]
+        entry = {header[i]: value for i, value in enumerate(row) if value not in (None, "")}
+        cost = count_tokens(json.dumps(entry, cls=JsonEncoder)) + 1
+        if batch and tokens + cost > budget:
+            yield record(source, first, last, batch)
+            batch, tokens = [], empty
+        if not batch:
+            first = number
+        batch.append(entry)
+        tokens += cost
+        last = number
+    if batch:
+        yield record(source, first, last, batch)
+
+
+def record(source: str, first: int, last: int, batch: list[dict[str, Any]]) -> Record:
+    return Record(
+        json.dumps({"sheet": source, "rows": [first, last], "records": batch}, cls=JsonEncoder)
+    )
+
+
 @dataclass
 class ExcelLoader(RawDoc):
-    def extract_text(self):
-        wb = load_workbook(filename=self.file_path, data_only=True)
-        for sheet_name in self.wb.sheetnames:
-            sheet = wb[sheet_name]
-            for row in sheet.iter_rows():
-                for cell in row:
-                    if cell.value:
-                        data_dict = {
-                            "row": cell.row,
-                            "column": cell.column,
-                            "value": cell.value,
-                            "sheet": sheet_name,
-                        }
-                        yield json.dumps(data_dict, cls=JsonEncoder)
-
-    def extract_image(self):
-        wb = load_workbook(filename=self.file_path, data_only=True)
-        for sheet_name in wb.sheetnames:
-            sheet = wb[sheet_name]
-            for image in sheet._images:  # type: ignore
-                yield image._data()  # type: ignore
+    """
+    Streams workbooks in read-only mode as records of the rows of every
+    sheet sized to `chunk_tokens`, followed by the embedded images of the
+    package. A page is a block of `ROWS_PER_PAGE` rows of a sheet, parsed
+    with the header of its sheet, so large sheets are split across tasks.
+    """
+
+    def extract(self):
+        wb = load_workbook(filename=self.file_path, read_only=True, data_only=True)
+        try:
+            for sheet_name in wb.sheetnames:
+                rows = wb[sheet_name].iter_rows(values_only=True)  # type: ignore
+                yield from records(rows, sheet_name, self.chunk_tokens)  # type: ignore
+        finally:
+            wb.close()
+        yield from self.images()
+
+    def pages(self) -> int:
+        wb = load_workbook(filename=self.file_path, read_only=True)
+        try:
+            return max(1, len(self.blocks(wb)))
+        finally:
+            wb.close()
+
+    def extract_pages(self, start: int, stop: int):
+        items: list[Any] = []
+        wb = load_workbook(filename=self.file_path, read_only=True, data_only=True)
+        try:
+            for sheet_name, first in self.blocks(wb)[start:stop]:
+                sheet = wb[sheet_name]
+                header_row, header = header_of(sheet.iter_rows(values_only=True))  # type: ignore
+                if header is None:
+                    continue
+                rows = sheet.iter_rows(  # type: ignore
+                    min_row=first, max_row=first + ROWS_PER_PAGE - 1, values_only=True
+                )
+                items.extend(
+                    records(rows, sheet_name, self.chunk_tokens, first, header, header_row)
+                )
+        finally:
+            wb.close()
+        if start == 0:
+            items.extend(self.images())
+        return items
+
+    @staticmethod
+    def blocks(wb: Any) -> list[tuple[str, int]]:
+        """
+        Sheet name and first row of every page, counted by streaming the rows
+        since read-only worksheets may not record their dimensions.
+        """
+        return [
+            (sheet_name, first)
+            for sheet_name in wb.sheetnames
+            for first in row_blocks(sum(1 for _ in wb[sheet_name].iter_rows(values_only=True)))
+        ]
+
+    def images(self):
+        with zipfile.ZipFile(self.file_path) as package:
+            for name in package.namelist():
+                if name.startswith("xl/media/"):
+                    yield package.read(name)
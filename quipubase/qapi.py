@@ -4,12 +4,21 @@ from fastapi.responses import RedirectResponse
 from starlette.middleware.sessions import SessionMiddleware
 
 from .const import DESCRIPTION, SERVERS
+from .qblob import app as blobs_app
 from .qdoc import app as documents_app
+from .qembed import QuipuEmbeddings
+from .qfiles import shutdown_parsers
+from .qindex import VectorIndex
+from .qshard import HandlePool
+from .qjobs import JobRunner
+from .qjobs import app as jobs_app
 from .qvector import app as vector_app
 from .auth import create_auth
 
 
-def create_app(routers: list[APIRouter] = [documents_app, vector_app]) -> FastAPI:
+def create_app(
+    routers: list[APIRouter] = [documents_app, vector_app, blobs_app, jobs_app]
+) -> FastAPI:
     """
     Create and configure the QuipuBase API.
 
@@ -35,6 +44,18 @@ def create_app(routers: list[APIRouter] = [documents_app, vector_app]) -> FastAP
         api.include_router(router, prefix="/api")
     api.include_router(create_auth())
 
+    @api.on_event("startup")
+    async def _():
+        JobRunner.get().resume()
+
+    @api.on_event("shutdown")
+    async def _():
+        VectorIndex.save_all()
+        await QuipuEmbeddings.aclose()
+        JobRunner.get().close()
+        shutdown_parsers()
+        HandlePool.get().close_all()
+
     @api.get("/", tags=["Root"])
     def _():
         """
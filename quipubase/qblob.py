@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+from typing import Any, ClassVar, Iterator, Optional
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import Response, StreamingResponse
+
+from .quipubase import Quipu  # pylint: disable=E0611
+
+BLOB_ROOT = "db/_blobs"
+BLOB_CHUNK = 256 * 1024
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+RANGE = re.compile(r"bytes=(\d*)-(\d*)$")
+SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"BM", "image/bmp"),
+    (b"II*\x00", "image/tiff"),
+    (b"MM\x00*", "image/tiff"),
+)
+
+
+def sniff(data: bytes) -> str:
+    """
+    Media type of `data` from its magic number.
+    """
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    for signature, media_type in SIGNATURES:
+        if data.startswith(signature):
+            return media_type
+    return "application/octet-stream"
+
+
+class BlobStore:
+    """
+    Content-addressed store of the binary assets extracted from documents.
+
+    Blobs are keyed by the sha256 of their content, so identical images are
+    stored once, and split in `BLOB_CHUNK` byte chunks so a range read only
+    loads the chunks it overlaps:
+
+    - `m:{digest}` holds the size, chunk count and media type
+    - `c:{digest}:{n}` holds the raw bytes of chunk `n`
+
+    Usage:
+        blobs = BlobStore.get()
+        digest = blobs.put(image_bytes)
+        b"".join(blobs.read(digest, 0, 1023))
+    """
+
+    _instance: ClassVar[Optional[BlobStore]] = None
+
+    def __init__(self, path: str = BLOB_ROOT, chunk_size: int = BLOB_CHUNK):
+        os.makedirs(path, exist_ok=True)
+        self.db = Quipu(path)
+        self.chunk_size = chunk_size
+
+    @classmethod
+    def get(cls) -> BlobStore:
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def put(self, data: bytes, media_type: Optional[str] = None) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        if self.db.exists(f"m:{digest}"):
+            return digest
+        chunks = max(1, -(-len(data) // self.chunk_size))
+        for n in range(chunks):
+            start = n * self.chunk_size
+            self.db.put(f"c:{digest}:{n:08d}", data[start : start + self.chunk_size])
+        self.db.put_doc(
+            f"m:{digest}",
+            {
+                "size": len(data),
+                "chunks": chunks,
+                "chunk_size": self.chunk_size,
+                "media_type": media_type or sniff(data),
+            },
+        )
+        return digest
+
+    def meta(self, digest: str) -> Optional[dict[str, Any]]:
+        return self.db.get_doc(f"m:{digest}")
+
+    def read(self, digest: str, start: int, end: int) -> Iterator[bytes]:
+        """
+        The bytes `start` to `end` (inclusive) of a blob, one chunk at a time.
+        """
+        meta = self.meta(digest)
+        assert meta is not None, f"Blob {digest} not found"
+        size = meta["chunk_size"]
+        for n in range(start // size, end // size + 1):
+            view = self.db.get_view(f"c:{digest}:{n:08d}")
+            assert view is not None, f"Blob {digest} is missing chunk {n}"
+            offset = n * size
+            yield bytes(view[max(start - offset, 0) : end - offset + 1])
+            view.release()
+
+
+app = APIRouter(tags=["Blobs"])
+
+
+def byte_range(header: Optional[str], size: int) -> Optional[tuple[int, int]]:
+    """
+    The inclusive `(start, end)` of a single `Range: bytes=...` header.
+    """
+    if header is None:
+        return None
+    match = RANGE.match(header.strip())
+    if match is None or match.groups() == ("", ""):
+        raise HTTPException(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+    first, last = match.groups()
+    if first == "":
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start, end = int(first), min(int(last), size - 1) if last else size - 1
+    if start > end or start >= size:
+        raise HTTPException(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+    return start, end
+
+
+@app.get("/blobs/{digest}")
+async def get_blob(
+    digest: str,
+    range_: Optional[str] = Header(default=None, alias="Range"),
+    if_none_match: Optional[str] = Header(default=None, alias="If-None-Match"),
+):
+    """
+    Download a stored blob, honouring single byte-range requests. Blobs are
+    immutable so they are cached for a year and revalidated by their digest.
+    """
+    blobs = BlobStore.get()
+    meta = blobs.meta(digest)
+    if meta is None:
+        raise HTTPException(status_code=404, detail=f"Blob {digest} not found")
+    headers = {
+        "ETag": f'"{digest}"',
+        "Cache-Control": CACHE_CONTROL,
+        "Accept-Ranges": "bytes",
+    }
+    if if_none_match is not None and digest in if_none_match:
+        return Response(status_code=304, headers=headers)
+    size = meta["size"]
+    requested = byte_range(range_, size)
+    start, end = requested or (0, size - 1)
+    headers["Content-Length"] = str(end - start + 1)
+    if requested is not None:
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return StreamingResponse(
+        blobs.read(digest, start, end) if size else iter([b""]),
+        status_code=206 if requested is not None else 200,
+        media_type=meta["media_type"],
+        headers=headers,
+    )
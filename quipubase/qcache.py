@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import unicodedata
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .quipubase import Quipu  # pylint: disable=E0611
+
+CACHE_ROOT = "db/_embeddings"
+LRU_CAPACITY = 10_000
+
+
+def normalize_text(text: str) -> str:
+    """
+    Canonical form of `text` for caching: NFC unicode, collapsed whitespace.
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class EmbeddingCache:
+    """
+    Two-tier cache of embeddings keyed by (model, dim, normalized content hash).
+
+    Hot entries are served from an in-memory LRU, the rest from a RocksDB
+    database holding raw float32 bytes that are decoded straight from the
+    pinned value without an intermediate copy.
+
+    Usage:
+        cache = EmbeddingCache()
+        key = cache.key("model", 768, "Hello, world!")
+        cache.get(key) or cache.put(key, vector)
+    """
+
+    def __init__(self, path: str = CACHE_ROOT, capacity: int = LRU_CAPACITY):
+        os.makedirs(path, exist_ok=True)
+        self.db = Quipu(path)
+        self.capacity = capacity
+        self.lru: OrderedDict[str, NDArray[np.float32]] = OrderedDict()
+        self.lock = Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(model: str, dim: Optional[int], text: str) -> str:
+        digest = hashlib.sha256(normalize_text(text).encode()).hexdigest()
+        return f"{model}:{dim or 0}:{digest}"
+
+    def get(self, key: str) -> Optional[NDArray[np.float32]]:
+        with self.lock:
+            if key in self.lru:
+                self.lru.move_to_end(key)
+                self.memory_hits += 1
+                return self.lru[key]
+        view = self.db.get_view(key)
+        if view is None:
+            with self.lock:
+                self.misses += 1
+            return None
+        vector = np.frombuffer(view, dtype=np.float32).copy()
+        with self.lock:
+            self.disk_hits += 1
+            self.remember(key, vector)
+        return vector
+
+    def put(self, key: str, vector: NDArray[np.float32]) -> NDArray[np.float32]:
+        vector = np.asarray(vector, dtype=np.float32)
+        self.db.put(key, vector.tobytes())
+        with self.lock:
+            self.remember(key, vector)
+        return vector
+
+    def remember(self, key: str, vector: NDArray[np.float32]):
+        self.lru[key] = vector
+        self.lru.move_to_end(key)
+        while len(self.lru) > self.capacity:
+            self.lru.popitem(last=False)
+
+    def stats(self) -> dict[str, float]:
+        with self.lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "lookups": lookups,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+                "memory_entries": len(self.lru),
+            }
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import re
+from collections import deque
+
+CHUNK_TOKENS = 256
+CHUNK_OVERLAP = 32
+TOKEN = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+SENTENCE = re.compile(r"(?<=[.!?;:])\s+|\n{2,}")
+
+
+def count_tokens(text: str) -> int:
+    """
+    Word-piece estimate of the token count of `text`: every word and every
+    punctuation mark counts as one token, close to what BPE tokenizers give
+    for prose without depending on one.
+    """
+    return len(TOKEN.findall(text))
+
+
+class Record(str):
+    """
+    A fragment the `Chunker` keeps whole, such as a JSON block of spreadsheet
+    rows: it may share a chunk with its neighbours but is never cut.
+    """
+
+    __slots__ = ()
+
+
+def sentences(text: str, size: int) -> list[str]:
+    """
+    Split `text` on sentence boundaries, breaking sentences longer than
+    `size` tokens on word boundaries.
+    """
+    results: list[str] = []
+    for sentence in SENTENCE.split(text):
+        sentence = " ".join(sentence.split())
+        if not sentence:
+            continue
+        if count_tokens(sentence) <= size:
+            results.append(sentence)
+            continue
+        words: list[str] = []
+        tokens = 0
+        for word in sentence.split(" "):
+            cost = count_tokens(word)
+            if words and tokens + cost > size:
+                results.append(" ".join(words))
+                words, tokens = [], 0
+            words.append(word)
+            tokens += cost
+        if words:
+            results.append(" ".join(words))
+    return results
+
+
+class Chunker:
+    """
+    Merges the fragments yielded by the loaders (paragraphs, pages, cells)
+    into chunks of about `size` tokens cut on sentence boundaries, repeating
+    the trailing sentences worth at most `overlap` tokens at the start of the
+    next chunk. A `Record` counts as a single sentence, even when larger than
+    `size`.
+
+    Usage:
+        chunker = Chunker(size=256, overlap=32)
+        for fragment in fragments:
+            for chunk in chunker.feed(fragment):
+                ...
+        for chunk in chunker.flush():
+            ...
+    """
+
+    def __init__(self, size: int = CHUNK_TOKENS, overlap: int = CHUNK_OVERLAP):
+        assert 0 <= overlap < size, "The overlap must be smaller than the chunk size"
+        self.size = size
+        self.overlap = overlap
+        self.buffer: deque[tuple[str, int]] = deque()
+        self.tokens = 0
+        self.fresh = 0
+
+    def feed(self, text: str) -> list[str]:
+        chunks: list[str] = []
+        units = [text] if isinstance(text, Record) else sentences(text, self.size)
+        for sentence in units:
+            cost = count_tokens(sentence)
+            if self.fresh and self.tokens + cost > self.size:
+                chunks.append(self.emit())
+            if self.tokens + cost > self.size:
+                self.buffer.clear()
+                self.tokens = 0
+            self.buffer.append((sentence, cost))
+            self.tokens += cost
+            self.fresh += 1
+        return chunks
+
+    def flush(self) -> list[str]:
+        if not self.fresh:
+            return []
+        chunk = self.emit()
+        self.buffer.clear()
+        self.tokens = 0
+        return [chunk]
+
+    def emit(self) -> str:
+        chunk = " ".join(sentence for sentence, _ in self.buffer)
+        kept: deque[tuple[str, int]] = deque()
+        tokens = 0
+        for sentence, cost in reversed(self.buffer):
+            if tokens + cost > self.overlap:
+                break
+            kept.appendleft((sentence, cost))
+            tokens += cost
+        self.buffer, self.tokens, self.fresh = kept, tokens, 0
+        return chunk
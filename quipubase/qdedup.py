@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from threading import RLock
+from typing import Callable, ContextManager, Literal, Optional
+
+import numpy as np
+
+from .qcache import normalize_text
+from .qlexical import LEXICAL_ROOT, tokenize
+from .qshard import HandlePool
+from .quipubase import Quipu  # pylint: disable=E0611
+
+DedupMode = Literal["none", "exact", "near"]
+
+SHINGLE = 3
+BANDS = 4
+NEAR_DISTANCE = 3
+BITS = np.arange(64, dtype=np.uint64)
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).lower().encode()).hexdigest()
+
+
+def simhash(text: str) -> int:
+    """
+    64-bit SimHash of the token `SHINGLE`-grams of `text`: texts differing by
+    a few words land within a few bits of each other.
+    """
+    tokens = tokenize(text)
+    shingles = [
+        " ".join(tokens[i : i + SHINGLE]) for i in range(max(1, len(tokens) - SHINGLE + 1))
+    ]
+    hashes = np.array(
+        [
+            int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "little")
+            for s in shingles
+        ],
+        dtype=np.uint64,
+    )
+    bits = ((hashes[:, None] >> BITS) & np.uint64(1)).astype(np.int64)
+    weights = (2 * bits - 1).sum(axis=0)
+    return int(((weights > 0).astype(np.uint64) << BITS).sum())
+
+
+def bands(fingerprint: int) -> list[str]:
+    width = 64 // BANDS
+    return [
+        f"{band}:{(fingerprint >> (band * width)) & ((1 << width) - 1):x}"
+        for band in range(BANDS)
+    ]
+
+
+class ChunkDeduper:
+    """
+    Fingerprints of the chunks ingested into one namespace, used to skip
+    unchanged chunks of re-uploaded documents before they are embedded.
+
+    Exact duplicates are found by the sha256 of the normalized text. Near
+    duplicates are chunks whose SimHash is within `NEAR_DISTANCE` bits of a
+    stored one; fingerprints are split in `BANDS` bands indexed separately,
+    so any candidate within the distance shares at least one band.
+
+    - `h:{sha256}` -> the key of the chunk
+    - `b:{band}:{bits}:{key}` -> the fingerprint of a chunk, read per band
+      with a prefix scan
+    - `k:{key}` -> the hash and fingerprint of a chunk, to remove its entries
+
+    Chunks are removed along with their vectors; entries pointing to keys
+    missing from the vector index are ignored all the same. Open dedupers
+    are leased from the `HandlePool` as `chunks/{namespace}`.
+
+    Usage:
+        with ChunkDeduper.lease("my-namespace") as deduper:
+            fresh = deduper.select(chunks, mode="near", exists=live_keys.__contains__)
+            deduper.add(chunk, key)
+    """
+
+    def __init__(self, namespace: str, root: str = LEXICAL_ROOT):
+        path = os.path.join(root, namespace)
+        os.makedirs(path, exist_ok=True)
+        self.namespace = namespace
+        self.db = Quipu(os.path.join(path, "chunks"))
+        self.lock = RLock()
+
+    @classmethod
+    def lease(cls, namespace: str) -> ContextManager[ChunkDeduper]:
+        return HandlePool.get().lease(f"chunks/{namespace}", lambda _: cls(namespace))
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+        HandlePool.get().forget(f"chunks/{self.namespace}", self)
+
+    def add(self, text: str, key: str):
+        """
+        Fingerprint `text` under `key`, replacing what the key held before.
+        """
+        digest, fingerprint = content_hash(text), f"{simhash(text):x}"
+        with self.lock:
+            self.remove(key)
+            self.db.put_doc(f"h:{digest}", {"key": key})
+            for band in bands(int(fingerprint, 16)):
+                self.db.put_doc(f"b:{band}:{key}", {"fingerprint": fingerprint})
+            self.db.put_doc(f"k:{key}", {"hash": digest, "fingerprint": fingerprint})
+
+    def remove(self, key: str):
+        with self.lock:
+            entry = self.db.get_doc(f"k:{key}")
+            if entry is None:
+                return
+            for band in bands(int(entry["fingerprint"], 16)):
+                self.db.delete(f"b:{band}:{key}")
+            if self.exact_key(entry["hash"]) == key:
+                self.db.delete(f"h:{entry['hash']}")
+            self.db.delete(f"k:{key}")
+
+    def exact_key(self, digest: str) -> Optional[str]:
+        entry = self.db.get_doc(f"h:{digest}")
+        return entry["key"] if entry else None
+
+    def exact(self, text: str) -> Optional[str]:
+        return self.exact_key(content_hash(text))
+
+    def near(self, text: str) -> list[str]:
+        fingerprint = simhash(text)
+        keys: list[str] = []
+        for band in bands(fingerprint):
+            prefix = f"b:{band}:"
+            for entry_key, entry in self.db.scan_prefix(prefix):
+                key = entry_key[len(prefix) :]
+                member = int(entry["fingerprint"], 16)
+                if key not in keys and bin(member ^ fingerprint).count("1") <= NEAR_DISTANCE:
+                    keys.append(key)
+        return keys
+
+    def select(
+        self,
+        chunks: list[str],
+        mode: DedupMode,
+        exists: Callable[[str], bool],
+        seen: Optional[set[str]] = None,
+    ) -> list[str]:
+        """
+        The chunks of `chunks` not yet ingested, i.e. without an exact (or,
+        in `near` mode, near) duplicate among the stored keys for which
+        `exists` is true, nor in the hashes of `seen`, which collects the
+        hashes of the chunks selected.
+        """
+        if mode == "none":
+            return chunks
+        seen = set() if seen is None else seen
+        fresh: list[str] = []
+        for chunk in chunks:
+            digest = content_hash(chunk)
+            if digest in seen:
+                continue
+            key = self.exact(chunk)
+            if key is not None and exists(key):
+                continue
+            if mode == "near" and any(exists(key) for key in self.near(chunk)):
+                continue
+            seen.add(digest)
+            fresh.append(chunk)
+        return fresh
@@ -1,7 +1,6 @@
 from __future__ import annotations
-import os
 import types
-from typing import Any, ClassVar, Dict, Optional, Type, TypeVar, Union
+from typing import Any, ClassVar, ContextManager, Dict, Optional, Type, TypeVar, Union
 from uuid import uuid4
 
 from fastapi import APIRouter, Body, Path, Query
@@ -9,7 +8,7 @@ from pydantic import BaseModel, Field
 from typing_extensions import Literal
 
 from .const import DEF_EXAMPLES, EXAMPLES, JSON_SCHEMA_DESCRIPTION
-from .quipubase import Quipu  # pylint: disable=E0611
+from .qshard import HandlePool, ShardedQuipu
 from .schemas import JsonSchema  # pylint: disable=E0611 # type: ignore
 from .schemas import create_class
 
@@ -51,20 +50,21 @@ class BaseDocument(Base):
 
 
 class QuipuDocument(BaseDocument):
-    _db_instances: ClassVar[dict[str, Quipu]] = {}
     _subclasses: ClassVar[dict[str, Type[QuipuDocument]]] = {}
     key: str = Field(default_factory=lambda: str(uuid4()))
 
     @classmethod
     def __init_subclass__(cls, **kwargs: Any):
-        os.makedirs("db", exist_ok=True)
         cls.__name__ = cls.__name__.replace("::", "/")
-        os.makedirs(f"db/{cls.__name__}", exist_ok=True)
         super().__init_subclass__(**kwargs)
 
-        if cls.__name__ not in cls._db_instances:
-            cls._db_instances[cls.__name__] = Quipu(f"db/{cls.__name__}")
-        cls._db = cls._db_instances[cls.__name__]
+    @classmethod
+    def handle(cls) -> ContextManager[ShardedQuipu]:
+        """
+        Lease the database of the class from the shared `HandlePool`, which
+        keeps it open for the duration of the `with` block.
+        """
+        return HandlePool.get().lease(cls.__name__)
 
     @classmethod
     def get_definition(cls) -> JsonSchema:
@@ -77,16 +77,18 @@ class QuipuDocument(BaseDocument):
 
     @types.coroutine
     def put_doc(self):
-        if self._db.exists(key=self.key):
-            self._db.merge_doc(self.key, self.model_dump())
-        yield
-        self._db.put_doc(self.key, self.model_dump())
+        with self.handle() as db:
+            if db.exists(key=self.key):
+                db.merge_doc(self.key, self.model_dump())
+            yield
+            db.put_doc(self.key, self.model_dump())
         return self
 
     @classmethod
     @types.coroutine
     def get_doc(cls, *, key: str):
-        data = cls._db.get_doc(key=key)
+        with cls.handle() as db:
+            data = db.get_doc(key=key)
         yield
         if data:
             return cls(**data)
@@ -99,14 +101,16 @@ class QuipuDocument(BaseDocument):
 
     @types.coroutine
     def merge_doc(self):
-        self._db.merge_doc(key=self.key, value=self.model_dump())
+        with self.handle() as db:
+            db.merge_doc(key=self.key, value=self.model_dump())
         yield
         return self
 
     @classmethod
     @types.coroutine
     def delete_doc(cls, *, key: str):
-        cls._db.delete_doc(key=key)
+        with cls.handle() as db:
+            db.delete_doc(key=key)
         yield
         return Status(
             code=204,
@@ -119,15 +123,15 @@ class QuipuDocument(BaseDocument):
     @types.coroutine
     def scan_docs(cls, *, limit: int = 1000, offset: int = 0):
         yield
-        return [
-            cls.model_validate(i)  # pylint: disable=E1101
-            for i in cls._db.scan_docs(limit, offset)
-        ]
+        with cls.handle() as db:
+            docs = db.scan_docs(limit, offset)
+        return [cls.model_validate(i) for i in docs]  # pylint: disable=E1101
 
     @classmethod
     @types.coroutine
     def find_docs(cls, limit: int = 1000, offset: int = 0, **kwargs: Any):
-        response = cls._db.find_docs(limit=limit, offset=offset, kwargs=kwargs)
+        with cls.handle() as db:
+            response = db.find_docs(limit=limit, offset=offset, kwargs=kwargs)
         yield
         return [cls.model_validate(i) for i in response]
 
@@ -135,13 +139,15 @@ class QuipuDocument(BaseDocument):
     @types.coroutine
     def count(cls):
         yield
-        return cls._db.count()
+        with cls.handle() as db:
+            return db.count()
 
     @classmethod
     @types.coroutine
     def exists(cls, *, key: str):
         yield
-        return cls._db.exists(key=key)
+        with cls.handle() as db:
+            return db.exists(key=key)
 
 
 app = APIRouter(tags=["Document Store"], prefix="/document")
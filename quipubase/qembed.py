@@ -1,8 +1,126 @@
-from typing import Union
+import asyncio
+from typing import Awaitable, Callable, ClassVar, Literal, Optional, Union
+from weakref import WeakKeyDictionary
 
 import numpy as np
-from httpx import AsyncClient
+from httpx import AsyncClient, Limits
+from numpy.typing import NDArray
+from .const import EMBEDDINGS_PROVIDER
 from .proxy import Proxy
+from .qcache import EmbeddingCache, normalize_text
+from .qlocal import LocalEmbeddings
+
+EMBEDDINGS_URL = "https://embeddings.indiecloud.co/api/embeddings"
+EMBEDDINGS_MODEL = "indiecloud"
+MAX_CONNECTIONS = 32
+MAX_KEEPALIVE = 16
+KEEPALIVE_EXPIRY = 60
+BATCH_WINDOW = 0.005
+MAX_BATCH = 64
+
+EmbeddingProvider = Literal["remote", "local"]
+
+
+def fit(vector: list[float], dim: Optional[int]) -> NDArray[np.float32]:
+    """
+    `vector` cut to its first `dim` components and L2-normalized again, since
+    the provider always answers with its full dimension.
+    """
+    data = np.asarray(vector, dtype=np.float32)
+    if dim is None or len(data) == dim:
+        return data
+    if len(data) < dim:
+        raise ValueError(f"The embeddings have {len(data)} dimensions, {dim} were requested")
+    data = data[:dim]
+    norm = np.linalg.norm(data)
+    return data / norm if norm else data
+
+
+class MicroBatcher:
+    """
+    Coalesces the texts submitted by concurrent callers within `window`
+    seconds (or until `max_batch` texts are pending) into calls to `send` of
+    at most `max_batch` texts, then hands every caller back its own slice of
+    the results.
+
+    Usage:
+        batcher = MicroBatcher(send)
+        vectors = await batcher.submit(["Hello", "world"])
+    """
+
+    def __init__(
+        self,
+        send: Callable[[list[str]], Awaitable[list[list[float]]]],
+        window: float = BATCH_WINDOW,
+        max_batch: int = MAX_BATCH,
+    ):
+        self.send = send
+        self.window = window
+        self.max_batch = max_batch
+        self.pending: list[tuple[list[str], asyncio.Future[list[list[float]]]]] = []
+        self.size = 0
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.tasks: set[asyncio.Task[None]] = set()
+        self.requests = 0
+        self.texts = 0
+
+    async def submit(self, texts: list[str]) -> list[list[float]]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[list[float]]] = loop.create_future()
+        self.pending.append((texts, future))
+        self.size += len(texts)
+        if self.size >= self.max_batch:
+            self.schedule(loop, 0)
+        elif self.timer is None:
+            self.schedule(loop, self.window)
+        return await future
+
+    def schedule(self, loop: asyncio.AbstractEventLoop, delay: float):
+        if self.timer is not None:
+            self.timer.cancel()
+        self.timer = loop.call_later(delay, self.start, loop)
+
+    def start(self, loop: asyncio.AbstractEventLoop):
+        task = loop.create_task(self.flush())
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    def close(self):
+        """
+        Cancel the scheduled and running flushes and the callers still waiting.
+        """
+        if self.timer is not None:
+            self.timer.cancel()
+        for task in self.tasks:
+            task.cancel()
+        for _, future in self.pending:
+            future.cancel()
+        self.pending, self.size, self.timer = [], 0, None
+
+    async def flush(self):
+        pending, self.pending, self.size, self.timer = self.pending, [], 0, None
+        if not pending:
+            return
+        texts = [text for batch, _ in pending for text in batch]
+        slices = [
+            texts[start : start + self.max_batch]
+            for start in range(0, len(texts), self.max_batch)
+        ]
+        self.requests += len(slices)
+        self.texts += len(texts)
+        try:
+            results = await asyncio.gather(*(self.send(batch) for batch in slices))
+            vectors = [vector for result in results for vector in result]
+        except Exception as e:  # pylint: disable=W0718
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        start = 0
+        for batch, future in pending:
+            if not future.done():
+                future.set_result(vectors[start : start + len(batch)])
+            start += len(batch)
 
 
 class QuipuEmbeddings(Proxy[AsyncClient]):
@@ -13,7 +131,7 @@ class QuipuEmbeddings(Proxy[AsyncClient]):
         None
 
     Methods:
-        __load__(): Loads the asynchronous client.
+        __load__(): Loads the asynchronous client shared by the running event loop.
         encode(text: str | list[str]): Encodes the given text into vectors.
 
     Usage:
@@ -21,27 +139,119 @@ class QuipuEmbeddings(Proxy[AsyncClient]):
         vectors = await embedding_api.encode("Hello, world!")
     """
 
+    model: ClassVar[str] = EMBEDDINGS_MODEL
+    _cache: ClassVar[Optional[EmbeddingCache]] = None
+    _clients: ClassVar["WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncClient]"] = (
+        WeakKeyDictionary()
+    )
+    _batchers: ClassVar["WeakKeyDictionary[asyncio.AbstractEventLoop, MicroBatcher]"] = (
+        WeakKeyDictionary()
+    )
+
+    @classmethod
+    def cache(cls) -> EmbeddingCache:
+        if cls._cache is None:
+            cls._cache = EmbeddingCache()
+        return cls._cache
+
     def __load__(self):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self.connect()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = self._clients[loop] = self.connect()
+        return client
+
+    @staticmethod
+    def connect() -> AsyncClient:
         return AsyncClient(
             timeout=600,
+            limits=Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+        )
+
+    @classmethod
+    async def aclose(cls):
+        """
+        Close the pooled client and the batcher of the running event loop.
+        """
+        batcher = cls._batchers.pop(asyncio.get_running_loop(), None)
+        if batcher is not None:
+            batcher.close()
+        client = cls._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def batcher(self) -> MicroBatcher:
+        loop = asyncio.get_running_loop()
+        if loop not in self._batchers:
+            self._batchers[loop] = MicroBatcher(self.post)
+        return self._batchers[loop]
+
+    async def post(self, texts: list[str]) -> list[list[float]]:
+        response = await self.__load__().post(
+            EMBEDDINGS_URL,
+            json={"content": texts},
         )
+        return response.json()["content"]
 
-    async def encode(self, text: str):
+    async def encode(self, text: Union[str, list[str]], dim: Optional[int] = None):
         """
                 Encodes the given text into vectors.
 
                 Args:
                     text (str | list[str]): The text or list of texts to be encoded.
-        w
+                    dim (int | None): The dimension the vectors are cut to, the full one by default.
+
                 Returns:
-                    numpy.ndarray: An array of vectors representing the encoded text.
+                    list[float] | list[list[float]]: The vector of `text`, or one vector per text.
+
+                Texts already embedded by the same model and dimension (after
+                unicode and whitespace normalization) are served from the
+                `EmbeddingCache`, the misses of concurrent calls are coalesced
+                by the `MicroBatcher` into a single request over the pooled client.
 
                 Example:
                     embedding_api = EmbeddingAPI()
                     vectors = await embedding_api.encode("Hello, world!")
         """
-        response = await self.__load__().post(
-            "https://embeddings.indiecloud.co/api/embeddings",
-            json={"content": text},
-        )
-        return response.json()["content"]
+        texts = [text] if isinstance(text, str) else list(text)
+        cache = self.cache()
+        keys = [cache.key(self.model, dim, t) for t in texts]
+        originals = dict(zip(keys, texts))
+        vectors = {key: cache.get(key) for key in originals}
+        missing = [key for key, vector in vectors.items() if vector is None]
+        if missing:
+            computed = await self.batcher().submit(
+                [normalize_text(originals[key]) for key in missing]
+            )
+            for key, vector in zip(missing, computed):
+                vectors[key] = cache.put(key, fit(vector, dim))
+        result = [vectors[key].tolist() for key in keys]  # type: ignore
+        return result[0] if isinstance(text, str) else result
+
+    def stats(self) -> dict[str, float]:
+        batcher = self._batchers.get(asyncio.get_running_loop())
+        requests = batcher.requests if batcher else 0
+        texts = batcher.texts if batcher else 0
+        return {
+            "requests": requests,
+            "texts": texts,
+            "texts_per_request": texts / requests if requests else 0.0,
+        }
+
+
+def get_embeddings(
+    provider: Optional[EmbeddingProvider] = None,
+) -> Union[QuipuEmbeddings, LocalEmbeddings]:
+    """
+    The embedding backend of `provider`, `QUIPU_EMBEDDINGS` (remote by default) when unset.
+    """
+    if (provider or EMBEDDINGS_PROVIDER) == "local":
+        return LocalEmbeddings()
+    return QuipuEmbeddings()
@@ -1,7 +1,18 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_all_start_methods, get_context
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal, Type
-from fastapi import UploadFile
+from typing import AsyncIterator, Literal, Optional, Type, Union
+from fastapi import HTTPException, UploadFile
+from .const import MAX_UPLOAD_BYTES
+from .qchunk import CHUNK_TOKENS
 from .lib import (
+    CsvLoader,
     PptxLoader,
     PdfLoader,
     ExcelLoader,
@@ -10,7 +21,11 @@ from .lib import (
     RawDoc,
 )
 
-MapKey = Literal[".docx", ".doc", ".pdf", ".ppt", ".pptx", ".xlsx", ".xls"]
+UPLOAD_CHUNK = 1024 * 1024
+PARSE_WORKERS = os.cpu_count() or 1
+PAGES_PER_TASK = 8
+
+MapKey = Literal[".docx", ".doc", ".pdf", ".ppt", ".pptx", ".xlsx", ".xls", ".csv"]
 
 MAPPING: dict[MapKey, Type[RawDoc]] = {
     ".docx": DocxLoader,
@@ -20,14 +35,132 @@ MAPPING: dict[MapKey, Type[RawDoc]] = {
     ".pptx": PptxLoader,
     ".xlsx": ExcelLoader,
     ".xls": ExcelLoader,
+    ".csv": CsvLoader,
 }
 
 
-def stream_file(file: UploadFile, file_path: str):
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def parse_pool() -> ProcessPoolExecutor:
+    """
+    The process pool of the parsers. Workers are started by a fork server
+    (spawned where unavailable): forking the threaded server would copy its
+    locks and open RocksDB handles into the workers.
+    """
+    global _pool  # pylint: disable=W0603
+    if _pool is None:
+        method = "forkserver" if "forkserver" in get_all_start_methods() else "spawn"
+        _pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS, mp_context=get_context(method))
+    return _pool
+
+
+def shutdown_parsers():
+    global _pool  # pylint: disable=W0603
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
+
+
+def count_pages(suffix: MapKey, file_path: str) -> int:
+    return MAPPING[suffix](file_path=file_path).pages()
+
+
+def parse_pages(suffix: MapKey, file_path: str, start: int, stop: int, size: int):
+    loader = MAPPING[suffix](file_path=file_path, chunk_tokens=size)
+    return loader.extract_pages(start, stop)
+
+
+async def parse_file(
+    file: UploadFile,
+    file_path: str,
+    pages_per_task: int = PAGES_PER_TASK,
+    size: int = CHUNK_TOKENS,
+) -> AsyncIterator[Union[str, bytes]]:
+    """
+    Parse a document in the process pool, `pages_per_task` pages (slides,
+    sheets) per task, yielding text chunks and images in document order.
+    Structured records (spreadsheet rows) are sized to chunks of `size` tokens.
+
+    At most `2 * PARSE_WORKERS` tasks are in flight, so parsing scales with
+    the cores without holding the whole document in memory nor blocking the
+    event loop.
+    """
+    async for item in parse_path(check_suffix(file), file_path, pages_per_task, size):
+        yield item
+
+
+async def parse_path(
+    suffix: MapKey,
+    file_path: str,
+    pages_per_task: int = PAGES_PER_TASK,
+    size: int = CHUNK_TOKENS,
+) -> AsyncIterator[Union[str, bytes]]:
+    """
+    `parse_file` for a document already on disk, typed by its `suffix`.
+    """
+    loop = asyncio.get_running_loop()
+    pool = parse_pool()
+    pages = await loop.run_in_executor(pool, count_pages, suffix, file_path)
+    ranges = iter(range(0, pages, pages_per_task))
+    pending: deque[asyncio.Future[list[Union[str, bytes]]]] = deque()
+
+    def submit():
+        start = next(ranges, None)
+        if start is not None:
+            pending.append(
+                loop.run_in_executor(
+                    pool, parse_pages, suffix, file_path, start, start + pages_per_task, size
+                )
+            )
+
+    for _ in range(2 * PARSE_WORKERS):
+        submit()
+    try:
+        while pending:
+            results = await pending.popleft()
+            submit()
+            for result in results:
+                yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+@dataclass
+class SpooledUpload:
+    path: Path
+    size: int
+    sha256: str
+
+    def remove(self):
+        self.path.unlink(missing_ok=True)
+
+
+async def spool_upload(
+    file: UploadFile, limit: int = MAX_UPLOAD_BYTES, directory: Optional[str] = None
+) -> SpooledUpload:
+    """
+    Copy an upload to a temporary file in `UPLOAD_CHUNK` pieces, hashing it on
+    the way, so memory stays bounded by the chunk size whatever the file size.
+    Uploads larger than `limit` bytes are rejected with a 413. The file is
+    created in the system temporary directory unless `directory` is given.
+    """
     suffix = check_suffix(file)
-    klass = MAPPING[suffix]
-    loader = klass(file_path=Path(file_path).as_posix())
-    for chunk in loader.extract_text():
-        yield chunk
-    for chunk in loader.extract_image():
-        yield chunk
+    fd, name = tempfile.mkstemp(prefix="quipu-", suffix=suffix, dir=directory)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            while chunk := await file.read(UPLOAD_CHUNK):
+                size += len(chunk)
+                if size > limit:
+                    raise HTTPException(
+                        status_code=413, detail=f"Upload exceeds {limit} bytes"
+                    )
+                digest.update(chunk)
+                f.write(chunk)
+    except BaseException:
+        os.remove(name)
+        raise
+    return SpooledUpload(path=Path(name), size=size, sha256=digest.hexdigest())
@@ -0,0 +1,692 @@
+from __future__ import annotations
+
+import os
+from threading import RLock, Thread
+from typing import Any, ContextManager, Iterable, Literal, Optional
+
+import hnswlib
+import numpy as np
+import orjson
+from numpy.typing import NDArray
+
+from .qquant import QUANTIZERS, ProductQuantizer, QuantizationKind, Quantizer
+from .qshard import HandlePool
+from .qstore import VectorStore, normalize
+from .quipubase import Quipu  # pylint: disable=E0611
+
+INDEX_ROOT = "db/_index"
+M = 16
+EF_CONSTRUCTION = 200
+EF = 50
+INITIAL_CAPACITY = 1024
+SAVE_EVERY = 1000
+SAVE_FRACTION = 0.1
+EXACT_THRESHOLD = 50_000
+POSTFILTER_SELECTIVITY = 0.5
+TRAIN_THRESHOLD = 1024
+RERANK = 8
+TOMBSTONE_RATIO = 0.2
+META = "__meta__"
+
+Engine = Literal["exact", "hnsw", "quantized"]
+
+
+def attribute(value: Any) -> bytes:
+    return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+
+
+class VectorIndex:
+    """
+    Persistent HNSW index of one vector namespace.
+
+    The graph lives in `db/_index/{namespace}/hnsw.bin`, the vectors in a
+    `VectorStore` (`vectors.f32`) and the key <-> label mapping in a RocksDB
+    database next to them, so an index survives restarts and replays the rows
+    written after its last save straight from the store. The graph is saved on
+    close, and in between only once the unsaved rows exceed `SAVE_FRACTION`
+    of it (and `SAVE_EVERY`), so the bytes written grow linearly with the
+    namespace rather than quadratically.
+
+    Deleted keys leave their label as a tombstone: it is marked deleted in
+    the graph and handed to the next new key, and once tombstones exceed
+    `TOMBSTONE_RATIO` of the graph it is rebuilt from the live rows in a
+    background thread while queries keep using the current one.
+
+    Namespaces configured with a quantization keep compact codes
+    (`codes.bin`, `quantizer.npz`) instead of the in-memory graph: large
+    searches scan the codes for `RERANK * k` candidates and re-rank them with
+    the float vectors of the store.
+
+    Open indexes are leased from the `HandlePool` as `index/{namespace}`,
+    which closes (saving the graph) the least recently used idle ones beyond
+    `MAX_OPEN_DATABASES`.
+
+    Usage:
+        with VectorIndex.lease("my-namespace") as index:
+            index.add("doc-key", vector)
+            index.search(query_vector, k=5)
+    """
+
+    def __init__(self, namespace: str, root: str = INDEX_ROOT):
+        self.namespace = namespace
+        self.path = os.path.join(root, namespace)
+        os.makedirs(self.path, exist_ok=True)
+        self.labels = Quipu(os.path.join(self.path, "labels"))
+        self.lock = RLock()
+        self.meta: dict[str, Any] = self.labels.get_doc(META) or {
+            "dim": None,
+            "next_label": 0,
+        }
+        self.meta.setdefault("quantization", None)
+        self.meta.setdefault("subspaces", None)
+        self.meta.setdefault("provider", None)
+        self.meta.setdefault("m", M)
+        self.meta.setdefault("ef_construction", EF_CONSTRUCTION)
+        self.meta.setdefault("ef", EF)
+        self.meta.setdefault("migrated", False)
+        self.hnsw: Optional[hnswlib.Index] = None
+        self.store: Optional[VectorStore] = None
+        self.quantizer: Optional[Quantizer] = None
+        self.codes: Optional[VectorStore] = None
+        self.unsaved = 0
+        self.attributes: dict[tuple[str, bytes], set[int]] = {}
+        self.free: set[int] = set()
+        self.marked: set[int] = set()
+        self.rebuilding = False
+        self.rebuilder: Optional[Thread] = None
+        self.touched: set[int] = set()
+        if self.meta["dim"] is not None:
+            for entry in self.labels.scan_docs(2**31 - 1, 0):
+                if "key" in entry:
+                    self.tag(entry["label"], entry.get("metadata") or {})
+                elif "free" in entry:
+                    self.free.add(entry["free"])
+            self.store = VectorStore(self.vectors_file, self.meta["dim"])
+            if self.quantization is None:
+                self.hnsw = self.load()
+                self.marked = self.free & set(self.hnsw.get_ids_list())  # type: ignore
+                self.replay()
+            elif os.path.exists(self.quantizer_file):
+                self.quantizer = Quantizer.load(self.quantizer_file)
+                self.codes = self.open_codes(self.quantizer)
+                self.encode_missing()
+
+    @classmethod
+    def lease(cls, namespace: str) -> ContextManager[VectorIndex]:
+        return HandlePool.get().lease(f"index/{namespace}", lambda _: cls(namespace))
+
+    @classmethod
+    def save_all(cls):
+        pool = HandlePool.get()
+        with pool.lock:
+            indexes = [handle for handle in pool.handles.values() if isinstance(handle, cls)]
+        for index in indexes:
+            index.save()
+
+    @property
+    def file(self) -> str:
+        return os.path.join(self.path, "hnsw.bin")
+
+    @property
+    def vectors_file(self) -> str:
+        return os.path.join(self.path, "vectors.f32")
+
+    @property
+    def codes_file(self) -> str:
+        return os.path.join(self.path, "codes.bin")
+
+    @property
+    def quantizer_file(self) -> str:
+        return os.path.join(self.path, "quantizer.npz")
+
+    @property
+    def dim(self) -> Optional[int]:
+        return self.meta["dim"]
+
+    @property
+    def quantization(self) -> Optional[QuantizationKind]:
+        return self.meta["quantization"]
+
+    @property
+    def provider(self) -> Optional[str]:
+        return self.meta["provider"]
+
+    def __len__(self) -> int:
+        if self.store is None:
+            return 0
+        return len(self.store)
+
+    @property
+    def live(self) -> int:
+        return len(self) - len(self.free)
+
+    def create(
+        self,
+        dim: int,
+        capacity: int = INITIAL_CAPACITY,
+        m: Optional[int] = None,
+        ef_construction: Optional[int] = None,
+    ) -> hnswlib.Index:
+        hnsw = hnswlib.Index(space="cosine", dim=dim)  # type: ignore
+        hnsw.init_index(  # type: ignore
+            max_elements=capacity,
+            ef_construction=ef_construction or self.meta["ef_construction"],
+            M=m or self.meta["m"],
+        )
+        hnsw.set_ef(self.meta["ef"])  # type: ignore
+        return hnsw
+
+    def load(self) -> hnswlib.Index:
+        assert self.dim is not None
+        if not os.path.exists(self.file):
+            return self.create(self.dim, max(INITIAL_CAPACITY, len(self)))
+        hnsw = hnswlib.Index(space="cosine", dim=self.dim)  # type: ignore
+        hnsw.load_index(self.file)  # type: ignore
+        hnsw.set_ef(self.meta["ef"])  # type: ignore
+        return hnsw
+
+    def open_codes(self, quantizer: Quantizer) -> VectorStore:
+        return VectorStore(self.codes_file, quantizer.code_size, quantizer.dtype)
+
+    def configure(
+        self,
+        quantization: Optional[QuantizationKind],
+        subspaces: Optional[int] = None,
+    ):
+        """
+        Switch the namespace between the HNSW graph and quantized codes.
+
+        The quantizer is trained on the stored vectors once the namespace holds
+        `TRAIN_THRESHOLD` of them, until then searches stay exact; turning
+        quantization off rebuilds the graph from the vector store.
+        """
+        with self.lock:
+            self.meta["quantization"] = quantization
+            self.meta["subspaces"] = subspaces
+            self.labels.put_doc(META, self.meta)
+            self.quantizer = None
+            self.codes = None
+            for path in (self.codes_file, self.quantizer_file, self.file):
+                if os.path.exists(path):
+                    os.remove(path)
+            self.hnsw = None
+            self.marked = set()
+            if self.store is None:
+                return
+            if quantization is None:
+                self.hnsw = self.load()
+                self.replay()
+                self.save()
+            else:
+                self.train()
+
+    def use_provider(self, provider: Optional[str]):
+        """
+        Pin the embedding provider of the namespace. Vectors of different
+        providers are not comparable, so it can only change while empty.
+        """
+        with self.lock:
+            if provider == self.provider:
+                return
+            if self.live:
+                raise ValueError(
+                    f"Namespace `{self.namespace}` already holds {self.provider or 'default'} embeddings"
+                )
+            self.meta["provider"] = provider
+            self.labels.put_doc(META, self.meta)
+
+    @property
+    def migrated(self) -> bool:
+        return self.meta["migrated"]
+
+    def mark_migrated(self):
+        """
+        Record that the documents stored before the index existed were
+        backfilled, so the document store is never scanned for them again.
+        """
+        with self.lock:
+            self.meta["migrated"] = True
+            self.labels.put_doc(META, self.meta)
+
+    def set_hnsw(
+        self,
+        m: Optional[int] = None,
+        ef_construction: Optional[int] = None,
+        ef: Optional[int] = None,
+    ):
+        """
+        Change the HNSW parameters of the namespace, `None` keeps the current
+        value. `ef` applies to the next query, a new `m` or `ef_construction`
+        rebuilds the graph from the vector store.
+        """
+        with self.lock:
+            rebuild = (m or self.meta["m"], ef_construction or self.meta["ef_construction"]) != (
+                self.meta["m"],
+                self.meta["ef_construction"],
+            )
+            self.meta["m"] = m or self.meta["m"]
+            self.meta["ef_construction"] = ef_construction or self.meta["ef_construction"]
+            self.meta["ef"] = ef or self.meta["ef"]
+            self.labels.put_doc(META, self.meta)
+            rebuild = rebuild and self.hnsw is not None
+        if rebuild:
+            self.rebuild()
+
+    def train(self):
+        """
+        Train the configured quantizer on the vector store and encode every row.
+        """
+        assert self.store is not None and self.dim is not None
+        kind = self.quantization
+        if kind is None or len(self.store) < TRAIN_THRESHOLD:
+            return
+        if kind == "pq":
+            quantizer: Quantizer = ProductQuantizer(
+                self.dim, subspaces=self.meta["subspaces"] or pq_subspaces(self.dim)
+            )
+        else:
+            quantizer = QUANTIZERS[kind](self.dim)
+        quantizer.train(self.store.matrix())
+        quantizer.save(self.quantizer_file)
+        if os.path.exists(self.codes_file):
+            os.remove(self.codes_file)
+        self.quantizer = quantizer
+        self.codes = self.open_codes(quantizer)
+        self.encode_missing()
+
+    def encode_missing(self):
+        assert self.store is not None
+        if self.quantizer is None or self.codes is None:
+            return
+        matrix = self.store.matrix()
+        for start in range(len(self.codes), len(matrix), INITIAL_CAPACITY * 16):
+            rows = np.asarray(matrix[start : start + INITIAL_CAPACITY * 16])
+            labels = np.arange(start, start + len(rows), dtype=np.int64)
+            self.codes.write(labels, self.quantizer.encode(rows))
+
+    def label_of(self, key: str) -> Optional[int]:
+        entry = self.labels.get_doc(f"k:{key}")
+        return entry["label"] if entry else None
+
+    def key_of(self, label: int) -> Optional[str]:
+        entry = self.labels.get_doc(f"l:{label}")
+        return entry["key"] if entry else None
+
+    def assign(self, key: str, metadata: dict[str, Any]) -> int:
+        label = self.label_of(key)
+        if label is None and self.free:
+            label = self.free.pop()
+            self.marked.discard(label)
+            self.labels.delete(f"f:{label}")
+            self.labels.put_doc(f"k:{key}", {"label": label})
+        elif label is None:
+            label = self.meta["next_label"]
+            self.meta["next_label"] = label + 1
+            self.labels.put_doc(f"k:{key}", {"label": label})
+            self.labels.put_doc(META, self.meta)
+        else:
+            previous = self.labels.get_doc(f"l:{label}") or {}
+            self.untag(label, previous.get("metadata") or {})
+        self.labels.put_doc(
+            f"l:{label}", {"key": key, "label": label, "metadata": metadata}
+        )
+        self.tag(label, metadata)
+        return label
+
+    def tag(self, label: int, metadata: dict[str, Any]):
+        for field, value in metadata.items():
+            self.attributes.setdefault((field, attribute(value)), set()).add(label)
+
+    def untag(self, label: int, metadata: dict[str, Any]):
+        for field, value in metadata.items():
+            self.attributes.get((field, attribute(value)), set()).discard(label)
+
+    def matching(self, where: dict[str, Any]) -> NDArray[np.int64]:
+        """
+        Labels whose metadata equals every `field: value` pair of `where`.
+        """
+        allowed: Optional[set[int]] = None
+        for field, value in where.items():
+            labels = self.attributes.get((field, attribute(value)), set())
+            allowed = set(labels) if allowed is None else allowed & labels
+            if not allowed:
+                break
+        return np.fromiter(sorted(allowed or ()), dtype=np.int64)
+
+    def stale(self) -> list[int]:
+        """
+        Labels stored in the vector store but missing from the graph, i.e. the
+        ones written after the last save of an index that was not shut down cleanly.
+        """
+        if self.hnsw is None or self.store is None:
+            return []
+        present = set(self.hnsw.get_ids_list())  # type: ignore
+        return [
+            label
+            for label in range(len(self.store))
+            if label not in present and label not in self.free
+        ]
+
+    def replay(self):
+        labels = np.asarray(self.stale(), dtype=np.int64)
+        if not len(labels):
+            return
+        assert self.hnsw is not None and self.store is not None
+        needed = int(labels.max()) + 1
+        if needed > self.hnsw.get_max_elements():
+            self.hnsw.resize_index(max(needed, self.hnsw.get_max_elements() * 2))  # type: ignore
+        self.hnsw.add_items(self.store.get(labels), labels)  # type: ignore
+        self.unsaved += len(labels)
+
+    def add(
+        self,
+        key: str,
+        vector: Iterable[float],
+        metadata: Optional[dict[str, Any]] = None,
+    ):
+        self.add_many([(key, vector)], [metadata or {}])
+
+    def add_many(
+        self,
+        items: Iterable[tuple[str, Iterable[float]]],
+        metadata: Optional[Iterable[dict[str, Any]]] = None,
+    ):
+        items = list(items)
+        metadata = list(metadata) if metadata is not None else [{}] * len(items)
+        if not items:
+            return
+        data = np.asarray([vector for _, vector in items], dtype=np.float32)
+        with self.lock:
+            if self.store is None:
+                self.meta["dim"] = int(data.shape[1])
+                self.labels.put_doc(META, self.meta)
+                self.store = VectorStore(self.vectors_file, self.meta["dim"])
+                if self.quantization is None:
+                    self.hnsw = self.create(self.meta["dim"])
+            if data.shape[1] != self.dim:
+                raise ValueError(
+                    f"Vector of dimension {data.shape[1]} does not match index dimension {self.dim}"
+                )
+            data = normalize(data)
+            labels = np.asarray(
+                [self.assign(key, md) for (key, _), md in zip(items, metadata)],
+                dtype=np.int64,
+            )
+            self.store.write(labels, data)
+            if self.rebuilding:
+                self.touched.update(labels.tolist())
+            if self.quantization is not None:
+                if self.quantizer is None:
+                    self.train()
+                elif self.codes is not None:
+                    self.codes.write(labels, self.quantizer.encode(data))
+                return
+            assert self.hnsw is not None
+            needed = int(labels.max()) + 1
+            capacity = self.hnsw.get_max_elements()
+            if needed > capacity:
+                self.hnsw.resize_index(max(needed, capacity * 2))  # type: ignore
+            self.hnsw.add_items(data, labels)  # type: ignore
+            self.unsaved += len(items)
+            if self.unsaved > max(SAVE_EVERY, SAVE_FRACTION * len(self)):
+                self.save()
+
+    def delete(self, key: str) -> bool:
+        """
+        Remove `key` from the index, leaving its label as a tombstone to be
+        reused by the next new key. Returns whether the key was indexed.
+        """
+        with self.lock:
+            label = self.label_of(key)
+            if label is None:
+                return False
+            entry = self.labels.get_doc(f"l:{label}") or {}
+            self.untag(label, entry.get("metadata") or {})
+            self.labels.delete(f"k:{key}")
+            self.labels.delete(f"l:{label}")
+            self.labels.put_doc(f"f:{label}", {"free": label})
+            self.free.add(label)
+            if self.rebuilding:
+                self.touched.add(label)
+            if self.hnsw is not None:
+                try:
+                    self.hnsw.mark_deleted(label)  # type: ignore
+                    self.marked.add(label)
+                    self.unsaved += 1
+                except RuntimeError:
+                    pass
+            if self.hnsw is not None and not self.rebuilding and (
+                len(self.marked) > TOMBSTONE_RATIO * len(self)
+            ):
+                self.rebuilding = True
+                self.rebuilder = Thread(target=self.rebuild, daemon=True)
+                self.rebuilder.start()
+            return True
+
+    def rebuild(self):
+        """
+        Rebuild the graph from the live rows of the store, dropping tombstones.
+
+        The new graph is built outside the index lock from a snapshot of the
+        live labels; labels written or deleted meanwhile are applied to it
+        before it replaces the current graph.
+        """
+        with self.lock:
+            if self.hnsw is None or self.store is None or self.dim is None:
+                self.rebuilding = False
+                return
+            self.rebuilding = True
+            self.touched = set()
+            rows = len(self.store)
+            live = np.setdiff1d(
+                np.arange(rows, dtype=np.int64), np.fromiter(self.free, dtype=np.int64)
+            )
+            data = self.store.get(live)
+        try:
+            hnsw = self.create(self.dim, max(INITIAL_CAPACITY, rows))
+            if len(live):
+                hnsw.add_items(data, live)  # type: ignore
+            with self.lock:
+                touched = np.fromiter(self.touched - self.free, dtype=np.int64)
+                if len(touched):
+                    needed = max(int(touched.max()) + 1, len(self.store))
+                    if needed > hnsw.get_max_elements():
+                        hnsw.resize_index(max(needed, hnsw.get_max_elements() * 2))  # type: ignore
+                    hnsw.add_items(self.store.get(touched), touched)  # type: ignore
+                present = set(hnsw.get_ids_list())  # type: ignore
+                self.marked = set()
+                for label in self.touched & self.free & present:
+                    hnsw.mark_deleted(label)  # type: ignore
+                    self.marked.add(label)
+                self.hnsw = hnsw
+                self.unsaved += 1
+                self.save()
+        finally:
+            with self.lock:
+                self.rebuilding = False
+                self.touched = set()
+
+    def plan(self, recall: Optional[float] = None, size: Optional[int] = None) -> Engine:
+        """
+        Pick the search engine: exact scan of the vector store when exact
+        results are requested or at most `EXACT_THRESHOLD` vectors (`size`,
+        the whole namespace by default) are searched, the quantized codes of
+        quantized namespaces, the HNSW graph otherwise.
+        """
+        if recall is not None and recall >= 1:
+            return "exact"
+        if (self.live if size is None else size) <= EXACT_THRESHOLD:
+            return "exact"
+        if self.quantizer is not None and self.codes is not None:
+            return "quantized"
+        if self.hnsw is not None:
+            return "hnsw"
+        return "exact"
+
+    def search(
+        self,
+        vector: NDArray[np.float32],
+        k: int,
+        recall: Optional[float] = None,
+        where: Optional[dict[str, Any]] = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Return the `k` nearest keys to `vector` with their cosine similarity,
+        restricted to the labels whose metadata matches `where` when given.
+
+        Filtered searches scan the matching rows exactly when there are at most
+        `EXACT_THRESHOLD` of them, over-fetch from the graph and post-filter
+        when at least `POSTFILTER_SELECTIVITY` of the namespace matches, and
+        otherwise pre-filter the graph traversal with an allowed-label bitmap.
+        """
+        return self.search_many(np.atleast_2d(vector), k, recall, where)[0]
+
+    def search_many(
+        self,
+        vectors: NDArray[np.float32],
+        k: int,
+        recall: Optional[float] = None,
+        where: Optional[dict[str, Any]] = None,
+    ) -> list[list[tuple[str, float]]]:
+        """
+        `search` for every row of `vectors`, answered by a single matrix
+        product or a single multi-threaded `knn_query` when unfiltered.
+        """
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+        with self.lock:
+            if self.store is None or self.live == 0:
+                return [[] for _ in vectors]
+            if where:
+                allowed = self.matching(where)
+                found = [self.filtered(v, k, recall, allowed) for v in vectors]
+                rows = [(labels[0], scores[0]) for labels, scores in found]
+            else:
+                engine = self.plan(recall)
+                if engine == "exact":
+                    labels, scores = self.store.search(
+                        vectors, min(k, self.live), exclude=self.tombstones()
+                    )
+                elif engine == "quantized":
+                    labels, scores = self.quantized(
+                        vectors, min(k, self.live), exclude=self.tombstones()
+                    )
+                else:
+                    labels, scores = self.knn(vectors, min(k, self.live))
+                rows = list(zip(labels, scores))
+        keys: dict[int, Optional[str]] = {}
+        results: list[list[tuple[str, float]]] = []
+        for labels, scores in rows:
+            hits: list[tuple[str, float]] = []
+            for label, score in zip(labels, scores):  # type: ignore
+                label = int(label)
+                if label not in keys:
+                    keys[label] = None if label in self.free else self.key_of(label)
+                if keys[label] is not None:
+                    hits.append((keys[label], float(score)))  # type: ignore
+            results.append(hits[:k])
+        return results
+
+    def tombstones(self) -> Optional[NDArray[np.bool_]]:
+        """
+        Mask of the free labels over the rows of the store, masked out of
+        exact and quantized scans so they never take the place of a hit.
+        """
+        if not self.free or self.store is None:
+            return None
+        mask = np.zeros(len(self.store), dtype=bool)
+        mask[np.fromiter(self.free, dtype=np.int64)] = True
+        return mask
+
+    def knn(self, vectors: NDArray[np.float32], k: int, **kwargs: Any):
+        assert self.hnsw is not None
+        self.hnsw.set_ef(max(self.meta["ef"], k))  # type: ignore
+        labels, distances = self.hnsw.knn_query(np.asarray(vectors, dtype=np.float32), k=k, **kwargs)  # type: ignore
+        return labels, 1 - distances
+
+    def quantized(
+        self,
+        vectors: NDArray[np.float32],
+        k: int,
+        labels: Optional[NDArray[np.int64]] = None,
+        exclude: Optional[NDArray[np.bool_]] = None,
+    ):
+        """
+        Scan the quantized codes for `RERANK * k` candidates per query and
+        re-rank them exactly with the float vectors of the store.
+        """
+        assert self.store is not None and self.codes is not None
+        assert self.quantizer is not None
+        vectors = normalize(np.atleast_2d(np.asarray(vectors, dtype=np.float32)))
+        candidates, _ = self.codes.search(
+            vectors, k * RERANK, labels=labels, score=self.quantizer.scores, exclude=exclude
+        )
+        scores = np.einsum("qd,qcd->qc", vectors, self.store.get(candidates))
+        if exclude is not None:
+            scores = np.where(exclude[candidates], np.float32(-np.inf), scores)
+        top = np.argsort(-scores, axis=1)[:, :k]
+        return (
+            np.take_along_axis(candidates, top, axis=1),
+            np.take_along_axis(scores, top, axis=1),
+        )
+
+    def filtered(
+        self,
+        vector: NDArray[np.float32],
+        k: int,
+        recall: Optional[float],
+        allowed: NDArray[np.int64],
+    ):
+        assert self.store is not None
+        k = min(k, len(allowed))
+        if k == 0:
+            return np.empty((1, 0), dtype=np.int64), np.empty((1, 0), dtype=np.float32)
+        engine = self.plan(recall, size=len(allowed))
+        if engine == "exact":
+            return self.store.search(vector, k, labels=allowed)
+        if engine == "quantized":
+            return self.quantized(vector, k, labels=allowed)
+        assert self.hnsw is not None
+        bitmap = np.zeros(self.hnsw.get_max_elements(), dtype=bool)
+        bitmap[allowed] = True
+        selectivity = len(allowed) / self.live
+        if selectivity < POSTFILTER_SELECTIVITY:
+            return self.knn(vector, k, num_threads=1, filter=lambda label: bitmap[label])
+        fetch = int(np.ceil(k / selectivity)) + k
+        while True:
+            fetch = min(fetch, self.live)
+            labels, scores = self.knn(vector, fetch)
+            keep = bitmap[labels[0]]
+            if keep.sum() >= k or fetch == self.live:
+                return labels[:, keep][:, :k], scores[:, keep][:, :k]
+            fetch *= 2
+
+    def close(self):
+        """
+        Save the graph and release the label database, waiting for a rebuild
+        in progress. The index can't be used afterwards.
+        """
+        if self.rebuilder is not None:
+            self.rebuilder.join()
+        with self.lock:
+            self.save()
+            self.labels.close()
+        HandlePool.get().forget(f"index/{self.namespace}", self)
+
+    def save(self):
+        with self.lock:
+            if self.hnsw is None or not self.unsaved:
+                return
+            tmp = f"{self.file}.tmp"
+            self.hnsw.save_index(tmp)  # type: ignore
+            os.replace(tmp, self.file)
+            self.unsaved = 0
+
+
+def pq_subspaces(dim: int) -> int:
+    """
+    Largest subspace count of at most `dim // 8` dividing `dim` (96 bytes for 768 dims).
+    """
+    for subspaces in range(max(1, dim // 8), 0, -1):
+        if dim % subspaces == 0:
+            return subspaces
+    return 1
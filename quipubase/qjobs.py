@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from typing import Any, ClassVar, Optional
+from uuid import uuid4
+
+from fastapi import APIRouter, File, HTTPException, Query, UploadFile
+
+from .lib import check_suffix
+from .qblob import BlobStore
+from .qdedup import DedupMode
+from .qfiles import parse_path, spool_upload
+from .qpipeline import IngestPipeline
+from .quipubase import Quipu  # pylint: disable=E0611
+from .qvector import QuipuVector, dedup_filter, write_chunks
+
+JOBS_ROOT = "db/_jobs"
+JOB_WORKERS = 2
+
+
+class JobRunner:
+    """
+    Runs uploads as background ingestion jobs that outlive the request.
+
+    Every job is a document of a RocksDB database (`db/_jobs`) holding its
+    status, the number of chunks committed so far and the `cursor`, the
+    chunker position following the last chunk committed, updated after every
+    grouped write of the pipeline. The uploaded file is kept under
+    `db/_jobs/files` until the job ends, so jobs interrupted by a restart are
+    resumed at startup from their cursor. Chunks are keyed by job and chunker
+    position, counted before deduplication, so a group committed before its
+    cursor was recorded is replayed over the same documents (or skipped as
+    duplicates) instead of shifting onto other chunks' keys. A file submitted
+    again while its job is in flight joins that job, matched by the sha256 of
+    its content, through an in-memory index of the jobs in flight kept up to
+    date with their status.
+
+    Usage:
+        runner = JobRunner.get()
+        job = await runner.submit(namespace, upload, filename)
+        runner.status(job["id"])
+    """
+
+    _instance: ClassVar[Optional[JobRunner]] = None
+
+    def __init__(self, path: str = JOBS_ROOT, workers: int = JOB_WORKERS):
+        self.files = os.path.join(path, "files")
+        os.makedirs(self.files, exist_ok=True)
+        self.db = Quipu(os.path.join(path, "jobs"))
+        self.workers = workers
+        self.slots: Optional[asyncio.Semaphore] = None
+        self.tasks: dict[str, asyncio.Task[None]] = {}
+        self.cancelled: set[str] = set()
+        self.active: dict[tuple[str, str, int, int], str] = {}
+        for job in self.jobs():
+            self.track(job)
+
+    @classmethod
+    def get(cls) -> JobRunner:
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def close(self):
+        """
+        Stop the jobs in flight, left `running` to be resumed by the next
+        process, and release the database.
+        """
+        for task in list(self.tasks.values()):
+            task.cancel()
+        self.db.close()
+        if JobRunner._instance is self:
+            JobRunner._instance = None
+
+    def status(self, job_id: str) -> Optional[dict[str, Any]]:
+        return self.db.get_doc(job_id)
+
+    def update(self, job: dict[str, Any], **changes: Any) -> dict[str, Any]:
+        job.update(changes, updated=time.time())
+        self.db.put_doc(job["id"], job)
+        self.track(job)
+        return job
+
+    def track(self, job: dict[str, Any]):
+        key = (job["namespace"], job["sha256"], job["size"], job["overlap"])
+        if job["status"] in ("queued", "running"):
+            self.active[key] = job["id"]
+        elif self.active.get(key) == job["id"]:
+            del self.active[key]
+
+    def jobs(self) -> list[dict[str, Any]]:
+        return list(self.db.scan_docs(2**31 - 1, 0))
+
+    def in_flight(
+        self, namespace: str, sha256: str, size: int, overlap: int
+    ) -> Optional[dict[str, Any]]:
+        """
+        The queued or running job ingesting the same content with the same settings.
+        """
+        job_id = self.active.get((namespace, sha256, size, overlap))
+        return None if job_id is None else self.status(job_id)
+
+    async def submit(
+        self,
+        namespace: str,
+        file: UploadFile,
+        size: int,
+        overlap: int,
+        dedup: DedupMode = "exact",
+    ) -> dict[str, Any]:
+        upload = await spool_upload(file, directory=self.files)
+        running = self.in_flight(namespace, upload.sha256, size, overlap)
+        if running is not None:
+            upload.remove()
+            return running
+        job_id = str(uuid4())
+        job = self.update(
+            {
+                "id": job_id,
+                "namespace": namespace,
+                "filename": file.filename,
+                "suffix": check_suffix(file),
+                "path": upload.path.as_posix(),
+                "sha256": upload.sha256,
+                "bytes": upload.size,
+                "size": size,
+                "overlap": overlap,
+                "dedup": dedup,
+                "status": "queued",
+                "chunks": 0,
+                "cursor": 0,
+                "images": [],
+                "error": None,
+                "created": time.time(),
+            }
+        )
+        self.start(job_id)
+        return job
+
+    def start(self, job_id: str):
+        self.tasks[job_id] = asyncio.ensure_future(self.run(job_id))
+        self.tasks[job_id].add_done_callback(lambda _: self.tasks.pop(job_id, None))
+
+    def resume(self):
+        """
+        Restart the jobs left queued or running by the previous process.
+        """
+        for job_id in list(self.active.values()):
+            if job_id not in self.tasks:
+                self.start(job_id)
+
+    def cancel(self, job_id: str) -> Optional[dict[str, Any]]:
+        job = self.status(job_id)
+        if job is None or job["status"] not in ("queued", "running"):
+            return job
+        job = self.update(job, status="cancelled")
+        self.cancelled.add(job_id)
+        task = self.tasks.get(job_id)
+        if task is not None:
+            task.cancel()
+        else:
+            self.discard(job)
+        return job
+
+    def discard(self, job: dict[str, Any]):
+        if os.path.exists(job["path"]):
+            os.remove(job["path"])
+
+    async def run(self, job_id: str):
+        if self.slots is None:
+            self.slots = asyncio.Semaphore(self.workers)
+        async with self.slots:
+            job = self.status(job_id)
+            if job is None or job["status"] not in ("queued", "running"):
+                return
+            job = self.update(job, status="running")
+            namespace = job["namespace"]
+            embedder = QuipuVector(content="", namespace=namespace)
+
+            async def embed(chunks: list[str]) -> list[list[float]]:
+                return await embedder.embed(namespace=namespace, content=chunks)
+
+            async def write(chunks: list[str], vectors: list[list[float]], positions: list[int]):
+                keys = [f"{job_id}-{position}" for position in positions]
+                await write_chunks(chunks, vectors, namespace, keys)
+                self.update(job, chunks=job["chunks"] + len(chunks), cursor=positions[-1] + 1)
+
+            pipeline = IngestPipeline(
+                embed,
+                write,
+                size=job["size"],
+                overlap=job["overlap"],
+                skip=job.get("cursor", job["chunks"]),
+                select=dedup_filter(namespace, job.get("dedup", "none")),
+            )
+            try:
+                source = parse_path(job["suffix"], job["path"], size=job["size"])
+                async for item in pipeline.run(source):
+                    if isinstance(item, bytes):
+                        digest = BlobStore.get().put(item)
+                        if digest not in job["images"]:
+                            self.update(job, images=[*job["images"], digest])
+            except asyncio.CancelledError:
+                if job_id in self.cancelled:
+                    self.update(job, status="cancelled")
+                    self.discard(job)
+                raise
+            except Exception as e:  # pylint: disable=W0718
+                self.update(job, status="failed", error=str(e))
+                self.discard(job)
+                return
+            self.update(job, status="done", metrics=pipeline.metrics())
+            self.discard(job)
+
+
+app = APIRouter(tags=["Ingestion Jobs"])
+
+
+@app.post("/jobs/{namespace}")
+async def submit_job(
+    namespace: str,
+    file: UploadFile = File(...),
+    chunkSize: int = Query(256, gt=0, description="The target size of a chunk in tokens"),
+    overlap: int = Query(32, ge=0, description="The tokens repeated between consecutive chunks"),
+    dedup: DedupMode = Query(
+        "exact", description="Skip chunks already ingested: none, exact or near duplicates"
+    ),
+) -> dict[str, Any]:
+    """
+    Ingest a document in the background, returning the job to poll.
+    """
+    assert file.filename, "No file name provided"
+    assert overlap < chunkSize, "The overlap must be smaller than the chunk size"
+    return await JobRunner.get().submit(namespace, file, chunkSize, overlap, dedup)
+
+
+@app.get("/jobs/{job_id}")
+async def job_status(job_id: str) -> dict[str, Any]:
+    """
+    Status and committed chunks of an ingestion job.
+    """
+    job = JobRunner.get().status(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
+@app.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str) -> dict[str, Any]:
+    """
+    Cancel a queued or running ingestion job, keeping the chunks already committed.
+    """
+    job = JobRunner.get().cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
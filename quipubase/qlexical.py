@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import heapq
+import math
+import os
+import re
+from collections import Counter, OrderedDict
+from threading import RLock
+from typing import Any, ContextManager, Iterable, Optional
+
+from .qshard import HandlePool
+from .quipubase import Quipu  # pylint: disable=E0611
+
+LEXICAL_ROOT = "db/_index"
+K1 = 1.2
+B = 0.75
+RRF_K = 60
+POSTINGS_CACHE = 4096
+META = "__meta__"
+TOKEN = re.compile(r"\w+(?:[-./]\w+)*", re.UNICODE)
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Lowercased word tokens, keeping codes such as `AB-1234` or `v2.1` whole.
+    """
+    return TOKEN.findall(text.lower())
+
+
+def rrf(rankings: Iterable[list[tuple[str, float]]], k: int = RRF_K) -> list[tuple[str, float]]:
+    """
+    Reciprocal rank fusion: every key scores `sum(1 / (k + rank))` over the
+    rankings it appears in, so lexical and vector scores of unrelated scales
+    are fused by position alone.
+    """
+    fused: dict[str, float] = {}
+    for ranking in rankings:
+        for rank, (key, _) in enumerate(ranking, start=1):
+            fused[key] = fused.get(key, 0.0) + 1 / (k + rank)
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
+
+
+class LexicalIndex:
+    """
+    BM25 inverted index over the `content` of one vector namespace.
+
+    Postings live in a RocksDB database next to the vector index
+    (`db/_index/{namespace}/lexicon`), one entry per term and key
+    (`t:{term}:{key}` -> term frequency and document length), so indexing a
+    document writes one small value per term and a query reads the postings
+    of a term with a single prefix scan, never touching the documents. The
+    postings of hot terms are kept in an in-memory LRU of `POSTINGS_CACHE`
+    terms. Open indexes are leased from the `HandlePool` as
+    `lexicon/{namespace}`.
+
+    Usage:
+        with LexicalIndex.lease("my-namespace") as lexicon:
+            lexicon.add("doc-key", "Replacement filter AB-1234")
+            lexicon.search("ab-1234", k=5)
+    """
+
+    def __init__(
+        self, namespace: str, root: str = LEXICAL_ROOT, capacity: int = POSTINGS_CACHE
+    ):
+        self.namespace = namespace
+        path = os.path.join(root, namespace)
+        os.makedirs(path, exist_ok=True)
+        self.db = Quipu(os.path.join(path, "lexicon"))
+        self.lock = RLock()
+        self.meta: dict[str, Any] = self.db.get_doc(META) or {"docs": 0, "length": 0}
+        self.capacity = capacity
+        self.cache: OrderedDict[str, dict[str, tuple[int, int]]] = OrderedDict()
+
+    @classmethod
+    def lease(cls, namespace: str) -> ContextManager[LexicalIndex]:
+        return HandlePool.get().lease(f"lexicon/{namespace}", lambda _: cls(namespace))
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+            self.cache.clear()
+        HandlePool.get().forget(f"lexicon/{self.namespace}", self)
+
+    def __len__(self) -> int:
+        return self.meta["docs"]
+
+    def postings(self, term: str) -> dict[str, tuple[int, int]]:
+        with self.lock:
+            if term in self.cache:
+                self.cache.move_to_end(term)
+                return self.cache[term]
+            prefix = f"t:{term}:"
+            postings = {
+                key[len(prefix) :]: (entry["tf"], entry["length"])
+                for key, entry in self.db.scan_prefix(prefix)
+            }
+            self.cache[term] = postings
+            while len(self.cache) > self.capacity:
+                self.cache.popitem(last=False)
+            return postings
+
+    def add(self, key: str, text: str):
+        """
+        Index `text` under `key`, replacing what the key held before.
+        """
+        terms = Counter(tokenize(text))
+        length = sum(terms.values())
+        with self.lock:
+            self.remove(key)
+            for term, tf in terms.items():
+                self.db.put_doc(f"t:{term}:{key}", {"tf": tf, "length": length})
+                self.cache.pop(term, None)
+            self.db.put_doc(f"d:{key}", {"terms": list(terms), "length": length})
+            self.meta["docs"] += 1
+            self.meta["length"] += length
+            self.db.put_doc(META, self.meta)
+
+    def remove(self, key: str):
+        with self.lock:
+            entry = self.db.get_doc(f"d:{key}")
+            if entry is None:
+                return
+            for term in entry["terms"]:
+                self.db.delete(f"t:{term}:{key}")
+                self.cache.pop(term, None)
+            self.db.delete(f"d:{key}")
+            self.meta["docs"] -= 1
+            self.meta["length"] -= entry["length"]
+            self.db.put_doc(META, self.meta)
+
+    def search(
+        self, text: str, k: int, allowed: Optional[set[str]] = None
+    ) -> list[tuple[str, float]]:
+        """
+        The `k` best BM25 matches of `text`, optionally restricted to the keys in `allowed`.
+        """
+        docs = self.meta["docs"]
+        if not docs:
+            return []
+        average = self.meta["length"] / docs
+        scores: dict[str, float] = {}
+        for term in set(tokenize(text)):
+            postings = self.postings(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (docs - len(postings) + 0.5) / (len(postings) + 0.5))
+            for key, (tf, length) in postings.items():
+                if allowed is not None and key not in allowed:
+                    continue
+                norm = tf + K1 * (1 - B + B * length / average)
+                scores[key] = scores.get(key, 0.0) + idf * tf * (K1 + 1) / norm
+        return heapq.nlargest(k, scores.items(), key=lambda item: item[1])
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import re
+from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar, Optional, Type, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .qstore import normalize
+
+LOCAL_MODEL = "hashing"
+LOCAL_WORKERS = min(8, os.cpu_count() or 1)
+LOCAL_BATCH = 64
+DEFAULT_DIM = 768
+TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+class LocalModel(ABC):
+    """
+    An embedding model evaluated in-process on the CPU.
+
+    Implementations encode a whole batch at once and must be safe to call
+    from several threads, `LocalEmbeddings` spreads batches over a pool.
+    """
+
+    name: ClassVar[str]
+
+    @abstractmethod
+    def encode(self, texts: list[str], dim: int) -> NDArray[np.float32]:
+        """L2-normalized embeddings, shaped `(len(texts), dim)`."""
+
+
+class HashingEmbedder(LocalModel):
+    """
+    Deterministic feature-hashing embedder: every unigram and bigram of the
+    lowercased text is hashed with blake2b into a signed bucket of a `dim`
+    vector weighted by `1 + log(tf)`. It needs no weights or network, gives
+    the same vectors in every process and keeps lexical neighbours close,
+    which makes it the backend of offline tests and benchmarks.
+    """
+
+    name = "hashing"
+
+    @staticmethod
+    def features(text: str) -> Counter[str]:
+        tokens = TOKEN.findall(text.lower())
+        return Counter(tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])])
+
+    @staticmethod
+    def bucket(feature: str, dim: int) -> tuple[int, float]:
+        digest = int.from_bytes(
+            hashlib.blake2b(feature.encode(), digest_size=8).digest(), "little"
+        )
+        return (digest >> 1) % dim, 1.0 if digest & 1 else -1.0
+
+    def encode(self, texts: list[str], dim: int) -> NDArray[np.float32]:
+        data = np.zeros((len(texts), dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, count in self.features(text).items():
+                column, sign = self.bucket(feature, dim)
+                data[row, column] += sign * (1 + np.log(count))
+        return normalize(data)
+
+
+class LocalEmbeddings:
+    """
+    In-process CPU embedding provider with the interface of `QuipuEmbeddings`.
+
+    Texts are split in batches of `LOCAL_BATCH` encoded concurrently on a
+    shared thread pool, so embedding is colocated with storage and never pays
+    a network round trip.
+
+    Usage:
+        embeddings = LocalEmbeddings()
+        vectors = await embeddings.encode(["Hello", "world"], dim=384)
+    """
+
+    models: ClassVar[dict[str, Type[LocalModel]]] = {"hashing": HashingEmbedder}
+    _models: ClassVar[dict[str, LocalModel]] = {}
+    _executor: ClassVar[Optional[ThreadPoolExecutor]] = None
+
+    def __init__(self, model: str = LOCAL_MODEL):
+        assert model in self.models, f"Unknown local embedding model `{model}`"
+        if model not in self._models:
+            self._models[model] = self.models[model]()
+        self.model = model
+
+    @classmethod
+    def register(cls, model: Type[LocalModel]):
+        cls.models[model.name] = model
+        return model
+
+    @classmethod
+    def executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=LOCAL_WORKERS, thread_name_prefix="quipu-embed"
+            )
+        return cls._executor
+
+    def encode_sync(self, texts: list[str], dim: Optional[int] = None) -> NDArray[np.float32]:
+        return self._models[self.model].encode(texts, dim or DEFAULT_DIM)
+
+    async def encode(self, text: Union[str, list[str]], dim: Optional[int] = None):
+        """
+        Encodes the given text into vectors on the local thread pool.
+
+        Args:
+            text (str | list[str]): The text or list of texts to be encoded.
+            dim (int | None): The dimension of the vectors, 768 by default.
+
+        Returns:
+            list[float] | list[list[float]]: The vector of `text`, or one vector per text.
+        """
+        texts = [text] if isinstance(text, str) else list(text)
+        loop = asyncio.get_running_loop()
+        batches = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self.executor(), self.encode_sync, texts[i : i + LOCAL_BATCH], dim
+                )
+                for i in range(0, len(texts), LOCAL_BATCH)
+            )
+        )
+        result = np.concatenate(batches).tolist() if batches else []
+        return result[0] if isinstance(text, str) else result
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, ClassVar, Optional, Union
+
+from .qchunk import CHUNK_OVERLAP, CHUNK_TOKENS, Chunker
+
+EMBED_BATCH = 32
+EMBED_WORKERS = 4
+QUEUE_SIZE = 8
+WRITE_GROUP = 4
+
+Embed = Callable[[list[str]], Awaitable[list[list[float]]]]
+Write = Callable[[list[str], list[list[float]], list[int]], Awaitable[Any]]
+Select = Callable[[list[str]], list[str]]
+
+
+@dataclass
+class StageMetrics:
+    items: int = 0
+    busy: float = 0.0
+
+    def record(self, items: int, started: float):
+        self.items += items
+        self.busy += time.perf_counter() - started
+
+    def report(self) -> dict[str, float]:
+        return {
+            "items": self.items,
+            "busy_seconds": self.busy,
+            "items_per_second": self.items / self.busy if self.busy else 0.0,
+        }
+
+
+def selected(numbered: list[tuple[str, int]], fresh: list[str]) -> list[tuple[str, int]]:
+    """
+    The numbered chunks kept by a `Select`, which returns a subsequence of its input.
+    """
+    kept: list[tuple[str, int]] = []
+    remaining = iter(fresh)
+    wanted = next(remaining, None)
+    for chunk, position in numbered:
+        if chunk == wanted:
+            kept.append((chunk, position))
+            wanted = next(remaining, None)
+    return kept
+
+
+class IngestPipeline:
+    """
+    Ingestion as four stages joined by bounded queues:
+
+    parse -> chunk -> embed (`workers` concurrent calls) -> write (grouped commits)
+
+    Every queue holds at most `queue_size` items, so a slow stage applies
+    backpressure upstream instead of buffering the document, and the stages
+    overlap so throughput is bound by the slowest one rather than their sum.
+    Batches are committed in document order, so the chunks written always
+    form a prefix of the document and a run can resume after `skip` of them.
+    When given, `select` filters every batch of chunks before it is embedded,
+    dropping the ones already ingested (see `ChunkDeduper`). `write` receives
+    the position of every chunk in the chunker output, counted before `skip`
+    and `select`, so positions are stable across runs of the same document
+    and the last one written plus one is the `skip` of the next run.
+    Written chunks and parsed images are yielded as they complete.
+
+    Usage:
+        pipeline = IngestPipeline(embed, write)
+        async for item in pipeline.run(parse_file(file, path)):
+            ...
+        pipeline.metrics()
+    """
+
+    totals: ClassVar[dict[str, StageMetrics]] = {}
+
+    def __init__(
+        self,
+        embed: Embed,
+        write: Write,
+        size: int = CHUNK_TOKENS,
+        overlap: int = CHUNK_OVERLAP,
+        workers: int = EMBED_WORKERS,
+        batch: int = EMBED_BATCH,
+        queue_size: int = QUEUE_SIZE,
+        skip: int = 0,
+        select: Optional[Select] = None,
+    ):
+        self.embed = embed
+        self.write = write
+        self.chunker = Chunker(size=size, overlap=overlap)
+        self.workers = workers
+        self.batch = batch
+        self.skip = skip
+        self.select = select
+        self.texts: asyncio.Queue[Optional[str]] = asyncio.Queue(queue_size)
+        self.batches: asyncio.Queue[Optional[tuple[int, list[str], list[int]]]] = asyncio.Queue(
+            queue_size
+        )
+        self.vectors: asyncio.Queue[
+            Optional[tuple[int, list[str], list[list[float]], list[int]]]
+        ] = asyncio.Queue(queue_size)
+        self.output: asyncio.Queue[Union[str, bytes, BaseException, None]] = asyncio.Queue(
+            queue_size
+        )
+        self.stages = {
+            name: StageMetrics() for name in ("parse", "chunk", "dedup", "embed", "write")
+        }
+
+    async def parse(self, source: AsyncIterator[Union[str, bytes]]):
+        started = time.perf_counter()
+        async for item in source:
+            self.stages["parse"].record(1, started)
+            if isinstance(item, bytes):
+                await self.output.put(item)
+            else:
+                await self.texts.put(item)
+            started = time.perf_counter()
+        await self.texts.put(None)
+
+    async def chunk(self):
+        sequence = 0
+        position = 0
+        pending: list[tuple[str, int]] = []
+        while True:
+            text = await self.texts.get()
+            started = time.perf_counter()
+            chunks = self.chunker.flush() if text is None else self.chunker.feed(text)
+            self.stages["chunk"].record(len(chunks), started)
+            numbered = [(chunk, position + i) for i, chunk in enumerate(chunks)]
+            position += len(chunks)
+            numbered = [item for item in numbered if item[1] >= self.skip]
+            if self.select is not None and numbered:
+                started = time.perf_counter()
+                fresh = selected(numbered, self.select([chunk for chunk, _ in numbered]))
+                self.stages["dedup"].record(len(numbered) - len(fresh), started)
+                numbered = fresh
+            pending.extend(numbered)
+            while len(pending) >= self.batch or (text is None and pending):
+                batch = pending[: self.batch]
+                await self.batches.put(
+                    (sequence, [chunk for chunk, _ in batch], [at for _, at in batch])
+                )
+                pending = pending[self.batch :]
+                sequence += 1
+            if text is None:
+                break
+        for _ in range(self.workers):
+            await self.batches.put(None)
+
+    async def embed_worker(self):
+        while (item := await self.batches.get()) is not None:
+            sequence, chunks, positions = item
+            started = time.perf_counter()
+            vectors = await self.embed(chunks)
+            self.stages["embed"].record(len(chunks), started)
+            await self.vectors.put((sequence, chunks, vectors, positions))
+        await self.vectors.put(None)
+
+    async def writer(self):
+        done = 0
+        following = 0
+        ready: dict[int, tuple[list[str], list[list[float]], list[int]]] = {}
+        while done < self.workers:
+            item = await self.vectors.get()
+            while True:
+                if item is None:
+                    done += 1
+                else:
+                    ready[item[0]] = (item[1], item[2], item[3])
+                if self.vectors.empty():
+                    break
+                item = self.vectors.get_nowait()
+            while following in ready:
+                group: list[tuple[list[str], list[list[float]], list[int]]] = []
+                while following in ready and len(group) < WRITE_GROUP:
+                    group.append(ready.pop(following))
+                    following += 1
+                started = time.perf_counter()
+                chunks = [chunk for batch, _, _ in group for chunk in batch]
+                await self.write(
+                    chunks,
+                    [v for _, vectors, _ in group for v in vectors],
+                    [at for _, _, positions in group for at in positions],
+                )
+                self.stages["write"].record(len(chunks), started)
+                for chunk in chunks:
+                    await self.output.put(chunk)
+
+    async def supervise(self, source: AsyncIterator[Union[str, bytes]]):
+        tasks = [
+            asyncio.ensure_future(self.parse(source)),
+            asyncio.ensure_future(self.chunk()),
+            *(asyncio.ensure_future(self.embed_worker()) for _ in range(self.workers)),
+            asyncio.ensure_future(self.writer()),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+            await self.output.put(None)
+        except BaseException as e:  # pylint: disable=W0718
+            for task in tasks:
+                task.cancel()
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            await self.output.put(e)
+
+    async def run(
+        self, source: AsyncIterator[Union[str, bytes]]
+    ) -> AsyncIterator[Union[str, bytes]]:
+        supervisor = asyncio.ensure_future(self.supervise(source))
+        try:
+            while (item := await self.output.get()) is not None:
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            supervisor.cancel()
+            for name, stage in self.stages.items():
+                total = self.totals.setdefault(name, StageMetrics())
+                total.items += stage.items
+                total.busy += stage.busy
+
+    def metrics(self) -> dict[str, dict[str, float]]:
+        return {name: stage.report() for name, stage in self.stages.items()}
+
+    @classmethod
+    def total_metrics(cls) -> dict[str, dict[str, float]]:
+        return {name: stage.report() for name, stage in cls.totals.items()}
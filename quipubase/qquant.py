@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import ClassVar, Literal, Type
+
+import numpy as np
+from numpy.typing import NDArray
+
+QuantizationKind = Literal["int8", "pq"]
+
+TRAIN_SAMPLE = 20_000
+KMEANS_ITERATIONS = 12
+
+
+class Quantizer(ABC):
+    """
+    Compresses the normalized float32 rows of a `VectorStore` into compact
+    codes scanned for candidates, which are then re-ranked from the floats.
+
+    Usage:
+        quantizer = ScalarQuantizer(dim=768)
+        quantizer.train(vectors)
+        codes = quantizer.encode(vectors)
+        approx = quantizer.scores(queries, codes)
+    """
+
+    kind: ClassVar[QuantizationKind]
+    dtype: ClassVar[type[np.generic]]
+
+    def __init__(self, dim: int):
+        self.dim = dim
+
+    @property
+    @abstractmethod
+    def code_size(self) -> int: ...
+
+    @abstractmethod
+    def train(self, data: NDArray[np.float32]): ...
+
+    @abstractmethod
+    def encode(self, data: NDArray[np.float32]) -> NDArray[np.generic]: ...
+
+    @abstractmethod
+    def scores(
+        self, queries: NDArray[np.float32], codes: NDArray[np.generic]
+    ) -> NDArray[np.float32]:
+        """Approximate inner products, shaped `(len(queries), len(codes))`."""
+
+    @abstractmethod
+    def state(self) -> dict[str, NDArray[np.generic]]: ...
+
+    @abstractmethod
+    def restore(self, state: dict[str, NDArray[np.generic]]): ...
+
+    def save(self, path: str):
+        with open(path, "wb") as f:
+            np.savez(f, kind=np.array(self.kind), dim=np.array(self.dim), **self.state())
+
+    @staticmethod
+    def load(path: str) -> Quantizer:
+        with np.load(path) as state:
+            klass = QUANTIZERS[str(state["kind"])]  # type: ignore
+            quantizer = klass.from_state(int(state["dim"]), dict(state))
+        return quantizer
+
+    @classmethod
+    def from_state(cls, dim: int, state: dict[str, NDArray[np.generic]]) -> Quantizer:
+        quantizer = cls(dim)
+        quantizer.restore(state)
+        return quantizer
+
+
+def sample(data: NDArray[np.float32], size: int = TRAIN_SAMPLE) -> NDArray[np.float32]:
+    if len(data) <= size:
+        return np.asarray(data, dtype=np.float32)
+    rows = np.random.default_rng(0).choice(len(data), size=size, replace=False)
+    return np.asarray(data[np.sort(rows)], dtype=np.float32)
+
+
+class ScalarQuantizer(Quantizer):
+    """
+    Symmetric per-dimension int8 quantization, 4x smaller than float32.
+    """
+
+    kind = "int8"
+    dtype = np.int8
+
+    def __init__(self, dim: int):
+        super().__init__(dim)
+        self.scale = np.ones(dim, dtype=np.float32)
+
+    @property
+    def code_size(self) -> int:
+        return self.dim
+
+    def train(self, data: NDArray[np.float32]):
+        peak = np.abs(sample(data)).max(axis=0)
+        peak[peak == 0] = 1
+        self.scale = (peak / 127).astype(np.float32)
+
+    def encode(self, data: NDArray[np.float32]) -> NDArray[np.int8]:
+        return np.clip(np.rint(data / self.scale), -127, 127).astype(np.int8)
+
+    def scores(self, queries: NDArray[np.float32], codes: NDArray[np.generic]):
+        return (queries * self.scale) @ codes.astype(np.float32).T
+
+    def state(self):
+        return {"scale": self.scale}
+
+    def restore(self, state: dict[str, NDArray[np.generic]]):
+        self.scale = state["scale"].astype(np.float32)
+
+
+class ProductQuantizer(Quantizer):
+    """
+    Product quantization: every vector is split into `subspaces` chunks, each
+    replaced by the uint8 id of its nearest of 256 k-means centroids, so a
+    768-dim vector fits in `subspaces` bytes. Queries are scored with
+    per-subspace lookup tables (asymmetric distance computation).
+    """
+
+    kind = "pq"
+    dtype = np.uint8
+
+    def __init__(self, dim: int, subspaces: int = 48):
+        super().__init__(dim)
+        if dim % subspaces:
+            raise ValueError(f"dim {dim} is not divisible by {subspaces} subspaces")
+        self.subspaces = subspaces
+        self.centroids = np.zeros((subspaces, 256, dim // subspaces), dtype=np.float32)
+
+    @property
+    def code_size(self) -> int:
+        return self.subspaces
+
+    def split(self, data: NDArray[np.float32]) -> NDArray[np.float32]:
+        return np.asarray(data, dtype=np.float32).reshape(len(data), self.subspaces, -1)
+
+    def train(self, data: NDArray[np.float32]):
+        parts = self.split(sample(data))
+        rng = np.random.default_rng(0)
+        for j in range(self.subspaces):
+            points = parts[:, j, :]
+            seeds = rng.choice(len(points), size=256, replace=len(points) < 256)
+            centroids = points[seeds].copy()
+            for _ in range(KMEANS_ITERATIONS):
+                members = np.zeros((256, len(points)), dtype=np.float32)
+                members[nearest(points, centroids), np.arange(len(points))] = 1
+                sums = members @ points
+                counts = members.sum(axis=1, keepdims=True)
+                centroids = np.where(counts > 0, sums / np.maximum(counts, 1), centroids)
+            self.centroids[j] = centroids
+
+    def encode(self, data: NDArray[np.float32]) -> NDArray[np.uint8]:
+        parts = self.split(data)
+        codes = np.empty((len(parts), self.subspaces), dtype=np.uint8)
+        for j in range(self.subspaces):
+            codes[:, j] = nearest(parts[:, j, :], self.centroids[j])
+        return codes
+
+    def scores(self, queries: NDArray[np.float32], codes: NDArray[np.generic]):
+        tables = np.einsum("qjd,jkd->qjk", self.split(queries), self.centroids)
+        columns = np.arange(self.subspaces)
+        return np.stack(
+            [table[columns, codes].sum(axis=1) for table in tables]
+        ).astype(np.float32)
+
+    def state(self):
+        return {"centroids": self.centroids}
+
+    def restore(self, state: dict[str, NDArray[np.generic]]):
+        self.centroids = state["centroids"].astype(np.float32)
+        self.subspaces = len(self.centroids)
+
+    @classmethod
+    def from_state(cls, dim: int, state: dict[str, NDArray[np.generic]]) -> Quantizer:
+        quantizer = cls(dim, subspaces=len(state["centroids"]))
+        quantizer.restore(state)
+        return quantizer
+
+
+def nearest(points: NDArray[np.float32], centroids: NDArray[np.float32]) -> NDArray[np.int64]:
+    distances = (
+        (points**2).sum(axis=1, keepdims=True)
+        - 2 * points @ centroids.T
+        + (centroids**2).sum(axis=1)
+    )
+    return distances.argmin(axis=1)
+
+
+QUANTIZERS: dict[str, Type[Quantizer]] = {
+    "int8": ScalarQuantizer,
+    "pq": ProductQuantizer,
+}
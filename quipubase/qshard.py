@@ -0,0 +1,455 @@
+from __future__ import annotations
+
+import heapq
+import os
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from threading import Event, RLock
+from typing import Any, Callable, ClassVar, Iterable, Iterator, Optional, Protocol, TypeVar
+
+import orjson
+
+from .const import MAX_OPEN_DATABASES, SHARD_NODES, SHARDS
+from .quipubase import Quipu  # pylint: disable=E0611
+
+T = TypeVar("T")
+
+
+class Closeable(Protocol):
+    def close(self) -> None: ...
+
+SHARDS_FILE = "SHARDS"
+
+_pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix="quipu-shard")
+
+
+def _encode(obj: Any) -> Any:
+    if isinstance(obj, bytes):
+        return obj.decode()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class Transport(ABC):
+    """
+    The operations a storage node must serve to hold one shard of a namespace.
+
+    Remote nodes implement this over their own wire protocol, `LocalShard`
+    serves a RocksDB directory on this host and `InProcessNode` stands in for
+    a remote node by round-tripping every call through serialized payloads.
+    """
+
+    @abstractmethod
+    def put_doc(self, key: str, value: dict[str, Any]) -> None: ...
+
+    @abstractmethod
+    def get_doc(self, key: str) -> Optional[dict[str, Any]]: ...
+
+    @abstractmethod
+    def merge_doc(self, key: str, value: dict[str, Any]) -> None: ...
+
+    @abstractmethod
+    def delete_doc(self, key: str) -> None: ...
+
+    @abstractmethod
+    def exists(self, key: str) -> bool: ...
+
+    @abstractmethod
+    def count(self) -> int: ...
+
+    @abstractmethod
+    def scan_docs(
+        self, limit: int, offset: int, keys_only: bool = False
+    ) -> list[Any]: ...
+
+    @abstractmethod
+    def find_docs(
+        self, limit: int, offset: int, kwargs: dict[str, Any]
+    ) -> list[dict[str, Any]]: ...
+
+    def close(self) -> None:
+        """Release the resources held by the shard, a no-op by default."""
+
+
+class LocalShard(Transport):
+    """A shard stored in a RocksDB directory on this host."""
+
+    def __init__(self, path: str):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.db = Quipu(path)
+
+    def put_doc(self, key: str, value: dict[str, Any]) -> None:
+        self.db.put_doc(key, value)
+
+    def get_doc(self, key: str) -> Optional[dict[str, Any]]:
+        return self.db.get_doc(key)
+
+    def merge_doc(self, key: str, value: dict[str, Any]) -> None:
+        self.db.merge_doc(key, value)
+
+    def delete_doc(self, key: str) -> None:
+        self.db.delete_doc(key)
+
+    def exists(self, key: str) -> bool:
+        return self.db.exists(key)
+
+    def count(self) -> int:
+        return self.db.count()
+
+    def scan_docs(self, limit: int, offset: int, keys_only: bool = False):
+        return self.db.scan_docs(limit, offset, keys_only)
+
+    def find_docs(self, limit: int, offset: int, kwargs: dict[str, Any]):
+        return self.db.find_docs(limit, offset, kwargs)
+
+    def close(self) -> None:
+        self.db.close()
+
+
+class InProcessNode(Transport):
+    """
+    Stand-in for a remote storage node.
+
+    Every call is encoded as a request payload and answered with an encoded
+    response, exactly as a network transport would, but dispatched to a
+    `LocalShard` in this process.
+    """
+
+    def __init__(self, path: str):
+        self.node = LocalShard(path)
+
+    def call(self, method: str, **params: Any) -> Any:
+        request = orjson.dumps({"method": method, "params": params})
+        payload = orjson.loads(request)
+        result = getattr(self.node, payload["method"])(**payload["params"])
+        response = orjson.dumps({"result": result}, default=_encode)
+        return orjson.loads(response)["result"]
+
+    def put_doc(self, key: str, value: dict[str, Any]) -> None:
+        self.call("put_doc", key=key, value=value)
+
+    def get_doc(self, key: str) -> Optional[dict[str, Any]]:
+        return self.call("get_doc", key=key)
+
+    def merge_doc(self, key: str, value: dict[str, Any]) -> None:
+        self.call("merge_doc", key=key, value=value)
+
+    def delete_doc(self, key: str) -> None:
+        self.call("delete_doc", key=key)
+
+    def exists(self, key: str) -> bool:
+        return self.call("exists", key=key)
+
+    def count(self) -> int:
+        return self.call("count")
+
+    def scan_docs(self, limit: int, offset: int, keys_only: bool = False):
+        if keys_only:
+            return [
+                k.encode()
+                for k in self.call(
+                    "scan_docs", limit=limit, offset=offset, keys_only=keys_only
+                )
+            ]
+        return self.call("scan_docs", limit=limit, offset=offset, keys_only=keys_only)
+
+    def find_docs(self, limit: int, offset: int, kwargs: dict[str, Any]):
+        return self.call("find_docs", limit=limit, offset=offset, kwargs=kwargs)
+
+    def close(self) -> None:
+        self.node.close()
+
+
+TRANSPORTS: dict[str, Callable[[str], Transport]] = {
+    "file": LocalShard,
+    "inproc": InProcessNode,
+}
+
+
+def register_transport(scheme: str, factory: Callable[[str], Transport]):
+    """
+    Register the factory used to open shards whose node URI starts with `scheme://`.
+    """
+    TRANSPORTS[scheme] = factory
+
+
+def open_transport(uri: str) -> Transport:
+    """
+    Open a shard from its node URI, plain paths are served by `LocalShard`.
+    """
+    scheme, sep, location = uri.partition("://")
+    if not sep:
+        return LocalShard(uri)
+    if scheme not in TRANSPORTS:
+        raise ValueError(f"No transport registered for `{scheme}://`")
+    return TRANSPORTS[scheme](location)
+
+
+def stored_shards(path: str) -> Optional[int]:
+    """
+    Number of local shards the namespace at `path` was created with, read from
+    its `SHARDS` file or, for namespaces created before it, from its layout.
+    """
+    marker = os.path.join(path, SHARDS_FILE)
+    if os.path.exists(marker):
+        with open(marker, encoding="utf-8") as f:
+            return int(f.read().strip())
+    if os.path.exists(os.path.join(path, "CURRENT")):
+        return 1
+    if os.path.isdir(path):
+        layout = [entry for entry in os.listdir(path) if entry.startswith("shard-")]
+        if layout:
+            return len(layout)
+    return None
+
+
+def shard_of(key: str, shards: int) -> int:
+    """
+    Stable hash partition of `key`, identical across processes and restarts.
+    """
+    return zlib.crc32(key.encode()) % shards
+
+
+class ShardedQuipu:
+    """
+    Hash-partitions the keys of one namespace across several shards.
+
+    Point operations are routed to the owning shard, `count`, `scan_docs` and
+    `find_docs` fan out to every shard in parallel and gather the results in
+    key order, so paging behaves like a single RocksDB instance. The number of
+    local shards of a namespace is recorded when it is created and opening it
+    with a different count is refused. RocksDB calls release the GIL, so the
+    fan-out runs in parallel.
+    """
+
+    def __init__(self, shards: list[Transport]):
+        if not shards:
+            raise ValueError("At least one shard must be provided")
+        self.shards = shards
+
+    @property
+    def databases(self) -> int:
+        return len(self.shards)
+
+    @classmethod
+    def open(cls, name: str, *, shards: int = SHARDS, nodes: str = SHARD_NODES):
+        """
+        Open the shards of namespace `name`.
+
+        `nodes` is a comma separated list of node URIs (`file://`, `inproc://`
+        or any registered scheme) each receiving a `/{name}` suffix; otherwise
+        `shards` local directories are used, keeping the historical `db/{name}`
+        layout when there is a single one.
+        """
+        if nodes:
+            return cls(
+                [
+                    open_transport(f"{node.rstrip('/')}/{name}")
+                    for node in nodes.split(",")
+                ]
+            )
+        shards = max(shards, 1)
+        stored = stored_shards(f"db/{name}")
+        if stored is not None and stored != shards:
+            raise ValueError(
+                f"Namespace `{name}` is stored in {stored} shards, not {shards}"
+            )
+        if stored is None:
+            os.makedirs(f"db/{name}", exist_ok=True)
+            with open(os.path.join(f"db/{name}", SHARDS_FILE), "w", encoding="utf-8") as f:
+                f.write(str(shards))
+        if shards == 1:
+            return cls([LocalShard(f"db/{name}")])
+        return cls([LocalShard(f"db/{name}/shard-{i:03d}") for i in range(shards)])
+
+    def shard(self, key: str) -> Transport:
+        return self.shards[shard_of(key, len(self.shards))]
+
+    def gather(self, func: Callable[[Transport], T]) -> list[T]:
+        if len(self.shards) == 1:
+            return [func(self.shards[0])]
+        return list(_pool.map(func, self.shards))
+
+    def put_doc(self, key: str, value: dict[str, Any]) -> None:
+        self.shard(key).put_doc(key, value)
+
+    def get_doc(self, key: str) -> Optional[dict[str, Any]]:
+        return self.shard(key).get_doc(key)
+
+    def merge_doc(self, key: str, value: dict[str, Any]) -> None:
+        self.shard(key).merge_doc(key, value)
+
+    def delete_doc(self, key: str) -> None:
+        self.shard(key).delete_doc(key)
+
+    def exists(self, key: str) -> bool:
+        return self.shard(key).exists(key)
+
+    def count(self) -> int:
+        return sum(self.gather(lambda shard: shard.count()))
+
+    @staticmethod
+    def page(
+        parts: Iterable[list[T]], key: Callable[[T], Any], limit: int, offset: int
+    ) -> list[T]:
+        return list(islice(heapq.merge(*parts, key=key), offset, offset + limit))
+
+    def scan_docs(self, limit: int, offset: int, keys_only: bool = False):
+        if len(self.shards) == 1:
+            return self.shards[0].scan_docs(limit, offset, keys_only)
+        parts = self.gather(lambda shard: shard.scan_docs(limit + offset, 0, keys_only))
+        if keys_only:
+            return self.page(parts, lambda k: k, limit, offset)
+        return self.page(parts, lambda doc: doc.get("key", ""), limit, offset)
+
+    def find_docs(self, limit: int, offset: int, kwargs: dict[str, Any]):
+        if len(self.shards) == 1:
+            return self.shards[0].find_docs(limit, offset, kwargs)
+        parts = self.gather(lambda shard: shard.find_docs(limit + offset, 0, kwargs))
+        return self.page(parts, lambda doc: doc.get("key", ""), limit, offset)
+
+    def close(self) -> None:
+        for shard in self.shards:
+            shard.close()
+
+
+class HandlePool:
+    """
+    Bounded set of the open handles of the process, by name: the
+    `ShardedQuipu` of the document namespaces and the indexes of the vector
+    namespaces (`index/{namespace}`, `lexicon/{namespace}`, ...).
+
+    Handles are opened lazily on their first lease and kept in LRU order.
+    The budget `max_open` counts RocksDB databases, not handles: a handle
+    weighs its `databases` (the shards of a `ShardedQuipu`, one otherwise).
+    Beyond the budget the least recently used handles without leases in
+    flight are closed, releasing their memtables, threads and file
+    descriptors; a handle in use is never closed underneath an operation,
+    the pool goes over the budget until its leases are returned instead.
+
+    Opening and closing happen outside the pool lock, so a slow open or a
+    graph save only delays the leases of that name, which wait for it.
+
+    Usage:
+        with HandlePool.get().lease("Pet") as db:
+            db.get_doc(key)
+    """
+
+    _instance: ClassVar[Optional[HandlePool]] = None
+
+    def __init__(
+        self,
+        max_open: int = MAX_OPEN_DATABASES,
+        opener: Callable[[str], Closeable] = ShardedQuipu.open,
+    ):
+        self.max_open = max_open
+        self.opener = opener
+        self.handles: OrderedDict[str, Closeable] = OrderedDict()
+        self.refs: dict[str, int] = {}
+        self.pending: dict[str, Event] = {}
+        self.databases = 0
+        self.lock = RLock()
+
+    @classmethod
+    def get(cls) -> HandlePool:
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __len__(self) -> int:
+        return len(self.handles)
+
+    @staticmethod
+    def weight(handle: Closeable) -> int:
+        return getattr(handle, "databases", 1)
+
+    def acquire(self, name: str, opener: Optional[Callable[[str], T]] = None) -> T:
+        while True:
+            with self.lock:
+                if name in self.handles:
+                    self.handles.move_to_end(name)
+                    self.refs[name] = self.refs.get(name, 0) + 1
+                    return self.handles[name]  # type: ignore
+                busy = self.pending.get(name)
+                if busy is None:
+                    self.pending[name] = Event()
+                    self.refs[name] = self.refs.get(name, 0) + 1
+                    break
+            busy.wait()
+        try:
+            handle = (opener or self.opener)(name)
+        except BaseException:
+            with self.lock:
+                self.unref(name)
+                self.pending.pop(name).set()
+            raise
+        with self.lock:
+            self.handles[name] = handle  # type: ignore
+            self.databases += self.weight(handle)  # type: ignore
+            self.pending.pop(name).set()
+            victims = self.victims()
+        self.close(victims)
+        return handle
+
+    def unref(self, name: str):
+        self.refs[name] -= 1
+        if not self.refs[name]:
+            del self.refs[name]
+
+    def release(self, name: str):
+        with self.lock:
+            self.unref(name)
+            victims = self.victims()
+        self.close(victims)
+
+    @contextmanager
+    def lease(self, name: str, opener: Optional[Callable[[str], T]] = None) -> Iterator[T]:
+        handle = self.acquire(name, opener)
+        try:
+            yield handle
+        finally:
+            self.release(name)
+
+    def victims(self, everything: bool = False) -> list[tuple[str, Closeable]]:
+        """
+        Detach the idle handles to close, least recently used first, while
+        over budget (or all of them), marking their names pending until closed.
+        """
+        victims: list[tuple[str, Closeable]] = []
+        for name in [name for name in self.handles if name not in self.refs]:
+            if not everything and self.databases <= self.max_open:
+                break
+            handle = self.handles.pop(name)
+            self.databases -= self.weight(handle)
+            self.pending[name] = Event()
+            victims.append((name, handle))
+        return victims
+
+    def close(self, victims: list[tuple[str, Closeable]]):
+        for name, handle in victims:
+            try:
+                handle.close()
+            finally:
+                with self.lock:
+                    self.pending.pop(name).set()
+
+    def forget(self, name: str, handle: Closeable):
+        """
+        Drop `handle`, closed by its owner, if it is still the one open for `name`.
+        """
+        with self.lock:
+            if self.handles.get(name) is handle:
+                del self.handles[name]
+                self.databases -= self.weight(handle)
+
+    def close_all(self):
+        """
+        Close every idle handle, called at shutdown.
+        """
+        with self.lock:
+            victims = self.victims(everything=True)
+        self.close(victims)
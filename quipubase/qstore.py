@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import os
+from threading import RLock
+from typing import Callable, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+BLOCK_ROWS = 16384
+
+
+def normalize(data: NDArray[np.float32]) -> NDArray[np.float32]:
+    """
+    L2-normalize the rows of `data`, leaving all-zero rows untouched.
+    """
+    norms = np.linalg.norm(data, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return (data / norms).astype(np.float32, copy=False)
+
+
+class VectorStore:
+    """
+    Contiguous float32 matrix holding the vectors of one namespace.
+
+    Row `i` is the vector of index label `i`, so the key <-> label mapping of
+    the index doubles as the id mapping of the store. Rows are appended to a
+    flat file and read back through a read-only `numpy.memmap`, which lets the
+    page cache share them between worker processes and hands the index and
+    exact search a matrix without decoding any JSON.
+    """
+
+    def __init__(self, path: str, dim: int, dtype: type[np.generic] = np.float32):
+        self.path = path
+        self.dim = dim
+        self.dtype = np.dtype(dtype)
+        self.lock = RLock()
+        self.view: Optional[NDArray[np.float32]] = None
+        open(self.path, "ab").close()
+
+    @property
+    def row_size(self) -> int:
+        return self.dim * self.dtype.itemsize
+
+    def __len__(self) -> int:
+        return os.path.getsize(self.path) // self.row_size
+
+    def write(self, labels: NDArray[np.int64], data: NDArray[np.float32]):
+        """
+        Write the rows of `data` at the positions given by `labels`, appending
+        in a single write when they extend the file contiguously.
+        """
+        data = np.ascontiguousarray(data, dtype=self.dtype)
+        with self.lock, open(self.path, "r+b") as f:
+            rows = len(self)
+            if np.array_equal(labels, np.arange(rows, rows + len(labels))):
+                f.seek(rows * self.row_size)
+                f.write(data.tobytes())
+            else:
+                for label, row in zip(labels, data):
+                    f.seek(int(label) * self.row_size)
+                    f.write(row.tobytes())
+            f.flush()
+            self.view = None
+
+    def matrix(self) -> NDArray[np.float32]:
+        """
+        Memory-mapped view of every row, remapped only after writes.
+        """
+        with self.lock:
+            if self.view is None:
+                rows = len(self)
+                if rows == 0:
+                    return np.empty((0, self.dim), dtype=self.dtype)
+                self.view = np.memmap(
+                    self.path, dtype=self.dtype, mode="r", shape=(rows, self.dim)
+                )
+            return self.view
+
+    def get(self, labels: NDArray[np.int64]) -> NDArray[np.float32]:
+        return np.asarray(self.matrix()[labels])
+
+    def search(
+        self,
+        queries: NDArray[np.float32],
+        k: int,
+        block: int = BLOCK_ROWS,
+        labels: Optional[NDArray[np.int64]] = None,
+        score: Optional[Callable[[NDArray[np.float32], NDArray[np.generic]], NDArray[np.float32]]] = None,
+        exclude: Optional[NDArray[np.bool_]] = None,
+    ) -> tuple[NDArray[np.int64], NDArray[np.float32]]:
+        """
+        Exact cosine top-`k` of each row of `queries` against every stored row,
+        or only against the rows in `labels` when given. Stores of quantized
+        codes pass the `score` function of their quantizer instead. Rows set
+        in the `exclude` mask (deleted labels) score `-inf` and are never
+        returned while enough other rows exist.
+
+        The matrix is scanned in blocks of `block` rows, each block scored with
+        one matrix product and reduced to its own top-`k` with `argpartition`
+        before being merged into the running best, so memory stays bounded by
+        the block size whatever the namespace size.
+
+        Returns:
+            (labels, scores): two `(len(queries), k)` arrays sorted by descending score.
+        """
+        queries = normalize(np.atleast_2d(np.asarray(queries, dtype=np.float32)))
+        matrix = self.matrix()
+        total = len(matrix) if labels is None else len(labels)
+        k = min(k, total)
+        best_labels = np.empty((len(queries), 0), dtype=np.int64)
+        best_scores = np.empty((len(queries), 0), dtype=np.float32)
+        for start in range(0, total, block):
+            if labels is None:
+                ids = np.arange(start, min(start + block, total), dtype=np.int64)
+                rows = np.asarray(matrix[start : start + block])
+            else:
+                ids = labels[start : start + block]
+                rows = matrix[ids]
+            scores = score(queries, rows) if score else queries @ rows.T
+            if exclude is not None:
+                scores = np.where(exclude[ids], np.float32(-np.inf), scores)
+            found = np.broadcast_to(ids, scores.shape)
+            if scores.shape[1] > k:
+                top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+                scores = np.take_along_axis(scores, top, axis=1)
+                found = np.take_along_axis(found, top, axis=1)
+            scores = np.concatenate([best_scores, scores], axis=1)
+            found = np.concatenate([best_labels, found], axis=1)
+            if scores.shape[1] > k:
+                top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+                scores = np.take_along_axis(scores, top, axis=1)
+                found = np.take_along_axis(found, top, axis=1)
+            best_scores, best_labels = scores, found
+        order = np.argsort(-best_scores, axis=1)
+        return (
+            np.take_along_axis(best_labels, order, axis=1),
+            np.take_along_axis(best_scores, order, axis=1),
+        )
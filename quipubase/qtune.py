@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Iterable, Optional
+
+import numpy as np
+
+from .qindex import VectorIndex
+
+TUNE_QUERIES = 200
+TUNE_K = 10
+TUNE_RECALL = 0.95
+EF_GRID = (16, 32, 64, 128, 256, 512)
+M_GRID = (8, 16, 32)
+
+
+def sweep(
+    index: VectorIndex,
+    k: int = TUNE_K,
+    queries: int = TUNE_QUERIES,
+    ms: Iterable[int] = M_GRID,
+    efs: Iterable[int] = EF_GRID,
+    seed: int = 0,
+) -> list[dict[str, Any]]:
+    """
+    Measure recall@k and single-query latency of HNSW graphs of the namespace
+    for every `m` in `ms` and `ef` in `efs`.
+
+    Queries are sampled from the live vectors of the store and their exact
+    top-`k` is the ground truth; a graph is built for each `m` with the
+    namespace `ef_construction`, leaving the serving graph untouched.
+
+    Returns:
+        One report per setting: m, ef_construction, ef, recall, p50_ms and p99_ms.
+    """
+    with index.lock:
+        if index.store is None or index.dim is None or not index.live:
+            raise ValueError(f"Namespace `{index.namespace}` holds no vectors")
+        if index.quantization is not None:
+            raise ValueError(f"Namespace `{index.namespace}` is quantized and has no HNSW graph")
+        rows = len(index.store)
+        live = np.setdiff1d(
+            np.arange(rows, dtype=np.int64), np.fromiter(index.free, dtype=np.int64)
+        )
+        data = index.store.get(live)
+        ef_construction = index.meta["ef_construction"]
+    k = min(k, len(live))
+    rng = np.random.default_rng(seed)
+    sample = data[rng.choice(len(live), size=min(queries, len(live)), replace=False)]
+    positions, _ = index.store.search(sample, k, labels=live)
+    truth = [set(row.tolist()) for row in positions]
+    reports: list[dict[str, Any]] = []
+    for m in ms:
+        hnsw = index.create(index.dim, max(rows, 1), m=m, ef_construction=ef_construction)
+        hnsw.add_items(data, live)  # type: ignore
+        for ef in efs:
+            hnsw.set_ef(max(ef, k))  # type: ignore
+            latencies = np.empty(len(sample))
+            found = 0
+            for i, query in enumerate(sample):
+                start = time.perf_counter()
+                labels, _ = hnsw.knn_query(query, k=k)  # type: ignore
+                latencies[i] = time.perf_counter() - start
+                found += len(truth[i] & set(labels[0].tolist()))
+            reports.append(
+                {
+                    "m": m,
+                    "ef_construction": ef_construction,
+                    "ef": ef,
+                    "recall": found / (len(sample) * k),
+                    "p50_ms": float(np.percentile(latencies, 50) * 1000),
+                    "p99_ms": float(np.percentile(latencies, 99) * 1000),
+                }
+            )
+    return reports
+
+
+def choose(reports: list[dict[str, Any]], recall: float = TUNE_RECALL) -> Optional[dict[str, Any]]:
+    """
+    The setting with the lowest p99 latency reaching `recall`, or the most
+    accurate one when none does.
+    """
+    if not reports:
+        return None
+    reached = [report for report in reports if report["recall"] >= recall]
+    if reached:
+        return min(reached, key=lambda report: (report["p99_ms"], report["p50_ms"]))
+    return max(reports, key=lambda report: (report["recall"], -report["p99_ms"]))
+
+
+def autotune(
+    index: VectorIndex,
+    recall: float = TUNE_RECALL,
+    k: int = TUNE_K,
+    queries: int = TUNE_QUERIES,
+    apply: bool = True,
+) -> dict[str, Any]:
+    """
+    Sweep the namespace and, when `apply`, switch it to the chosen setting.
+    """
+    reports = sweep(index, k=k, queries=queries)
+    chosen = choose(reports, recall)
+    if apply and chosen is not None:
+        index.set_hnsw(m=chosen["m"], ef=chosen["ef"])
+    return {"target": recall, "chosen": chosen, "applied": apply, "reports": reports}
@@ -1521,8 +1521,8 @@ static const char *__pyx_filename;
 /* #### Code section: filename_table ### */
 
 static const char *__pyx_f[] = {
-  "quipubase.pyx",
   "<stringsource>",
+  "quipubase.pyx",
 };
 /* #### Code section: utility_code_proto_before_types ### */
 /* ForceInitThreads.proto */
@@ -1530,14 +1530,36 @@ static const char *__pyx_f[] = {
   #define __PYX_FORCE_INIT_THREADS 0
 #endif
 
+/* NoFastGil.proto */
+#define __Pyx_PyGILState_Ensure PyGILState_Ensure
+#define __Pyx_PyGILState_Release PyGILState_Release
+#define __Pyx_FastGIL_Remember()
+#define __Pyx_FastGIL_Forget()
+#define __Pyx_FastGilFuncInit()
+
 /* #### Code section: numeric_typedefs ### */
 /* #### Code section: complex_type_declarations ### */
 /* #### Code section: type_declarations ### */
 
 /*--- Type declarations ---*/
+struct __pyx_obj_9quipubase_PinnedValue;
 struct __pyx_obj_9quipubase_Quipu;
 
-/* "quipubase.pyx":51
+/* "quipubase.pyx":65
+ * 
+ * 
+ * cdef class PinnedValue:             # <<<<<<<<<<<<<<
+ *     """
+ *     Read-only buffer over a value pinned in the RocksDB block cache.
+ */
+struct __pyx_obj_9quipubase_PinnedValue {
+  PyObject_HEAD
+  rocksdb::PinnableSlice *slice;
+  PyObject *owner;
+};
+
+
+/* "quipubase.pyx":102
  * 
  * 
  * cdef class Quipu:             # <<<<<<<<<<<<<<
@@ -1561,6 +1583,7 @@ struct __pyx_obj_9quipubase_Quipu {
 struct __pyx_vtabstruct_9quipubase_Quipu {
   void (*open_db)(struct __pyx_obj_9quipubase_Quipu *);
   void (*close_db)(struct __pyx_obj_9quipubase_Quipu *);
+  int (*ensure_open)(struct __pyx_obj_9quipubase_Quipu *);
 };
 static struct __pyx_vtabstruct_9quipubase_Quipu *__pyx_vtabptr_9quipubase_Quipu;
 /* #### Code section: utility_code_proto ### */
@@ -1773,6 +1796,16 @@ static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int
 #define __Pyx_ArgsSlice_FASTCALL(args, start, stop) PyTuple_GetSlice(args, start, stop)
 #endif
 
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* KeywordStringCheck.proto */
+static int __Pyx_CheckKeywordStrings(PyObject *kw, const char* function_name, int kw_allowed);
+
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
 /* RaiseDoubleKeywords.proto */
 static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
 
@@ -1782,10 +1815,6 @@ static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject *const *kwvalues
     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,
     const char* function_name);
 
-/* RaiseArgTupleInvalid.proto */
-static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
-    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
-
 /* ArgTypeTest.proto */
 #define __Pyx_ArgTypeTest(obj, type, none_allowed, name, exact)\
     ((likely(__Pyx_IS_TYPE(obj, type) | (none_allowed && (obj == Py_None)))) ? 1 :\
@@ -1799,9 +1828,6 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg
 #define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
 #endif
 
-/* RaiseException.proto */
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
-
 /* UnpackUnboundCMethod.proto */
 typedef struct {
     PyObject *type;
@@ -2004,8 +2030,8 @@ static void __Pyx_WriteUnraisable(const char *name, int clineno,
                                   int lineno, const char *filename,
                                   int full_traceback, int nogil);
 
-/* KeywordStringCheck.proto */
-static int __Pyx_CheckKeywordStrings(PyObject *kw, const char* function_name, int kw_allowed);
+/* PyObjectCallNoArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
 
 /* RaiseUnexpectedTypeError.proto */
 static int __Pyx_RaiseUnexpectedTypeError(const char *expected, PyObject *obj);
@@ -2068,9 +2094,6 @@ static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value,
 /* IterFinish.proto */
 static CYTHON_INLINE int __Pyx_IterFinish(void);
 
-/* PyObjectCallNoArg.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
-
 /* PyObjectGetMethod.proto */
 static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method);
 
@@ -2110,6 +2133,32 @@ static CYTHON_INLINE PyObject* __Pyx_dict_iterator(PyObject* dict, int is_dict,
 static CYTHON_INLINE int __Pyx_dict_iter_next(PyObject* dict_or_iter, Py_ssize_t orig_length, Py_ssize_t* ppos,
                                               PyObject** pkey, PyObject** pvalue, PyObject** pitem, int is_dict);
 
+/* bytes_tailmatch.proto */
+static int __Pyx_PyBytes_SingleTailmatch(PyObject* self, PyObject* arg,
+                                         Py_ssize_t start, Py_ssize_t end, int direction);
+static int __Pyx_PyBytes_Tailmatch(PyObject* self, PyObject* substr,
+                                   Py_ssize_t start, Py_ssize_t end, int direction);
+
+/* decode_bytes.proto */
+static CYTHON_INLINE PyObject* __Pyx_decode_bytes(
+         PyObject* string, Py_ssize_t start, Py_ssize_t stop,
+         const char* encoding, const char* errors,
+         PyObject* (*decode_func)(const char *s, Py_ssize_t size, const char *errors)) {
+    char* as_c_string;
+    Py_ssize_t size;
+#if CYTHON_ASSUME_SAFE_MACROS
+    as_c_string = PyBytes_AS_STRING(string);
+    size = PyBytes_GET_SIZE(string);
+#else
+    if (PyBytes_AsStringAndSize(string, &as_c_string, &size) < 0) {
+        return NULL;
+    }
+#endif
+    return __Pyx_decode_c_bytes(
+        as_c_string, size,
+        start, stop, encoding, errors, decode_func);
+}
+
 /* IncludeStructmemberH.proto */
 #include <structmember.h>
 
@@ -2140,6 +2189,11 @@ static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_nam
 #define __Pyx_PyObject_GenericGetAttr PyObject_GenericGetAttr
 #endif
 
+/* SetupReduce.proto */
+#if !CYTHON_COMPILING_IN_LIMITED_API
+static int __Pyx_setup_reduce(PyObject* type_obj);
+#endif
+
 /* SetVTable.proto */
 static int __Pyx_SetVtable(PyTypeObject* typeptr , void* vtable);
 
@@ -2151,11 +2205,6 @@ static void* __Pyx_GetVtable(PyTypeObject *type);
 static int __Pyx_MergeVtables(PyTypeObject *type);
 #endif
 
-/* SetupReduce.proto */
-#if !CYTHON_COMPILING_IN_LIMITED_API
-static int __Pyx_setup_reduce(PyObject* type_obj);
-#endif
-
 /* Import.proto */
 static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
 
@@ -2438,6 +2487,11 @@ static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 /* #### Code section: module_declarations ### */
 static void __pyx_f_9quipubase_5Quipu_open_db(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self); /* proto*/
 static void __pyx_f_9quipubase_5Quipu_close_db(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self); /* proto*/
+static int __pyx_f_9quipubase_5Quipu_ensure_open(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self); /* proto*/
+
+/* Module declarations from "cpython.buffer" */
+
+/* Module declarations from "cpython.memoryview" */
 
 /* Module declarations from "libcpp" */
 
@@ -2446,6 +2500,7 @@ static void __pyx_f_9quipubase_5Quipu_close_db(struct __pyx_obj_9quipubase_Quipu
 /* Module declarations from "libcpp.string" */
 
 /* Module declarations from "quipubase" */
+static CYTHON_INLINE PyObject *__pyx_f_9quipubase_slice_view(char const *, size_t); /*proto*/
 static std::string __pyx_convert_string_from_py_6libcpp_6string_std__in_string(PyObject *); /*proto*/
 static CYTHON_INLINE PyObject *__pyx_convert_PyObject_string_to_py_6libcpp_6string_std__in_string(std::string const &); /*proto*/
 static CYTHON_INLINE PyObject *__pyx_convert_PyUnicode_string_to_py_6libcpp_6string_std__in_string(std::string const &); /*proto*/
@@ -2460,15 +2515,15 @@ int __pyx_module_is_main_quipubase = 0;
 
 /* Implementation of "quipubase" */
 /* #### Code section: global_var ### */
+static PyObject *__pyx_builtin_TypeError;
 static PyObject *__pyx_builtin_ValueError;
 static PyObject *__pyx_builtin_RuntimeError;
-static PyObject *__pyx_builtin_TypeError;
 /* #### Code section: string_decls ### */
-static const char __pyx_k__3[] = ".";
-static const char __pyx_k__4[] = "*";
+static const char __pyx_k__4[] = ".";
+static const char __pyx_k__5[] = "*";
 static const char __pyx_k_gc[] = "gc";
 static const char __pyx_k_it[] = "it";
-static const char __pyx_k__27[] = "?";
+static const char __pyx_k__38[] = "?";
 static const char __pyx_k_doc[] = "doc";
 static const char __pyx_k_get[] = "get";
 static const char __pyx_k_int[] = "int";
@@ -2476,13 +2531,16 @@ static const char __pyx_k_key[] = "key";
 static const char __pyx_k_put[] = "put";
 static const char __pyx_k_Lock[] = "Lock";
 static const char __pyx_k_bool[] = "bool";
+static const char __pyx_k_ckey[] = "ckey";
 static const char __pyx_k_exit[] = "__exit__";
 static const char __pyx_k_main[] = "__main__";
 static const char __pyx_k_name[] = "__name__";
 static const char __pyx_k_self[] = "self";
 static const char __pyx_k_spec[] = "__spec__";
 static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_view[] = "view";
 static const char __pyx_k_Quipu[] = "Quipu";
+static const char __pyx_k_close[] = "close";
 static const char __pyx_k_count[] = "count";
 static const char __pyx_k_dumps[] = "dumps";
 static const char __pyx_k_enter[] = "__enter__";
@@ -2491,6 +2549,7 @@ static const char __pyx_k_limit[] = "limit";
 static const char __pyx_k_loads[] = "loads";
 static const char __pyx_k_mutex[] = "mutex";
 static const char __pyx_k_value[] = "value";
+static const char __pyx_k_cvalue[] = "cvalue";
 static const char __pyx_k_delete[] = "delete";
 static const char __pyx_k_enable[] = "enable";
 static const char __pyx_k_encode[] = "encode";
@@ -2500,15 +2559,21 @@ static const char __pyx_k_kwargs[] = "kwargs";
 static const char __pyx_k_offset[] = "offset";
 static const char __pyx_k_option[] = "option";
 static const char __pyx_k_orjson[] = "orjson";
+static const char __pyx_k_pinned[] = "pinned";
+static const char __pyx_k_prefix[] = "prefix";
 static const char __pyx_k_reduce[] = "__reduce__";
 static const char __pyx_k_return[] = "return";
 static const char __pyx_k_update[] = "update";
+static const char __pyx_k_bprefix[] = "bprefix";
+static const char __pyx_k_cprefix[] = "cprefix";
 static const char __pyx_k_db_path[] = "db_path";
 static const char __pyx_k_disable[] = "disable";
 static const char __pyx_k_get_doc[] = "get_doc";
 static const char __pyx_k_put_doc[] = "put_doc";
+static const char __pyx_k_release[] = "release";
 static const char __pyx_k_results[] = "results";
 static const char __pyx_k_existing[] = "existing";
+static const char __pyx_k_get_view[] = "get_view";
 static const char __pyx_k_getstate[] = "__getstate__";
 static const char __pyx_k_setstate[] = "__setstate__";
 static const char __pyx_k_Quipu_get[] = "Quipu.get";
@@ -2527,7 +2592,10 @@ static const char __pyx_k_threading[] = "threading";
 static const char __pyx_k_ValueError[] = "ValueError";
 static const char __pyx_k_delete_doc[] = "delete_doc";
 static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_PinnedValue[] = "PinnedValue";
+static const char __pyx_k_Quipu_close[] = "Quipu.close";
 static const char __pyx_k_Quipu_count[] = "Quipu.count";
+static const char __pyx_k_scan_prefix[] = "scan_prefix";
 static const char __pyx_k_Quipu_delete[] = "Quipu.delete";
 static const char __pyx_k_Quipu_exists[] = "Quipu.exists";
 static const char __pyx_k_RuntimeError[] = "RuntimeError";
@@ -2540,11 +2608,14 @@ static const char __pyx_k_existing_dict[] = "existing_dict";
 static const char __pyx_k_quipubase_pyx[] = "quipubase.pyx";
 static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
 static const char __pyx_k_Object_with_id[] = "Object with id ";
+static const char __pyx_k_Quipu_get_view[] = "Quipu.get_view";
 static const char __pyx_k_Quipu_find_docs[] = "Quipu.find_docs";
 static const char __pyx_k_Quipu_merge_doc[] = "Quipu.merge_doc";
 static const char __pyx_k_Quipu_scan_docs[] = "Quipu.scan_docs";
 static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
 static const char __pyx_k_Quipu_delete_doc[] = "Quipu.delete_doc";
+static const char __pyx_k_Quipu_scan_prefix[] = "Quipu.scan_prefix";
+static const char __pyx_k_Database_is_closed[] = "Database is closed";
 static const char __pyx_k_asyncio_coroutines[] = "asyncio.coroutines";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
 static const char __pyx_k_OPT_SERIALIZE_NUMPY[] = "OPT_SERIALIZE_NUMPY";
@@ -2552,23 +2623,37 @@ static const char __pyx_k_Quipu___reduce_cython[] = "Quipu.__reduce_cython__";
 static const char __pyx_k_Failed_to_open_database[] = "Failed to open database: ";
 static const char __pyx_k_Quipu___setstate_cython[] = "Quipu.__setstate_cython__";
 static const char __pyx_k_db_path_must_be_provided[] = "db_path must be provided";
+static const char __pyx_k_PinnedValue___reduce_cython[] = "PinnedValue.__reduce_cython__";
+static const char __pyx_k_PinnedValue___setstate_cython[] = "PinnedValue.__setstate_cython__";
 static const char __pyx_k_no_default___reduce___due_to_non[] = "no default __reduce__ due to non-trivial __cinit__";
 /* #### Code section: decls ### */
+static int __pyx_pf_9quipubase_11PinnedValue___cinit__(struct __pyx_obj_9quipubase_PinnedValue *__pyx_v_self); /* proto */
+static void __pyx_pf_9quipubase_11PinnedValue_2__dealloc__(struct __pyx_obj_9quipubase_PinnedValue *__pyx_v_self); /* proto */
+static Py_ssize_t __pyx_pf_9quipubase_11PinnedValue_4__len__(struct __pyx_obj_9quipubase_PinnedValue *__pyx_v_self); /* proto */
+static int __pyx_pf_9quipubase_11PinnedValue_6__getbuffer__(struct __pyx_obj_9quipubase_PinnedValue *__pyx_v_self, Py_buffer *__pyx_v_buffer, int __pyx_v_flags); /* proto */
+static void __pyx_pf_9quipubase_11PinnedValue_8__releasebuffer__(CYTHON_UNUSED struct __pyx_obj_9quipubase_PinnedValue *__pyx_v_self, CYTHON_UNUSED Py_buffer *__pyx_v_buffer); /* proto */
+static PyObject *__pyx_pf_9quipubase_11PinnedValue_10__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_9quipubase_PinnedValue *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9quipubase_11PinnedValue_12__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_9quipubase_PinnedValue *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
 static int __pyx_pf_9quipubase_5Quipu___cinit__(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_db_path); /* proto */
 static void __pyx_pf_9quipubase_5Quipu_2__dealloc__(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_9quipubase_5Quipu_4put(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key, PyObject *__pyx_v_value); /* proto */
-static PyObject *__pyx_pf_9quipubase_5Quipu_6get(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key); /* proto */
-static PyObject *__pyx_pf_9quipubase_5Quipu_8delete(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key); /* proto */
-static PyObject *__pyx_pf_9quipubase_5Quipu_10exists(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key); /* proto */
-static PyObject *__pyx_pf_9quipubase_5Quipu_12count(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_9quipubase_5Quipu_14get_doc(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key); /* proto */
-static PyObject *__pyx_pf_9quipubase_5Quipu_16put_doc(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key, PyObject *__pyx_v_value); /* proto */
-static PyObject *__pyx_pf_9quipubase_5Quipu_18delete_doc(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key); /* proto */
-static PyObject *__pyx_pf_9quipubase_5Quipu_20scan_docs(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, int __pyx_v_limit, int __pyx_v_offset, bool __pyx_v_keys_only); /* proto */
-static PyObject *__pyx_pf_9quipubase_5Quipu_22find_docs(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, int __pyx_v_limit, int __pyx_v_offset, PyObject *__pyx_v_kwargs); /* proto */
-static PyObject *__pyx_pf_9quipubase_5Quipu_24merge_doc(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key, PyObject *__pyx_v_value); /* proto */
-static PyObject *__pyx_pf_9quipubase_5Quipu_26__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_9quipubase_Quipu *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_9quipubase_5Quipu_28__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_9quipubase_5Quipu_4close(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9quipubase_5Quipu_6closed___get__(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9quipubase_5Quipu_6put(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_9quipubase_5Quipu_8get(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key); /* proto */
+static PyObject *__pyx_pf_9quipubase_5Quipu_10get_view(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key); /* proto */
+static PyObject *__pyx_pf_9quipubase_5Quipu_12delete(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key); /* proto */
+static PyObject *__pyx_pf_9quipubase_5Quipu_14exists(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key); /* proto */
+static PyObject *__pyx_pf_9quipubase_5Quipu_16count(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9quipubase_5Quipu_18get_doc(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key); /* proto */
+static PyObject *__pyx_pf_9quipubase_5Quipu_20put_doc(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_9quipubase_5Quipu_22delete_doc(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key); /* proto */
+static PyObject *__pyx_pf_9quipubase_5Quipu_24scan_docs(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, int __pyx_v_limit, int __pyx_v_offset, bool __pyx_v_keys_only); /* proto */
+static PyObject *__pyx_pf_9quipubase_5Quipu_26find_docs(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, int __pyx_v_limit, int __pyx_v_offset, PyObject *__pyx_v_kwargs); /* proto */
+static PyObject *__pyx_pf_9quipubase_5Quipu_28scan_prefix(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_prefix, bool __pyx_v_keys_only); /* proto */
+static PyObject *__pyx_pf_9quipubase_5Quipu_30merge_doc(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_9quipubase_5Quipu_32__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_9quipubase_Quipu *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9quipubase_5Quipu_34__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_tp_new_9quipubase_PinnedValue(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_9quipubase_Quipu(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static __Pyx_CachedCFunction __pyx_umethod_PyString_Type_encode = {0, 0, 0, 0, 0};
 /* #### Code section: late_includes ### */
@@ -2605,16 +2690,27 @@ typedef struct {
   #if CYTHON_USE_MODULE_STATE
   #endif
   #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  PyObject *__pyx_type_9quipubase_PinnedValue;
   PyObject *__pyx_type_9quipubase_Quipu;
   #endif
+  PyTypeObject *__pyx_ptype_9quipubase_PinnedValue;
   PyTypeObject *__pyx_ptype_9quipubase_Quipu;
+  PyObject *__pyx_kp_s_Database_is_closed;
   PyObject *__pyx_kp_u_Failed_to_open_database;
   PyObject *__pyx_n_s_Lock;
   PyObject *__pyx_n_s_OPT_SERIALIZE_NUMPY;
   PyObject *__pyx_kp_u_Object_with_id;
+  PyObject *__pyx_n_s_PinnedValue;
+  PyObject *__pyx_n_s_PinnedValue___reduce_cython;
+  PyObject *__pyx_n_s_PinnedValue___setstate_cython;
   PyObject *__pyx_n_s_Quipu;
   PyObject *__pyx_n_s_Quipu___reduce_cython;
   PyObject *__pyx_n_s_Quipu___setstate_cython;
+  PyObject *__pyx_n_s_Quipu_close;
   PyObject *__pyx_n_s_Quipu_count;
   PyObject *__pyx_n_s_Quipu_delete;
   PyObject *__pyx_n_s_Quipu_delete_doc;
@@ -2622,20 +2718,27 @@ typedef struct {
   PyObject *__pyx_n_s_Quipu_find_docs;
   PyObject *__pyx_n_s_Quipu_get;
   PyObject *__pyx_n_s_Quipu_get_doc;
+  PyObject *__pyx_n_s_Quipu_get_view;
   PyObject *__pyx_n_s_Quipu_merge_doc;
   PyObject *__pyx_n_s_Quipu_put;
   PyObject *__pyx_n_s_Quipu_put_doc;
   PyObject *__pyx_n_s_Quipu_scan_docs;
+  PyObject *__pyx_n_s_Quipu_scan_prefix;
   PyObject *__pyx_n_s_RuntimeError;
   PyObject *__pyx_n_s_TypeError;
   PyObject *__pyx_n_s_ValueError;
-  PyObject *__pyx_n_s__27;
-  PyObject *__pyx_kp_u__3;
-  PyObject *__pyx_n_s__4;
+  PyObject *__pyx_n_s__38;
+  PyObject *__pyx_kp_u__4;
+  PyObject *__pyx_n_s__5;
   PyObject *__pyx_n_s_asyncio_coroutines;
   PyObject *__pyx_n_s_bool;
+  PyObject *__pyx_n_s_bprefix;
+  PyObject *__pyx_n_s_ckey;
   PyObject *__pyx_n_s_cline_in_traceback;
+  PyObject *__pyx_n_s_close;
   PyObject *__pyx_n_s_count;
+  PyObject *__pyx_n_s_cprefix;
+  PyObject *__pyx_n_s_cvalue;
   PyObject *__pyx_n_s_db_path;
   PyObject *__pyx_kp_s_db_path_must_be_provided;
   PyObject *__pyx_n_s_delete;
@@ -2654,6 +2757,7 @@ typedef struct {
   PyObject *__pyx_kp_u_gc;
   PyObject *__pyx_n_s_get;
   PyObject *__pyx_n_s_get_doc;
+  PyObject *__pyx_n_s_get_view;
   PyObject *__pyx_n_s_getstate;
   PyObject *__pyx_n_s_import;
   PyObject *__pyx_n_s_initializing;
@@ -2676,6 +2780,8 @@ typedef struct {
   PyObject *__pyx_n_s_offset;
   PyObject *__pyx_n_s_option;
   PyObject *__pyx_n_s_orjson;
+  PyObject *__pyx_n_s_pinned;
+  PyObject *__pyx_n_s_prefix;
   PyObject *__pyx_n_s_put;
   PyObject *__pyx_n_s_put_doc;
   PyObject *__pyx_n_s_pyx_state;
@@ -2685,9 +2791,11 @@ typedef struct {
   PyObject *__pyx_n_s_reduce;
   PyObject *__pyx_n_s_reduce_cython;
   PyObject *__pyx_n_s_reduce_ex;
+  PyObject *__pyx_n_s_release;
   PyObject *__pyx_n_s_results;
   PyObject *__pyx_n_s_return;
   PyObject *__pyx_n_s_scan_docs;
+  PyObject *__pyx_n_s_scan_prefix;
   PyObject *__pyx_n_s_self;
   PyObject *__pyx_n_s_setstate;
   PyObject *__pyx_n_s_setstate_cython;
@@ -2697,30 +2805,42 @@ typedef struct {
   PyObject *__pyx_n_s_threading;
   PyObject *__pyx_n_s_update;
   PyObject *__pyx_n_s_value;
+  PyObject *__pyx_n_s_view;
   PyObject *__pyx_tuple_;
   PyObject *__pyx_tuple__2;
-  PyObject *__pyx_tuple__5;
+  PyObject *__pyx_tuple__3;
+  PyObject *__pyx_tuple__6;
   PyObject *__pyx_tuple__8;
   PyObject *__pyx_tuple__11;
-  PyObject *__pyx_tuple__16;
-  PyObject *__pyx_tuple__18;
+  PyObject *__pyx_tuple__13;
+  PyObject *__pyx_tuple__15;
+  PyObject *__pyx_tuple__17;
   PyObject *__pyx_tuple__19;
   PyObject *__pyx_tuple__21;
   PyObject *__pyx_tuple__23;
-  PyObject *__pyx_tuple__25;
-  PyObject *__pyx_codeobj__6;
+  PyObject *__pyx_tuple__27;
+  PyObject *__pyx_tuple__29;
+  PyObject *__pyx_tuple__30;
+  PyObject *__pyx_tuple__32;
+  PyObject *__pyx_tuple__34;
   PyObject *__pyx_codeobj__7;
   PyObject *__pyx_codeobj__9;
   PyObject *__pyx_codeobj__10;
   PyObject *__pyx_codeobj__12;
-  PyObject *__pyx_codeobj__13;
   PyObject *__pyx_codeobj__14;
-  PyObject *__pyx_codeobj__15;
-  PyObject *__pyx_codeobj__17;
+  PyObject *__pyx_codeobj__16;
+  PyObject *__pyx_codeobj__18;
   PyObject *__pyx_codeobj__20;
   PyObject *__pyx_codeobj__22;
   PyObject *__pyx_codeobj__24;
+  PyObject *__pyx_codeobj__25;
   PyObject *__pyx_codeobj__26;
+  PyObject *__pyx_codeobj__28;
+  PyObject *__pyx_codeobj__31;
+  PyObject *__pyx_codeobj__33;
+  PyObject *__pyx_codeobj__35;
+  PyObject *__pyx_codeobj__36;
+  PyObject *__pyx_codeobj__37;
 } __pyx_mstate;
 
 #if CYTHON_USE_MODULE_STATE
@@ -2763,15 +2883,22 @@ static int __pyx_m_clear(PyObject *m) {
   #ifdef __Pyx_FusedFunction_USED
   Py_CLEAR(clear_module_state->__pyx_FusedFunctionType);
   #endif
+  Py_CLEAR(clear_module_state->__pyx_ptype_9quipubase_PinnedValue);
+  Py_CLEAR(clear_module_state->__pyx_type_9quipubase_PinnedValue);
   Py_CLEAR(clear_module_state->__pyx_ptype_9quipubase_Quipu);
   Py_CLEAR(clear_module_state->__pyx_type_9quipubase_Quipu);
+  Py_CLEAR(clear_module_state->__pyx_kp_s_Database_is_closed);
   Py_CLEAR(clear_module_state->__pyx_kp_u_Failed_to_open_database);
   Py_CLEAR(clear_module_state->__pyx_n_s_Lock);
   Py_CLEAR(clear_module_state->__pyx_n_s_OPT_SERIALIZE_NUMPY);
   Py_CLEAR(clear_module_state->__pyx_kp_u_Object_with_id);
+  Py_CLEAR(clear_module_state->__pyx_n_s_PinnedValue);
+  Py_CLEAR(clear_module_state->__pyx_n_s_PinnedValue___reduce_cython);
+  Py_CLEAR(clear_module_state->__pyx_n_s_PinnedValue___setstate_cython);
   Py_CLEAR(clear_module_state->__pyx_n_s_Quipu);
   Py_CLEAR(clear_module_state->__pyx_n_s_Quipu___reduce_cython);
   Py_CLEAR(clear_module_state->__pyx_n_s_Quipu___setstate_cython);
+  Py_CLEAR(clear_module_state->__pyx_n_s_Quipu_close);
   Py_CLEAR(clear_module_state->__pyx_n_s_Quipu_count);
   Py_CLEAR(clear_module_state->__pyx_n_s_Quipu_delete);
   Py_CLEAR(clear_module_state->__pyx_n_s_Quipu_delete_doc);
@@ -2779,20 +2906,27 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_Quipu_find_docs);
   Py_CLEAR(clear_module_state->__pyx_n_s_Quipu_get);
   Py_CLEAR(clear_module_state->__pyx_n_s_Quipu_get_doc);
+  Py_CLEAR(clear_module_state->__pyx_n_s_Quipu_get_view);
   Py_CLEAR(clear_module_state->__pyx_n_s_Quipu_merge_doc);
   Py_CLEAR(clear_module_state->__pyx_n_s_Quipu_put);
   Py_CLEAR(clear_module_state->__pyx_n_s_Quipu_put_doc);
   Py_CLEAR(clear_module_state->__pyx_n_s_Quipu_scan_docs);
+  Py_CLEAR(clear_module_state->__pyx_n_s_Quipu_scan_prefix);
   Py_CLEAR(clear_module_state->__pyx_n_s_RuntimeError);
   Py_CLEAR(clear_module_state->__pyx_n_s_TypeError);
   Py_CLEAR(clear_module_state->__pyx_n_s_ValueError);
-  Py_CLEAR(clear_module_state->__pyx_n_s__27);
-  Py_CLEAR(clear_module_state->__pyx_kp_u__3);
-  Py_CLEAR(clear_module_state->__pyx_n_s__4);
+  Py_CLEAR(clear_module_state->__pyx_n_s__38);
+  Py_CLEAR(clear_module_state->__pyx_kp_u__4);
+  Py_CLEAR(clear_module_state->__pyx_n_s__5);
   Py_CLEAR(clear_module_state->__pyx_n_s_asyncio_coroutines);
   Py_CLEAR(clear_module_state->__pyx_n_s_bool);
+  Py_CLEAR(clear_module_state->__pyx_n_s_bprefix);
+  Py_CLEAR(clear_module_state->__pyx_n_s_ckey);
   Py_CLEAR(clear_module_state->__pyx_n_s_cline_in_traceback);
+  Py_CLEAR(clear_module_state->__pyx_n_s_close);
   Py_CLEAR(clear_module_state->__pyx_n_s_count);
+  Py_CLEAR(clear_module_state->__pyx_n_s_cprefix);
+  Py_CLEAR(clear_module_state->__pyx_n_s_cvalue);
   Py_CLEAR(clear_module_state->__pyx_n_s_db_path);
   Py_CLEAR(clear_module_state->__pyx_kp_s_db_path_must_be_provided);
   Py_CLEAR(clear_module_state->__pyx_n_s_delete);
@@ -2811,6 +2945,7 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_kp_u_gc);
   Py_CLEAR(clear_module_state->__pyx_n_s_get);
   Py_CLEAR(clear_module_state->__pyx_n_s_get_doc);
+  Py_CLEAR(clear_module_state->__pyx_n_s_get_view);
   Py_CLEAR(clear_module_state->__pyx_n_s_getstate);
   Py_CLEAR(clear_module_state->__pyx_n_s_import);
   Py_CLEAR(clear_module_state->__pyx_n_s_initializing);
@@ -2833,6 +2968,8 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_offset);
   Py_CLEAR(clear_module_state->__pyx_n_s_option);
   Py_CLEAR(clear_module_state->__pyx_n_s_orjson);
+  Py_CLEAR(clear_module_state->__pyx_n_s_pinned);
+  Py_CLEAR(clear_module_state->__pyx_n_s_prefix);
   Py_CLEAR(clear_module_state->__pyx_n_s_put);
   Py_CLEAR(clear_module_state->__pyx_n_s_put_doc);
   Py_CLEAR(clear_module_state->__pyx_n_s_pyx_state);
@@ -2842,9 +2979,11 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_reduce);
   Py_CLEAR(clear_module_state->__pyx_n_s_reduce_cython);
   Py_CLEAR(clear_module_state->__pyx_n_s_reduce_ex);
+  Py_CLEAR(clear_module_state->__pyx_n_s_release);
   Py_CLEAR(clear_module_state->__pyx_n_s_results);
   Py_CLEAR(clear_module_state->__pyx_n_s_return);
   Py_CLEAR(clear_module_state->__pyx_n_s_scan_docs);
+  Py_CLEAR(clear_module_state->__pyx_n_s_scan_prefix);
   Py_CLEAR(clear_module_state->__pyx_n_s_self);
   Py_CLEAR(clear_module_state->__pyx_n_s_setstate);
   Py_CLEAR(clear_module_state->__pyx_n_s_setstate_cython);
@@ -2854,30 +2993,42 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_threading);
   Py_CLEAR(clear_module_state->__pyx_n_s_update);
   Py_CLEAR(clear_module_state->__pyx_n_s_value);
+  Py_CLEAR(clear_module_state->__pyx_n_s_view);
   Py_CLEAR(clear_module_state->__pyx_tuple_);
   Py_CLEAR(clear_module_state->__pyx_tuple__2);
-  Py_CLEAR(clear_module_state->__pyx_tuple__5);
+  Py_CLEAR(clear_module_state->__pyx_tuple__3);
+  Py_CLEAR(clear_module_state->__pyx_tuple__6);
   Py_CLEAR(clear_module_state->__pyx_tuple__8);
   Py_CLEAR(clear_module_state->__pyx_tuple__11);
-  Py_CLEAR(clear_module_state->__pyx_tuple__16);
-  Py_CLEAR(clear_module_state->__pyx_tuple__18);
+  Py_CLEAR(clear_module_state->__pyx_tuple__13);
+  Py_CLEAR(clear_module_state->__pyx_tuple__15);
+  Py_CLEAR(clear_module_state->__pyx_tuple__17);
   Py_CLEAR(clear_module_state->__pyx_tuple__19);
   Py_CLEAR(clear_module_state->__pyx_tuple__21);
   Py_CLEAR(clear_module_state->__pyx_tuple__23);
-  Py_CLEAR(clear_module_state->__pyx_tuple__25);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__6);
+  Py_CLEAR(clear_module_state->__pyx_tuple__27);
+  Py_CLEAR(clear_module_state->__pyx_tuple__29);
+  Py_CLEAR(clear_module_state->__pyx_tuple__30);
+  Py_CLEAR(clear_module_state->__pyx_tuple__32);
+  Py_CLEAR(clear_module_state->__pyx_tuple__34);
   Py_CLEAR(clear_module_state->__pyx_codeobj__7);
   Py_CLEAR(clear_module_state->__pyx_codeobj__9);
   Py_CLEAR(clear_module_state->__pyx_codeobj__10);
   Py_CLEAR(clear_module_state->__pyx_codeobj__12);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__13);
   Py_CLEAR(clear_module_state->__pyx_codeobj__14);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__15);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__17);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__16);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__18);
   Py_CLEAR(clear_module_state->__pyx_codeobj__20);
   Py_CLEAR(clear_module_state->__pyx_codeobj__22);
   Py_CLEAR(clear_module_state->__pyx_codeobj__24);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__25);
   Py_CLEAR(clear_module_state->__pyx_codeobj__26);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__28);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__31);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__33);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__35);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__36);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__37);
   return 0;
 }
 #endif
@@ -2898,15 +3049,22 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   #ifdef __Pyx_FusedFunction_USED
   Py_VISIT(traverse_module_state->__pyx_FusedFunctionType);
   #endif
+  Py_VISIT(traverse_module_state->__pyx_ptype_9quipubase_PinnedValue);
+  Py_VISIT(traverse_module_state->__pyx_type_9quipubase_PinnedValue);
   Py_VISIT(traverse_module_state->__pyx_ptype_9quipubase_Quipu);
   Py_VISIT(traverse_module_state->__pyx_type_9quipubase_Quipu);
+  Py_VISIT(traverse_module_state->__pyx_kp_s_Database_is_closed);
   Py_VISIT(traverse_module_state->__pyx_kp_u_Failed_to_open_database);
   Py_VISIT(traverse_module_state->__pyx_n_s_Lock);
   Py_VISIT(traverse_module_state->__pyx_n_s_OPT_SERIALIZE_NUMPY);
   Py_VISIT(traverse_module_state->__pyx_kp_u_Object_with_id);
+  Py_VISIT(traverse_module_state->__pyx_n_s_PinnedValue);
+  Py_VISIT(traverse_module_state->__pyx_n_s_PinnedValue___reduce_cython);
+  Py_VISIT(traverse_module_state->__pyx_n_s_PinnedValue___setstate_cython);
   Py_VISIT(traverse_module_state->__pyx_n_s_Quipu);
   Py_VISIT(traverse_module_state->__pyx_n_s_Quipu___reduce_cython);
   Py_VISIT(traverse_module_state->__pyx_n_s_Quipu___setstate_cython);
+  Py_VISIT(traverse_module_state->__pyx_n_s_Quipu_close);
   Py_VISIT(traverse_module_state->__pyx_n_s_Quipu_count);
   Py_VISIT(traverse_module_state->__pyx_n_s_Quipu_delete);
   Py_VISIT(traverse_module_state->__pyx_n_s_Quipu_delete_doc);
@@ -2914,20 +3072,27 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_Quipu_find_docs);
   Py_VISIT(traverse_module_state->__pyx_n_s_Quipu_get);
   Py_VISIT(traverse_module_state->__pyx_n_s_Quipu_get_doc);
+  Py_VISIT(traverse_module_state->__pyx_n_s_Quipu_get_view);
   Py_VISIT(traverse_module_state->__pyx_n_s_Quipu_merge_doc);
   Py_VISIT(traverse_module_state->__pyx_n_s_Quipu_put);
   Py_VISIT(traverse_module_state->__pyx_n_s_Quipu_put_doc);
   Py_VISIT(traverse_module_state->__pyx_n_s_Quipu_scan_docs);
+  Py_VISIT(traverse_module_state->__pyx_n_s_Quipu_scan_prefix);
   Py_VISIT(traverse_module_state->__pyx_n_s_RuntimeError);
   Py_VISIT(traverse_module_state->__pyx_n_s_TypeError);
   Py_VISIT(traverse_module_state->__pyx_n_s_ValueError);
-  Py_VISIT(traverse_module_state->__pyx_n_s__27);
-  Py_VISIT(traverse_module_state->__pyx_kp_u__3);
-  Py_VISIT(traverse_module_state->__pyx_n_s__4);
+  Py_VISIT(traverse_module_state->__pyx_n_s__38);
+  Py_VISIT(traverse_module_state->__pyx_kp_u__4);
+  Py_VISIT(traverse_module_state->__pyx_n_s__5);
   Py_VISIT(traverse_module_state->__pyx_n_s_asyncio_coroutines);
   Py_VISIT(traverse_module_state->__pyx_n_s_bool);
+  Py_VISIT(traverse_module_state->__pyx_n_s_bprefix);
+  Py_VISIT(traverse_module_state->__pyx_n_s_ckey);
   Py_VISIT(traverse_module_state->__pyx_n_s_cline_in_traceback);
+  Py_VISIT(traverse_module_state->__pyx_n_s_close);
   Py_VISIT(traverse_module_state->__pyx_n_s_count);
+  Py_VISIT(traverse_module_state->__pyx_n_s_cprefix);
+  Py_VISIT(traverse_module_state->__pyx_n_s_cvalue);
   Py_VISIT(traverse_module_state->__pyx_n_s_db_path);
   Py_VISIT(traverse_module_state->__pyx_kp_s_db_path_must_be_provided);
   Py_VISIT(traverse_module_state->__pyx_n_s_delete);
@@ -2946,6 +3111,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_kp_u_gc);
   Py_VISIT(traverse_module_state->__pyx_n_s_get);
   Py_VISIT(traverse_module_state->__pyx_n_s_get_doc);
+  Py_VISIT(traverse_module_state->__pyx_n_s_get_view);
   Py_VISIT(traverse_module_state->__pyx_n_s_getstate);
   Py_VISIT(traverse_module_state->__pyx_n_s_import);
   Py_VISIT(traverse_module_state->__pyx_n_s_initializing);
@@ -2968,6 +3134,8 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_offset);
   Py_VISIT(traverse_module_state->__pyx_n_s_option);
   Py_VISIT(traverse_module_state->__pyx_n_s_orjson);
+  Py_VISIT(traverse_module_state->__pyx_n_s_pinned);
+  Py_VISIT(traverse_module_state->__pyx_n_s_prefix);
   Py_VISIT(traverse_module_state->__pyx_n_s_put);
   Py_VISIT(traverse_module_state->__pyx_n_s_put_doc);
   Py_VISIT(traverse_module_state->__pyx_n_s_pyx_state);
@@ -2977,9 +3145,11 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_reduce);
   Py_VISIT(traverse_module_state->__pyx_n_s_reduce_cython);
   Py_VISIT(traverse_module_state->__pyx_n_s_reduce_ex);
+  Py_VISIT(traverse_module_state->__pyx_n_s_release);
   Py_VISIT(traverse_module_state->__pyx_n_s_results);
   Py_VISIT(traverse_module_state->__pyx_n_s_return);
   Py_VISIT(traverse_module_state->__pyx_n_s_scan_docs);
+  Py_VISIT(traverse_module_state->__pyx_n_s_scan_prefix);
   Py_VISIT(traverse_module_state->__pyx_n_s_self);
   Py_VISIT(traverse_module_state->__pyx_n_s_setstate);
   Py_VISIT(traverse_module_state->__pyx_n_s_setstate_cython);
@@ -2989,30 +3159,42 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_threading);
   Py_VISIT(traverse_module_state->__pyx_n_s_update);
   Py_VISIT(traverse_module_state->__pyx_n_s_value);
+  Py_VISIT(traverse_module_state->__pyx_n_s_view);
   Py_VISIT(traverse_module_state->__pyx_tuple_);
   Py_VISIT(traverse_module_state->__pyx_tuple__2);
-  Py_VISIT(traverse_module_state->__pyx_tuple__5);
+  Py_VISIT(traverse_module_state->__pyx_tuple__3);
+  Py_VISIT(traverse_module_state->__pyx_tuple__6);
   Py_VISIT(traverse_module_state->__pyx_tuple__8);
   Py_VISIT(traverse_module_state->__pyx_tuple__11);
-  Py_VISIT(traverse_module_state->__pyx_tuple__16);
-  Py_VISIT(traverse_module_state->__pyx_tuple__18);
+  Py_VISIT(traverse_module_state->__pyx_tuple__13);
+  Py_VISIT(traverse_module_state->__pyx_tuple__15);
+  Py_VISIT(traverse_module_state->__pyx_tuple__17);
   Py_VISIT(traverse_module_state->__pyx_tuple__19);
   Py_VISIT(traverse_module_state->__pyx_tuple__21);
   Py_VISIT(traverse_module_state->__pyx_tuple__23);
-  Py_VISIT(traverse_module_state->__pyx_tuple__25);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__6);
+  Py_VISIT(traverse_module_state->__pyx_tuple__27);
+  Py_VISIT(traverse_module_state->__pyx_tuple__29);
+  Py_VISIT(traverse_module_state->__pyx_tuple__30);
+  Py_VISIT(traverse_module_state->__pyx_tuple__32);
+  Py_VISIT(traverse_module_state->__pyx_tuple__34);
   Py_VISIT(traverse_module_state->__pyx_codeobj__7);
   Py_VISIT(traverse_module_state->__pyx_codeobj__9);
   Py_VISIT(traverse_module_state->__pyx_codeobj__10);
   Py_VISIT(traverse_module_state->__pyx_codeobj__12);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__13);
   Py_VISIT(traverse_module_state->__pyx_codeobj__14);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__15);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__17);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__16);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__18);
   Py_VISIT(traverse_module_state->__pyx_codeobj__20);
   Py_VISIT(traverse_module_state->__pyx_codeobj__22);
   Py_VISIT(traverse_module_state->__pyx_codeobj__24);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__25);
   Py_VISIT(traverse_module_state->__pyx_codeobj__26);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__28);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__31);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__33);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__35);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__36);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__37);
   return 0;
 }
 #endif
@@ -3048,16 +3230,27 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #if CYTHON_USE_MODULE_STATE
 #endif
 #if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
+#define __pyx_type_9quipubase_PinnedValue __pyx_mstate_global->__pyx_type_9quipubase_PinnedValue
 #define __pyx_type_9quipubase_Quipu __pyx_mstate_global->__pyx_type_9quipubase_Quipu
 #endif
+#define __pyx_ptype_9quipubase_PinnedValue __pyx_mstate_global->__pyx_ptype_9quipubase_PinnedValue
 #define __pyx_ptype_9quipubase_Quipu __pyx_mstate_global->__pyx_ptype_9quipubase_Quipu
+#define __pyx_kp_s_Database_is_closed __pyx_mstate_global->__pyx_kp_s_Database_is_closed
 #define __pyx_kp_u_Failed_to_open_database __pyx_mstate_global->__pyx_kp_u_Failed_to_open_database
 #define __pyx_n_s_Lock __pyx_mstate_global->__pyx_n_s_Lock
 #define __pyx_n_s_OPT_SERIALIZE_NUMPY __pyx_mstate_global->__pyx_n_s_OPT_SERIALIZE_NUMPY
 #define __pyx_kp_u_Object_with_id __pyx_mstate_global->__pyx_kp_u_Object_with_id
+#define __pyx_n_s_PinnedValue __pyx_mstate_global->__pyx_n_s_PinnedValue
+#define __pyx_n_s_PinnedValue___reduce_cython __pyx_mstate_global->__pyx_n_s_PinnedValue___reduce_cython
+#define __pyx_n_s_PinnedValue___setstate_cython __pyx_mstate_global->__pyx_n_s_PinnedValue___setstate_cython
 #define __pyx_n_s_Quipu __pyx_mstate_global->__pyx_n_s_Quipu
 #define __pyx_n_s_Quipu___reduce_cython __pyx_mstate_global->__pyx_n_s_Quipu___reduce_cython
 #define __pyx_n_s_Quipu___setstate_cython __pyx_mstate_global->__pyx_n_s_Quipu___setstate_cython
+#define __pyx_n_s_Quipu_close __pyx_mstate_global->__pyx_n_s_Quipu_close
 #define __pyx_n_s_Quipu_count __pyx_mstate_global->__pyx_n_s_Quipu_count
 #define __pyx_n_s_Quipu_delete __pyx_mstate_global->__pyx_n_s_Quipu_delete
 #define __pyx_n_s_Quipu_delete_doc __pyx_mstate_global->__pyx_n_s_Quipu_delete_doc
@@ -3065,20 +3258,27 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_Quipu_find_docs __pyx_mstate_global->__pyx_n_s_Quipu_find_docs
 #define __pyx_n_s_Quipu_get __pyx_mstate_global->__pyx_n_s_Quipu_get
 #define __pyx_n_s_Quipu_get_doc __pyx_mstate_global->__pyx_n_s_Quipu_get_doc
+#define __pyx_n_s_Quipu_get_view __pyx_mstate_global->__pyx_n_s_Quipu_get_view
 #define __pyx_n_s_Quipu_merge_doc __pyx_mstate_global->__pyx_n_s_Quipu_merge_doc
 #define __pyx_n_s_Quipu_put __pyx_mstate_global->__pyx_n_s_Quipu_put
 #define __pyx_n_s_Quipu_put_doc __pyx_mstate_global->__pyx_n_s_Quipu_put_doc
 #define __pyx_n_s_Quipu_scan_docs __pyx_mstate_global->__pyx_n_s_Quipu_scan_docs
+#define __pyx_n_s_Quipu_scan_prefix __pyx_mstate_global->__pyx_n_s_Quipu_scan_prefix
 #define __pyx_n_s_RuntimeError __pyx_mstate_global->__pyx_n_s_RuntimeError
 #define __pyx_n_s_TypeError __pyx_mstate_global->__pyx_n_s_TypeError
 #define __pyx_n_s_ValueError __pyx_mstate_global->__pyx_n_s_ValueError
-#define __pyx_n_s__27 __pyx_mstate_global->__pyx_n_s__27
-#define __pyx_kp_u__3 __pyx_mstate_global->__pyx_kp_u__3
-#define __pyx_n_s__4 __pyx_mstate_global->__pyx_n_s__4
+#define __pyx_n_s__38 __pyx_mstate_global->__pyx_n_s__38
+#define __pyx_kp_u__4 __pyx_mstate_global->__pyx_kp_u__4
+#define __pyx_n_s__5 __pyx_mstate_global->__pyx_n_s__5
 #define __pyx_n_s_asyncio_coroutines __pyx_mstate_global->__pyx_n_s_asyncio_coroutines
 #define __pyx_n_s_bool __pyx_mstate_global->__pyx_n_s_bool
+#define __pyx_n_s_bprefix __pyx_mstate_global->__pyx_n_s_bprefix
+#define __pyx_n_s_ckey __pyx_mstate_global->__pyx_n_s_ckey
 #define __pyx_n_s_cline_in_traceback __pyx_mstate_global->__pyx_n_s_cline_in_traceback
+#define __pyx_n_s_close __pyx_mstate_global->__pyx_n_s_close
 #define __pyx_n_s_count __pyx_mstate_global->__pyx_n_s_count
+#define __pyx_n_s_cprefix __pyx_mstate_global->__pyx_n_s_cprefix
+#define __pyx_n_s_cvalue __pyx_mstate_global->__pyx_n_s_cvalue
 #define __pyx_n_s_db_path __pyx_mstate_global->__pyx_n_s_db_path
 #define __pyx_kp_s_db_path_must_be_provided __pyx_mstate_global->__pyx_kp_s_db_path_must_be_provided
 #define __pyx_n_s_delete __pyx_mstate_global->__pyx_n_s_delete
@@ -3097,6 +3297,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_kp_u_gc __pyx_mstate_global->__pyx_kp_u_gc
 #define __pyx_n_s_get __pyx_mstate_global->__pyx_n_s_get
 #define __pyx_n_s_get_doc __pyx_mstate_global->__pyx_n_s_get_doc
+#define __pyx_n_s_get_view __pyx_mstate_global->__pyx_n_s_get_view
 #define __pyx_n_s_getstate __pyx_mstate_global->__pyx_n_s_getstate
 #define __pyx_n_s_import __pyx_mstate_global->__pyx_n_s_import
 #define __pyx_n_s_initializing __pyx_mstate_global->__pyx_n_s_initializing
@@ -3119,6 +3320,8 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_offset __pyx_mstate_global->__pyx_n_s_offset
 #define __pyx_n_s_option __pyx_mstate_global->__pyx_n_s_option
 #define __pyx_n_s_orjson __pyx_mstate_global->__pyx_n_s_orjson
+#define __pyx_n_s_pinned __pyx_mstate_global->__pyx_n_s_pinned
+#define __pyx_n_s_prefix __pyx_mstate_global->__pyx_n_s_prefix
 #define __pyx_n_s_put __pyx_mstate_global->__pyx_n_s_put
 #define __pyx_n_s_put_doc __pyx_mstate_global->__pyx_n_s_put_doc
 #define __pyx_n_s_pyx_state __pyx_mstate_global->__pyx_n_s_pyx_state
@@ -3128,9 +3331,11 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_reduce __pyx_mstate_global->__pyx_n_s_reduce
 #define __pyx_n_s_reduce_cython __pyx_mstate_global->__pyx_n_s_reduce_cython
 #define __pyx_n_s_reduce_ex __pyx_mstate_global->__pyx_n_s_reduce_ex
+#define __pyx_n_s_release __pyx_mstate_global->__pyx_n_s_release
 #define __pyx_n_s_results __pyx_mstate_global->__pyx_n_s_results
 #define __pyx_n_s_return __pyx_mstate_global->__pyx_n_s_return
 #define __pyx_n_s_scan_docs __pyx_mstate_global->__pyx_n_s_scan_docs
+#define __pyx_n_s_scan_prefix __pyx_mstate_global->__pyx_n_s_scan_prefix
 #define __pyx_n_s_self __pyx_mstate_global->__pyx_n_s_self
 #define __pyx_n_s_setstate __pyx_mstate_global->__pyx_n_s_setstate
 #define __pyx_n_s_setstate_cython __pyx_mstate_global->__pyx_n_s_setstate_cython
@@ -3140,30 +3345,42 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_threading __pyx_mstate_global->__pyx_n_s_threading
 #define __pyx_n_s_update __pyx_mstate_global->__pyx_n_s_update
 #define __pyx_n_s_value __pyx_mstate_global->__pyx_n_s_value
+#define __pyx_n_s_view __pyx_mstate_global->__pyx_n_s_view
 #define __pyx_tuple_ __pyx_mstate_global->__pyx_tuple_
 #define __pyx_tuple__2 __pyx_mstate_global->__pyx_tuple__2
-#define __pyx_tuple__5 __pyx_mstate_global->__pyx_tuple__5
+#define __pyx_tuple__3 __pyx_mstate_global->__pyx_tuple__3
+#define __pyx_tuple__6 __pyx_mstate_global->__pyx_tuple__6
 #define __pyx_tuple__8 __pyx_mstate_global->__pyx_tuple__8
 #define __pyx_tuple__11 __pyx_mstate_global->__pyx_tuple__11
-#define __pyx_tuple__16 __pyx_mstate_global->__pyx_tuple__16
-#define __pyx_tuple__18 __pyx_mstate_global->__pyx_tuple__18
+#define __pyx_tuple__13 __pyx_mstate_global->__pyx_tuple__13
+#define __pyx_tuple__15 __pyx_mstate_global->__pyx_tuple__15
+#define __pyx_tuple__17 __pyx_mstate_global->__pyx_tuple__17
 #define __pyx_tuple__19 __pyx_mstate_global->__pyx_tuple__19
 #define __pyx_tuple__21 __pyx_mstate_global->__pyx_tuple__21
 #define __pyx_tuple__23 __pyx_mstate_global->__pyx_tuple__23
-#define __pyx_tuple__25 __pyx_mstate_global->__pyx_tuple__25
-#define __pyx_codeobj__6 __pyx_mstate_global->__pyx_codeobj__6
+#define __pyx_tuple__27 __pyx_mstate_global->__pyx_tuple__27
+#define __pyx_tuple__29 __pyx_mstate_global->__pyx_tuple__29
+#define __pyx_tuple__30 __pyx_mstate_global->__pyx_tuple__30
+#define __pyx_tuple__32 __pyx_mstate_global->__pyx_tuple__32
+#define __pyx_tuple__34 __pyx_mstate_global->__pyx_tuple__34
 #define __pyx_codeobj__7 __pyx_mstate_global->__pyx_codeobj__7
 #define __pyx_codeobj__9 __pyx_mstate_global->__pyx_codeobj__9
 #define __pyx_codeobj__10 __pyx_mstate_global->__pyx_codeobj__10
 #define __pyx_codeobj__12 __pyx_mstate_global->__pyx_codeobj__12
-#define __pyx_codeobj__13 __pyx_mstate_global->__pyx_codeobj__13
 #define __pyx_codeobj__14 __pyx_mstate_global->__pyx_codeobj__14
-#define __pyx_codeobj__15 __pyx_mstate_global->__pyx_codeobj__15
-#define __pyx_codeobj__17 __pyx_mstate_global->__pyx_codeobj__17
+#define __pyx_codeobj__16 __pyx_mstate_global->__pyx_codeobj__16
+#define __pyx_codeobj__18 __pyx_mstate_global->__pyx_codeobj__18
 #define __pyx_codeobj__20 __pyx_mstate_global->__pyx_codeobj__20
 #define __pyx_codeobj__22 __pyx_mstate_global->__pyx_codeobj__22
 #define __pyx_codeobj__24 __pyx_mstate_global->__pyx_codeobj__24
+#define __pyx_codeobj__25 __pyx_mstate_global->__pyx_codeobj__25
 #define __pyx_codeobj__26 __pyx_mstate_global->__pyx_codeobj__26
+#define __pyx_codeobj__28 __pyx_mstate_global->__pyx_codeobj__28
+#define __pyx_codeobj__31 __pyx_mstate_global->__pyx_codeobj__31
+#define __pyx_codeobj__33 __pyx_mstate_global->__pyx_codeobj__33
+#define __pyx_codeobj__35 __pyx_mstate_global->__pyx_codeobj__35
+#define __pyx_codeobj__36 __pyx_mstate_global->__pyx_codeobj__36
+#define __pyx_codeobj__37 __pyx_mstate_global->__pyx_codeobj__37
 /* #### Code section: module_code ### */
 
 /* "string.from_py":13
@@ -3200,7 +3417,7 @@ static std::string __pyx_convert_string_from_py_6libcpp_6string_std__in_string(P
  *     return string(data, length)
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_AsStringAndSize(__pyx_v_o, (&__pyx_v_length)); if (unlikely(__pyx_t_1 == ((char const *)NULL))) __PYX_ERR(1, 15, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_AsStringAndSize(__pyx_v_o, (&__pyx_v_length)); if (unlikely(__pyx_t_1 == ((char const *)NULL))) __PYX_ERR(0, 15, __pyx_L1_error)
   __pyx_v_data = __pyx_t_1;
 
   /* "string.from_py":16
@@ -3214,7 +3431,7 @@ static std::string __pyx_convert_string_from_py_6libcpp_6string_std__in_string(P
     __pyx_t_2 = std::string(__pyx_v_data, __pyx_v_length);
   } catch(...) {
     __Pyx_CppExn2PyErr();
-    __PYX_ERR(1, 16, __pyx_L1_error)
+    __PYX_ERR(0, 16, __pyx_L1_error)
   }
   __pyx_r = __pyx_t_2;
   goto __pyx_L0;
@@ -3260,7 +3477,7 @@ static CYTHON_INLINE PyObject *__pyx_convert_PyObject_string_to_py_6libcpp_6stri
  *     cdef object __Pyx_PyUnicode_FromStringAndSize(const char*, size_t)
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_FromStringAndSize(__pyx_v_s.data(), __pyx_v_s.size()); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 32, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_FromStringAndSize(__pyx_v_s.data(), __pyx_v_s.size()); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 32, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -3310,7 +3527,7 @@ static CYTHON_INLINE PyObject *__pyx_convert_PyUnicode_string_to_py_6libcpp_6str
  *     cdef object __Pyx_PyStr_FromStringAndSize(const char*, size_t)
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyUnicode_FromStringAndSize(__pyx_v_s.data(), __pyx_v_s.size()); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 38, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyUnicode_FromStringAndSize(__pyx_v_s.data(), __pyx_v_s.size()); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 38, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -3360,7 +3577,7 @@ static CYTHON_INLINE PyObject *__pyx_convert_PyStr_string_to_py_6libcpp_6string_
  *     cdef object __Pyx_PyBytes_FromStringAndSize(const char*, size_t)
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyStr_FromStringAndSize(__pyx_v_s.data(), __pyx_v_s.size()); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 44, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyStr_FromStringAndSize(__pyx_v_s.data(), __pyx_v_s.size()); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 44, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -3410,7 +3627,7 @@ static CYTHON_INLINE PyObject *__pyx_convert_PyBytes_string_to_py_6libcpp_6strin
  *     cdef object __Pyx_PyByteArray_FromStringAndSize(const char*, size_t)
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBytes_FromStringAndSize(__pyx_v_s.data(), __pyx_v_s.size()); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 50, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyBytes_FromStringAndSize(__pyx_v_s.data(), __pyx_v_s.size()); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 50, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -3459,7 +3676,7 @@ static CYTHON_INLINE PyObject *__pyx_convert_PyByteArray_string_to_py_6libcpp_6s
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyByteArray_FromStringAndSize(__pyx_v_s.data(), __pyx_v_s.size()); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 56, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyByteArray_FromStringAndSize(__pyx_v_s.data(), __pyx_v_s.size()); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 56, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -3484,24 +3701,19 @@ static CYTHON_INLINE PyObject *__pyx_convert_PyByteArray_string_to_py_6libcpp_6s
   return __pyx_r;
 }
 
-/* "quipubase.pyx":60
- *     cdef object lock
+/* "quipubase.pyx":77
+ *     cdef object owner
+ * 
+ *     def __cinit__(self):             # <<<<<<<<<<<<<<
+ *         self.slice = new PinnableSlice()
  * 
- *     def __cinit__(self, str db_path):             # <<<<<<<<<<<<<<
- *         if not db_path:
- *             raise ValueError("db_path must be provided")
  */
 
 /* Python wrapper */
-static int __pyx_pw_9quipubase_5Quipu_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pw_9quipubase_5Quipu_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_db_path = 0;
+static int __pyx_pw_9quipubase_11PinnedValue_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_9quipubase_11PinnedValue_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
@@ -3511,673 +3723,1844 @@ static int __pyx_pw_9quipubase_5Quipu_1__cinit__(PyObject *__pyx_v_self, PyObjec
   __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return -1;
   #endif
   __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_db_path,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  1: values[0] = __Pyx_Arg_VARARGS(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_VARARGS(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_db_path)) != 0)) {
-          (void)__Pyx_Arg_NewRef_VARARGS(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 60, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__cinit__") < 0)) __PYX_ERR(0, 60, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 1)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_VARARGS(__pyx_args, 0);
-    }
-    __pyx_v_db_path = ((PyObject*)values[0]);
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 60, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_VARARGS(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("quipubase.Quipu.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_db_path), (&PyString_Type), 1, "db_path", 1))) __PYX_ERR(0, 60, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9quipubase_5Quipu___cinit__(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_db_path);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 0, 0, __pyx_nargs); return -1;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_VARARGS(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__cinit__", 0))) return -1;
+  __pyx_r = __pyx_pf_9quipubase_11PinnedValue___cinit__(((struct __pyx_obj_9quipubase_PinnedValue *)__pyx_v_self));
 
   /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = -1;
-  __pyx_L0:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_VARARGS(values[__pyx_temp]);
-    }
-  }
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static int __pyx_pf_9quipubase_5Quipu___cinit__(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_db_path) {
+static int __pyx_pf_9quipubase_11PinnedValue___cinit__(struct __pyx_obj_9quipubase_PinnedValue *__pyx_v_self) {
   int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  std::string __pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  int __pyx_t_7;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__cinit__", 1);
 
-  /* "quipubase.pyx":61
+  /* "quipubase.pyx":78
  * 
- *     def __cinit__(self, str db_path):
- *         if not db_path:             # <<<<<<<<<<<<<<
- *             raise ValueError("db_path must be provided")
- *         self.options = Options()
+ *     def __cinit__(self):
+ *         self.slice = new PinnableSlice()             # <<<<<<<<<<<<<<
+ * 
+ *     def __dealloc__(self):
  */
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_db_path); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 61, __pyx_L1_error)
-  __pyx_t_2 = (!__pyx_t_1);
-  if (unlikely(__pyx_t_2)) {
+  __pyx_v_self->slice = new rocksdb::PinnableSlice();
 
-    /* "quipubase.pyx":62
- *     def __cinit__(self, str db_path):
- *         if not db_path:
- *             raise ValueError("db_path must be provided")             # <<<<<<<<<<<<<<
- *         self.options = Options()
- *         self.options.create_if_missing = True
+  /* "quipubase.pyx":77
+ *     cdef object owner
+ * 
+ *     def __cinit__(self):             # <<<<<<<<<<<<<<
+ *         self.slice = new PinnableSlice()
+ * 
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 62, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(0, 62, __pyx_L1_error)
 
-    /* "quipubase.pyx":61
+  /* function exit code */
+  __pyx_r = 0;
+  return __pyx_r;
+}
+
+/* "quipubase.pyx":80
+ *         self.slice = new PinnableSlice()
  * 
- *     def __cinit__(self, str db_path):
- *         if not db_path:             # <<<<<<<<<<<<<<
- *             raise ValueError("db_path must be provided")
- *         self.options = Options()
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         if self.slice != NULL:
+ *             self.slice.Reset()
  */
-  }
 
-  /* "quipubase.pyx":63
- *         if not db_path:
- *             raise ValueError("db_path must be provided")
- *         self.options = Options()             # <<<<<<<<<<<<<<
- *         self.options.create_if_missing = True
- *         self.write_options = WriteOptions()
- */
-  __pyx_v_self->options = rocksdb::Options();
+/* Python wrapper */
+static void __pyx_pw_9quipubase_11PinnedValue_3__dealloc__(PyObject *__pyx_v_self); /*proto*/
+static void __pyx_pw_9quipubase_11PinnedValue_3__dealloc__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__dealloc__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_pf_9quipubase_11PinnedValue_2__dealloc__(((struct __pyx_obj_9quipubase_PinnedValue *)__pyx_v_self));
 
-  /* "quipubase.pyx":64
- *             raise ValueError("db_path must be provided")
- *         self.options = Options()
- *         self.options.create_if_missing = True             # <<<<<<<<<<<<<<
- *         self.write_options = WriteOptions()
- *         self.read_options = ReadOptions()
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+static void __pyx_pf_9quipubase_11PinnedValue_2__dealloc__(struct __pyx_obj_9quipubase_PinnedValue *__pyx_v_self) {
+  int __pyx_t_1;
+
+  /* "quipubase.pyx":81
+ * 
+ *     def __dealloc__(self):
+ *         if self.slice != NULL:             # <<<<<<<<<<<<<<
+ *             self.slice.Reset()
+ *             del self.slice
  */
-  __pyx_v_self->options.create_if_missing = 1;
+  __pyx_t_1 = (__pyx_v_self->slice != NULL);
+  if (__pyx_t_1) {
 
-  /* "quipubase.pyx":65
- *         self.options = Options()
- *         self.options.create_if_missing = True
- *         self.write_options = WriteOptions()             # <<<<<<<<<<<<<<
- *         self.read_options = ReadOptions()
- *         self.db_path = db_path.encode()
+    /* "quipubase.pyx":82
+ *     def __dealloc__(self):
+ *         if self.slice != NULL:
+ *             self.slice.Reset()             # <<<<<<<<<<<<<<
+ *             del self.slice
+ *             self.slice = NULL
  */
-  __pyx_v_self->write_options = rocksdb::WriteOptions();
+    __pyx_v_self->slice->Reset();
 
-  /* "quipubase.pyx":66
- *         self.options.create_if_missing = True
- *         self.write_options = WriteOptions()
- *         self.read_options = ReadOptions()             # <<<<<<<<<<<<<<
- *         self.db_path = db_path.encode()
- *         self.lock = mutex()
+    /* "quipubase.pyx":83
+ *         if self.slice != NULL:
+ *             self.slice.Reset()
+ *             del self.slice             # <<<<<<<<<<<<<<
+ *             self.slice = NULL
+ * 
  */
-  __pyx_v_self->read_options = rocksdb::ReadOptions();
+    delete __pyx_v_self->slice;
 
-  /* "quipubase.pyx":67
- *         self.write_options = WriteOptions()
- *         self.read_options = ReadOptions()
- *         self.db_path = db_path.encode()             # <<<<<<<<<<<<<<
- *         self.lock = mutex()
- *         self.open_db()
+    /* "quipubase.pyx":84
+ *             self.slice.Reset()
+ *             del self.slice
+ *             self.slice = NULL             # <<<<<<<<<<<<<<
+ * 
+ *     def __len__(self):
  */
-  __pyx_t_3 = __Pyx_CallUnboundCMethod0(&__pyx_umethod_PyString_Type_encode, __pyx_v_db_path); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 67, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __pyx_convert_string_from_py_6libcpp_6string_std__in_string(__pyx_t_3); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 67, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_v_self->db_path = __PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_4);
+    __pyx_v_self->slice = NULL;
 
-  /* "quipubase.pyx":68
- *         self.read_options = ReadOptions()
- *         self.db_path = db_path.encode()
- *         self.lock = mutex()             # <<<<<<<<<<<<<<
- *         self.open_db()
+    /* "quipubase.pyx":81
  * 
+ *     def __dealloc__(self):
+ *         if self.slice != NULL:             # <<<<<<<<<<<<<<
+ *             self.slice.Reset()
+ *             del self.slice
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_mutex); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 68, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
-    if (likely(__pyx_t_6)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_6);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_5, function);
-      __pyx_t_7 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_6, NULL};
-    __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+1-__pyx_t_7, 0+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 68, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   }
-  __Pyx_GIVEREF(__pyx_t_3);
-  __Pyx_GOTREF(__pyx_v_self->lock);
-  __Pyx_DECREF(__pyx_v_self->lock);
-  __pyx_v_self->lock = __pyx_t_3;
-  __pyx_t_3 = 0;
 
-  /* "quipubase.pyx":69
- *         self.db_path = db_path.encode()
- *         self.lock = mutex()
- *         self.open_db()             # <<<<<<<<<<<<<<
+  /* "quipubase.pyx":80
+ *         self.slice = new PinnableSlice()
  * 
- *     cdef void open_db(self):
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         if self.slice != NULL:
+ *             self.slice.Reset()
  */
-  ((struct __pyx_vtabstruct_9quipubase_Quipu *)__pyx_v_self->__pyx_vtab)->open_db(__pyx_v_self); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 69, __pyx_L1_error)
 
-  /* "quipubase.pyx":60
- *     cdef object lock
+  /* function exit code */
+}
+
+/* "quipubase.pyx":86
+ *             self.slice = NULL
+ * 
+ *     def __len__(self):             # <<<<<<<<<<<<<<
+ *         return self.slice.size()
  * 
- *     def __cinit__(self, str db_path):             # <<<<<<<<<<<<<<
- *         if not db_path:
- *             raise ValueError("db_path must be provided")
  */
 
+/* Python wrapper */
+static Py_ssize_t __pyx_pw_9quipubase_11PinnedValue_5__len__(PyObject *__pyx_v_self); /*proto*/
+static Py_ssize_t __pyx_pw_9quipubase_11PinnedValue_5__len__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  Py_ssize_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__len__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9quipubase_11PinnedValue_4__len__(((struct __pyx_obj_9quipubase_PinnedValue *)__pyx_v_self));
+
   /* function exit code */
-  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static Py_ssize_t __pyx_pf_9quipubase_11PinnedValue_4__len__(struct __pyx_obj_9quipubase_PinnedValue *__pyx_v_self) {
+  Py_ssize_t __pyx_r;
+
+  /* "quipubase.pyx":87
+ * 
+ *     def __len__(self):
+ *         return self.slice.size()             # <<<<<<<<<<<<<<
+ * 
+ *     def __getbuffer__(self, Py_buffer* buffer, int flags):
+ */
+  __pyx_r = __pyx_v_self->slice->size();
   goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_AddTraceback("quipubase.Quipu.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
+
+  /* "quipubase.pyx":86
+ *             self.slice = NULL
+ * 
+ *     def __len__(self):             # <<<<<<<<<<<<<<
+ *         return self.slice.size()
+ * 
+ */
+
+  /* function exit code */
   __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "quipubase.pyx":71
- *         self.open_db()
+/* "quipubase.pyx":89
+ *         return self.slice.size()
+ * 
+ *     def __getbuffer__(self, Py_buffer* buffer, int flags):             # <<<<<<<<<<<<<<
+ *         PyBuffer_FillInfo(buffer, self, <void*>self.slice.data(), self.slice.size(), 1, flags)
  * 
- *     cdef void open_db(self):             # <<<<<<<<<<<<<<
- *         with self.lock:
- *             self.status = DB.Open(self.options, self.db_path, &self.db)
  */
 
-static void __pyx_f_9quipubase_5Quipu_open_db(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self) {
+/* Python wrapper */
+CYTHON_UNUSED static int __pyx_pw_9quipubase_11PinnedValue_7__getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_buffer, int __pyx_v_flags); /*proto*/
+CYTHON_UNUSED static int __pyx_pw_9quipubase_11PinnedValue_7__getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_buffer, int __pyx_v_flags) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_t_5;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  int __pyx_t_9;
-  PyObject *__pyx_t_10 = NULL;
-  PyObject *__pyx_t_11 = NULL;
-  int __pyx_t_12;
+  __Pyx_RefNannySetupContext("__getbuffer__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9quipubase_11PinnedValue_6__getbuffer__(((struct __pyx_obj_9quipubase_PinnedValue *)__pyx_v_self), ((Py_buffer *)__pyx_v_buffer), ((int)__pyx_v_flags));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_9quipubase_11PinnedValue_6__getbuffer__(struct __pyx_obj_9quipubase_PinnedValue *__pyx_v_self, Py_buffer *__pyx_v_buffer, int __pyx_v_flags) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("open_db", 1);
+  if (unlikely(__pyx_v_buffer == NULL)) {
+    PyErr_SetString(PyExc_BufferError, "PyObject_GetBuffer: view==NULL argument is obsolete");
+    return -1;
+  }
+  __Pyx_RefNannySetupContext("__getbuffer__", 0);
+  __pyx_v_buffer->obj = Py_None; __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(__pyx_v_buffer->obj);
 
-  /* "quipubase.pyx":72
+  /* "quipubase.pyx":90
  * 
- *     cdef void open_db(self):
- *         with self.lock:             # <<<<<<<<<<<<<<
- *             self.status = DB.Open(self.options, self.db_path, &self.db)
- *             if not self.status.ok():
+ *     def __getbuffer__(self, Py_buffer* buffer, int flags):
+ *         PyBuffer_FillInfo(buffer, self, <void*>self.slice.data(), self.slice.size(), 1, flags)             # <<<<<<<<<<<<<<
+ * 
+ *     def __releasebuffer__(self, Py_buffer* buffer):
  */
-  /*with:*/ {
-    __pyx_t_1 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_exit); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 72, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_enter); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 72, __pyx_L3_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = NULL;
-    __pyx_t_5 = 0;
-    #if CYTHON_UNPACK_METHODS
-    if (likely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_4)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_4);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-        __pyx_t_5 = 1;
-      }
-    }
-    #endif
-    {
-      PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
-      __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 72, __pyx_L3_error)
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    }
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    /*try:*/ {
-      {
-        __Pyx_PyThreadState_declare
-        __Pyx_PyThreadState_assign
-        __Pyx_ExceptionSave(&__pyx_t_6, &__pyx_t_7, &__pyx_t_8);
-        __Pyx_XGOTREF(__pyx_t_6);
-        __Pyx_XGOTREF(__pyx_t_7);
-        __Pyx_XGOTREF(__pyx_t_8);
-        /*try:*/ {
+  __pyx_t_1 = PyBuffer_FillInfo(__pyx_v_buffer, ((PyObject *)__pyx_v_self), ((void *)__pyx_v_self->slice->data()), __pyx_v_self->slice->size(), 1, __pyx_v_flags); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(1, 90, __pyx_L1_error)
 
-          /* "quipubase.pyx":73
- *     cdef void open_db(self):
- *         with self.lock:
- *             self.status = DB.Open(self.options, self.db_path, &self.db)             # <<<<<<<<<<<<<<
- *             if not self.status.ok():
- *                 raise RuntimeError(f"Failed to open database: {self.status.ToString().decode()}")
+  /* "quipubase.pyx":89
+ *         return self.slice.size()
+ * 
+ *     def __getbuffer__(self, Py_buffer* buffer, int flags):             # <<<<<<<<<<<<<<
+ *         PyBuffer_FillInfo(buffer, self, <void*>self.slice.data(), self.slice.size(), 1, flags)
+ * 
  */
-          __pyx_v_self->status = rocksdb::DB::Open(__pyx_v_self->options, __pyx_v_self->db_path, (&__pyx_v_self->db));
 
-          /* "quipubase.pyx":74
- *         with self.lock:
- *             self.status = DB.Open(self.options, self.db_path, &self.db)
- *             if not self.status.ok():             # <<<<<<<<<<<<<<
- *                 raise RuntimeError(f"Failed to open database: {self.status.ToString().decode()}")
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("quipubase.PinnedValue.__getbuffer__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  if (__pyx_v_buffer->obj != NULL) {
+    __Pyx_GOTREF(__pyx_v_buffer->obj);
+    __Pyx_DECREF(__pyx_v_buffer->obj); __pyx_v_buffer->obj = 0;
+  }
+  goto __pyx_L2;
+  __pyx_L0:;
+  if (__pyx_v_buffer->obj == Py_None) {
+    __Pyx_GOTREF(__pyx_v_buffer->obj);
+    __Pyx_DECREF(__pyx_v_buffer->obj); __pyx_v_buffer->obj = 0;
+  }
+  __pyx_L2:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "quipubase.pyx":92
+ *         PyBuffer_FillInfo(buffer, self, <void*>self.slice.data(), self.slice.size(), 1, flags)
+ * 
+ *     def __releasebuffer__(self, Py_buffer* buffer):             # <<<<<<<<<<<<<<
+ *         pass
  * 
  */
-          __pyx_t_9 = (!(__pyx_v_self->status.ok() != 0));
-          if (unlikely(__pyx_t_9)) {
 
-            /* "quipubase.pyx":75
- *             self.status = DB.Open(self.options, self.db_path, &self.db)
- *             if not self.status.ok():
- *                 raise RuntimeError(f"Failed to open database: {self.status.ToString().decode()}")             # <<<<<<<<<<<<<<
- * 
- *     cdef void close_db(self):
+/* Python wrapper */
+CYTHON_UNUSED static void __pyx_pw_9quipubase_11PinnedValue_9__releasebuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_buffer); /*proto*/
+CYTHON_UNUSED static void __pyx_pw_9quipubase_11PinnedValue_9__releasebuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_buffer) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__releasebuffer__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_pf_9quipubase_11PinnedValue_8__releasebuffer__(((struct __pyx_obj_9quipubase_PinnedValue *)__pyx_v_self), ((Py_buffer *)__pyx_v_buffer));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+static void __pyx_pf_9quipubase_11PinnedValue_8__releasebuffer__(CYTHON_UNUSED struct __pyx_obj_9quipubase_PinnedValue *__pyx_v_self, CYTHON_UNUSED Py_buffer *__pyx_v_buffer) {
+
+  /* function exit code */
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
  */
-            __pyx_t_2 = __Pyx_decode_cpp_string(__pyx_v_self->status.ToString(), 0, PY_SSIZE_T_MAX, NULL, NULL, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 75, __pyx_L7_error)
-            __Pyx_GOTREF(__pyx_t_2);
-            __pyx_t_3 = __Pyx_PyUnicode_Concat(__pyx_kp_u_Failed_to_open_database, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 75, __pyx_L7_error)
-            __Pyx_GOTREF(__pyx_t_3);
-            __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-            __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_RuntimeError, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 75, __pyx_L7_error)
-            __Pyx_GOTREF(__pyx_t_2);
-            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-            __Pyx_Raise(__pyx_t_2, 0, 0, 0);
-            __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-            __PYX_ERR(0, 75, __pyx_L7_error)
 
-            /* "quipubase.pyx":74
- *         with self.lock:
- *             self.status = DB.Open(self.options, self.db_path, &self.db)
- *             if not self.status.ok():             # <<<<<<<<<<<<<<
- *                 raise RuntimeError(f"Failed to open database: {self.status.ToString().decode()}")
- * 
+/* Python wrapper */
+static PyObject *__pyx_pw_9quipubase_11PinnedValue_11__reduce_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_9quipubase_11PinnedValue_11__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_11PinnedValue_11__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9quipubase_11PinnedValue_11__reduce_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("__reduce_cython__", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__reduce_cython__", 0))) return NULL;
+  __pyx_r = __pyx_pf_9quipubase_11PinnedValue_10__reduce_cython__(((struct __pyx_obj_9quipubase_PinnedValue *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9quipubase_11PinnedValue_10__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_9quipubase_PinnedValue *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 1);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
  */
-          }
+  __Pyx_Raise(__pyx_builtin_TypeError, __pyx_kp_s_no_default___reduce___due_to_non, 0, 0);
+  __PYX_ERR(0, 2, __pyx_L1_error)
 
-          /* "quipubase.pyx":72
- * 
- *     cdef void open_db(self):
- *         with self.lock:             # <<<<<<<<<<<<<<
- *             self.status = DB.Open(self.options, self.db_path, &self.db)
- *             if not self.status.ok():
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
  */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("quipubase.PinnedValue.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9quipubase_11PinnedValue_13__setstate_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_9quipubase_11PinnedValue_13__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_11PinnedValue_13__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9quipubase_11PinnedValue_13__setstate_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  CYTHON_UNUSED PyObject *__pyx_v___pyx_state = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_state,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_pyx_state)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
         }
-        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-        goto __pyx_L12_try_end;
-        __pyx_L7_error:;
-        __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        /*except:*/ {
-          __Pyx_AddTraceback("quipubase.Quipu.open_db", __pyx_clineno, __pyx_lineno, __pyx_filename);
-          if (__Pyx_GetException(&__pyx_t_2, &__pyx_t_3, &__pyx_t_4) < 0) __PYX_ERR(0, 72, __pyx_L9_except_error)
-          __Pyx_XGOTREF(__pyx_t_2);
-          __Pyx_XGOTREF(__pyx_t_3);
-          __Pyx_XGOTREF(__pyx_t_4);
-          __pyx_t_10 = PyTuple_Pack(3, __pyx_t_2, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 72, __pyx_L9_except_error)
-          __Pyx_GOTREF(__pyx_t_10);
-          __pyx_t_11 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_10, NULL);
-          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-          if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 72, __pyx_L9_except_error)
-          __Pyx_GOTREF(__pyx_t_11);
-          __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_11);
-          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-          if (__pyx_t_9 < 0) __PYX_ERR(0, 72, __pyx_L9_except_error)
-          __pyx_t_12 = (!__pyx_t_9);
-          if (unlikely(__pyx_t_12)) {
-            __Pyx_GIVEREF(__pyx_t_2);
-            __Pyx_GIVEREF(__pyx_t_3);
-            __Pyx_XGIVEREF(__pyx_t_4);
-            __Pyx_ErrRestoreWithState(__pyx_t_2, __pyx_t_3, __pyx_t_4);
-            __pyx_t_2 = 0; __pyx_t_3 = 0; __pyx_t_4 = 0; 
-            __PYX_ERR(0, 72, __pyx_L9_except_error)
-          }
-          __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-          __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-          goto __pyx_L8_exception_handled;
-        }
-        __pyx_L9_except_error:;
-        __Pyx_XGIVEREF(__pyx_t_6);
-        __Pyx_XGIVEREF(__pyx_t_7);
-        __Pyx_XGIVEREF(__pyx_t_8);
-        __Pyx_ExceptionReset(__pyx_t_6, __pyx_t_7, __pyx_t_8);
-        goto __pyx_L1_error;
-        __pyx_L8_exception_handled:;
-        __Pyx_XGIVEREF(__pyx_t_6);
-        __Pyx_XGIVEREF(__pyx_t_7);
-        __Pyx_XGIVEREF(__pyx_t_8);
-        __Pyx_ExceptionReset(__pyx_t_6, __pyx_t_7, __pyx_t_8);
-        __pyx_L12_try_end:;
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 3, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__setstate_cython__") < 0)) __PYX_ERR(0, 3, __pyx_L3_error)
       }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
     }
-    /*finally:*/ {
-      /*normal exit:*/{
-        if (__pyx_t_1) {
-          __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__2, NULL);
-          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-          if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 72, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_8);
-          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_v___pyx_state = values[0];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__setstate_cython__", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 3, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("quipubase.PinnedValue.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9quipubase_11PinnedValue_12__setstate_cython__(((struct __pyx_obj_9quipubase_PinnedValue *)__pyx_v_self), __pyx_v___pyx_state);
+
+  /* function exit code */
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9quipubase_11PinnedValue_12__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_9quipubase_PinnedValue *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 1);
+
+  /* "(tree fragment)":4
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"             # <<<<<<<<<<<<<<
+ */
+  __Pyx_Raise(__pyx_builtin_TypeError, __pyx_kp_s_no_default___reduce___due_to_non, 0, 0);
+  __PYX_ERR(0, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("quipubase.PinnedValue.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "quipubase.pyx":96
+ * 
+ * 
+ * cdef inline object slice_view(const char* data, size_t size):             # <<<<<<<<<<<<<<
+ *     # Borrowed view over an iterator slice, only valid until the iterator moves.
+ *     return PyMemoryView_FromMemory(<char*>data, size, PyBUF_READ)
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_9quipubase_slice_view(char const *__pyx_v_data, size_t __pyx_v_size) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("slice_view", 1);
+
+  /* "quipubase.pyx":98
+ * cdef inline object slice_view(const char* data, size_t size):
+ *     # Borrowed view over an iterator slice, only valid until the iterator moves.
+ *     return PyMemoryView_FromMemory(<char*>data, size, PyBUF_READ)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyMemoryView_FromMemory(((char *)__pyx_v_data), __pyx_v_size, PyBUF_READ); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 98, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "quipubase.pyx":96
+ * 
+ * 
+ * cdef inline object slice_view(const char* data, size_t size):             # <<<<<<<<<<<<<<
+ *     # Borrowed view over an iterator slice, only valid until the iterator moves.
+ *     return PyMemoryView_FromMemory(<char*>data, size, PyBUF_READ)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("quipubase.slice_view", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "quipubase.pyx":111
+ *     cdef object lock
+ * 
+ *     def __cinit__(self, str db_path):             # <<<<<<<<<<<<<<
+ *         if not db_path:
+ *             raise ValueError("db_path must be provided")
+ */
+
+/* Python wrapper */
+static int __pyx_pw_9quipubase_5Quipu_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_9quipubase_5Quipu_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_db_path = 0;
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return -1;
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_db_path,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  1: values[0] = __Pyx_Arg_VARARGS(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_VARARGS(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_db_path)) != 0)) {
+          (void)__Pyx_Arg_NewRef_VARARGS(values[0]);
+          kw_args--;
         }
-        goto __pyx_L6;
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 111, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
       }
-      __pyx_L6:;
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__cinit__") < 0)) __PYX_ERR(1, 111, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_VARARGS(__pyx_args, 0);
+    }
+    __pyx_v_db_path = ((PyObject*)values[0]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 1, 1, __pyx_nargs); __PYX_ERR(1, 111, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_VARARGS(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("quipubase.Quipu.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_db_path), (&PyString_Type), 1, "db_path", 1))) __PYX_ERR(1, 111, __pyx_L1_error)
+  __pyx_r = __pyx_pf_9quipubase_5Quipu___cinit__(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_db_path);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = -1;
+  __pyx_L0:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_VARARGS(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_9quipubase_5Quipu___cinit__(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_db_path) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  std::string __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__cinit__", 1);
+
+  /* "quipubase.pyx":112
+ * 
+ *     def __cinit__(self, str db_path):
+ *         if not db_path:             # <<<<<<<<<<<<<<
+ *             raise ValueError("db_path must be provided")
+ *         self.options = Options()
+ */
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_db_path); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(1, 112, __pyx_L1_error)
+  __pyx_t_2 = (!__pyx_t_1);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "quipubase.pyx":113
+ *     def __cinit__(self, str db_path):
+ *         if not db_path:
+ *             raise ValueError("db_path must be provided")             # <<<<<<<<<<<<<<
+ *         self.options = Options()
+ *         self.options.create_if_missing = True
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 113, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(1, 113, __pyx_L1_error)
+
+    /* "quipubase.pyx":112
+ * 
+ *     def __cinit__(self, str db_path):
+ *         if not db_path:             # <<<<<<<<<<<<<<
+ *             raise ValueError("db_path must be provided")
+ *         self.options = Options()
+ */
+  }
+
+  /* "quipubase.pyx":114
+ *         if not db_path:
+ *             raise ValueError("db_path must be provided")
+ *         self.options = Options()             # <<<<<<<<<<<<<<
+ *         self.options.create_if_missing = True
+ *         self.write_options = WriteOptions()
+ */
+  __pyx_v_self->options = rocksdb::Options();
+
+  /* "quipubase.pyx":115
+ *             raise ValueError("db_path must be provided")
+ *         self.options = Options()
+ *         self.options.create_if_missing = True             # <<<<<<<<<<<<<<
+ *         self.write_options = WriteOptions()
+ *         self.read_options = ReadOptions()
+ */
+  __pyx_v_self->options.create_if_missing = 1;
+
+  /* "quipubase.pyx":116
+ *         self.options = Options()
+ *         self.options.create_if_missing = True
+ *         self.write_options = WriteOptions()             # <<<<<<<<<<<<<<
+ *         self.read_options = ReadOptions()
+ *         self.db_path = db_path.encode()
+ */
+  __pyx_v_self->write_options = rocksdb::WriteOptions();
+
+  /* "quipubase.pyx":117
+ *         self.options.create_if_missing = True
+ *         self.write_options = WriteOptions()
+ *         self.read_options = ReadOptions()             # <<<<<<<<<<<<<<
+ *         self.db_path = db_path.encode()
+ *         self.lock = mutex()
+ */
+  __pyx_v_self->read_options = rocksdb::ReadOptions();
+
+  /* "quipubase.pyx":118
+ *         self.write_options = WriteOptions()
+ *         self.read_options = ReadOptions()
+ *         self.db_path = db_path.encode()             # <<<<<<<<<<<<<<
+ *         self.lock = mutex()
+ *         self.open_db()
+ */
+  __pyx_t_3 = __Pyx_CallUnboundCMethod0(&__pyx_umethod_PyString_Type_encode, __pyx_v_db_path); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 118, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __pyx_convert_string_from_py_6libcpp_6string_std__in_string(__pyx_t_3); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 118, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_self->db_path = __PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_4);
+
+  /* "quipubase.pyx":119
+ *         self.read_options = ReadOptions()
+ *         self.db_path = db_path.encode()
+ *         self.lock = mutex()             # <<<<<<<<<<<<<<
+ *         self.open_db()
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_mutex); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 119, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = NULL;
+  __pyx_t_7 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+      __pyx_t_7 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_6, NULL};
+    __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+1-__pyx_t_7, 0+__pyx_t_7);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 119, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+  __Pyx_GIVEREF(__pyx_t_3);
+  __Pyx_GOTREF(__pyx_v_self->lock);
+  __Pyx_DECREF(__pyx_v_self->lock);
+  __pyx_v_self->lock = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "quipubase.pyx":120
+ *         self.db_path = db_path.encode()
+ *         self.lock = mutex()
+ *         self.open_db()             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void open_db(self):
+ */
+  ((struct __pyx_vtabstruct_9quipubase_Quipu *)__pyx_v_self->__pyx_vtab)->open_db(__pyx_v_self); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 120, __pyx_L1_error)
+
+  /* "quipubase.pyx":111
+ *     cdef object lock
+ * 
+ *     def __cinit__(self, str db_path):             # <<<<<<<<<<<<<<
+ *         if not db_path:
+ *             raise ValueError("db_path must be provided")
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("quipubase.Quipu.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "quipubase.pyx":122
+ *         self.open_db()
+ * 
+ *     cdef void open_db(self):             # <<<<<<<<<<<<<<
+ *         with self.lock:
+ *             self.status = DB.Open(self.options, self.db_path, &self.db)
+ */
+
+static void __pyx_f_9quipubase_5Quipu_open_db(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  int __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("open_db", 1);
+
+  /* "quipubase.pyx":123
+ * 
+ *     cdef void open_db(self):
+ *         with self.lock:             # <<<<<<<<<<<<<<
+ *             self.status = DB.Open(self.options, self.db_path, &self.db)
+ *             if not self.status.ok():
+ */
+  /*with:*/ {
+    __pyx_t_1 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_exit); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 123, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_enter); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 123, __pyx_L3_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = NULL;
+    __pyx_t_5 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_5 = 1;
+      }
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
+      __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 123, __pyx_L3_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    /*try:*/ {
+      {
+        __Pyx_PyThreadState_declare
+        __Pyx_PyThreadState_assign
+        __Pyx_ExceptionSave(&__pyx_t_6, &__pyx_t_7, &__pyx_t_8);
+        __Pyx_XGOTREF(__pyx_t_6);
+        __Pyx_XGOTREF(__pyx_t_7);
+        __Pyx_XGOTREF(__pyx_t_8);
+        /*try:*/ {
+
+          /* "quipubase.pyx":124
+ *     cdef void open_db(self):
+ *         with self.lock:
+ *             self.status = DB.Open(self.options, self.db_path, &self.db)             # <<<<<<<<<<<<<<
+ *             if not self.status.ok():
+ *                 raise RuntimeError(f"Failed to open database: {self.status.ToString().decode()}")
+ */
+          __pyx_v_self->status = rocksdb::DB::Open(__pyx_v_self->options, __pyx_v_self->db_path, (&__pyx_v_self->db));
+
+          /* "quipubase.pyx":125
+ *         with self.lock:
+ *             self.status = DB.Open(self.options, self.db_path, &self.db)
+ *             if not self.status.ok():             # <<<<<<<<<<<<<<
+ *                 raise RuntimeError(f"Failed to open database: {self.status.ToString().decode()}")
+ * 
+ */
+          __pyx_t_9 = (!(__pyx_v_self->status.ok() != 0));
+          if (unlikely(__pyx_t_9)) {
+
+            /* "quipubase.pyx":126
+ *             self.status = DB.Open(self.options, self.db_path, &self.db)
+ *             if not self.status.ok():
+ *                 raise RuntimeError(f"Failed to open database: {self.status.ToString().decode()}")             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void close_db(self):
+ */
+            __pyx_t_2 = __Pyx_decode_cpp_string(__pyx_v_self->status.ToString(), 0, PY_SSIZE_T_MAX, NULL, NULL, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 126, __pyx_L7_error)
+            __Pyx_GOTREF(__pyx_t_2);
+            __pyx_t_3 = __Pyx_PyUnicode_Concat(__pyx_kp_u_Failed_to_open_database, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 126, __pyx_L7_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+            __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_RuntimeError, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 126, __pyx_L7_error)
+            __Pyx_GOTREF(__pyx_t_2);
+            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+            __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+            __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+            __PYX_ERR(1, 126, __pyx_L7_error)
+
+            /* "quipubase.pyx":125
+ *         with self.lock:
+ *             self.status = DB.Open(self.options, self.db_path, &self.db)
+ *             if not self.status.ok():             # <<<<<<<<<<<<<<
+ *                 raise RuntimeError(f"Failed to open database: {self.status.ToString().decode()}")
+ * 
+ */
+          }
+
+          /* "quipubase.pyx":123
+ * 
+ *     cdef void open_db(self):
+ *         with self.lock:             # <<<<<<<<<<<<<<
+ *             self.status = DB.Open(self.options, self.db_path, &self.db)
+ *             if not self.status.ok():
+ */
+        }
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        goto __pyx_L12_try_end;
+        __pyx_L7_error:;
+        __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        /*except:*/ {
+          __Pyx_AddTraceback("quipubase.Quipu.open_db", __pyx_clineno, __pyx_lineno, __pyx_filename);
+          if (__Pyx_GetException(&__pyx_t_2, &__pyx_t_3, &__pyx_t_4) < 0) __PYX_ERR(1, 123, __pyx_L9_except_error)
+          __Pyx_XGOTREF(__pyx_t_2);
+          __Pyx_XGOTREF(__pyx_t_3);
+          __Pyx_XGOTREF(__pyx_t_4);
+          __pyx_t_10 = PyTuple_Pack(3, __pyx_t_2, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_10)) __PYX_ERR(1, 123, __pyx_L9_except_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __pyx_t_11 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_10, NULL);
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          if (unlikely(!__pyx_t_11)) __PYX_ERR(1, 123, __pyx_L9_except_error)
+          __Pyx_GOTREF(__pyx_t_11);
+          __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_11);
+          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+          if (__pyx_t_9 < 0) __PYX_ERR(1, 123, __pyx_L9_except_error)
+          __pyx_t_12 = (!__pyx_t_9);
+          if (unlikely(__pyx_t_12)) {
+            __Pyx_GIVEREF(__pyx_t_2);
+            __Pyx_GIVEREF(__pyx_t_3);
+            __Pyx_XGIVEREF(__pyx_t_4);
+            __Pyx_ErrRestoreWithState(__pyx_t_2, __pyx_t_3, __pyx_t_4);
+            __pyx_t_2 = 0; __pyx_t_3 = 0; __pyx_t_4 = 0; 
+            __PYX_ERR(1, 123, __pyx_L9_except_error)
+          }
+          __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+          __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+          goto __pyx_L8_exception_handled;
+        }
+        __pyx_L9_except_error:;
+        __Pyx_XGIVEREF(__pyx_t_6);
+        __Pyx_XGIVEREF(__pyx_t_7);
+        __Pyx_XGIVEREF(__pyx_t_8);
+        __Pyx_ExceptionReset(__pyx_t_6, __pyx_t_7, __pyx_t_8);
+        goto __pyx_L1_error;
+        __pyx_L8_exception_handled:;
+        __Pyx_XGIVEREF(__pyx_t_6);
+        __Pyx_XGIVEREF(__pyx_t_7);
+        __Pyx_XGIVEREF(__pyx_t_8);
+        __Pyx_ExceptionReset(__pyx_t_6, __pyx_t_7, __pyx_t_8);
+        __pyx_L12_try_end:;
+      }
+    }
+    /*finally:*/ {
+      /*normal exit:*/{
+        if (__pyx_t_1) {
+          __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__2, NULL);
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+          if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 123, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        }
+        goto __pyx_L6;
+      }
+      __pyx_L6:;
+    }
+    goto __pyx_L17;
+    __pyx_L3_error:;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    goto __pyx_L1_error;
+    __pyx_L17:;
+  }
+
+  /* "quipubase.pyx":122
+ *         self.open_db()
+ * 
+ *     cdef void open_db(self):             # <<<<<<<<<<<<<<
+ *         with self.lock:
+ *             self.status = DB.Open(self.options, self.db_path, &self.db)
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("quipubase.Quipu.open_db", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "quipubase.pyx":128
+ *                 raise RuntimeError(f"Failed to open database: {self.status.ToString().decode()}")
+ * 
+ *     cdef void close_db(self):             # <<<<<<<<<<<<<<
+ *         with self.lock:
+ *             if self.db:
+ */
+
+static void __pyx_f_9quipubase_5Quipu_close_db(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("close_db", 1);
+
+  /* "quipubase.pyx":129
+ * 
+ *     cdef void close_db(self):
+ *         with self.lock:             # <<<<<<<<<<<<<<
+ *             if self.db:
+ *                 self.db.Close()
+ */
+  /*with:*/ {
+    __pyx_t_1 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_exit); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 129, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_enter); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 129, __pyx_L3_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = NULL;
+    __pyx_t_5 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_5 = 1;
+      }
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
+      __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 129, __pyx_L3_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    /*try:*/ {
+      {
+        (void)__pyx_t_6; (void)__pyx_t_7; (void)__pyx_t_8; /* mark used */
+        /*try:*/ {
+
+          /* "quipubase.pyx":130
+ *     cdef void close_db(self):
+ *         with self.lock:
+ *             if self.db:             # <<<<<<<<<<<<<<
+ *                 self.db.Close()
+ *                 del self.db
+ */
+          __pyx_t_9 = (__pyx_v_self->db != 0);
+          if (__pyx_t_9) {
+
+            /* "quipubase.pyx":131
+ *         with self.lock:
+ *             if self.db:
+ *                 self.db.Close()             # <<<<<<<<<<<<<<
+ *                 del self.db
+ *                 self.db = NULL
+ */
+            __pyx_v_self->db->Close();
+
+            /* "quipubase.pyx":132
+ *             if self.db:
+ *                 self.db.Close()
+ *                 del self.db             # <<<<<<<<<<<<<<
+ *                 self.db = NULL
+ * 
+ */
+            delete __pyx_v_self->db;
+
+            /* "quipubase.pyx":133
+ *                 self.db.Close()
+ *                 del self.db
+ *                 self.db = NULL             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int ensure_open(self) except -1:
+ */
+            __pyx_v_self->db = NULL;
+
+            /* "quipubase.pyx":130
+ *     cdef void close_db(self):
+ *         with self.lock:
+ *             if self.db:             # <<<<<<<<<<<<<<
+ *                 self.db.Close()
+ *                 del self.db
+ */
+          }
+
+          /* "quipubase.pyx":129
+ * 
+ *     cdef void close_db(self):
+ *         with self.lock:             # <<<<<<<<<<<<<<
+ *             if self.db:
+ *                 self.db.Close()
+ */
+        }
+      }
+    }
+    /*finally:*/ {
+      /*normal exit:*/{
+        if (__pyx_t_1) {
+          __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__2, NULL);
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+          if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 129, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        }
+        goto __pyx_L6;
+      }
+      __pyx_L6:;
+    }
+    goto __pyx_L14;
+    __pyx_L3_error:;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    goto __pyx_L1_error;
+    __pyx_L14:;
+  }
+
+  /* "quipubase.pyx":128
+ *                 raise RuntimeError(f"Failed to open database: {self.status.ToString().decode()}")
+ * 
+ *     cdef void close_db(self):             # <<<<<<<<<<<<<<
+ *         with self.lock:
+ *             if self.db:
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("quipubase.Quipu.close_db", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "quipubase.pyx":135
+ *                 self.db = NULL
+ * 
+ *     cdef int ensure_open(self) except -1:             # <<<<<<<<<<<<<<
+ *         # Called with `self.lock` held, so the database can't close underneath.
+ *         if self.db == NULL:
+ */
+
+static int __pyx_f_9quipubase_5Quipu_ensure_open(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("ensure_open", 1);
+
+  /* "quipubase.pyx":137
+ *     cdef int ensure_open(self) except -1:
+ *         # Called with `self.lock` held, so the database can't close underneath.
+ *         if self.db == NULL:             # <<<<<<<<<<<<<<
+ *             raise RuntimeError("Database is closed")
+ *         return 0
+ */
+  __pyx_t_1 = (__pyx_v_self->db == NULL);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "quipubase.pyx":138
+ *         # Called with `self.lock` held, so the database can't close underneath.
+ *         if self.db == NULL:
+ *             raise RuntimeError("Database is closed")             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 138, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(1, 138, __pyx_L1_error)
+
+    /* "quipubase.pyx":137
+ *     cdef int ensure_open(self) except -1:
+ *         # Called with `self.lock` held, so the database can't close underneath.
+ *         if self.db == NULL:             # <<<<<<<<<<<<<<
+ *             raise RuntimeError("Database is closed")
+ *         return 0
+ */
+  }
+
+  /* "quipubase.pyx":139
+ *         if self.db == NULL:
+ *             raise RuntimeError("Database is closed")
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     def __dealloc__(self):
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "quipubase.pyx":135
+ *                 self.db = NULL
+ * 
+ *     cdef int ensure_open(self) except -1:             # <<<<<<<<<<<<<<
+ *         # Called with `self.lock` held, so the database can't close underneath.
+ *         if self.db == NULL:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("quipubase.Quipu.ensure_open", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "quipubase.pyx":141
+ *         return 0
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         self.close_db()
+ * 
+ */
+
+/* Python wrapper */
+static void __pyx_pw_9quipubase_5Quipu_3__dealloc__(PyObject *__pyx_v_self); /*proto*/
+static void __pyx_pw_9quipubase_5Quipu_3__dealloc__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__dealloc__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_pf_9quipubase_5Quipu_2__dealloc__(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+static void __pyx_pf_9quipubase_5Quipu_2__dealloc__(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+
+  /* "quipubase.pyx":142
+ * 
+ *     def __dealloc__(self):
+ *         self.close_db()             # <<<<<<<<<<<<<<
+ * 
+ *     def close(self):
+ */
+  ((struct __pyx_vtabstruct_9quipubase_Quipu *)__pyx_v_self->__pyx_vtab)->close_db(__pyx_v_self); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 142, __pyx_L1_error)
+
+  /* "quipubase.pyx":141
+ *         return 0
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         self.close_db()
+ * 
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("quipubase.Quipu.__dealloc__", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_L0:;
+}
+
+/* "quipubase.pyx":144
+ *         self.close_db()
+ * 
+ *     def close(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Flush and close the database, releasing its memtables, background
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9quipubase_5Quipu_5close(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9quipubase_5Quipu_4close, "\n        Flush and close the database, releasing its memtables, background\n        threads and file descriptors. The instance can't be used afterwards.\n        ");
+static PyMethodDef __pyx_mdef_9quipubase_5Quipu_5close = {"close", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_5close, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9quipubase_5Quipu_4close};
+static PyObject *__pyx_pw_9quipubase_5Quipu_5close(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("close (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("close", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "close", 0))) return NULL;
+  __pyx_r = __pyx_pf_9quipubase_5Quipu_4close(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9quipubase_5Quipu_4close(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("close", 1);
+
+  /* "quipubase.pyx":149
+ *         threads and file descriptors. The instance can't be used afterwards.
+ *         """
+ *         self.close_db()             # <<<<<<<<<<<<<<
+ * 
+ *     @property
+ */
+  ((struct __pyx_vtabstruct_9quipubase_Quipu *)__pyx_v_self->__pyx_vtab)->close_db(__pyx_v_self); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 149, __pyx_L1_error)
+
+  /* "quipubase.pyx":144
+ *         self.close_db()
+ * 
+ *     def close(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Flush and close the database, releasing its memtables, background
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("quipubase.Quipu.close", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "quipubase.pyx":151
+ *         self.close_db()
+ * 
+ *     @property             # <<<<<<<<<<<<<<
+ *     def closed(self)->bool:
+ *         return self.db == NULL
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9quipubase_5Quipu_6closed_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_9quipubase_5Quipu_6closed_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9quipubase_5Quipu_6closed___get__(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9quipubase_5Quipu_6closed___get__(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 1);
+
+  /* "quipubase.pyx":153
+ *     @property
+ *     def closed(self)->bool:
+ *         return self.db == NULL             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyBool_FromLong((__pyx_v_self->db == NULL)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 153, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "quipubase.pyx":151
+ *         self.close_db()
+ * 
+ *     @property             # <<<<<<<<<<<<<<
+ *     def closed(self)->bool:
+ *         return self.db == NULL
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("quipubase.Quipu.closed.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "quipubase.pyx":156
+ * 
+ * 
+ *     def put(self, str key, bytes value):             # <<<<<<<<<<<<<<
+ *         cdef string ckey = key.encode()
+ *         cdef string cvalue = value
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9quipubase_5Quipu_7put(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_9quipubase_5Quipu_7put = {"put", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_7put, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9quipubase_5Quipu_7put(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_key = 0;
+  PyObject *__pyx_v_value = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[2] = {0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("put (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_key,&__pyx_n_s_value,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_key)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 156, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_value)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 156, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("put", 1, 2, 2, 1); __PYX_ERR(1, 156, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "put") < 0)) __PYX_ERR(1, 156, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 2)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+    }
+    __pyx_v_key = ((PyObject*)values[0]);
+    __pyx_v_value = ((PyObject*)values[1]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("put", 1, 2, 2, __pyx_nargs); __PYX_ERR(1, 156, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
-    goto __pyx_L17;
-    __pyx_L3_error:;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    goto __pyx_L1_error;
-    __pyx_L17:;
   }
-
-  /* "quipubase.pyx":71
- *         self.open_db()
- * 
- *     cdef void open_db(self):             # <<<<<<<<<<<<<<
- *         with self.lock:
- *             self.status = DB.Open(self.options, self.db_path, &self.db)
- */
+  __Pyx_AddTraceback("quipubase.Quipu.put", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_key), (&PyString_Type), 1, "key", 1))) __PYX_ERR(1, 156, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_value), (&PyBytes_Type), 1, "value", 1))) __PYX_ERR(1, 156, __pyx_L1_error)
+  __pyx_r = __pyx_pf_9quipubase_5Quipu_6put(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_key, __pyx_v_value);
 
   /* function exit code */
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_10);
-  __Pyx_AddTraceback("quipubase.Quipu.open_db", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
   __pyx_L0:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
   __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-/* "quipubase.pyx":77
- *                 raise RuntimeError(f"Failed to open database: {self.status.ToString().decode()}")
- * 
- *     cdef void close_db(self):             # <<<<<<<<<<<<<<
- *         with self.lock:
- *             if self.db:
- */
-
-static void __pyx_f_9quipubase_5Quipu_close_db(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self) {
+static PyObject *__pyx_pf_9quipubase_5Quipu_6put(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key, PyObject *__pyx_v_value) {
+  std::string __pyx_v_ckey;
+  std::string __pyx_v_cvalue;
+  PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
+  std::string __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
-  int __pyx_t_5;
-  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
   PyObject *__pyx_t_7 = NULL;
   PyObject *__pyx_t_8 = NULL;
-  int __pyx_t_9;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  int __pyx_t_12;
+  int __pyx_t_13;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("close_db", 1);
+  __Pyx_RefNannySetupContext("put", 1);
 
-  /* "quipubase.pyx":78
+  /* "quipubase.pyx":157
  * 
- *     cdef void close_db(self):
+ *     def put(self, str key, bytes value):
+ *         cdef string ckey = key.encode()             # <<<<<<<<<<<<<<
+ *         cdef string cvalue = value
+ *         with self.lock:
+ */
+  __pyx_t_1 = __Pyx_CallUnboundCMethod0(&__pyx_umethod_PyString_Type_encode, __pyx_v_key); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 157, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_convert_string_from_py_6libcpp_6string_std__in_string(__pyx_t_1); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 157, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_ckey = __PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2);
+
+  /* "quipubase.pyx":158
+ *     def put(self, str key, bytes value):
+ *         cdef string ckey = key.encode()
+ *         cdef string cvalue = value             # <<<<<<<<<<<<<<
+ *         with self.lock:
+ *             self.ensure_open()
+ */
+  __pyx_t_2 = __pyx_convert_string_from_py_6libcpp_6string_std__in_string(__pyx_v_value); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 158, __pyx_L1_error)
+  __pyx_v_cvalue = __PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2);
+
+  /* "quipubase.pyx":159
+ *         cdef string ckey = key.encode()
+ *         cdef string cvalue = value
  *         with self.lock:             # <<<<<<<<<<<<<<
- *             if self.db:
- *                 self.db.Close()
+ *             self.ensure_open()
+ *             with nogil:
  */
   /*with:*/ {
-    __pyx_t_1 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_exit); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 78, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_enter); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 78, __pyx_L3_error)
+    __pyx_t_3 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_exit); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 159, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = NULL;
-    __pyx_t_5 = 0;
+    __pyx_t_4 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_enter); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 159, __pyx_L3_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    __pyx_t_6 = 0;
     #if CYTHON_UNPACK_METHODS
-    if (likely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_4)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_4);
+    if (likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-        __pyx_t_5 = 1;
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+        __pyx_t_6 = 1;
       }
     }
     #endif
     {
-      PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
-      __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 78, __pyx_L3_error)
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      PyObject *__pyx_callargs[2] = {__pyx_t_5, NULL};
+      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_6, 0+__pyx_t_6);
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 159, __pyx_L3_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     }
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     /*try:*/ {
       {
-        (void)__pyx_t_6; (void)__pyx_t_7; (void)__pyx_t_8; /* mark used */
+        __Pyx_PyThreadState_declare
+        __Pyx_PyThreadState_assign
+        __Pyx_ExceptionSave(&__pyx_t_7, &__pyx_t_8, &__pyx_t_9);
+        __Pyx_XGOTREF(__pyx_t_7);
+        __Pyx_XGOTREF(__pyx_t_8);
+        __Pyx_XGOTREF(__pyx_t_9);
         /*try:*/ {
 
-          /* "quipubase.pyx":79
- *     cdef void close_db(self):
+          /* "quipubase.pyx":160
+ *         cdef string cvalue = value
  *         with self.lock:
- *             if self.db:             # <<<<<<<<<<<<<<
- *                 self.db.Close()
- *                 del self.db
+ *             self.ensure_open()             # <<<<<<<<<<<<<<
+ *             with nogil:
+ *                 self.db.Put(self.write_options, ckey, cvalue)
  */
-          __pyx_t_9 = (__pyx_v_self->db != 0);
-          if (__pyx_t_9) {
+          __pyx_t_6 = ((struct __pyx_vtabstruct_9quipubase_Quipu *)__pyx_v_self->__pyx_vtab)->ensure_open(__pyx_v_self); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(1, 160, __pyx_L7_error)
 
-            /* "quipubase.pyx":80
+          /* "quipubase.pyx":161
  *         with self.lock:
- *             if self.db:
- *                 self.db.Close()             # <<<<<<<<<<<<<<
- *                 del self.db
+ *             self.ensure_open()
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 self.db.Put(self.write_options, ckey, cvalue)
  * 
  */
-            __pyx_v_self->db->Close();
-
-            /* "quipubase.pyx":81
- *             if self.db:
- *                 self.db.Close()
- *                 del self.db             # <<<<<<<<<<<<<<
+          {
+              #ifdef WITH_THREAD
+              PyThreadState *_save;
+              _save = NULL;
+              Py_UNBLOCK_THREADS
+              __Pyx_FastGIL_Remember();
+              #endif
+              /*try:*/ {
+
+                /* "quipubase.pyx":162
+ *             self.ensure_open()
+ *             with nogil:
+ *                 self.db.Put(self.write_options, ckey, cvalue)             # <<<<<<<<<<<<<<
  * 
- *     def __dealloc__(self):
+ *     def get(self, str key):
  */
-            delete __pyx_v_self->db;
+                __pyx_v_self->db->Put(__pyx_v_self->write_options, __pyx_v_ckey, __pyx_v_cvalue);
+              }
 
-            /* "quipubase.pyx":79
- *     cdef void close_db(self):
+              /* "quipubase.pyx":161
  *         with self.lock:
- *             if self.db:             # <<<<<<<<<<<<<<
- *                 self.db.Close()
- *                 del self.db
+ *             self.ensure_open()
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 self.db.Put(self.write_options, ckey, cvalue)
+ * 
  */
+              /*finally:*/ {
+                /*normal exit:*/{
+                  #ifdef WITH_THREAD
+                  __Pyx_FastGIL_Forget();
+                  Py_BLOCK_THREADS
+                  #endif
+                  goto __pyx_L15;
+                }
+                __pyx_L15:;
+              }
           }
 
-          /* "quipubase.pyx":78
- * 
- *     cdef void close_db(self):
+          /* "quipubase.pyx":159
+ *         cdef string ckey = key.encode()
+ *         cdef string cvalue = value
  *         with self.lock:             # <<<<<<<<<<<<<<
- *             if self.db:
- *                 self.db.Close()
+ *             self.ensure_open()
+ *             with nogil:
  */
         }
+        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+        goto __pyx_L12_try_end;
+        __pyx_L7_error:;
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        /*except:*/ {
+          __Pyx_AddTraceback("quipubase.Quipu.put", __pyx_clineno, __pyx_lineno, __pyx_filename);
+          if (__Pyx_GetException(&__pyx_t_1, &__pyx_t_4, &__pyx_t_5) < 0) __PYX_ERR(1, 159, __pyx_L9_except_error)
+          __Pyx_XGOTREF(__pyx_t_1);
+          __Pyx_XGOTREF(__pyx_t_4);
+          __Pyx_XGOTREF(__pyx_t_5);
+          __pyx_t_10 = PyTuple_Pack(3, __pyx_t_1, __pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_10)) __PYX_ERR(1, 159, __pyx_L9_except_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __pyx_t_11 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_10, NULL);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          if (unlikely(!__pyx_t_11)) __PYX_ERR(1, 159, __pyx_L9_except_error)
+          __Pyx_GOTREF(__pyx_t_11);
+          __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_11);
+          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+          if (__pyx_t_12 < 0) __PYX_ERR(1, 159, __pyx_L9_except_error)
+          __pyx_t_13 = (!__pyx_t_12);
+          if (unlikely(__pyx_t_13)) {
+            __Pyx_GIVEREF(__pyx_t_1);
+            __Pyx_GIVEREF(__pyx_t_4);
+            __Pyx_XGIVEREF(__pyx_t_5);
+            __Pyx_ErrRestoreWithState(__pyx_t_1, __pyx_t_4, __pyx_t_5);
+            __pyx_t_1 = 0; __pyx_t_4 = 0; __pyx_t_5 = 0; 
+            __PYX_ERR(1, 159, __pyx_L9_except_error)
+          }
+          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+          goto __pyx_L8_exception_handled;
+        }
+        __pyx_L9_except_error:;
+        __Pyx_XGIVEREF(__pyx_t_7);
+        __Pyx_XGIVEREF(__pyx_t_8);
+        __Pyx_XGIVEREF(__pyx_t_9);
+        __Pyx_ExceptionReset(__pyx_t_7, __pyx_t_8, __pyx_t_9);
+        goto __pyx_L1_error;
+        __pyx_L8_exception_handled:;
+        __Pyx_XGIVEREF(__pyx_t_7);
+        __Pyx_XGIVEREF(__pyx_t_8);
+        __Pyx_XGIVEREF(__pyx_t_9);
+        __Pyx_ExceptionReset(__pyx_t_7, __pyx_t_8, __pyx_t_9);
+        __pyx_L12_try_end:;
       }
     }
     /*finally:*/ {
       /*normal exit:*/{
-        if (__pyx_t_1) {
-          __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__2, NULL);
-          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-          if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 78, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_8);
-          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        if (__pyx_t_3) {
+          __pyx_t_9 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_tuple__2, NULL);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 159, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
         }
         goto __pyx_L6;
       }
       __pyx_L6:;
     }
-    goto __pyx_L14;
+    goto __pyx_L19;
     __pyx_L3_error:;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     goto __pyx_L1_error;
-    __pyx_L14:;
+    __pyx_L19:;
   }
 
-  /* "quipubase.pyx":77
- *                 raise RuntimeError(f"Failed to open database: {self.status.ToString().decode()}")
+  /* "quipubase.pyx":156
  * 
- *     cdef void close_db(self):             # <<<<<<<<<<<<<<
- *         with self.lock:
- *             if self.db:
+ * 
+ *     def put(self, str key, bytes value):             # <<<<<<<<<<<<<<
+ *         cdef string ckey = key.encode()
+ *         cdef string cvalue = value
  */
 
   /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("quipubase.Quipu.close_db", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("quipubase.Quipu.put", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-/* "quipubase.pyx":83
- *                 del self.db
- * 
- *     def __dealloc__(self):             # <<<<<<<<<<<<<<
- *         self.close_db()
- * 
- */
-
-/* Python wrapper */
-static void __pyx_pw_9quipubase_5Quipu_3__dealloc__(PyObject *__pyx_v_self); /*proto*/
-static void __pyx_pw_9quipubase_5Quipu_3__dealloc__(PyObject *__pyx_v_self) {
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__dealloc__ (wrapper)", 0);
-  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
-  __pyx_pf_9quipubase_5Quipu_2__dealloc__(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-}
-
-static void __pyx_pf_9quipubase_5Quipu_2__dealloc__(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self) {
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-
-  /* "quipubase.pyx":84
- * 
- *     def __dealloc__(self):
- *         self.close_db()             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  ((struct __pyx_vtabstruct_9quipubase_Quipu *)__pyx_v_self->__pyx_vtab)->close_db(__pyx_v_self); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 84, __pyx_L1_error)
-
-  /* "quipubase.pyx":83
- *                 del self.db
- * 
- *     def __dealloc__(self):             # <<<<<<<<<<<<<<
- *         self.close_db()
- * 
- */
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_WriteUnraisable("quipubase.Quipu.__dealloc__", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
-  __pyx_L0:;
-}
-
-/* "quipubase.pyx":87
- * 
+/* "quipubase.pyx":164
+ *                 self.db.Put(self.write_options, ckey, cvalue)
  * 
- *     def put(self, str key, bytes value):             # <<<<<<<<<<<<<<
- *         with self.lock:
- *             self.db.Put(self.write_options, key.encode(), value)
+ *     def get(self, str key):             # <<<<<<<<<<<<<<
+ *         cdef string ckey = key.encode()
+ *         cdef string value
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9quipubase_5Quipu_5put(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_9quipubase_5Quipu_9get(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_9quipubase_5Quipu_5put = {"put", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_5put, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9quipubase_5Quipu_5put(PyObject *__pyx_v_self, 
+static PyMethodDef __pyx_mdef_9quipubase_5Quipu_9get = {"get", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_9get, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9quipubase_5Quipu_9get(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -4185,18 +5568,17 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
   PyObject *__pyx_v_key = 0;
-  PyObject *__pyx_v_value = 0;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[2] = {0,0};
+  PyObject* values[1] = {0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("put (wrapper)", 0);
+  __Pyx_RefNannySetupContext("get (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_MACROS
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -4206,12 +5588,10 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_key,&__pyx_n_s_value,0};
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_key,0};
     if (__pyx_kwds) {
       Py_ssize_t kw_args;
       switch (__pyx_nargs) {
-        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
         case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
         CYTHON_FALLTHROUGH;
         case  0: break;
@@ -4224,35 +5604,23 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 87, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_value)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 87, __pyx_L3_error)
-        else {
-          __Pyx_RaiseArgtupleInvalid("put", 1, 2, 2, 1); __PYX_ERR(0, 87, __pyx_L3_error)
-        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 164, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "put") < 0)) __PYX_ERR(0, 87, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "get") < 0)) __PYX_ERR(1, 164, __pyx_L3_error)
       }
-    } else if (unlikely(__pyx_nargs != 2)) {
+    } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
     }
     __pyx_v_key = ((PyObject*)values[0]);
-    __pyx_v_value = ((PyObject*)values[1]);
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("put", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 87, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("get", 1, 1, 1, __pyx_nargs); __PYX_ERR(1, 164, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -4262,13 +5630,12 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
   }
-  __Pyx_AddTraceback("quipubase.Quipu.put", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("quipubase.Quipu.get", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_key), (&PyString_Type), 1, "key", 1))) __PYX_ERR(0, 87, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_value), (&PyBytes_Type), 1, "value", 1))) __PYX_ERR(0, 87, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9quipubase_5Quipu_4put(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_key, __pyx_v_value);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_key), (&PyString_Type), 1, "key", 1))) __PYX_ERR(1, 164, __pyx_L1_error)
+  __pyx_r = __pyx_pf_9quipubase_5Quipu_8get(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_key);
 
   /* function exit code */
   goto __pyx_L0;
@@ -4285,184 +5652,297 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9quipubase_5Quipu_4put(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key, PyObject *__pyx_v_value) {
+static PyObject *__pyx_pf_9quipubase_5Quipu_8get(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key) {
+  std::string __pyx_v_ckey;
+  std::string __pyx_v_value;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
+  std::string __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
-  int __pyx_t_5;
-  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
   PyObject *__pyx_t_7 = NULL;
   PyObject *__pyx_t_8 = NULL;
-  std::string __pyx_t_9;
-  std::string __pyx_t_10;
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_t_10;
   PyObject *__pyx_t_11 = NULL;
   PyObject *__pyx_t_12 = NULL;
   int __pyx_t_13;
-  int __pyx_t_14;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("put", 1);
+  __Pyx_RefNannySetupContext("get", 1);
 
-  /* "quipubase.pyx":88
+  /* "quipubase.pyx":165
  * 
- *     def put(self, str key, bytes value):
+ *     def get(self, str key):
+ *         cdef string ckey = key.encode()             # <<<<<<<<<<<<<<
+ *         cdef string value
+ *         with self.lock:
+ */
+  __pyx_t_1 = __Pyx_CallUnboundCMethod0(&__pyx_umethod_PyString_Type_encode, __pyx_v_key); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 165, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_convert_string_from_py_6libcpp_6string_std__in_string(__pyx_t_1); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 165, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_ckey = __PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2);
+
+  /* "quipubase.pyx":167
+ *         cdef string ckey = key.encode()
+ *         cdef string value
  *         with self.lock:             # <<<<<<<<<<<<<<
- *             self.db.Put(self.write_options, key.encode(), value)
- * 
+ *             self.ensure_open()
+ *             with nogil:
  */
   /*with:*/ {
-    __pyx_t_1 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_exit); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 88, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_enter); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 88, __pyx_L3_error)
+    __pyx_t_3 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_exit); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 167, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = NULL;
-    __pyx_t_5 = 0;
+    __pyx_t_4 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_enter); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 167, __pyx_L3_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    __pyx_t_6 = 0;
     #if CYTHON_UNPACK_METHODS
-    if (likely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_4)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_4);
+    if (likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-        __pyx_t_5 = 1;
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+        __pyx_t_6 = 1;
       }
     }
     #endif
     {
-      PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
-      __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 88, __pyx_L3_error)
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      PyObject *__pyx_callargs[2] = {__pyx_t_5, NULL};
+      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_6, 0+__pyx_t_6);
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 167, __pyx_L3_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     }
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     /*try:*/ {
       {
         __Pyx_PyThreadState_declare
         __Pyx_PyThreadState_assign
-        __Pyx_ExceptionSave(&__pyx_t_6, &__pyx_t_7, &__pyx_t_8);
-        __Pyx_XGOTREF(__pyx_t_6);
+        __Pyx_ExceptionSave(&__pyx_t_7, &__pyx_t_8, &__pyx_t_9);
         __Pyx_XGOTREF(__pyx_t_7);
         __Pyx_XGOTREF(__pyx_t_8);
+        __Pyx_XGOTREF(__pyx_t_9);
         /*try:*/ {
 
-          /* "quipubase.pyx":89
- *     def put(self, str key, bytes value):
+          /* "quipubase.pyx":168
+ *         cdef string value
+ *         with self.lock:
+ *             self.ensure_open()             # <<<<<<<<<<<<<<
+ *             with nogil:
+ *                 self.status = self.db.Get(self.read_options, ckey, &value)
+ */
+          __pyx_t_6 = ((struct __pyx_vtabstruct_9quipubase_Quipu *)__pyx_v_self->__pyx_vtab)->ensure_open(__pyx_v_self); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(1, 168, __pyx_L7_error)
+
+          /* "quipubase.pyx":169
+ *         with self.lock:
+ *             self.ensure_open()
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 self.status = self.db.Get(self.read_options, ckey, &value)
+ *             if not self.status.ok():
+ */
+          {
+              #ifdef WITH_THREAD
+              PyThreadState *_save;
+              _save = NULL;
+              Py_UNBLOCK_THREADS
+              __Pyx_FastGIL_Remember();
+              #endif
+              /*try:*/ {
+
+                /* "quipubase.pyx":170
+ *             self.ensure_open()
+ *             with nogil:
+ *                 self.status = self.db.Get(self.read_options, ckey, &value)             # <<<<<<<<<<<<<<
+ *             if not self.status.ok():
+ *                 return None
+ */
+                __pyx_v_self->status = __pyx_v_self->db->Get(__pyx_v_self->read_options, __pyx_v_ckey, (&__pyx_v_value));
+              }
+
+              /* "quipubase.pyx":169
  *         with self.lock:
- *             self.db.Put(self.write_options, key.encode(), value)             # <<<<<<<<<<<<<<
+ *             self.ensure_open()
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 self.status = self.db.Get(self.read_options, ckey, &value)
+ *             if not self.status.ok():
+ */
+              /*finally:*/ {
+                /*normal exit:*/{
+                  #ifdef WITH_THREAD
+                  __Pyx_FastGIL_Forget();
+                  Py_BLOCK_THREADS
+                  #endif
+                  goto __pyx_L15;
+                }
+                __pyx_L15:;
+              }
+          }
+
+          /* "quipubase.pyx":171
+ *             with nogil:
+ *                 self.status = self.db.Get(self.read_options, ckey, &value)
+ *             if not self.status.ok():             # <<<<<<<<<<<<<<
+ *                 return None
+ *             return value
+ */
+          __pyx_t_10 = (!(__pyx_v_self->status.ok() != 0));
+          if (__pyx_t_10) {
+
+            /* "quipubase.pyx":172
+ *                 self.status = self.db.Get(self.read_options, ckey, &value)
+ *             if not self.status.ok():
+ *                 return None             # <<<<<<<<<<<<<<
+ *             return value
  * 
- *     def get(self, str key):
  */
-          __pyx_t_2 = __Pyx_CallUnboundCMethod0(&__pyx_umethod_PyString_Type_encode, __pyx_v_key); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 89, __pyx_L7_error)
-          __Pyx_GOTREF(__pyx_t_2);
-          __pyx_t_9 = __pyx_convert_string_from_py_6libcpp_6string_std__in_string(__pyx_t_2); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 89, __pyx_L7_error)
-          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-          __pyx_t_10 = __pyx_convert_string_from_py_6libcpp_6string_std__in_string(__pyx_v_value); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 89, __pyx_L7_error)
-          __pyx_v_self->db->Put(__pyx_v_self->write_options, __pyx_t_9, __pyx_t_10);
+            __Pyx_XDECREF(__pyx_r);
+            __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+            goto __pyx_L11_try_return;
+
+            /* "quipubase.pyx":171
+ *             with nogil:
+ *                 self.status = self.db.Get(self.read_options, ckey, &value)
+ *             if not self.status.ok():             # <<<<<<<<<<<<<<
+ *                 return None
+ *             return value
+ */
+          }
 
-          /* "quipubase.pyx":88
+          /* "quipubase.pyx":173
+ *             if not self.status.ok():
+ *                 return None
+ *             return value             # <<<<<<<<<<<<<<
  * 
- *     def put(self, str key, bytes value):
+ *     def get_view(self, str key):
+ */
+          __Pyx_XDECREF(__pyx_r);
+          __pyx_t_1 = __pyx_convert_PyBytes_string_to_py_6libcpp_6string_std__in_string(__pyx_v_value); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 173, __pyx_L7_error)
+          __Pyx_GOTREF(__pyx_t_1);
+          __pyx_r = __pyx_t_1;
+          __pyx_t_1 = 0;
+          goto __pyx_L11_try_return;
+
+          /* "quipubase.pyx":167
+ *         cdef string ckey = key.encode()
+ *         cdef string value
  *         with self.lock:             # <<<<<<<<<<<<<<
- *             self.db.Put(self.write_options, key.encode(), value)
- * 
+ *             self.ensure_open()
+ *             with nogil:
  */
         }
-        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-        goto __pyx_L12_try_end;
         __pyx_L7_error:;
-        __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
         __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
         /*except:*/ {
-          __Pyx_AddTraceback("quipubase.Quipu.put", __pyx_clineno, __pyx_lineno, __pyx_filename);
-          if (__Pyx_GetException(&__pyx_t_2, &__pyx_t_3, &__pyx_t_4) < 0) __PYX_ERR(0, 88, __pyx_L9_except_error)
-          __Pyx_XGOTREF(__pyx_t_2);
-          __Pyx_XGOTREF(__pyx_t_3);
+          __Pyx_AddTraceback("quipubase.Quipu.get", __pyx_clineno, __pyx_lineno, __pyx_filename);
+          if (__Pyx_GetException(&__pyx_t_1, &__pyx_t_4, &__pyx_t_5) < 0) __PYX_ERR(1, 167, __pyx_L9_except_error)
+          __Pyx_XGOTREF(__pyx_t_1);
           __Pyx_XGOTREF(__pyx_t_4);
-          __pyx_t_11 = PyTuple_Pack(3, __pyx_t_2, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 88, __pyx_L9_except_error)
+          __Pyx_XGOTREF(__pyx_t_5);
+          __pyx_t_11 = PyTuple_Pack(3, __pyx_t_1, __pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_11)) __PYX_ERR(1, 167, __pyx_L9_except_error)
           __Pyx_GOTREF(__pyx_t_11);
-          __pyx_t_12 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_11, NULL);
-          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __pyx_t_12 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_11, NULL);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
           __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-          if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 88, __pyx_L9_except_error)
+          if (unlikely(!__pyx_t_12)) __PYX_ERR(1, 167, __pyx_L9_except_error)
           __Pyx_GOTREF(__pyx_t_12);
-          __pyx_t_13 = __Pyx_PyObject_IsTrue(__pyx_t_12);
+          __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_12);
           __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-          if (__pyx_t_13 < 0) __PYX_ERR(0, 88, __pyx_L9_except_error)
-          __pyx_t_14 = (!__pyx_t_13);
-          if (unlikely(__pyx_t_14)) {
-            __Pyx_GIVEREF(__pyx_t_2);
-            __Pyx_GIVEREF(__pyx_t_3);
-            __Pyx_XGIVEREF(__pyx_t_4);
-            __Pyx_ErrRestoreWithState(__pyx_t_2, __pyx_t_3, __pyx_t_4);
-            __pyx_t_2 = 0; __pyx_t_3 = 0; __pyx_t_4 = 0; 
-            __PYX_ERR(0, 88, __pyx_L9_except_error)
+          if (__pyx_t_10 < 0) __PYX_ERR(1, 167, __pyx_L9_except_error)
+          __pyx_t_13 = (!__pyx_t_10);
+          if (unlikely(__pyx_t_13)) {
+            __Pyx_GIVEREF(__pyx_t_1);
+            __Pyx_GIVEREF(__pyx_t_4);
+            __Pyx_XGIVEREF(__pyx_t_5);
+            __Pyx_ErrRestoreWithState(__pyx_t_1, __pyx_t_4, __pyx_t_5);
+            __pyx_t_1 = 0; __pyx_t_4 = 0; __pyx_t_5 = 0; 
+            __PYX_ERR(1, 167, __pyx_L9_except_error)
           }
-          __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-          __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
           __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
           goto __pyx_L8_exception_handled;
         }
         __pyx_L9_except_error:;
-        __Pyx_XGIVEREF(__pyx_t_6);
         __Pyx_XGIVEREF(__pyx_t_7);
         __Pyx_XGIVEREF(__pyx_t_8);
-        __Pyx_ExceptionReset(__pyx_t_6, __pyx_t_7, __pyx_t_8);
+        __Pyx_XGIVEREF(__pyx_t_9);
+        __Pyx_ExceptionReset(__pyx_t_7, __pyx_t_8, __pyx_t_9);
         goto __pyx_L1_error;
+        __pyx_L11_try_return:;
+        __Pyx_XGIVEREF(__pyx_t_7);
+        __Pyx_XGIVEREF(__pyx_t_8);
+        __Pyx_XGIVEREF(__pyx_t_9);
+        __Pyx_ExceptionReset(__pyx_t_7, __pyx_t_8, __pyx_t_9);
+        goto __pyx_L4_return;
         __pyx_L8_exception_handled:;
-        __Pyx_XGIVEREF(__pyx_t_6);
         __Pyx_XGIVEREF(__pyx_t_7);
         __Pyx_XGIVEREF(__pyx_t_8);
-        __Pyx_ExceptionReset(__pyx_t_6, __pyx_t_7, __pyx_t_8);
-        __pyx_L12_try_end:;
+        __Pyx_XGIVEREF(__pyx_t_9);
+        __Pyx_ExceptionReset(__pyx_t_7, __pyx_t_8, __pyx_t_9);
       }
     }
     /*finally:*/ {
       /*normal exit:*/{
-        if (__pyx_t_1) {
-          __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__2, NULL);
-          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-          if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 88, __pyx_L1_error)
+        if (__pyx_t_3) {
+          __pyx_t_9 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_tuple__2, NULL);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 167, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        }
+        goto __pyx_L6;
+      }
+      __pyx_L4_return: {
+        __pyx_t_9 = __pyx_r;
+        __pyx_r = 0;
+        if (__pyx_t_3) {
+          __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_tuple__2, NULL);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 167, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_8);
           __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
         }
-        goto __pyx_L6;
+        __pyx_r = __pyx_t_9;
+        __pyx_t_9 = 0;
+        goto __pyx_L0;
       }
       __pyx_L6:;
     }
-    goto __pyx_L16;
+    goto __pyx_L20;
     __pyx_L3_error:;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     goto __pyx_L1_error;
-    __pyx_L16:;
+    __pyx_L20:;
   }
 
-  /* "quipubase.pyx":87
- * 
+  /* "quipubase.pyx":164
+ *                 self.db.Put(self.write_options, ckey, cvalue)
  * 
- *     def put(self, str key, bytes value):             # <<<<<<<<<<<<<<
- *         with self.lock:
- *             self.db.Put(self.write_options, key.encode(), value)
+ *     def get(self, str key):             # <<<<<<<<<<<<<<
+ *         cdef string ckey = key.encode()
+ *         cdef string value
  */
 
   /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_11);
-  __Pyx_AddTraceback("quipubase.Quipu.put", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("quipubase.Quipu.get", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -4470,24 +5950,24 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_4put(struct __pyx_obj_9quipubase_Qui
   return __pyx_r;
 }
 
-/* "quipubase.pyx":91
- *             self.db.Put(self.write_options, key.encode(), value)
+/* "quipubase.pyx":175
+ *             return value
  * 
- *     def get(self, str key):             # <<<<<<<<<<<<<<
- *         cdef string value
- *         with self.lock:
+ *     def get_view(self, str key):             # <<<<<<<<<<<<<<
+ *         cdef PinnedValue pinned = PinnedValue()
+ *         cdef string ckey = key.encode()
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9quipubase_5Quipu_7get(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_9quipubase_5Quipu_11get_view(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_9quipubase_5Quipu_7get = {"get", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_7get, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9quipubase_5Quipu_7get(PyObject *__pyx_v_self, 
+static PyMethodDef __pyx_mdef_9quipubase_5Quipu_11get_view = {"get_view", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_11get_view, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9quipubase_5Quipu_11get_view(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -4505,7 +5985,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("get (wrapper)", 0);
+  __Pyx_RefNannySetupContext("get_view (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_MACROS
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -4531,12 +6011,12 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 91, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 175, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "get") < 0)) __PYX_ERR(0, 91, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "get_view") < 0)) __PYX_ERR(1, 175, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
@@ -4547,7 +6027,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("get", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 91, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("get_view", 1, 1, 1, __pyx_nargs); __PYX_ERR(1, 175, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -4557,12 +6037,12 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
   }
-  __Pyx_AddTraceback("quipubase.Quipu.get", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("quipubase.Quipu.get_view", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_key), (&PyString_Type), 1, "key", 1))) __PYX_ERR(0, 91, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9quipubase_5Quipu_6get(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_key);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_key), (&PyString_Type), 1, "key", 1))) __PYX_ERR(1, 175, __pyx_L1_error)
+  __pyx_r = __pyx_pf_9quipubase_5Quipu_10get_view(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_key);
 
   /* function exit code */
   goto __pyx_L0;
@@ -4579,19 +6059,20 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9quipubase_5Quipu_6get(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key) {
-  std::string __pyx_v_value;
+static PyObject *__pyx_pf_9quipubase_5Quipu_10get_view(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key) {
+  struct __pyx_obj_9quipubase_PinnedValue *__pyx_v_pinned = 0;
+  std::string __pyx_v_ckey;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
+  std::string __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
-  int __pyx_t_5;
-  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
   PyObject *__pyx_t_7 = NULL;
   PyObject *__pyx_t_8 = NULL;
-  std::string __pyx_t_9;
+  PyObject *__pyx_t_9 = NULL;
   int __pyx_t_10;
   PyObject *__pyx_t_11 = NULL;
   PyObject *__pyx_t_12 = NULL;
@@ -4599,247 +6080,330 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_6get(struct __pyx_obj_9quipubase_Qui
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("get", 1);
+  __Pyx_RefNannySetupContext("get_view", 1);
 
-  /* "quipubase.pyx":93
- *     def get(self, str key):
- *         cdef string value
+  /* "quipubase.pyx":176
+ * 
+ *     def get_view(self, str key):
+ *         cdef PinnedValue pinned = PinnedValue()             # <<<<<<<<<<<<<<
+ *         cdef string ckey = key.encode()
+ *         pinned.owner = self
+ */
+  __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_9quipubase_PinnedValue)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 176, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_pinned = ((struct __pyx_obj_9quipubase_PinnedValue *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "quipubase.pyx":177
+ *     def get_view(self, str key):
+ *         cdef PinnedValue pinned = PinnedValue()
+ *         cdef string ckey = key.encode()             # <<<<<<<<<<<<<<
+ *         pinned.owner = self
+ *         with self.lock:
+ */
+  __pyx_t_1 = __Pyx_CallUnboundCMethod0(&__pyx_umethod_PyString_Type_encode, __pyx_v_key); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 177, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_convert_string_from_py_6libcpp_6string_std__in_string(__pyx_t_1); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 177, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_ckey = __PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2);
+
+  /* "quipubase.pyx":178
+ *         cdef PinnedValue pinned = PinnedValue()
+ *         cdef string ckey = key.encode()
+ *         pinned.owner = self             # <<<<<<<<<<<<<<
+ *         with self.lock:
+ *             self.ensure_open()
+ */
+  __Pyx_INCREF((PyObject *)__pyx_v_self);
+  __Pyx_GIVEREF((PyObject *)__pyx_v_self);
+  __Pyx_GOTREF(__pyx_v_pinned->owner);
+  __Pyx_DECREF(__pyx_v_pinned->owner);
+  __pyx_v_pinned->owner = ((PyObject *)__pyx_v_self);
+
+  /* "quipubase.pyx":179
+ *         cdef string ckey = key.encode()
+ *         pinned.owner = self
  *         with self.lock:             # <<<<<<<<<<<<<<
- *             self.status = self.db.Get(self.read_options, key.encode(), &value)
- *             if not self.status.ok():
+ *             self.ensure_open()
+ *             with nogil:
  */
   /*with:*/ {
-    __pyx_t_1 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_exit); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 93, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_enter); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 93, __pyx_L3_error)
+    __pyx_t_3 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_exit); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 179, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = NULL;
-    __pyx_t_5 = 0;
+    __pyx_t_4 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_enter); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 179, __pyx_L3_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    __pyx_t_6 = 0;
     #if CYTHON_UNPACK_METHODS
-    if (likely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_4)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_4);
+    if (likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-        __pyx_t_5 = 1;
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+        __pyx_t_6 = 1;
       }
     }
     #endif
     {
-      PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
-      __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 93, __pyx_L3_error)
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      PyObject *__pyx_callargs[2] = {__pyx_t_5, NULL};
+      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_6, 0+__pyx_t_6);
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 179, __pyx_L3_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     }
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     /*try:*/ {
       {
         __Pyx_PyThreadState_declare
         __Pyx_PyThreadState_assign
-        __Pyx_ExceptionSave(&__pyx_t_6, &__pyx_t_7, &__pyx_t_8);
-        __Pyx_XGOTREF(__pyx_t_6);
+        __Pyx_ExceptionSave(&__pyx_t_7, &__pyx_t_8, &__pyx_t_9);
         __Pyx_XGOTREF(__pyx_t_7);
         __Pyx_XGOTREF(__pyx_t_8);
+        __Pyx_XGOTREF(__pyx_t_9);
         /*try:*/ {
 
-          /* "quipubase.pyx":94
- *         cdef string value
+          /* "quipubase.pyx":180
+ *         pinned.owner = self
  *         with self.lock:
- *             self.status = self.db.Get(self.read_options, key.encode(), &value)             # <<<<<<<<<<<<<<
- *             if not self.status.ok():
- *                 return None
+ *             self.ensure_open()             # <<<<<<<<<<<<<<
+ *             with nogil:
+ *                 self.status = self.db.Get(
  */
-          __pyx_t_2 = __Pyx_CallUnboundCMethod0(&__pyx_umethod_PyString_Type_encode, __pyx_v_key); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 94, __pyx_L7_error)
-          __Pyx_GOTREF(__pyx_t_2);
-          __pyx_t_9 = __pyx_convert_string_from_py_6libcpp_6string_std__in_string(__pyx_t_2); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 94, __pyx_L7_error)
-          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-          __pyx_v_self->status = __pyx_v_self->db->Get(__pyx_v_self->read_options, __pyx_t_9, (&__pyx_v_value));
+          __pyx_t_6 = ((struct __pyx_vtabstruct_9quipubase_Quipu *)__pyx_v_self->__pyx_vtab)->ensure_open(__pyx_v_self); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(1, 180, __pyx_L7_error)
 
-          /* "quipubase.pyx":95
+          /* "quipubase.pyx":181
  *         with self.lock:
- *             self.status = self.db.Get(self.read_options, key.encode(), &value)
+ *             self.ensure_open()
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 self.status = self.db.Get(
+ *                     self.read_options, self.db.DefaultColumnFamily(), Slice(ckey), pinned.slice
+ */
+          {
+              #ifdef WITH_THREAD
+              PyThreadState *_save;
+              _save = NULL;
+              Py_UNBLOCK_THREADS
+              __Pyx_FastGIL_Remember();
+              #endif
+              /*try:*/ {
+
+                /* "quipubase.pyx":182
+ *             self.ensure_open()
+ *             with nogil:
+ *                 self.status = self.db.Get(             # <<<<<<<<<<<<<<
+ *                     self.read_options, self.db.DefaultColumnFamily(), Slice(ckey), pinned.slice
+ *                 )
+ */
+                __pyx_v_self->status = __pyx_v_self->db->Get(__pyx_v_self->read_options, __pyx_v_self->db->DefaultColumnFamily(), rocksdb::Slice(__pyx_v_ckey), __pyx_v_pinned->slice);
+              }
+
+              /* "quipubase.pyx":181
+ *         with self.lock:
+ *             self.ensure_open()
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 self.status = self.db.Get(
+ *                     self.read_options, self.db.DefaultColumnFamily(), Slice(ckey), pinned.slice
+ */
+              /*finally:*/ {
+                /*normal exit:*/{
+                  #ifdef WITH_THREAD
+                  __Pyx_FastGIL_Forget();
+                  Py_BLOCK_THREADS
+                  #endif
+                  goto __pyx_L15;
+                }
+                __pyx_L15:;
+              }
+          }
+
+          /* "quipubase.pyx":185
+ *                     self.read_options, self.db.DefaultColumnFamily(), Slice(ckey), pinned.slice
+ *                 )
  *             if not self.status.ok():             # <<<<<<<<<<<<<<
  *                 return None
- *             return value
+ *         return memoryview(pinned)
  */
           __pyx_t_10 = (!(__pyx_v_self->status.ok() != 0));
           if (__pyx_t_10) {
 
-            /* "quipubase.pyx":96
- *             self.status = self.db.Get(self.read_options, key.encode(), &value)
+            /* "quipubase.pyx":186
+ *                 )
  *             if not self.status.ok():
  *                 return None             # <<<<<<<<<<<<<<
- *             return value
+ *         return memoryview(pinned)
  * 
  */
             __Pyx_XDECREF(__pyx_r);
             __pyx_r = Py_None; __Pyx_INCREF(Py_None);
             goto __pyx_L11_try_return;
 
-            /* "quipubase.pyx":95
- *         with self.lock:
- *             self.status = self.db.Get(self.read_options, key.encode(), &value)
+            /* "quipubase.pyx":185
+ *                     self.read_options, self.db.DefaultColumnFamily(), Slice(ckey), pinned.slice
+ *                 )
  *             if not self.status.ok():             # <<<<<<<<<<<<<<
  *                 return None
- *             return value
+ *         return memoryview(pinned)
  */
           }
 
-          /* "quipubase.pyx":97
- *             if not self.status.ok():
- *                 return None
- *             return value             # <<<<<<<<<<<<<<
- * 
- *     def delete(self, str key):
- */
-          __Pyx_XDECREF(__pyx_r);
-          __pyx_t_2 = __pyx_convert_PyBytes_string_to_py_6libcpp_6string_std__in_string(__pyx_v_value); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 97, __pyx_L7_error)
-          __Pyx_GOTREF(__pyx_t_2);
-          __pyx_r = __pyx_t_2;
-          __pyx_t_2 = 0;
-          goto __pyx_L11_try_return;
-
-          /* "quipubase.pyx":93
- *     def get(self, str key):
- *         cdef string value
+          /* "quipubase.pyx":179
+ *         cdef string ckey = key.encode()
+ *         pinned.owner = self
  *         with self.lock:             # <<<<<<<<<<<<<<
- *             self.status = self.db.Get(self.read_options, key.encode(), &value)
- *             if not self.status.ok():
+ *             self.ensure_open()
+ *             with nogil:
  */
         }
+        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+        goto __pyx_L12_try_end;
         __pyx_L7_error:;
-        __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
         __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
         /*except:*/ {
-          __Pyx_AddTraceback("quipubase.Quipu.get", __pyx_clineno, __pyx_lineno, __pyx_filename);
-          if (__Pyx_GetException(&__pyx_t_2, &__pyx_t_3, &__pyx_t_4) < 0) __PYX_ERR(0, 93, __pyx_L9_except_error)
-          __Pyx_XGOTREF(__pyx_t_2);
-          __Pyx_XGOTREF(__pyx_t_3);
+          __Pyx_AddTraceback("quipubase.Quipu.get_view", __pyx_clineno, __pyx_lineno, __pyx_filename);
+          if (__Pyx_GetException(&__pyx_t_1, &__pyx_t_4, &__pyx_t_5) < 0) __PYX_ERR(1, 179, __pyx_L9_except_error)
+          __Pyx_XGOTREF(__pyx_t_1);
           __Pyx_XGOTREF(__pyx_t_4);
-          __pyx_t_11 = PyTuple_Pack(3, __pyx_t_2, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 93, __pyx_L9_except_error)
+          __Pyx_XGOTREF(__pyx_t_5);
+          __pyx_t_11 = PyTuple_Pack(3, __pyx_t_1, __pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_11)) __PYX_ERR(1, 179, __pyx_L9_except_error)
           __Pyx_GOTREF(__pyx_t_11);
-          __pyx_t_12 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_11, NULL);
-          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __pyx_t_12 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_11, NULL);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
           __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-          if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 93, __pyx_L9_except_error)
+          if (unlikely(!__pyx_t_12)) __PYX_ERR(1, 179, __pyx_L9_except_error)
           __Pyx_GOTREF(__pyx_t_12);
           __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_12);
           __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-          if (__pyx_t_10 < 0) __PYX_ERR(0, 93, __pyx_L9_except_error)
+          if (__pyx_t_10 < 0) __PYX_ERR(1, 179, __pyx_L9_except_error)
           __pyx_t_13 = (!__pyx_t_10);
-          if (unlikely(__pyx_t_13)) {
-            __Pyx_GIVEREF(__pyx_t_2);
-            __Pyx_GIVEREF(__pyx_t_3);
-            __Pyx_XGIVEREF(__pyx_t_4);
-            __Pyx_ErrRestoreWithState(__pyx_t_2, __pyx_t_3, __pyx_t_4);
-            __pyx_t_2 = 0; __pyx_t_3 = 0; __pyx_t_4 = 0; 
-            __PYX_ERR(0, 93, __pyx_L9_except_error)
+          if (unlikely(__pyx_t_13)) {
+            __Pyx_GIVEREF(__pyx_t_1);
+            __Pyx_GIVEREF(__pyx_t_4);
+            __Pyx_XGIVEREF(__pyx_t_5);
+            __Pyx_ErrRestoreWithState(__pyx_t_1, __pyx_t_4, __pyx_t_5);
+            __pyx_t_1 = 0; __pyx_t_4 = 0; __pyx_t_5 = 0; 
+            __PYX_ERR(1, 179, __pyx_L9_except_error)
           }
-          __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-          __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
           __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
           goto __pyx_L8_exception_handled;
         }
         __pyx_L9_except_error:;
-        __Pyx_XGIVEREF(__pyx_t_6);
         __Pyx_XGIVEREF(__pyx_t_7);
         __Pyx_XGIVEREF(__pyx_t_8);
-        __Pyx_ExceptionReset(__pyx_t_6, __pyx_t_7, __pyx_t_8);
+        __Pyx_XGIVEREF(__pyx_t_9);
+        __Pyx_ExceptionReset(__pyx_t_7, __pyx_t_8, __pyx_t_9);
         goto __pyx_L1_error;
         __pyx_L11_try_return:;
-        __Pyx_XGIVEREF(__pyx_t_6);
         __Pyx_XGIVEREF(__pyx_t_7);
         __Pyx_XGIVEREF(__pyx_t_8);
-        __Pyx_ExceptionReset(__pyx_t_6, __pyx_t_7, __pyx_t_8);
+        __Pyx_XGIVEREF(__pyx_t_9);
+        __Pyx_ExceptionReset(__pyx_t_7, __pyx_t_8, __pyx_t_9);
         goto __pyx_L4_return;
         __pyx_L8_exception_handled:;
-        __Pyx_XGIVEREF(__pyx_t_6);
         __Pyx_XGIVEREF(__pyx_t_7);
         __Pyx_XGIVEREF(__pyx_t_8);
-        __Pyx_ExceptionReset(__pyx_t_6, __pyx_t_7, __pyx_t_8);
+        __Pyx_XGIVEREF(__pyx_t_9);
+        __Pyx_ExceptionReset(__pyx_t_7, __pyx_t_8, __pyx_t_9);
+        __pyx_L12_try_end:;
       }
     }
     /*finally:*/ {
       /*normal exit:*/{
-        if (__pyx_t_1) {
-          __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__2, NULL);
-          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-          if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 93, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_8);
-          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        if (__pyx_t_3) {
+          __pyx_t_9 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_tuple__2, NULL);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 179, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
         }
         goto __pyx_L6;
       }
       __pyx_L4_return: {
-        __pyx_t_8 = __pyx_r;
+        __pyx_t_9 = __pyx_r;
         __pyx_r = 0;
-        if (__pyx_t_1) {
-          __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__2, NULL);
-          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-          if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 93, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_7);
-          __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        if (__pyx_t_3) {
+          __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_tuple__2, NULL);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 179, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
         }
-        __pyx_r = __pyx_t_8;
-        __pyx_t_8 = 0;
+        __pyx_r = __pyx_t_9;
+        __pyx_t_9 = 0;
         goto __pyx_L0;
       }
       __pyx_L6:;
     }
-    goto __pyx_L17;
+    goto __pyx_L20;
     __pyx_L3_error:;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     goto __pyx_L1_error;
-    __pyx_L17:;
+    __pyx_L20:;
   }
 
-  /* "quipubase.pyx":91
- *             self.db.Put(self.write_options, key.encode(), value)
+  /* "quipubase.pyx":187
+ *             if not self.status.ok():
+ *                 return None
+ *         return memoryview(pinned)             # <<<<<<<<<<<<<<
  * 
- *     def get(self, str key):             # <<<<<<<<<<<<<<
- *         cdef string value
- *         with self.lock:
+ *     def delete(self, str key):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_5 = PyMemoryView_FromObject(((PyObject *)__pyx_v_pinned)); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 187, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_r = __pyx_t_5;
+  __pyx_t_5 = 0;
+  goto __pyx_L0;
+
+  /* "quipubase.pyx":175
+ *             return value
+ * 
+ *     def get_view(self, str key):             # <<<<<<<<<<<<<<
+ *         cdef PinnedValue pinned = PinnedValue()
+ *         cdef string ckey = key.encode()
  */
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_11);
-  __Pyx_AddTraceback("quipubase.Quipu.get", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("quipubase.Quipu.get_view", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_pinned);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "quipubase.pyx":99
- *             return value
+/* "quipubase.pyx":189
+ *         return memoryview(pinned)
  * 
  *     def delete(self, str key):             # <<<<<<<<<<<<<<
+ *         cdef string ckey = key.encode()
  *         with self.lock:
- *             self.db.Delete(self.write_options, key.encode())
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9quipubase_5Quipu_9delete(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_9quipubase_5Quipu_13delete(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_9quipubase_5Quipu_9delete = {"delete", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_9delete, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9quipubase_5Quipu_9delete(PyObject *__pyx_v_self, 
+static PyMethodDef __pyx_mdef_9quipubase_5Quipu_13delete = {"delete", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_13delete, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9quipubase_5Quipu_13delete(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -4883,12 +6447,12 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 99, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 189, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "delete") < 0)) __PYX_ERR(0, 99, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "delete") < 0)) __PYX_ERR(1, 189, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
@@ -4899,7 +6463,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("delete", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 99, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("delete", 1, 1, 1, __pyx_nargs); __PYX_ERR(1, 189, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -4913,8 +6477,8 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_key), (&PyString_Type), 1, "key", 1))) __PYX_ERR(0, 99, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9quipubase_5Quipu_8delete(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_key);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_key), (&PyString_Type), 1, "key", 1))) __PYX_ERR(1, 189, __pyx_L1_error)
+  __pyx_r = __pyx_pf_9quipubase_5Quipu_12delete(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_key);
 
   /* function exit code */
   goto __pyx_L0;
@@ -4931,18 +6495,19 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9quipubase_5Quipu_8delete(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key) {
+static PyObject *__pyx_pf_9quipubase_5Quipu_12delete(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key) {
+  std::string __pyx_v_ckey;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
+  std::string __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
-  int __pyx_t_5;
-  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
   PyObject *__pyx_t_7 = NULL;
   PyObject *__pyx_t_8 = NULL;
-  std::string __pyx_t_9;
+  PyObject *__pyx_t_9 = NULL;
   PyObject *__pyx_t_10 = NULL;
   PyObject *__pyx_t_11 = NULL;
   int __pyx_t_12;
@@ -4952,159 +6517,213 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_8delete(struct __pyx_obj_9quipubase_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("delete", 1);
 
-  /* "quipubase.pyx":100
+  /* "quipubase.pyx":190
  * 
  *     def delete(self, str key):
+ *         cdef string ckey = key.encode()             # <<<<<<<<<<<<<<
+ *         with self.lock:
+ *             self.ensure_open()
+ */
+  __pyx_t_1 = __Pyx_CallUnboundCMethod0(&__pyx_umethod_PyString_Type_encode, __pyx_v_key); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 190, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_convert_string_from_py_6libcpp_6string_std__in_string(__pyx_t_1); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 190, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_ckey = __PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2);
+
+  /* "quipubase.pyx":191
+ *     def delete(self, str key):
+ *         cdef string ckey = key.encode()
  *         with self.lock:             # <<<<<<<<<<<<<<
- *             self.db.Delete(self.write_options, key.encode())
- * 
+ *             self.ensure_open()
+ *             with nogil:
  */
   /*with:*/ {
-    __pyx_t_1 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_exit); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 100, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_enter); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 100, __pyx_L3_error)
+    __pyx_t_3 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_exit); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 191, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = NULL;
-    __pyx_t_5 = 0;
+    __pyx_t_4 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_enter); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 191, __pyx_L3_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    __pyx_t_6 = 0;
     #if CYTHON_UNPACK_METHODS
-    if (likely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_4)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_4);
+    if (likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-        __pyx_t_5 = 1;
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+        __pyx_t_6 = 1;
       }
     }
     #endif
     {
-      PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
-      __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 100, __pyx_L3_error)
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      PyObject *__pyx_callargs[2] = {__pyx_t_5, NULL};
+      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_6, 0+__pyx_t_6);
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 191, __pyx_L3_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     }
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     /*try:*/ {
       {
         __Pyx_PyThreadState_declare
         __Pyx_PyThreadState_assign
-        __Pyx_ExceptionSave(&__pyx_t_6, &__pyx_t_7, &__pyx_t_8);
-        __Pyx_XGOTREF(__pyx_t_6);
+        __Pyx_ExceptionSave(&__pyx_t_7, &__pyx_t_8, &__pyx_t_9);
         __Pyx_XGOTREF(__pyx_t_7);
         __Pyx_XGOTREF(__pyx_t_8);
+        __Pyx_XGOTREF(__pyx_t_9);
         /*try:*/ {
 
-          /* "quipubase.pyx":101
- *     def delete(self, str key):
+          /* "quipubase.pyx":192
+ *         cdef string ckey = key.encode()
+ *         with self.lock:
+ *             self.ensure_open()             # <<<<<<<<<<<<<<
+ *             with nogil:
+ *                 self.db.Delete(self.write_options, ckey)
+ */
+          __pyx_t_6 = ((struct __pyx_vtabstruct_9quipubase_Quipu *)__pyx_v_self->__pyx_vtab)->ensure_open(__pyx_v_self); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(1, 192, __pyx_L7_error)
+
+          /* "quipubase.pyx":193
  *         with self.lock:
- *             self.db.Delete(self.write_options, key.encode())             # <<<<<<<<<<<<<<
+ *             self.ensure_open()
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 self.db.Delete(self.write_options, ckey)
+ * 
+ */
+          {
+              #ifdef WITH_THREAD
+              PyThreadState *_save;
+              _save = NULL;
+              Py_UNBLOCK_THREADS
+              __Pyx_FastGIL_Remember();
+              #endif
+              /*try:*/ {
+
+                /* "quipubase.pyx":194
+ *             self.ensure_open()
+ *             with nogil:
+ *                 self.db.Delete(self.write_options, ckey)             # <<<<<<<<<<<<<<
  * 
  * 
  */
-          __pyx_t_2 = __Pyx_CallUnboundCMethod0(&__pyx_umethod_PyString_Type_encode, __pyx_v_key); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 101, __pyx_L7_error)
-          __Pyx_GOTREF(__pyx_t_2);
-          __pyx_t_9 = __pyx_convert_string_from_py_6libcpp_6string_std__in_string(__pyx_t_2); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 101, __pyx_L7_error)
-          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-          (void)(__pyx_v_self->db->Delete(__pyx_v_self->write_options, __pyx_t_9));
+                (void)(__pyx_v_self->db->Delete(__pyx_v_self->write_options, __pyx_v_ckey));
+              }
 
-          /* "quipubase.pyx":100
+              /* "quipubase.pyx":193
+ *         with self.lock:
+ *             self.ensure_open()
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 self.db.Delete(self.write_options, ckey)
  * 
+ */
+              /*finally:*/ {
+                /*normal exit:*/{
+                  #ifdef WITH_THREAD
+                  __Pyx_FastGIL_Forget();
+                  Py_BLOCK_THREADS
+                  #endif
+                  goto __pyx_L15;
+                }
+                __pyx_L15:;
+              }
+          }
+
+          /* "quipubase.pyx":191
  *     def delete(self, str key):
+ *         cdef string ckey = key.encode()
  *         with self.lock:             # <<<<<<<<<<<<<<
- *             self.db.Delete(self.write_options, key.encode())
- * 
+ *             self.ensure_open()
+ *             with nogil:
  */
         }
-        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
         __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
         __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
         goto __pyx_L12_try_end;
         __pyx_L7_error:;
-        __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
         __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
         /*except:*/ {
           __Pyx_AddTraceback("quipubase.Quipu.delete", __pyx_clineno, __pyx_lineno, __pyx_filename);
-          if (__Pyx_GetException(&__pyx_t_2, &__pyx_t_3, &__pyx_t_4) < 0) __PYX_ERR(0, 100, __pyx_L9_except_error)
-          __Pyx_XGOTREF(__pyx_t_2);
-          __Pyx_XGOTREF(__pyx_t_3);
+          if (__Pyx_GetException(&__pyx_t_1, &__pyx_t_4, &__pyx_t_5) < 0) __PYX_ERR(1, 191, __pyx_L9_except_error)
+          __Pyx_XGOTREF(__pyx_t_1);
           __Pyx_XGOTREF(__pyx_t_4);
-          __pyx_t_10 = PyTuple_Pack(3, __pyx_t_2, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 100, __pyx_L9_except_error)
+          __Pyx_XGOTREF(__pyx_t_5);
+          __pyx_t_10 = PyTuple_Pack(3, __pyx_t_1, __pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_10)) __PYX_ERR(1, 191, __pyx_L9_except_error)
           __Pyx_GOTREF(__pyx_t_10);
-          __pyx_t_11 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_10, NULL);
-          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __pyx_t_11 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_10, NULL);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
           __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-          if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 100, __pyx_L9_except_error)
+          if (unlikely(!__pyx_t_11)) __PYX_ERR(1, 191, __pyx_L9_except_error)
           __Pyx_GOTREF(__pyx_t_11);
           __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_11);
           __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-          if (__pyx_t_12 < 0) __PYX_ERR(0, 100, __pyx_L9_except_error)
+          if (__pyx_t_12 < 0) __PYX_ERR(1, 191, __pyx_L9_except_error)
           __pyx_t_13 = (!__pyx_t_12);
           if (unlikely(__pyx_t_13)) {
-            __Pyx_GIVEREF(__pyx_t_2);
-            __Pyx_GIVEREF(__pyx_t_3);
-            __Pyx_XGIVEREF(__pyx_t_4);
-            __Pyx_ErrRestoreWithState(__pyx_t_2, __pyx_t_3, __pyx_t_4);
-            __pyx_t_2 = 0; __pyx_t_3 = 0; __pyx_t_4 = 0; 
-            __PYX_ERR(0, 100, __pyx_L9_except_error)
+            __Pyx_GIVEREF(__pyx_t_1);
+            __Pyx_GIVEREF(__pyx_t_4);
+            __Pyx_XGIVEREF(__pyx_t_5);
+            __Pyx_ErrRestoreWithState(__pyx_t_1, __pyx_t_4, __pyx_t_5);
+            __pyx_t_1 = 0; __pyx_t_4 = 0; __pyx_t_5 = 0; 
+            __PYX_ERR(1, 191, __pyx_L9_except_error)
           }
-          __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-          __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
           __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
           goto __pyx_L8_exception_handled;
         }
         __pyx_L9_except_error:;
-        __Pyx_XGIVEREF(__pyx_t_6);
         __Pyx_XGIVEREF(__pyx_t_7);
         __Pyx_XGIVEREF(__pyx_t_8);
-        __Pyx_ExceptionReset(__pyx_t_6, __pyx_t_7, __pyx_t_8);
+        __Pyx_XGIVEREF(__pyx_t_9);
+        __Pyx_ExceptionReset(__pyx_t_7, __pyx_t_8, __pyx_t_9);
         goto __pyx_L1_error;
         __pyx_L8_exception_handled:;
-        __Pyx_XGIVEREF(__pyx_t_6);
         __Pyx_XGIVEREF(__pyx_t_7);
         __Pyx_XGIVEREF(__pyx_t_8);
-        __Pyx_ExceptionReset(__pyx_t_6, __pyx_t_7, __pyx_t_8);
+        __Pyx_XGIVEREF(__pyx_t_9);
+        __Pyx_ExceptionReset(__pyx_t_7, __pyx_t_8, __pyx_t_9);
         __pyx_L12_try_end:;
       }
     }
     /*finally:*/ {
       /*normal exit:*/{
-        if (__pyx_t_1) {
-          __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__2, NULL);
-          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-          if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 100, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_8);
-          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        if (__pyx_t_3) {
+          __pyx_t_9 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_tuple__2, NULL);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 191, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
         }
         goto __pyx_L6;
       }
       __pyx_L6:;
     }
-    goto __pyx_L16;
+    goto __pyx_L19;
     __pyx_L3_error:;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     goto __pyx_L1_error;
-    __pyx_L16:;
+    __pyx_L19:;
   }
 
-  /* "quipubase.pyx":99
- *             return value
+  /* "quipubase.pyx":189
+ *         return memoryview(pinned)
  * 
  *     def delete(self, str key):             # <<<<<<<<<<<<<<
+ *         cdef string ckey = key.encode()
  *         with self.lock:
- *             self.db.Delete(self.write_options, key.encode())
  */
 
   /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_10);
   __Pyx_AddTraceback("quipubase.Quipu.delete", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
@@ -5114,24 +6733,24 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_8delete(struct __pyx_obj_9quipubase_
   return __pyx_r;
 }
 
-/* "quipubase.pyx":104
+/* "quipubase.pyx":197
  * 
  * 
  *     def exists(self, str key)->bool:             # <<<<<<<<<<<<<<
- *         return self.get(key) is not None
+ *         return self.get_view(key) is not None
  * 
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9quipubase_5Quipu_11exists(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_9quipubase_5Quipu_15exists(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_9quipubase_5Quipu_11exists = {"exists", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_11exists, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9quipubase_5Quipu_11exists(PyObject *__pyx_v_self, 
+static PyMethodDef __pyx_mdef_9quipubase_5Quipu_15exists = {"exists", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_15exists, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9quipubase_5Quipu_15exists(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -5175,12 +6794,12 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 104, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 197, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "exists") < 0)) __PYX_ERR(0, 104, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "exists") < 0)) __PYX_ERR(1, 197, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
@@ -5191,7 +6810,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("exists", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 104, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("exists", 1, 1, 1, __pyx_nargs); __PYX_ERR(1, 197, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -5205,8 +6824,8 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_key), (&PyString_Type), 1, "key", 1))) __PYX_ERR(0, 104, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9quipubase_5Quipu_10exists(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_key);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_key), (&PyString_Type), 1, "key", 1))) __PYX_ERR(1, 197, __pyx_L1_error)
+  __pyx_r = __pyx_pf_9quipubase_5Quipu_14exists(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_key);
 
   /* function exit code */
   goto __pyx_L0;
@@ -5223,7 +6842,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9quipubase_5Quipu_10exists(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key) {
+static PyObject *__pyx_pf_9quipubase_5Quipu_14exists(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -5236,15 +6855,15 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_10exists(struct __pyx_obj_9quipubase
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("exists", 1);
 
-  /* "quipubase.pyx":105
+  /* "quipubase.pyx":198
  * 
  *     def exists(self, str key)->bool:
- *         return self.get(key) is not None             # <<<<<<<<<<<<<<
+ *         return self.get_view(key) is not None             # <<<<<<<<<<<<<<
  * 
  *     def count(self)->int:
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 105, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get_view); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 198, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   __pyx_t_4 = 0;
@@ -5264,23 +6883,23 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_10exists(struct __pyx_obj_9quipubase
     PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_key};
     __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 1+__pyx_t_4);
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 105, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 198, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   }
   __pyx_t_5 = (__pyx_t_1 != Py_None);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 105, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 198, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "quipubase.pyx":104
+  /* "quipubase.pyx":197
  * 
  * 
  *     def exists(self, str key)->bool:             # <<<<<<<<<<<<<<
- *         return self.get(key) is not None
+ *         return self.get_view(key) is not None
  * 
  */
 
@@ -5297,24 +6916,24 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_10exists(struct __pyx_obj_9quipubase
   return __pyx_r;
 }
 
-/* "quipubase.pyx":107
- *         return self.get(key) is not None
+/* "quipubase.pyx":200
+ *         return self.get_view(key) is not None
  * 
  *     def count(self)->int:             # <<<<<<<<<<<<<<
  *         cdef int count = 0
- *         cdef Iterator* it = self.db.NewIterator(self.read_options)
+ *         cdef Iterator* it
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9quipubase_5Quipu_13count(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_9quipubase_5Quipu_17count(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_9quipubase_5Quipu_13count = {"count", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_13count, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9quipubase_5Quipu_13count(PyObject *__pyx_v_self, 
+static PyMethodDef __pyx_mdef_9quipubase_5Quipu_17count = {"count", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_17count, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9quipubase_5Quipu_17count(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -5339,133 +6958,300 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   if (unlikely(__pyx_nargs > 0)) {
     __Pyx_RaiseArgtupleInvalid("count", 1, 0, 0, __pyx_nargs); return NULL;}
   if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "count", 0))) return NULL;
-  __pyx_r = __pyx_pf_9quipubase_5Quipu_12count(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self));
+  __pyx_r = __pyx_pf_9quipubase_5Quipu_16count(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9quipubase_5Quipu_12count(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self) {
+static PyObject *__pyx_pf_9quipubase_5Quipu_16count(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self) {
   int __pyx_v_count;
   rocksdb::Iterator *__pyx_v_it;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
+  PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  int __pyx_t_12;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("count", 1);
 
-  /* "quipubase.pyx":108
+  /* "quipubase.pyx":201
  * 
  *     def count(self)->int:
  *         cdef int count = 0             # <<<<<<<<<<<<<<
- *         cdef Iterator* it = self.db.NewIterator(self.read_options)
- *         try:
+ *         cdef Iterator* it
+ *         with self.lock:
  */
   __pyx_v_count = 0;
 
-  /* "quipubase.pyx":109
- *     def count(self)->int:
+  /* "quipubase.pyx":203
  *         cdef int count = 0
- *         cdef Iterator* it = self.db.NewIterator(self.read_options)             # <<<<<<<<<<<<<<
- *         try:
- *             it.SeekToFirst()
+ *         cdef Iterator* it
+ *         with self.lock:             # <<<<<<<<<<<<<<
+ *             self.ensure_open()
+ *             it = self.db.NewIterator(self.read_options)
  */
-  __pyx_v_it = __pyx_v_self->db->NewIterator(__pyx_v_self->read_options);
+  /*with:*/ {
+    __pyx_t_1 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_exit); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 203, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_enter); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 203, __pyx_L3_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = NULL;
+    __pyx_t_5 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_5 = 1;
+      }
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
+      __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 203, __pyx_L3_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    /*try:*/ {
+      {
+        __Pyx_PyThreadState_declare
+        __Pyx_PyThreadState_assign
+        __Pyx_ExceptionSave(&__pyx_t_6, &__pyx_t_7, &__pyx_t_8);
+        __Pyx_XGOTREF(__pyx_t_6);
+        __Pyx_XGOTREF(__pyx_t_7);
+        __Pyx_XGOTREF(__pyx_t_8);
+        /*try:*/ {
 
-  /* "quipubase.pyx":110
- *         cdef int count = 0
- *         cdef Iterator* it = self.db.NewIterator(self.read_options)
- *         try:             # <<<<<<<<<<<<<<
- *             it.SeekToFirst()
- *             while it.Valid():
+          /* "quipubase.pyx":204
+ *         cdef Iterator* it
+ *         with self.lock:
+ *             self.ensure_open()             # <<<<<<<<<<<<<<
+ *             it = self.db.NewIterator(self.read_options)
+ *             with nogil:
  */
-  /*try:*/ {
+          __pyx_t_5 = ((struct __pyx_vtabstruct_9quipubase_Quipu *)__pyx_v_self->__pyx_vtab)->ensure_open(__pyx_v_self); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(1, 204, __pyx_L7_error)
 
-    /* "quipubase.pyx":111
- *         cdef Iterator* it = self.db.NewIterator(self.read_options)
- *         try:
- *             it.SeekToFirst()             # <<<<<<<<<<<<<<
- *             while it.Valid():
- *                 count += 1
+          /* "quipubase.pyx":205
+ *         with self.lock:
+ *             self.ensure_open()
+ *             it = self.db.NewIterator(self.read_options)             # <<<<<<<<<<<<<<
+ *             with nogil:
+ *                 it.SeekToFirst()
  */
-    __pyx_v_it->SeekToFirst();
-
-    /* "quipubase.pyx":112
- *         try:
- *             it.SeekToFirst()
- *             while it.Valid():             # <<<<<<<<<<<<<<
- *                 count += 1
- *                 it.Next()
+          __pyx_v_it = __pyx_v_self->db->NewIterator(__pyx_v_self->read_options);
+
+          /* "quipubase.pyx":206
+ *             self.ensure_open()
+ *             it = self.db.NewIterator(self.read_options)
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 it.SeekToFirst()
+ *                 while it.Valid():
  */
-    while (1) {
-      __pyx_t_1 = (__pyx_v_it->Valid() != 0);
-      if (!__pyx_t_1) break;
+          {
+              #ifdef WITH_THREAD
+              PyThreadState *_save;
+              _save = NULL;
+              Py_UNBLOCK_THREADS
+              __Pyx_FastGIL_Remember();
+              #endif
+              /*try:*/ {
+
+                /* "quipubase.pyx":207
+ *             it = self.db.NewIterator(self.read_options)
+ *             with nogil:
+ *                 it.SeekToFirst()             # <<<<<<<<<<<<<<
+ *                 while it.Valid():
+ *                     count += 1
+ */
+                __pyx_v_it->SeekToFirst();
 
-      /* "quipubase.pyx":113
- *             it.SeekToFirst()
- *             while it.Valid():
- *                 count += 1             # <<<<<<<<<<<<<<
- *                 it.Next()
- *         finally:
+                /* "quipubase.pyx":208
+ *             with nogil:
+ *                 it.SeekToFirst()
+ *                 while it.Valid():             # <<<<<<<<<<<<<<
+ *                     count += 1
+ *                     it.Next()
+ */
+                while (1) {
+                  __pyx_t_9 = (__pyx_v_it->Valid() != 0);
+                  if (!__pyx_t_9) break;
+
+                  /* "quipubase.pyx":209
+ *                 it.SeekToFirst()
+ *                 while it.Valid():
+ *                     count += 1             # <<<<<<<<<<<<<<
+ *                     it.Next()
+ *                 del it
  */
-      __pyx_v_count = (__pyx_v_count + 1);
+                  __pyx_v_count = (__pyx_v_count + 1);
 
-      /* "quipubase.pyx":114
- *             while it.Valid():
- *                 count += 1
- *                 it.Next()             # <<<<<<<<<<<<<<
- *         finally:
- *             del it
+                  /* "quipubase.pyx":210
+ *                 while it.Valid():
+ *                     count += 1
+ *                     it.Next()             # <<<<<<<<<<<<<<
+ *                 del it
+ *         return count
  */
-      __pyx_v_it->Next();
-    }
-  }
+                  __pyx_v_it->Next();
+                }
 
-  /* "quipubase.pyx":116
- *                 it.Next()
- *         finally:
- *             del it             # <<<<<<<<<<<<<<
+                /* "quipubase.pyx":211
+ *                     count += 1
+ *                     it.Next()
+ *                 del it             # <<<<<<<<<<<<<<
  *         return count
  * 
  */
-  /*finally:*/ {
-    /*normal exit:*/{
-      delete __pyx_v_it;
-      goto __pyx_L5;
+                delete __pyx_v_it;
+              }
+
+              /* "quipubase.pyx":206
+ *             self.ensure_open()
+ *             it = self.db.NewIterator(self.read_options)
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 it.SeekToFirst()
+ *                 while it.Valid():
+ */
+              /*finally:*/ {
+                /*normal exit:*/{
+                  #ifdef WITH_THREAD
+                  __Pyx_FastGIL_Forget();
+                  Py_BLOCK_THREADS
+                  #endif
+                  goto __pyx_L15;
+                }
+                __pyx_L15:;
+              }
+          }
+
+          /* "quipubase.pyx":203
+ *         cdef int count = 0
+ *         cdef Iterator* it
+ *         with self.lock:             # <<<<<<<<<<<<<<
+ *             self.ensure_open()
+ *             it = self.db.NewIterator(self.read_options)
+ */
+        }
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        goto __pyx_L12_try_end;
+        __pyx_L7_error:;
+        __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        /*except:*/ {
+          __Pyx_AddTraceback("quipubase.Quipu.count", __pyx_clineno, __pyx_lineno, __pyx_filename);
+          if (__Pyx_GetException(&__pyx_t_2, &__pyx_t_3, &__pyx_t_4) < 0) __PYX_ERR(1, 203, __pyx_L9_except_error)
+          __Pyx_XGOTREF(__pyx_t_2);
+          __Pyx_XGOTREF(__pyx_t_3);
+          __Pyx_XGOTREF(__pyx_t_4);
+          __pyx_t_10 = PyTuple_Pack(3, __pyx_t_2, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_10)) __PYX_ERR(1, 203, __pyx_L9_except_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __pyx_t_11 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_10, NULL);
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          if (unlikely(!__pyx_t_11)) __PYX_ERR(1, 203, __pyx_L9_except_error)
+          __Pyx_GOTREF(__pyx_t_11);
+          __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_11);
+          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+          if (__pyx_t_9 < 0) __PYX_ERR(1, 203, __pyx_L9_except_error)
+          __pyx_t_12 = (!__pyx_t_9);
+          if (unlikely(__pyx_t_12)) {
+            __Pyx_GIVEREF(__pyx_t_2);
+            __Pyx_GIVEREF(__pyx_t_3);
+            __Pyx_XGIVEREF(__pyx_t_4);
+            __Pyx_ErrRestoreWithState(__pyx_t_2, __pyx_t_3, __pyx_t_4);
+            __pyx_t_2 = 0; __pyx_t_3 = 0; __pyx_t_4 = 0; 
+            __PYX_ERR(1, 203, __pyx_L9_except_error)
+          }
+          __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+          __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+          goto __pyx_L8_exception_handled;
+        }
+        __pyx_L9_except_error:;
+        __Pyx_XGIVEREF(__pyx_t_6);
+        __Pyx_XGIVEREF(__pyx_t_7);
+        __Pyx_XGIVEREF(__pyx_t_8);
+        __Pyx_ExceptionReset(__pyx_t_6, __pyx_t_7, __pyx_t_8);
+        goto __pyx_L1_error;
+        __pyx_L8_exception_handled:;
+        __Pyx_XGIVEREF(__pyx_t_6);
+        __Pyx_XGIVEREF(__pyx_t_7);
+        __Pyx_XGIVEREF(__pyx_t_8);
+        __Pyx_ExceptionReset(__pyx_t_6, __pyx_t_7, __pyx_t_8);
+        __pyx_L12_try_end:;
+      }
+    }
+    /*finally:*/ {
+      /*normal exit:*/{
+        if (__pyx_t_1) {
+          __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__2, NULL);
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+          if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 203, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        }
+        goto __pyx_L6;
+      }
+      __pyx_L6:;
     }
-    __pyx_L5:;
+    goto __pyx_L21;
+    __pyx_L3_error:;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    goto __pyx_L1_error;
+    __pyx_L21:;
   }
 
-  /* "quipubase.pyx":117
- *         finally:
- *             del it
+  /* "quipubase.pyx":212
+ *                     it.Next()
+ *                 del it
  *         return count             # <<<<<<<<<<<<<<
  * 
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_count); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 117, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (!(likely(__Pyx_Py3Int_CheckExact(__pyx_t_2)) || __Pyx_RaiseUnexpectedTypeError("int", __pyx_t_2))) __PYX_ERR(0, 117, __pyx_L1_error)
-  __pyx_r = ((PyObject*)__pyx_t_2);
-  __pyx_t_2 = 0;
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_count); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 212, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (!(likely(__Pyx_Py3Int_CheckExact(__pyx_t_4)) || __Pyx_RaiseUnexpectedTypeError("int", __pyx_t_4))) __PYX_ERR(1, 212, __pyx_L1_error)
+  __pyx_r = ((PyObject*)__pyx_t_4);
+  __pyx_t_4 = 0;
   goto __pyx_L0;
 
-  /* "quipubase.pyx":107
- *         return self.get(key) is not None
+  /* "quipubase.pyx":200
+ *         return self.get_view(key) is not None
  * 
  *     def count(self)->int:             # <<<<<<<<<<<<<<
  *         cdef int count = 0
- *         cdef Iterator* it = self.db.NewIterator(self.read_options)
+ *         cdef Iterator* it
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_10);
   __Pyx_AddTraceback("quipubase.Quipu.count", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -5474,24 +7260,24 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_12count(struct __pyx_obj_9quipubase_
   return __pyx_r;
 }
 
-/* "quipubase.pyx":121
+/* "quipubase.pyx":216
  * 
  * 
  *     def get_doc(self, str key):             # <<<<<<<<<<<<<<
- *         cdef bytes value
- *         value = self.get(key)
+ *         value = self.get_view(key)
+ *         if value is None:
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9quipubase_5Quipu_15get_doc(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_9quipubase_5Quipu_19get_doc(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_9quipubase_5Quipu_15get_doc = {"get_doc", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_15get_doc, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9quipubase_5Quipu_15get_doc(PyObject *__pyx_v_self, 
+static PyMethodDef __pyx_mdef_9quipubase_5Quipu_19get_doc = {"get_doc", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_19get_doc, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9quipubase_5Quipu_19get_doc(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -5535,12 +7321,12 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 121, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 216, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "get_doc") < 0)) __PYX_ERR(0, 121, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "get_doc") < 0)) __PYX_ERR(1, 216, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
@@ -5551,7 +7337,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("get_doc", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 121, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("get_doc", 1, 1, 1, __pyx_nargs); __PYX_ERR(1, 216, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -5565,8 +7351,8 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_key), (&PyString_Type), 1, "key", 1))) __PYX_ERR(0, 121, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9quipubase_5Quipu_14get_doc(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_key);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_key), (&PyString_Type), 1, "key", 1))) __PYX_ERR(1, 216, __pyx_L1_error)
+  __pyx_r = __pyx_pf_9quipubase_5Quipu_18get_doc(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_key);
 
   /* function exit code */
   goto __pyx_L0;
@@ -5583,8 +7369,8 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9quipubase_5Quipu_14get_doc(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key) {
-  PyObject *__pyx_v_value = 0;
+static PyObject *__pyx_pf_9quipubase_5Quipu_18get_doc(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key) {
+  PyObject *__pyx_v_value = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -5597,14 +7383,14 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_14get_doc(struct __pyx_obj_9quipubas
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_doc", 1);
 
-  /* "quipubase.pyx":123
+  /* "quipubase.pyx":217
+ * 
  *     def get_doc(self, str key):
- *         cdef bytes value
- *         value = self.get(key)             # <<<<<<<<<<<<<<
+ *         value = self.get_view(key)             # <<<<<<<<<<<<<<
  *         if value is None:
  *             return None
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 123, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get_view); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 217, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   __pyx_t_4 = 0;
@@ -5624,26 +7410,25 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_14get_doc(struct __pyx_obj_9quipubas
     PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_key};
     __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 1+__pyx_t_4);
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 123, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 217, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   }
-  if (!(likely(PyBytes_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_1))) __PYX_ERR(0, 123, __pyx_L1_error)
-  __pyx_v_value = ((PyObject*)__pyx_t_1);
+  __pyx_v_value = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "quipubase.pyx":124
- *         cdef bytes value
- *         value = self.get(key)
+  /* "quipubase.pyx":218
+ *     def get_doc(self, str key):
+ *         value = self.get_view(key)
  *         if value is None:             # <<<<<<<<<<<<<<
  *             return None
  *         return orjson.loads(value)
  */
-  __pyx_t_5 = (__pyx_v_value == ((PyObject*)Py_None));
+  __pyx_t_5 = (__pyx_v_value == Py_None);
   if (__pyx_t_5) {
 
-    /* "quipubase.pyx":125
- *         value = self.get(key)
+    /* "quipubase.pyx":219
+ *         value = self.get_view(key)
  *         if value is None:
  *             return None             # <<<<<<<<<<<<<<
  *         return orjson.loads(value)
@@ -5653,16 +7438,16 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_14get_doc(struct __pyx_obj_9quipubas
     __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
 
-    /* "quipubase.pyx":124
- *         cdef bytes value
- *         value = self.get(key)
+    /* "quipubase.pyx":218
+ *     def get_doc(self, str key):
+ *         value = self.get_view(key)
  *         if value is None:             # <<<<<<<<<<<<<<
  *             return None
  *         return orjson.loads(value)
  */
   }
 
-  /* "quipubase.pyx":126
+  /* "quipubase.pyx":220
  *         if value is None:
  *             return None
  *         return orjson.loads(value)             # <<<<<<<<<<<<<<
@@ -5670,9 +7455,9 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_14get_doc(struct __pyx_obj_9quipubas
  *     def put_doc(self, str key, dict[str,Any] value):
  */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_orjson); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 126, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_orjson); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 220, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_loads); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 126, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_loads); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 220, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_t_2 = NULL;
@@ -5693,7 +7478,7 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_14get_doc(struct __pyx_obj_9quipubas
     PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_v_value};
     __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_4, 1+__pyx_t_4);
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 126, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 220, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   }
@@ -5701,12 +7486,12 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_14get_doc(struct __pyx_obj_9quipubas
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "quipubase.pyx":121
+  /* "quipubase.pyx":216
  * 
  * 
  *     def get_doc(self, str key):             # <<<<<<<<<<<<<<
- *         cdef bytes value
- *         value = self.get(key)
+ *         value = self.get_view(key)
+ *         if value is None:
  */
 
   /* function exit code */
@@ -5723,7 +7508,7 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_14get_doc(struct __pyx_obj_9quipubas
   return __pyx_r;
 }
 
-/* "quipubase.pyx":128
+/* "quipubase.pyx":222
  *         return orjson.loads(value)
  * 
  *     def put_doc(self, str key, dict[str,Any] value):             # <<<<<<<<<<<<<<
@@ -5732,15 +7517,15 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_14get_doc(struct __pyx_obj_9quipubas
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9quipubase_5Quipu_17put_doc(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_9quipubase_5Quipu_21put_doc(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_9quipubase_5Quipu_17put_doc = {"put_doc", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_17put_doc, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9quipubase_5Quipu_17put_doc(PyObject *__pyx_v_self, 
+static PyMethodDef __pyx_mdef_9quipubase_5Quipu_21put_doc = {"put_doc", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_21put_doc, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9quipubase_5Quipu_21put_doc(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -5787,7 +7572,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 128, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 222, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
@@ -5795,14 +7580,14 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 128, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 222, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("put_doc", 1, 2, 2, 1); __PYX_ERR(0, 128, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("put_doc", 1, 2, 2, 1); __PYX_ERR(1, 222, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "put_doc") < 0)) __PYX_ERR(0, 128, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "put_doc") < 0)) __PYX_ERR(1, 222, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 2)) {
       goto __pyx_L5_argtuple_error;
@@ -5815,7 +7600,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("put_doc", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 128, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("put_doc", 1, 2, 2, __pyx_nargs); __PYX_ERR(1, 222, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -5829,9 +7614,219 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_key), (&PyString_Type), 1, "key", 1))) __PYX_ERR(0, 128, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_value), (&PyDict_Type), 1, "value", 1))) __PYX_ERR(0, 128, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9quipubase_5Quipu_16put_doc(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_key, __pyx_v_value);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_key), (&PyString_Type), 1, "key", 1))) __PYX_ERR(1, 222, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_value), (&PyDict_Type), 1, "value", 1))) __PYX_ERR(1, 222, __pyx_L1_error)
+  __pyx_r = __pyx_pf_9quipubase_5Quipu_20put_doc(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_key, __pyx_v_value);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9quipubase_5Quipu_20put_doc(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key, PyObject *__pyx_v_value) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("put_doc", 1);
+
+  /* "quipubase.pyx":223
+ * 
+ *     def put_doc(self, str key, dict[str,Any] value):
+ *         self.put(key, orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY))             # <<<<<<<<<<<<<<
+ * 
+ *     def delete_doc(self, str key):
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_put); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_orjson); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_dumps); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(__pyx_v_value);
+  __Pyx_GIVEREF(__pyx_v_value);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_value)) __PYX_ERR(1, 223, __pyx_L1_error);
+  __pyx_t_5 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_orjson); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_OPT_SERIALIZE_NUMPY); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_option, __pyx_t_7) < 0) __PYX_ERR(1, 223, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = NULL;
+  __pyx_t_8 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_8 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_5, __pyx_v_key, __pyx_t_7};
+    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_8, 2+__pyx_t_8);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 223, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "quipubase.pyx":222
+ *         return orjson.loads(value)
+ * 
+ *     def put_doc(self, str key, dict[str,Any] value):             # <<<<<<<<<<<<<<
+ *         self.put(key, orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY))
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("quipubase.Quipu.put_doc", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "quipubase.pyx":225
+ *         self.put(key, orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY))
+ * 
+ *     def delete_doc(self, str key):             # <<<<<<<<<<<<<<
+ *         if not self.exists(key):
+ *             raise ValueError(f"Object with id {key} not found")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9quipubase_5Quipu_23delete_doc(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_9quipubase_5Quipu_23delete_doc = {"delete_doc", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_23delete_doc, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9quipubase_5Quipu_23delete_doc(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_key = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("delete_doc (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_key,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_key)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 225, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "delete_doc") < 0)) __PYX_ERR(1, 225, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+    }
+    __pyx_v_key = ((PyObject*)values[0]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("delete_doc", 1, 1, 1, __pyx_nargs); __PYX_ERR(1, 225, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("quipubase.Quipu.delete_doc", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_key), (&PyString_Type), 1, "key", 1))) __PYX_ERR(1, 225, __pyx_L1_error)
+  __pyx_r = __pyx_pf_9quipubase_5Quipu_22delete_doc(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_key);
 
   /* function exit code */
   goto __pyx_L0;
@@ -5844,90 +7839,146 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
   }
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_9quipubase_5Quipu_16put_doc(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key, PyObject *__pyx_v_value) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  int __pyx_t_8;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("put_doc", 1);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9quipubase_5Quipu_22delete_doc(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  Py_UCS4 __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("delete_doc", 1);
+
+  /* "quipubase.pyx":226
+ * 
+ *     def delete_doc(self, str key):
+ *         if not self.exists(key):             # <<<<<<<<<<<<<<
+ *             raise ValueError(f"Object with id {key} not found")
+ *         self.delete(key)
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_exists); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 226, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = NULL;
+  __pyx_t_4 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_4 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_key};
+    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 1+__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 226, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  }
+  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_5 < 0))) __PYX_ERR(1, 226, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_6 = (!__pyx_t_5);
+  if (unlikely(__pyx_t_6)) {
 
-  /* "quipubase.pyx":129
+    /* "quipubase.pyx":227
+ *     def delete_doc(self, str key):
+ *         if not self.exists(key):
+ *             raise ValueError(f"Object with id {key} not found")             # <<<<<<<<<<<<<<
+ *         self.delete(key)
  * 
- *     def put_doc(self, str key, dict[str,Any] value):
- *         self.put(key, orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY))             # <<<<<<<<<<<<<<
+ */
+    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 227, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_7 = 0;
+    __pyx_t_8 = 127;
+    __Pyx_INCREF(__pyx_kp_u_Object_with_id);
+    __pyx_t_7 += 15;
+    __Pyx_GIVEREF(__pyx_kp_u_Object_with_id);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_kp_u_Object_with_id);
+    __pyx_t_2 = __Pyx_PyObject_FormatSimple(__pyx_v_key, __pyx_empty_unicode); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 227, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_8 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_2) > __pyx_t_8) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_2) : __pyx_t_8;
+    __pyx_t_7 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_2);
+    __pyx_t_2 = 0;
+    __Pyx_INCREF(__pyx_kp_u_not_found);
+    __pyx_t_7 += 10;
+    __Pyx_GIVEREF(__pyx_kp_u_not_found);
+    PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_kp_u_not_found);
+    __pyx_t_2 = __Pyx_PyUnicode_Join(__pyx_t_1, 3, __pyx_t_7, __pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 227, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 227, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(1, 227, __pyx_L1_error)
+
+    /* "quipubase.pyx":226
  * 
  *     def delete_doc(self, str key):
+ *         if not self.exists(key):             # <<<<<<<<<<<<<<
+ *             raise ValueError(f"Object with id {key} not found")
+ *         self.delete(key)
+ */
+  }
+
+  /* "quipubase.pyx":228
+ *         if not self.exists(key):
+ *             raise ValueError(f"Object with id {key} not found")
+ *         self.delete(key)             # <<<<<<<<<<<<<<
+ * 
+ * 
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_put); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 129, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_delete); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 228, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_orjson); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 129, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_dumps); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 129, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 129, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_INCREF(__pyx_v_value);
-  __Pyx_GIVEREF(__pyx_v_value);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_value)) __PYX_ERR(0, 129, __pyx_L1_error);
-  __pyx_t_5 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 129, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_orjson); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 129, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_OPT_SERIALIZE_NUMPY); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 129, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_option, __pyx_t_7) < 0) __PYX_ERR(0, 129, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 129, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = NULL;
-  __pyx_t_8 = 0;
+  __pyx_t_3 = NULL;
+  __pyx_t_4 = 0;
   #if CYTHON_UNPACK_METHODS
   if (likely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_5)) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
       PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_3);
       __Pyx_INCREF(function);
       __Pyx_DECREF_SET(__pyx_t_2, function);
-      __pyx_t_8 = 1;
+      __pyx_t_4 = 1;
     }
   }
   #endif
   {
-    PyObject *__pyx_callargs[3] = {__pyx_t_5, __pyx_v_key, __pyx_t_7};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_8, 2+__pyx_t_8);
-    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 129, __pyx_L1_error)
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_key};
+    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 1+__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 228, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "quipubase.pyx":128
- *         return orjson.loads(value)
- * 
- *     def put_doc(self, str key, dict[str,Any] value):             # <<<<<<<<<<<<<<
+  /* "quipubase.pyx":225
  *         self.put(key, orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY))
  * 
+ *     def delete_doc(self, str key):             # <<<<<<<<<<<<<<
+ *         if not self.exists(key):
+ *             raise ValueError(f"Object with id {key} not found")
  */
 
   /* function exit code */
@@ -5937,11 +7988,7 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_16put_doc(struct __pyx_obj_9quipubas
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("quipubase.Quipu.put_doc", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("quipubase.Quipu.delete_doc", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -5949,42 +7996,44 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_16put_doc(struct __pyx_obj_9quipubas
   return __pyx_r;
 }
 
-/* "quipubase.pyx":131
- *         self.put(key, orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY))
+/* "quipubase.pyx":231
  * 
- *     def delete_doc(self, str key):             # <<<<<<<<<<<<<<
- *         if not self.exists(key):
- *             raise ValueError(f"Object with id {key} not found")
+ * 
+ *     def scan_docs(self, int limit, int offset, bool keys_only=False):             # <<<<<<<<<<<<<<
+ *         cdef list results = []
+ *         cdef Iterator* it
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9quipubase_5Quipu_19delete_doc(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_9quipubase_5Quipu_25scan_docs(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_9quipubase_5Quipu_19delete_doc = {"delete_doc", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_19delete_doc, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9quipubase_5Quipu_19delete_doc(PyObject *__pyx_v_self, 
+static PyMethodDef __pyx_mdef_9quipubase_5Quipu_25scan_docs = {"scan_docs", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_25scan_docs, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9quipubase_5Quipu_25scan_docs(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  PyObject *__pyx_v_key = 0;
+  int __pyx_v_limit;
+  int __pyx_v_offset;
+  bool __pyx_v_keys_only;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
+  PyObject* values[3] = {0,0,0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("delete_doc (wrapper)", 0);
+  __Pyx_RefNannySetupContext("scan_docs (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_MACROS
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -5994,10 +8043,14 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_key,0};
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_limit,&__pyx_n_s_offset,&__pyx_n_s_keys_only,0};
     if (__pyx_kwds) {
       Py_ssize_t kw_args;
       switch (__pyx_nargs) {
+        case  3: values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
         case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
         CYTHON_FALLTHROUGH;
         case  0: break;
@@ -6006,27 +8059,55 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
       switch (__pyx_nargs) {
         case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_key)) != 0)) {
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_limit)) != 0)) {
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 131, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 231, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_offset)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 231, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("scan_docs", 0, 2, 3, 1); __PYX_ERR(1, 231, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_keys_only);
+          if (value) { values[2] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 231, __pyx_L3_error)
+        }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "delete_doc") < 0)) __PYX_ERR(0, 131, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "scan_docs") < 0)) __PYX_ERR(1, 231, __pyx_L3_error)
       }
-    } else if (unlikely(__pyx_nargs != 1)) {
-      goto __pyx_L5_argtuple_error;
     } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+      switch (__pyx_nargs) {
+        case  3: values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_limit = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_limit == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 231, __pyx_L3_error)
+    __pyx_v_offset = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_offset == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 231, __pyx_L3_error)
+    if (values[2]) {
+      __pyx_v_keys_only = __Pyx_PyObject_IsTrue(values[2]); if (unlikely((__pyx_v_keys_only == ((bool)-1)) && PyErr_Occurred())) __PYX_ERR(1, 231, __pyx_L3_error)
+    } else {
+      __pyx_v_keys_only = ((bool)0);
     }
-    __pyx_v_key = ((PyObject*)values[0]);
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("delete_doc", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 131, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("scan_docs", 0, 2, 3, __pyx_nargs); __PYX_ERR(1, 231, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -6036,199 +8117,589 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
   }
-  __Pyx_AddTraceback("quipubase.Quipu.delete_doc", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("quipubase.Quipu.scan_docs", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_key), (&PyString_Type), 1, "key", 1))) __PYX_ERR(0, 131, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9quipubase_5Quipu_18delete_doc(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_key);
+  __pyx_r = __pyx_pf_9quipubase_5Quipu_24scan_docs(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_limit, __pyx_v_offset, __pyx_v_keys_only);
+
+  /* function exit code */
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9quipubase_5Quipu_24scan_docs(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, int __pyx_v_limit, int __pyx_v_offset, bool __pyx_v_keys_only) {
+  PyObject *__pyx_v_results = 0;
+  rocksdb::Iterator *__pyx_v_it;
+  PyObject *__pyx_v_view = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_t_13;
+  char const *__pyx_t_14;
+  PyObject *__pyx_t_15 = NULL;
+  PyObject *__pyx_t_16 = NULL;
+  PyObject *__pyx_t_17 = NULL;
+  PyObject *__pyx_t_18 = NULL;
+  PyObject *__pyx_t_19 = NULL;
+  PyObject *__pyx_t_20 = NULL;
+  PyObject *__pyx_t_21 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("scan_docs", 1);
+
+  /* "quipubase.pyx":232
+ * 
+ *     def scan_docs(self, int limit, int offset, bool keys_only=False):
+ *         cdef list results = []             # <<<<<<<<<<<<<<
+ *         cdef Iterator* it
+ *         with self.lock:
+ */
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 232, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_results = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "quipubase.pyx":234
+ *         cdef list results = []
+ *         cdef Iterator* it
+ *         with self.lock:             # <<<<<<<<<<<<<<
+ *             self.ensure_open()
+ *             it = self.db.NewIterator(ReadOptions())
+ */
+  /*with:*/ {
+    __pyx_t_2 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_exit); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 234, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_enter); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 234, __pyx_L3_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = NULL;
+    __pyx_t_5 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_5 = 1;
+      }
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
+      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 234, __pyx_L3_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    /*try:*/ {
+      {
+        __Pyx_PyThreadState_declare
+        __Pyx_PyThreadState_assign
+        __Pyx_ExceptionSave(&__pyx_t_6, &__pyx_t_7, &__pyx_t_8);
+        __Pyx_XGOTREF(__pyx_t_6);
+        __Pyx_XGOTREF(__pyx_t_7);
+        __Pyx_XGOTREF(__pyx_t_8);
+        /*try:*/ {
+
+          /* "quipubase.pyx":235
+ *         cdef Iterator* it
+ *         with self.lock:
+ *             self.ensure_open()             # <<<<<<<<<<<<<<
+ *             it = self.db.NewIterator(ReadOptions())
+ *             with nogil:
+ */
+          __pyx_t_5 = ((struct __pyx_vtabstruct_9quipubase_Quipu *)__pyx_v_self->__pyx_vtab)->ensure_open(__pyx_v_self); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(1, 235, __pyx_L7_error)
+
+          /* "quipubase.pyx":236
+ *         with self.lock:
+ *             self.ensure_open()
+ *             it = self.db.NewIterator(ReadOptions())             # <<<<<<<<<<<<<<
+ *             with nogil:
+ *                 it.SeekToFirst()
+ */
+          __pyx_v_it = __pyx_v_self->db->NewIterator(rocksdb::ReadOptions());
+
+          /* "quipubase.pyx":237
+ *             self.ensure_open()
+ *             it = self.db.NewIterator(ReadOptions())
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 it.SeekToFirst()
+ *                 while it.Valid() and offset > 0:
+ */
+          {
+              #ifdef WITH_THREAD
+              PyThreadState *_save;
+              _save = NULL;
+              Py_UNBLOCK_THREADS
+              __Pyx_FastGIL_Remember();
+              #endif
+              /*try:*/ {
+
+                /* "quipubase.pyx":238
+ *             it = self.db.NewIterator(ReadOptions())
+ *             with nogil:
+ *                 it.SeekToFirst()             # <<<<<<<<<<<<<<
+ *                 while it.Valid() and offset > 0:
+ *                     offset -= 1
+ */
+                __pyx_v_it->SeekToFirst();
 
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  __pyx_L0:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+                /* "quipubase.pyx":239
+ *             with nogil:
+ *                 it.SeekToFirst()
+ *                 while it.Valid() and offset > 0:             # <<<<<<<<<<<<<<
+ *                     offset -= 1
+ *                     it.Next()
+ */
+                while (1) {
+                  __pyx_t_10 = (__pyx_v_it->Valid() != 0);
+                  if (__pyx_t_10) {
+                  } else {
+                    __pyx_t_9 = __pyx_t_10;
+                    goto __pyx_L18_bool_binop_done;
+                  }
+                  __pyx_t_10 = (__pyx_v_offset > 0);
+                  __pyx_t_9 = __pyx_t_10;
+                  __pyx_L18_bool_binop_done:;
+                  if (!__pyx_t_9) break;
+
+                  /* "quipubase.pyx":240
+ *                 it.SeekToFirst()
+ *                 while it.Valid() and offset > 0:
+ *                     offset -= 1             # <<<<<<<<<<<<<<
+ *                     it.Next()
+ *             try:
+ */
+                  __pyx_v_offset = (__pyx_v_offset - 1);
 
-static PyObject *__pyx_pf_9quipubase_5Quipu_18delete_doc(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
-  int __pyx_t_5;
-  int __pyx_t_6;
-  Py_ssize_t __pyx_t_7;
-  Py_UCS4 __pyx_t_8;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("delete_doc", 1);
+                  /* "quipubase.pyx":241
+ *                 while it.Valid() and offset > 0:
+ *                     offset -= 1
+ *                     it.Next()             # <<<<<<<<<<<<<<
+ *             try:
+ *                 while it.Valid() and len(results) < limit:
+ */
+                  __pyx_v_it->Next();
+                }
+              }
+
+              /* "quipubase.pyx":237
+ *             self.ensure_open()
+ *             it = self.db.NewIterator(ReadOptions())
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 it.SeekToFirst()
+ *                 while it.Valid() and offset > 0:
+ */
+              /*finally:*/ {
+                /*normal exit:*/{
+                  #ifdef WITH_THREAD
+                  __Pyx_FastGIL_Forget();
+                  Py_BLOCK_THREADS
+                  #endif
+                  goto __pyx_L15;
+                }
+                __pyx_L15:;
+              }
+          }
 
-  /* "quipubase.pyx":132
- * 
- *     def delete_doc(self, str key):
- *         if not self.exists(key):             # <<<<<<<<<<<<<<
- *             raise ValueError(f"Object with id {key} not found")
- *         self.delete(key)
+          /* "quipubase.pyx":242
+ *                     offset -= 1
+ *                     it.Next()
+ *             try:             # <<<<<<<<<<<<<<
+ *                 while it.Valid() and len(results) < limit:
+ *                     if keys_only:
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_exists); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 132, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = NULL;
-  __pyx_t_4 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (likely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_3)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_3);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-      __pyx_t_4 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_key};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 1+__pyx_t_4);
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 132, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  }
-  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_5 < 0))) __PYX_ERR(0, 132, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_6 = (!__pyx_t_5);
-  if (unlikely(__pyx_t_6)) {
+          /*try:*/ {
 
-    /* "quipubase.pyx":133
- *     def delete_doc(self, str key):
- *         if not self.exists(key):
- *             raise ValueError(f"Object with id {key} not found")             # <<<<<<<<<<<<<<
- *         self.delete(key)
- * 
+            /* "quipubase.pyx":243
+ *                     it.Next()
+ *             try:
+ *                 while it.Valid() and len(results) < limit:             # <<<<<<<<<<<<<<
+ *                     if keys_only:
+ *                         results.append(it.key().data()[:it.key().size()])
  */
-    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 133, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_7 = 0;
-    __pyx_t_8 = 127;
-    __Pyx_INCREF(__pyx_kp_u_Object_with_id);
-    __pyx_t_7 += 15;
-    __Pyx_GIVEREF(__pyx_kp_u_Object_with_id);
-    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_kp_u_Object_with_id);
-    __pyx_t_2 = __Pyx_PyObject_FormatSimple(__pyx_v_key, __pyx_empty_unicode); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 133, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_8 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_2) > __pyx_t_8) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_2) : __pyx_t_8;
-    __pyx_t_7 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_2);
-    __Pyx_GIVEREF(__pyx_t_2);
-    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_2);
-    __pyx_t_2 = 0;
-    __Pyx_INCREF(__pyx_kp_u_not_found);
-    __pyx_t_7 += 10;
-    __Pyx_GIVEREF(__pyx_kp_u_not_found);
-    PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_kp_u_not_found);
-    __pyx_t_2 = __Pyx_PyUnicode_Join(__pyx_t_1, 3, __pyx_t_7, __pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 133, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 133, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __PYX_ERR(0, 133, __pyx_L1_error)
+            while (1) {
+              __pyx_t_10 = (__pyx_v_it->Valid() != 0);
+              if (__pyx_t_10) {
+              } else {
+                __pyx_t_9 = __pyx_t_10;
+                goto __pyx_L25_bool_binop_done;
+              }
+              __pyx_t_11 = __Pyx_PyList_GET_SIZE(__pyx_v_results); if (unlikely(__pyx_t_11 == ((Py_ssize_t)-1))) __PYX_ERR(1, 243, __pyx_L21_error)
+              __pyx_t_10 = (__pyx_t_11 < __pyx_v_limit);
+              __pyx_t_9 = __pyx_t_10;
+              __pyx_L25_bool_binop_done:;
+              if (!__pyx_t_9) break;
+
+              /* "quipubase.pyx":244
+ *             try:
+ *                 while it.Valid() and len(results) < limit:
+ *                     if keys_only:             # <<<<<<<<<<<<<<
+ *                         results.append(it.key().data()[:it.key().size()])
+ *                     else:
+ */
+              __pyx_t_9 = (__pyx_v_keys_only != 0);
+              if (__pyx_t_9) {
+
+                /* "quipubase.pyx":245
+ *                 while it.Valid() and len(results) < limit:
+ *                     if keys_only:
+ *                         results.append(it.key().data()[:it.key().size()])             # <<<<<<<<<<<<<<
+ *                     else:
+ *                         view = slice_view(it.value().data(), it.value().size())
+ */
+                __pyx_t_1 = __Pyx_PyBytes_FromStringAndSize(__pyx_v_it->key().data() + 0, __pyx_v_it->key().size() - 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 245, __pyx_L21_error)
+                __Pyx_GOTREF(__pyx_t_1);
+                __pyx_t_12 = __Pyx_PyList_Append(__pyx_v_results, __pyx_t_1); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(1, 245, __pyx_L21_error)
+                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+                /* "quipubase.pyx":244
+ *             try:
+ *                 while it.Valid() and len(results) < limit:
+ *                     if keys_only:             # <<<<<<<<<<<<<<
+ *                         results.append(it.key().data()[:it.key().size()])
+ *                     else:
+ */
+                goto __pyx_L27;
+              }
+
+              /* "quipubase.pyx":247
+ *                         results.append(it.key().data()[:it.key().size()])
+ *                     else:
+ *                         view = slice_view(it.value().data(), it.value().size())             # <<<<<<<<<<<<<<
+ *                         results.append(orjson.loads(view))
+ *                         view.release()
+ */
+              /*else*/ {
+                __pyx_t_1 = __pyx_f_9quipubase_slice_view(__pyx_v_it->value().data(), __pyx_v_it->value().size()); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 247, __pyx_L21_error)
+                __Pyx_GOTREF(__pyx_t_1);
+                __Pyx_XDECREF_SET(__pyx_v_view, __pyx_t_1);
+                __pyx_t_1 = 0;
+
+                /* "quipubase.pyx":248
+ *                     else:
+ *                         view = slice_view(it.value().data(), it.value().size())
+ *                         results.append(orjson.loads(view))             # <<<<<<<<<<<<<<
+ *                         view.release()
+ *                     with nogil:
+ */
+                __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_orjson); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 248, __pyx_L21_error)
+                __Pyx_GOTREF(__pyx_t_3);
+                __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_loads); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 248, __pyx_L21_error)
+                __Pyx_GOTREF(__pyx_t_4);
+                __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+                __pyx_t_3 = NULL;
+                __pyx_t_5 = 0;
+                #if CYTHON_UNPACK_METHODS
+                if (unlikely(PyMethod_Check(__pyx_t_4))) {
+                  __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
+                  if (likely(__pyx_t_3)) {
+                    PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+                    __Pyx_INCREF(__pyx_t_3);
+                    __Pyx_INCREF(function);
+                    __Pyx_DECREF_SET(__pyx_t_4, function);
+                    __pyx_t_5 = 1;
+                  }
+                }
+                #endif
+                {
+                  PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_view};
+                  __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+                  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+                  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 248, __pyx_L21_error)
+                  __Pyx_GOTREF(__pyx_t_1);
+                  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+                }
+                __pyx_t_12 = __Pyx_PyList_Append(__pyx_v_results, __pyx_t_1); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(1, 248, __pyx_L21_error)
+                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+                /* "quipubase.pyx":249
+ *                         view = slice_view(it.value().data(), it.value().size())
+ *                         results.append(orjson.loads(view))
+ *                         view.release()             # <<<<<<<<<<<<<<
+ *                     with nogil:
+ *                         it.Next()
+ */
+                __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_view, __pyx_n_s_release); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 249, __pyx_L21_error)
+                __Pyx_GOTREF(__pyx_t_4);
+                __pyx_t_3 = NULL;
+                __pyx_t_5 = 0;
+                #if CYTHON_UNPACK_METHODS
+                if (likely(PyMethod_Check(__pyx_t_4))) {
+                  __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
+                  if (likely(__pyx_t_3)) {
+                    PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+                    __Pyx_INCREF(__pyx_t_3);
+                    __Pyx_INCREF(function);
+                    __Pyx_DECREF_SET(__pyx_t_4, function);
+                    __pyx_t_5 = 1;
+                  }
+                }
+                #endif
+                {
+                  PyObject *__pyx_callargs[2] = {__pyx_t_3, NULL};
+                  __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
+                  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+                  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 249, __pyx_L21_error)
+                  __Pyx_GOTREF(__pyx_t_1);
+                  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+                }
+                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+              }
+              __pyx_L27:;
+
+              /* "quipubase.pyx":250
+ *                         results.append(orjson.loads(view))
+ *                         view.release()
+ *                     with nogil:             # <<<<<<<<<<<<<<
+ *                         it.Next()
+ *             finally:
+ */
+              {
+                  #ifdef WITH_THREAD
+                  PyThreadState *_save;
+                  _save = NULL;
+                  Py_UNBLOCK_THREADS
+                  __Pyx_FastGIL_Remember();
+                  #endif
+                  /*try:*/ {
+
+                    /* "quipubase.pyx":251
+ *                         view.release()
+ *                     with nogil:
+ *                         it.Next()             # <<<<<<<<<<<<<<
+ *             finally:
+ *                 del it
+ */
+                    __pyx_v_it->Next();
+                  }
+
+                  /* "quipubase.pyx":250
+ *                         results.append(orjson.loads(view))
+ *                         view.release()
+ *                     with nogil:             # <<<<<<<<<<<<<<
+ *                         it.Next()
+ *             finally:
+ */
+                  /*finally:*/ {
+                    /*normal exit:*/{
+                      #ifdef WITH_THREAD
+                      __Pyx_FastGIL_Forget();
+                      Py_BLOCK_THREADS
+                      #endif
+                      goto __pyx_L32;
+                    }
+                    __pyx_L32:;
+                  }
+              }
+            }
+          }
 
-    /* "quipubase.pyx":132
+          /* "quipubase.pyx":253
+ *                         it.Next()
+ *             finally:
+ *                 del it             # <<<<<<<<<<<<<<
+ *         return results
  * 
- *     def delete_doc(self, str key):
- *         if not self.exists(key):             # <<<<<<<<<<<<<<
- *             raise ValueError(f"Object with id {key} not found")
- *         self.delete(key)
  */
-  }
+          /*finally:*/ {
+            /*normal exit:*/{
+              delete __pyx_v_it;
+              goto __pyx_L22;
+            }
+            __pyx_L21_error:;
+            /*exception exit:*/{
+              __Pyx_PyThreadState_declare
+              __Pyx_PyThreadState_assign
+              __pyx_t_15 = 0; __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0; __pyx_t_20 = 0;
+              __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+              __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+              __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+              if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_18, &__pyx_t_19, &__pyx_t_20);
+              if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_15, &__pyx_t_16, &__pyx_t_17) < 0)) __Pyx_ErrFetch(&__pyx_t_15, &__pyx_t_16, &__pyx_t_17);
+              __Pyx_XGOTREF(__pyx_t_15);
+              __Pyx_XGOTREF(__pyx_t_16);
+              __Pyx_XGOTREF(__pyx_t_17);
+              __Pyx_XGOTREF(__pyx_t_18);
+              __Pyx_XGOTREF(__pyx_t_19);
+              __Pyx_XGOTREF(__pyx_t_20);
+              __pyx_t_5 = __pyx_lineno; __pyx_t_13 = __pyx_clineno; __pyx_t_14 = __pyx_filename;
+              {
+                delete __pyx_v_it;
+              }
+              if (PY_MAJOR_VERSION >= 3) {
+                __Pyx_XGIVEREF(__pyx_t_18);
+                __Pyx_XGIVEREF(__pyx_t_19);
+                __Pyx_XGIVEREF(__pyx_t_20);
+                __Pyx_ExceptionReset(__pyx_t_18, __pyx_t_19, __pyx_t_20);
+              }
+              __Pyx_XGIVEREF(__pyx_t_15);
+              __Pyx_XGIVEREF(__pyx_t_16);
+              __Pyx_XGIVEREF(__pyx_t_17);
+              __Pyx_ErrRestore(__pyx_t_15, __pyx_t_16, __pyx_t_17);
+              __pyx_t_15 = 0; __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0; __pyx_t_20 = 0;
+              __pyx_lineno = __pyx_t_5; __pyx_clineno = __pyx_t_13; __pyx_filename = __pyx_t_14;
+              goto __pyx_L7_error;
+            }
+            __pyx_L22:;
+          }
 
-  /* "quipubase.pyx":134
- *         if not self.exists(key):
- *             raise ValueError(f"Object with id {key} not found")
- *         self.delete(key)             # <<<<<<<<<<<<<<
- * 
- * 
+          /* "quipubase.pyx":234
+ *         cdef list results = []
+ *         cdef Iterator* it
+ *         with self.lock:             # <<<<<<<<<<<<<<
+ *             self.ensure_open()
+ *             it = self.db.NewIterator(ReadOptions())
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_delete); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 134, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = NULL;
-  __pyx_t_4 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (likely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_3)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_3);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-      __pyx_t_4 = 1;
+        }
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        goto __pyx_L12_try_end;
+        __pyx_L7_error:;
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        /*except:*/ {
+          __Pyx_AddTraceback("quipubase.Quipu.scan_docs", __pyx_clineno, __pyx_lineno, __pyx_filename);
+          if (__Pyx_GetException(&__pyx_t_1, &__pyx_t_4, &__pyx_t_3) < 0) __PYX_ERR(1, 234, __pyx_L9_except_error)
+          __Pyx_XGOTREF(__pyx_t_1);
+          __Pyx_XGOTREF(__pyx_t_4);
+          __Pyx_XGOTREF(__pyx_t_3);
+          __pyx_t_21 = PyTuple_Pack(3, __pyx_t_1, __pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_21)) __PYX_ERR(1, 234, __pyx_L9_except_error)
+          __Pyx_GOTREF(__pyx_t_21);
+          __pyx_t_20 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_21, NULL);
+          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+          __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
+          if (unlikely(!__pyx_t_20)) __PYX_ERR(1, 234, __pyx_L9_except_error)
+          __Pyx_GOTREF(__pyx_t_20);
+          __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_20);
+          __Pyx_DECREF(__pyx_t_20); __pyx_t_20 = 0;
+          if (__pyx_t_9 < 0) __PYX_ERR(1, 234, __pyx_L9_except_error)
+          __pyx_t_10 = (!__pyx_t_9);
+          if (unlikely(__pyx_t_10)) {
+            __Pyx_GIVEREF(__pyx_t_1);
+            __Pyx_GIVEREF(__pyx_t_4);
+            __Pyx_XGIVEREF(__pyx_t_3);
+            __Pyx_ErrRestoreWithState(__pyx_t_1, __pyx_t_4, __pyx_t_3);
+            __pyx_t_1 = 0; __pyx_t_4 = 0; __pyx_t_3 = 0; 
+            __PYX_ERR(1, 234, __pyx_L9_except_error)
+          }
+          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+          goto __pyx_L8_exception_handled;
+        }
+        __pyx_L9_except_error:;
+        __Pyx_XGIVEREF(__pyx_t_6);
+        __Pyx_XGIVEREF(__pyx_t_7);
+        __Pyx_XGIVEREF(__pyx_t_8);
+        __Pyx_ExceptionReset(__pyx_t_6, __pyx_t_7, __pyx_t_8);
+        goto __pyx_L1_error;
+        __pyx_L8_exception_handled:;
+        __Pyx_XGIVEREF(__pyx_t_6);
+        __Pyx_XGIVEREF(__pyx_t_7);
+        __Pyx_XGIVEREF(__pyx_t_8);
+        __Pyx_ExceptionReset(__pyx_t_6, __pyx_t_7, __pyx_t_8);
+        __pyx_L12_try_end:;
+      }
     }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_key};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 1+__pyx_t_4);
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 134, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
+    /*finally:*/ {
+      /*normal exit:*/{
+        if (__pyx_t_2) {
+          __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__2, NULL);
+          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+          if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 234, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        }
+        goto __pyx_L6;
+      }
+      __pyx_L6:;
+    }
+    goto __pyx_L38;
+    __pyx_L3_error:;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    goto __pyx_L1_error;
+    __pyx_L38:;
   }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "quipubase.pyx":131
- *         self.put(key, orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY))
+  /* "quipubase.pyx":254
+ *             finally:
+ *                 del it
+ *         return results             # <<<<<<<<<<<<<<
  * 
- *     def delete_doc(self, str key):             # <<<<<<<<<<<<<<
- *         if not self.exists(key):
- *             raise ValueError(f"Object with id {key} not found")
+ *     def find_docs(self,  int limit, int offset, object kwargs):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_results);
+  __pyx_r = __pyx_v_results;
+  goto __pyx_L0;
+
+  /* "quipubase.pyx":231
+ * 
+ * 
+ *     def scan_docs(self, int limit, int offset, bool keys_only=False):             # <<<<<<<<<<<<<<
+ *         cdef list results = []
+ *         cdef Iterator* it
  */
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("quipubase.Quipu.delete_doc", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_21);
+  __Pyx_AddTraceback("quipubase.Quipu.scan_docs", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_results);
+  __Pyx_XDECREF(__pyx_v_view);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "quipubase.pyx":137
+/* "quipubase.pyx":256
+ *         return results
  * 
- * 
- *     def scan_docs(self, int limit, int offset, bool keys_only=False):             # <<<<<<<<<<<<<<
+ *     def find_docs(self,  int limit, int offset, object kwargs):             # <<<<<<<<<<<<<<
+ *         # `offset` counts matching documents, as when paging across shards
  *         cdef list results = []
- *         cdef Iterator* it = self.db.NewIterator(ReadOptions())
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9quipubase_5Quipu_21scan_docs(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_9quipubase_5Quipu_27find_docs(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_9quipubase_5Quipu_21scan_docs = {"scan_docs", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_21scan_docs, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9quipubase_5Quipu_21scan_docs(PyObject *__pyx_v_self, 
+static PyMethodDef __pyx_mdef_9quipubase_5Quipu_27find_docs = {"find_docs", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_27find_docs, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9quipubase_5Quipu_27find_docs(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -6237,7 +8708,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
 ) {
   int __pyx_v_limit;
   int __pyx_v_offset;
-  bool __pyx_v_keys_only;
+  PyObject *__pyx_v_kwargs = 0;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
@@ -6248,7 +8719,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("scan_docs (wrapper)", 0);
+  __Pyx_RefNannySetupContext("find_docs (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_MACROS
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -6258,7 +8729,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_limit,&__pyx_n_s_offset,&__pyx_n_s_keys_only,0};
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_limit,&__pyx_n_s_offset,&__pyx_n_s_kwargs,0};
     if (__pyx_kwds) {
       Py_ssize_t kw_args;
       switch (__pyx_nargs) {
@@ -6278,7 +8749,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 137, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 256, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
@@ -6286,43 +8757,39 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 137, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 256, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("scan_docs", 0, 2, 3, 1); __PYX_ERR(0, 137, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("find_docs", 1, 3, 3, 1); __PYX_ERR(1, 256, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
-        if (kw_args > 0) {
-          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_keys_only);
-          if (value) { values[2] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 137, __pyx_L3_error)
+        if (likely((values[2] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_kwargs)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[2]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 256, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("find_docs", 1, 3, 3, 2); __PYX_ERR(1, 256, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "scan_docs") < 0)) __PYX_ERR(0, 137, __pyx_L3_error)
-      }
-    } else {
-      switch (__pyx_nargs) {
-        case  3: values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
-        CYTHON_FALLTHROUGH;
-        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-        values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        break;
-        default: goto __pyx_L5_argtuple_error;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "find_docs") < 0)) __PYX_ERR(1, 256, __pyx_L3_error)
       }
-    }
-    __pyx_v_limit = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_limit == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 137, __pyx_L3_error)
-    __pyx_v_offset = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_offset == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 137, __pyx_L3_error)
-    if (values[2]) {
-      __pyx_v_keys_only = __Pyx_PyObject_IsTrue(values[2]); if (unlikely((__pyx_v_keys_only == ((bool)-1)) && PyErr_Occurred())) __PYX_ERR(0, 137, __pyx_L3_error)
+    } else if (unlikely(__pyx_nargs != 3)) {
+      goto __pyx_L5_argtuple_error;
     } else {
-      __pyx_v_keys_only = ((bool)0);
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+      values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
     }
+    __pyx_v_limit = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_limit == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 256, __pyx_L3_error)
+    __pyx_v_offset = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_offset == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 256, __pyx_L3_error)
+    __pyx_v_kwargs = values[2];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("scan_docs", 0, 2, 3, __pyx_nargs); __PYX_ERR(0, 137, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("find_docs", 1, 3, 3, __pyx_nargs); __PYX_ERR(1, 256, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -6332,11 +8799,11 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
   }
-  __Pyx_AddTraceback("quipubase.Quipu.scan_docs", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("quipubase.Quipu.find_docs", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9quipubase_5Quipu_20scan_docs(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_limit, __pyx_v_offset, __pyx_v_keys_only);
+  __pyx_r = __pyx_pf_9quipubase_5Quipu_26find_docs(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_limit, __pyx_v_offset, __pyx_v_kwargs);
 
   /* function exit code */
   {
@@ -6349,376 +8816,657 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9quipubase_5Quipu_20scan_docs(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, int __pyx_v_limit, int __pyx_v_offset, bool __pyx_v_keys_only) {
+static PyObject *__pyx_pf_9quipubase_5Quipu_26find_docs(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, int __pyx_v_limit, int __pyx_v_offset, PyObject *__pyx_v_kwargs) {
   PyObject *__pyx_v_results = 0;
   rocksdb::Iterator *__pyx_v_it;
+  PyObject *__pyx_v_view = NULL;
+  PyObject *__pyx_v_doc = NULL;
+  PyObject *__pyx_v_key = NULL;
+  PyObject *__pyx_v_value = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  Py_ssize_t __pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
-  int __pyx_t_6;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
   PyObject *__pyx_t_7 = NULL;
   PyObject *__pyx_t_8 = NULL;
   int __pyx_t_9;
-  PyObject *__pyx_t_10 = NULL;
-  PyObject *__pyx_t_11 = NULL;
-  PyObject *__pyx_t_12 = NULL;
-  PyObject *__pyx_t_13 = NULL;
+  int __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  int __pyx_t_13;
   PyObject *__pyx_t_14 = NULL;
-  PyObject *__pyx_t_15 = NULL;
+  int __pyx_t_15;
+  char const *__pyx_t_16;
+  PyObject *__pyx_t_17 = NULL;
+  PyObject *__pyx_t_18 = NULL;
+  PyObject *__pyx_t_19 = NULL;
+  PyObject *__pyx_t_20 = NULL;
+  PyObject *__pyx_t_21 = NULL;
+  PyObject *__pyx_t_22 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("scan_docs", 1);
+  __Pyx_RefNannySetupContext("find_docs", 1);
 
-  /* "quipubase.pyx":138
- * 
- *     def scan_docs(self, int limit, int offset, bool keys_only=False):
+  /* "quipubase.pyx":258
+ *     def find_docs(self,  int limit, int offset, object kwargs):
+ *         # `offset` counts matching documents, as when paging across shards
  *         cdef list results = []             # <<<<<<<<<<<<<<
- *         cdef Iterator* it = self.db.NewIterator(ReadOptions())
- *         it.SeekToFirst()
+ *         cdef Iterator* it
+ *         with self.lock:
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 138, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 258, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_results = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "quipubase.pyx":139
- *     def scan_docs(self, int limit, int offset, bool keys_only=False):
+  /* "quipubase.pyx":260
  *         cdef list results = []
- *         cdef Iterator* it = self.db.NewIterator(ReadOptions())             # <<<<<<<<<<<<<<
- *         it.SeekToFirst()
- *         try:
+ *         cdef Iterator* it
+ *         with self.lock:             # <<<<<<<<<<<<<<
+ *             self.ensure_open()
+ *             it = self.db.NewIterator(ReadOptions())
  */
-  __pyx_v_it = __pyx_v_self->db->NewIterator(rocksdb::ReadOptions());
+  /*with:*/ {
+    __pyx_t_2 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_exit); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 260, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_enter); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 260, __pyx_L3_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = NULL;
+    __pyx_t_5 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_5 = 1;
+      }
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
+      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 260, __pyx_L3_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    /*try:*/ {
+      {
+        __Pyx_PyThreadState_declare
+        __Pyx_PyThreadState_assign
+        __Pyx_ExceptionSave(&__pyx_t_6, &__pyx_t_7, &__pyx_t_8);
+        __Pyx_XGOTREF(__pyx_t_6);
+        __Pyx_XGOTREF(__pyx_t_7);
+        __Pyx_XGOTREF(__pyx_t_8);
+        /*try:*/ {
 
-  /* "quipubase.pyx":140
- *         cdef list results = []
- *         cdef Iterator* it = self.db.NewIterator(ReadOptions())
- *         it.SeekToFirst()             # <<<<<<<<<<<<<<
- *         try:
- *             while it.Valid() and len(results) < limit:
+          /* "quipubase.pyx":261
+ *         cdef Iterator* it
+ *         with self.lock:
+ *             self.ensure_open()             # <<<<<<<<<<<<<<
+ *             it = self.db.NewIterator(ReadOptions())
+ *             with nogil:
  */
-  __pyx_v_it->SeekToFirst();
+          __pyx_t_5 = ((struct __pyx_vtabstruct_9quipubase_Quipu *)__pyx_v_self->__pyx_vtab)->ensure_open(__pyx_v_self); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(1, 261, __pyx_L7_error)
 
-  /* "quipubase.pyx":141
- *         cdef Iterator* it = self.db.NewIterator(ReadOptions())
- *         it.SeekToFirst()
- *         try:             # <<<<<<<<<<<<<<
- *             while it.Valid() and len(results) < limit:
- *                 if offset > 0:
- */
-  /*try:*/ {
-
-    /* "quipubase.pyx":142
- *         it.SeekToFirst()
- *         try:
- *             while it.Valid() and len(results) < limit:             # <<<<<<<<<<<<<<
- *                 if offset > 0:
- *                     offset -= 1
+          /* "quipubase.pyx":262
+ *         with self.lock:
+ *             self.ensure_open()
+ *             it = self.db.NewIterator(ReadOptions())             # <<<<<<<<<<<<<<
+ *             with nogil:
+ *                 it.SeekToFirst()
  */
-    while (1) {
-      __pyx_t_3 = (__pyx_v_it->Valid() != 0);
-      if (__pyx_t_3) {
-      } else {
-        __pyx_t_2 = __pyx_t_3;
-        goto __pyx_L8_bool_binop_done;
-      }
-      __pyx_t_4 = __Pyx_PyList_GET_SIZE(__pyx_v_results); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(0, 142, __pyx_L4_error)
-      __pyx_t_3 = (__pyx_t_4 < __pyx_v_limit);
-      __pyx_t_2 = __pyx_t_3;
-      __pyx_L8_bool_binop_done:;
-      if (!__pyx_t_2) break;
-
-      /* "quipubase.pyx":143
- *         try:
- *             while it.Valid() and len(results) < limit:
- *                 if offset > 0:             # <<<<<<<<<<<<<<
- *                     offset -= 1
- *                     it.Next()
+          __pyx_v_it = __pyx_v_self->db->NewIterator(rocksdb::ReadOptions());
+
+          /* "quipubase.pyx":263
+ *             self.ensure_open()
+ *             it = self.db.NewIterator(ReadOptions())
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 it.SeekToFirst()
+ *             try:
  */
-      __pyx_t_2 = (__pyx_v_offset > 0);
-      if (__pyx_t_2) {
-
-        /* "quipubase.pyx":144
- *             while it.Valid() and len(results) < limit:
- *                 if offset > 0:
- *                     offset -= 1             # <<<<<<<<<<<<<<
- *                     it.Next()
- *                     continue
+          {
+              #ifdef WITH_THREAD
+              PyThreadState *_save;
+              _save = NULL;
+              Py_UNBLOCK_THREADS
+              __Pyx_FastGIL_Remember();
+              #endif
+              /*try:*/ {
+
+                /* "quipubase.pyx":264
+ *             it = self.db.NewIterator(ReadOptions())
+ *             with nogil:
+ *                 it.SeekToFirst()             # <<<<<<<<<<<<<<
+ *             try:
+ *                 while it.Valid() and len(results) < limit:
  */
-        __pyx_v_offset = (__pyx_v_offset - 1);
-
-        /* "quipubase.pyx":145
- *                 if offset > 0:
- *                     offset -= 1
- *                     it.Next()             # <<<<<<<<<<<<<<
- *                     continue
- *                 if keys_only:
+                __pyx_v_it->SeekToFirst();
+              }
+
+              /* "quipubase.pyx":263
+ *             self.ensure_open()
+ *             it = self.db.NewIterator(ReadOptions())
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 it.SeekToFirst()
+ *             try:
  */
-        __pyx_v_it->Next();
+              /*finally:*/ {
+                /*normal exit:*/{
+                  #ifdef WITH_THREAD
+                  __Pyx_FastGIL_Forget();
+                  Py_BLOCK_THREADS
+                  #endif
+                  goto __pyx_L15;
+                }
+                __pyx_L15:;
+              }
+          }
 
-        /* "quipubase.pyx":146
- *                     offset -= 1
- *                     it.Next()
- *                     continue             # <<<<<<<<<<<<<<
- *                 if keys_only:
- *                     results.append((<bytes>it.key().data())[:it.key().size()])
+          /* "quipubase.pyx":265
+ *             with nogil:
+ *                 it.SeekToFirst()
+ *             try:             # <<<<<<<<<<<<<<
+ *                 while it.Valid() and len(results) < limit:
+ *                     view = slice_view(it.value().data(), it.value().size())
  */
-        goto __pyx_L6_continue;
-
-        /* "quipubase.pyx":143
- *         try:
- *             while it.Valid() and len(results) < limit:
- *                 if offset > 0:             # <<<<<<<<<<<<<<
- *                     offset -= 1
- *                     it.Next()
+          /*try:*/ {
+
+            /* "quipubase.pyx":266
+ *                 it.SeekToFirst()
+ *             try:
+ *                 while it.Valid() and len(results) < limit:             # <<<<<<<<<<<<<<
+ *                     view = slice_view(it.value().data(), it.value().size())
+ *                     doc = orjson.loads(view)
  */
-      }
-
-      /* "quipubase.pyx":147
- *                     it.Next()
- *                     continue
- *                 if keys_only:             # <<<<<<<<<<<<<<
- *                     results.append((<bytes>it.key().data())[:it.key().size()])
- *                 else:
- */
-      __pyx_t_2 = (__pyx_v_keys_only != 0);
-      if (__pyx_t_2) {
-
-        /* "quipubase.pyx":148
- *                     continue
- *                 if keys_only:
- *                     results.append((<bytes>it.key().data())[:it.key().size()])             # <<<<<<<<<<<<<<
- *                 else:
- *                     results.append(orjson.loads((<bytes>it.value().data())[:it.value().size()]))
- */
-        __pyx_t_1 = __Pyx_PyBytes_FromString(__pyx_v_it->key().data()); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 148, __pyx_L4_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        if (unlikely(__pyx_t_1 == Py_None)) {
-          PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-          __PYX_ERR(0, 148, __pyx_L4_error)
-        }
-        __pyx_t_5 = PySequence_GetSlice(((PyObject*)__pyx_t_1), 0, __pyx_v_it->key().size()); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 148, __pyx_L4_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        __pyx_t_6 = __Pyx_PyList_Append(__pyx_v_results, __pyx_t_5); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 148, __pyx_L4_error)
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-
-        /* "quipubase.pyx":147
- *                     it.Next()
- *                     continue
- *                 if keys_only:             # <<<<<<<<<<<<<<
- *                     results.append((<bytes>it.key().data())[:it.key().size()])
- *                 else:
+            while (1) {
+              __pyx_t_10 = (__pyx_v_it->Valid() != 0);
+              if (__pyx_t_10) {
+              } else {
+                __pyx_t_9 = __pyx_t_10;
+                goto __pyx_L21_bool_binop_done;
+              }
+              __pyx_t_11 = __Pyx_PyList_GET_SIZE(__pyx_v_results); if (unlikely(__pyx_t_11 == ((Py_ssize_t)-1))) __PYX_ERR(1, 266, __pyx_L17_error)
+              __pyx_t_10 = (__pyx_t_11 < __pyx_v_limit);
+              __pyx_t_9 = __pyx_t_10;
+              __pyx_L21_bool_binop_done:;
+              if (!__pyx_t_9) break;
+
+              /* "quipubase.pyx":267
+ *             try:
+ *                 while it.Valid() and len(results) < limit:
+ *                     view = slice_view(it.value().data(), it.value().size())             # <<<<<<<<<<<<<<
+ *                     doc = orjson.loads(view)
+ *                     view.release()
  */
-        goto __pyx_L11;
-      }
-
-      /* "quipubase.pyx":150
- *                     results.append((<bytes>it.key().data())[:it.key().size()])
- *                 else:
- *                     results.append(orjson.loads((<bytes>it.value().data())[:it.value().size()]))             # <<<<<<<<<<<<<<
- *                 it.Next()
- *         finally:
- */
-      /*else*/ {
-        __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_orjson); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 150, __pyx_L4_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_loads); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 150, __pyx_L4_error)
-        __Pyx_GOTREF(__pyx_t_7);
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        __pyx_t_1 = __Pyx_PyBytes_FromString(__pyx_v_it->value().data()); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 150, __pyx_L4_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        if (unlikely(__pyx_t_1 == Py_None)) {
-          PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-          __PYX_ERR(0, 150, __pyx_L4_error)
-        }
-        __pyx_t_8 = PySequence_GetSlice(((PyObject*)__pyx_t_1), 0, __pyx_v_it->value().size()); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 150, __pyx_L4_error)
-        __Pyx_GOTREF(__pyx_t_8);
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        __pyx_t_1 = NULL;
-        __pyx_t_9 = 0;
-        #if CYTHON_UNPACK_METHODS
-        if (unlikely(PyMethod_Check(__pyx_t_7))) {
-          __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_7);
-          if (likely(__pyx_t_1)) {
-            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
-            __Pyx_INCREF(__pyx_t_1);
-            __Pyx_INCREF(function);
-            __Pyx_DECREF_SET(__pyx_t_7, function);
-            __pyx_t_9 = 1;
-          }
-        }
-        #endif
-        {
-          PyObject *__pyx_callargs[2] = {__pyx_t_1, __pyx_t_8};
-          __pyx_t_5 = __Pyx_PyObject_FastCall(__pyx_t_7, __pyx_callargs+1-__pyx_t_9, 1+__pyx_t_9);
-          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-          if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 150, __pyx_L4_error)
-          __Pyx_GOTREF(__pyx_t_5);
-          __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-        }
-        __pyx_t_6 = __Pyx_PyList_Append(__pyx_v_results, __pyx_t_5); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 150, __pyx_L4_error)
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      }
-      __pyx_L11:;
-
-      /* "quipubase.pyx":151
- *                 else:
- *                     results.append(orjson.loads((<bytes>it.value().data())[:it.value().size()]))
- *                 it.Next()             # <<<<<<<<<<<<<<
- *         finally:
- *             del it
+              __pyx_t_1 = __pyx_f_9quipubase_slice_view(__pyx_v_it->value().data(), __pyx_v_it->value().size()); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 267, __pyx_L17_error)
+              __Pyx_GOTREF(__pyx_t_1);
+              __Pyx_XDECREF_SET(__pyx_v_view, __pyx_t_1);
+              __pyx_t_1 = 0;
+
+              /* "quipubase.pyx":268
+ *                 while it.Valid() and len(results) < limit:
+ *                     view = slice_view(it.value().data(), it.value().size())
+ *                     doc = orjson.loads(view)             # <<<<<<<<<<<<<<
+ *                     view.release()
+ *                     for key, value in kwargs.items():
  */
-      __pyx_v_it->Next();
-      __pyx_L6_continue:;
-    }
-  }
-
-  /* "quipubase.pyx":153
- *                 it.Next()
- *         finally:
- *             del it             # <<<<<<<<<<<<<<
- *             return results
- * 
+              __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_orjson); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 268, __pyx_L17_error)
+              __Pyx_GOTREF(__pyx_t_3);
+              __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_loads); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 268, __pyx_L17_error)
+              __Pyx_GOTREF(__pyx_t_4);
+              __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+              __pyx_t_3 = NULL;
+              __pyx_t_5 = 0;
+              #if CYTHON_UNPACK_METHODS
+              if (unlikely(PyMethod_Check(__pyx_t_4))) {
+                __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
+                if (likely(__pyx_t_3)) {
+                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+                  __Pyx_INCREF(__pyx_t_3);
+                  __Pyx_INCREF(function);
+                  __Pyx_DECREF_SET(__pyx_t_4, function);
+                  __pyx_t_5 = 1;
+                }
+              }
+              #endif
+              {
+                PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_view};
+                __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+                __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+                if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 268, __pyx_L17_error)
+                __Pyx_GOTREF(__pyx_t_1);
+                __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+              }
+              __Pyx_XDECREF_SET(__pyx_v_doc, __pyx_t_1);
+              __pyx_t_1 = 0;
+
+              /* "quipubase.pyx":269
+ *                     view = slice_view(it.value().data(), it.value().size())
+ *                     doc = orjson.loads(view)
+ *                     view.release()             # <<<<<<<<<<<<<<
+ *                     for key, value in kwargs.items():
+ *                         if doc.get(key) != value:
+ */
+              __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_view, __pyx_n_s_release); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 269, __pyx_L17_error)
+              __Pyx_GOTREF(__pyx_t_4);
+              __pyx_t_3 = NULL;
+              __pyx_t_5 = 0;
+              #if CYTHON_UNPACK_METHODS
+              if (likely(PyMethod_Check(__pyx_t_4))) {
+                __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
+                if (likely(__pyx_t_3)) {
+                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+                  __Pyx_INCREF(__pyx_t_3);
+                  __Pyx_INCREF(function);
+                  __Pyx_DECREF_SET(__pyx_t_4, function);
+                  __pyx_t_5 = 1;
+                }
+              }
+              #endif
+              {
+                PyObject *__pyx_callargs[2] = {__pyx_t_3, NULL};
+                __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
+                __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+                if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 269, __pyx_L17_error)
+                __Pyx_GOTREF(__pyx_t_1);
+                __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+              }
+              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+              /* "quipubase.pyx":270
+ *                     doc = orjson.loads(view)
+ *                     view.release()
+ *                     for key, value in kwargs.items():             # <<<<<<<<<<<<<<
+ *                         if doc.get(key) != value:
+ *                             break
+ */
+              __pyx_t_11 = 0;
+              if (unlikely(__pyx_v_kwargs == Py_None)) {
+                PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "items");
+                __PYX_ERR(1, 270, __pyx_L17_error)
+              }
+              __pyx_t_4 = __Pyx_dict_iterator(__pyx_v_kwargs, 0, __pyx_n_s_items, (&__pyx_t_12), (&__pyx_t_5)); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 270, __pyx_L17_error)
+              __Pyx_GOTREF(__pyx_t_4);
+              __Pyx_XDECREF(__pyx_t_1);
+              __pyx_t_1 = __pyx_t_4;
+              __pyx_t_4 = 0;
+              while (1) {
+                __pyx_t_13 = __Pyx_dict_iter_next(__pyx_t_1, __pyx_t_12, &__pyx_t_11, &__pyx_t_4, &__pyx_t_3, NULL, __pyx_t_5);
+                if (unlikely(__pyx_t_13 == 0)) break;
+                if (unlikely(__pyx_t_13 == -1)) __PYX_ERR(1, 270, __pyx_L17_error)
+                __Pyx_GOTREF(__pyx_t_4);
+                __Pyx_GOTREF(__pyx_t_3);
+                __Pyx_XDECREF_SET(__pyx_v_key, __pyx_t_4);
+                __pyx_t_4 = 0;
+                __Pyx_XDECREF_SET(__pyx_v_value, __pyx_t_3);
+                __pyx_t_3 = 0;
+
+                /* "quipubase.pyx":271
+ *                     view.release()
+ *                     for key, value in kwargs.items():
+ *                         if doc.get(key) != value:             # <<<<<<<<<<<<<<
+ *                             break
+ *                     else:
+ */
+                __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_doc, __pyx_n_s_get); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 271, __pyx_L17_error)
+                __Pyx_GOTREF(__pyx_t_4);
+                __pyx_t_14 = NULL;
+                __pyx_t_13 = 0;
+                #if CYTHON_UNPACK_METHODS
+                if (likely(PyMethod_Check(__pyx_t_4))) {
+                  __pyx_t_14 = PyMethod_GET_SELF(__pyx_t_4);
+                  if (likely(__pyx_t_14)) {
+                    PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+                    __Pyx_INCREF(__pyx_t_14);
+                    __Pyx_INCREF(function);
+                    __Pyx_DECREF_SET(__pyx_t_4, function);
+                    __pyx_t_13 = 1;
+                  }
+                }
+                #endif
+                {
+                  PyObject *__pyx_callargs[2] = {__pyx_t_14, __pyx_v_key};
+                  __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_13, 1+__pyx_t_13);
+                  __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
+                  if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 271, __pyx_L17_error)
+                  __Pyx_GOTREF(__pyx_t_3);
+                  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+                }
+                __pyx_t_4 = PyObject_RichCompare(__pyx_t_3, __pyx_v_value, Py_NE); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 271, __pyx_L17_error)
+                __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+                __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely((__pyx_t_9 < 0))) __PYX_ERR(1, 271, __pyx_L17_error)
+                __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+                if (__pyx_t_9) {
+
+                  /* "quipubase.pyx":272
+ *                     for key, value in kwargs.items():
+ *                         if doc.get(key) != value:
+ *                             break             # <<<<<<<<<<<<<<
+ *                     else:
+ *                         if offset > 0:
+ */
+                  goto __pyx_L24_break;
+
+                  /* "quipubase.pyx":271
+ *                     view.release()
+ *                     for key, value in kwargs.items():
+ *                         if doc.get(key) != value:             # <<<<<<<<<<<<<<
+ *                             break
+ *                     else:
  */
-  /*finally:*/ {
-    /*normal exit:*/{
-      delete __pyx_v_it;
+                }
+              }
+
+              /* "quipubase.pyx":274
+ *                             break
+ *                     else:
+ *                         if offset > 0:             # <<<<<<<<<<<<<<
+ *                             offset -= 1
+ *                         else:
+ */
+              /*else*/ {
+                __pyx_t_9 = (__pyx_v_offset > 0);
+                if (__pyx_t_9) {
+
+                  /* "quipubase.pyx":275
+ *                     else:
+ *                         if offset > 0:
+ *                             offset -= 1             # <<<<<<<<<<<<<<
+ *                         else:
+ *                             results.append(doc)
+ */
+                  __pyx_v_offset = (__pyx_v_offset - 1);
+
+                  /* "quipubase.pyx":274
+ *                             break
+ *                     else:
+ *                         if offset > 0:             # <<<<<<<<<<<<<<
+ *                             offset -= 1
+ *                         else:
+ */
+                  goto __pyx_L26;
+                }
 
-      /* "quipubase.pyx":154
- *         finally:
- *             del it
- *             return results             # <<<<<<<<<<<<<<
- * 
- *     def find_docs(self,  int limit, int offset, object kwargs):
+                /* "quipubase.pyx":277
+ *                             offset -= 1
+ *                         else:
+ *                             results.append(doc)             # <<<<<<<<<<<<<<
+ *                     with nogil:
+ *                         it.Next()
  */
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_v_results);
-      __pyx_r = __pyx_v_results;
-      goto __pyx_L0;
-    }
-    __pyx_L4_error:;
-    /*exception exit:*/{
-      __Pyx_PyThreadState_declare
-      __Pyx_PyThreadState_assign
-      __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0; __pyx_t_14 = 0; __pyx_t_15 = 0;
-      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_13, &__pyx_t_14, &__pyx_t_15);
-      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_10, &__pyx_t_11, &__pyx_t_12) < 0)) __Pyx_ErrFetch(&__pyx_t_10, &__pyx_t_11, &__pyx_t_12);
-      __Pyx_XGOTREF(__pyx_t_10);
-      __Pyx_XGOTREF(__pyx_t_11);
-      __Pyx_XGOTREF(__pyx_t_12);
-      __Pyx_XGOTREF(__pyx_t_13);
-      __Pyx_XGOTREF(__pyx_t_14);
-      __Pyx_XGOTREF(__pyx_t_15);
-      {
+                /*else*/ {
+                  __pyx_t_15 = __Pyx_PyList_Append(__pyx_v_results, __pyx_v_doc); if (unlikely(__pyx_t_15 == ((int)-1))) __PYX_ERR(1, 277, __pyx_L17_error)
+                }
+                __pyx_L26:;
+              }
+              __pyx_L24_break:;
+              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+              /* "quipubase.pyx":278
+ *                         else:
+ *                             results.append(doc)
+ *                     with nogil:             # <<<<<<<<<<<<<<
+ *                         it.Next()
+ *             finally:
+ */
+              {
+                  #ifdef WITH_THREAD
+                  PyThreadState *_save;
+                  _save = NULL;
+                  Py_UNBLOCK_THREADS
+                  __Pyx_FastGIL_Remember();
+                  #endif
+                  /*try:*/ {
+
+                    /* "quipubase.pyx":279
+ *                             results.append(doc)
+ *                     with nogil:
+ *                         it.Next()             # <<<<<<<<<<<<<<
+ *             finally:
+ *                 del it
+ */
+                    __pyx_v_it->Next();
+                  }
+
+                  /* "quipubase.pyx":278
+ *                         else:
+ *                             results.append(doc)
+ *                     with nogil:             # <<<<<<<<<<<<<<
+ *                         it.Next()
+ *             finally:
+ */
+                  /*finally:*/ {
+                    /*normal exit:*/{
+                      #ifdef WITH_THREAD
+                      __Pyx_FastGIL_Forget();
+                      Py_BLOCK_THREADS
+                      #endif
+                      goto __pyx_L31;
+                    }
+                    __pyx_L31:;
+                  }
+              }
+            }
+          }
 
-        /* "quipubase.pyx":153
- *                 it.Next()
- *         finally:
- *             del it             # <<<<<<<<<<<<<<
- *             return results
+          /* "quipubase.pyx":281
+ *                         it.Next()
+ *             finally:
+ *                 del it             # <<<<<<<<<<<<<<
+ *         return results
  * 
  */
-        delete __pyx_v_it;
+          /*finally:*/ {
+            /*normal exit:*/{
+              delete __pyx_v_it;
+              goto __pyx_L18;
+            }
+            __pyx_L17_error:;
+            /*exception exit:*/{
+              __Pyx_PyThreadState_declare
+              __Pyx_PyThreadState_assign
+              __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0; __pyx_t_20 = 0; __pyx_t_21 = 0; __pyx_t_22 = 0;
+              __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+              __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
+              __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+              __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+              if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_20, &__pyx_t_21, &__pyx_t_22);
+              if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_17, &__pyx_t_18, &__pyx_t_19) < 0)) __Pyx_ErrFetch(&__pyx_t_17, &__pyx_t_18, &__pyx_t_19);
+              __Pyx_XGOTREF(__pyx_t_17);
+              __Pyx_XGOTREF(__pyx_t_18);
+              __Pyx_XGOTREF(__pyx_t_19);
+              __Pyx_XGOTREF(__pyx_t_20);
+              __Pyx_XGOTREF(__pyx_t_21);
+              __Pyx_XGOTREF(__pyx_t_22);
+              __pyx_t_5 = __pyx_lineno; __pyx_t_13 = __pyx_clineno; __pyx_t_16 = __pyx_filename;
+              {
+                delete __pyx_v_it;
+              }
+              if (PY_MAJOR_VERSION >= 3) {
+                __Pyx_XGIVEREF(__pyx_t_20);
+                __Pyx_XGIVEREF(__pyx_t_21);
+                __Pyx_XGIVEREF(__pyx_t_22);
+                __Pyx_ExceptionReset(__pyx_t_20, __pyx_t_21, __pyx_t_22);
+              }
+              __Pyx_XGIVEREF(__pyx_t_17);
+              __Pyx_XGIVEREF(__pyx_t_18);
+              __Pyx_XGIVEREF(__pyx_t_19);
+              __Pyx_ErrRestore(__pyx_t_17, __pyx_t_18, __pyx_t_19);
+              __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0; __pyx_t_20 = 0; __pyx_t_21 = 0; __pyx_t_22 = 0;
+              __pyx_lineno = __pyx_t_5; __pyx_clineno = __pyx_t_13; __pyx_filename = __pyx_t_16;
+              goto __pyx_L7_error;
+            }
+            __pyx_L18:;
+          }
 
-        /* "quipubase.pyx":154
- *         finally:
- *             del it
- *             return results             # <<<<<<<<<<<<<<
- * 
- *     def find_docs(self,  int limit, int offset, object kwargs):
+          /* "quipubase.pyx":260
+ *         cdef list results = []
+ *         cdef Iterator* it
+ *         with self.lock:             # <<<<<<<<<<<<<<
+ *             self.ensure_open()
+ *             it = self.db.NewIterator(ReadOptions())
  */
-        __Pyx_XDECREF(__pyx_r);
-        __Pyx_INCREF(__pyx_v_results);
-        __pyx_r = __pyx_v_results;
-        goto __pyx_L12_return;
+        }
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        goto __pyx_L12_try_end;
+        __pyx_L7_error:;
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
+        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        /*except:*/ {
+          __Pyx_AddTraceback("quipubase.Quipu.find_docs", __pyx_clineno, __pyx_lineno, __pyx_filename);
+          if (__Pyx_GetException(&__pyx_t_1, &__pyx_t_4, &__pyx_t_3) < 0) __PYX_ERR(1, 260, __pyx_L9_except_error)
+          __Pyx_XGOTREF(__pyx_t_1);
+          __Pyx_XGOTREF(__pyx_t_4);
+          __Pyx_XGOTREF(__pyx_t_3);
+          __pyx_t_14 = PyTuple_Pack(3, __pyx_t_1, __pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_14)) __PYX_ERR(1, 260, __pyx_L9_except_error)
+          __Pyx_GOTREF(__pyx_t_14);
+          __pyx_t_22 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_14, NULL);
+          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+          __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+          if (unlikely(!__pyx_t_22)) __PYX_ERR(1, 260, __pyx_L9_except_error)
+          __Pyx_GOTREF(__pyx_t_22);
+          __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_22);
+          __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
+          if (__pyx_t_9 < 0) __PYX_ERR(1, 260, __pyx_L9_except_error)
+          __pyx_t_10 = (!__pyx_t_9);
+          if (unlikely(__pyx_t_10)) {
+            __Pyx_GIVEREF(__pyx_t_1);
+            __Pyx_GIVEREF(__pyx_t_4);
+            __Pyx_XGIVEREF(__pyx_t_3);
+            __Pyx_ErrRestoreWithState(__pyx_t_1, __pyx_t_4, __pyx_t_3);
+            __pyx_t_1 = 0; __pyx_t_4 = 0; __pyx_t_3 = 0; 
+            __PYX_ERR(1, 260, __pyx_L9_except_error)
+          }
+          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+          goto __pyx_L8_exception_handled;
+        }
+        __pyx_L9_except_error:;
+        __Pyx_XGIVEREF(__pyx_t_6);
+        __Pyx_XGIVEREF(__pyx_t_7);
+        __Pyx_XGIVEREF(__pyx_t_8);
+        __Pyx_ExceptionReset(__pyx_t_6, __pyx_t_7, __pyx_t_8);
+        goto __pyx_L1_error;
+        __pyx_L8_exception_handled:;
+        __Pyx_XGIVEREF(__pyx_t_6);
+        __Pyx_XGIVEREF(__pyx_t_7);
+        __Pyx_XGIVEREF(__pyx_t_8);
+        __Pyx_ExceptionReset(__pyx_t_6, __pyx_t_7, __pyx_t_8);
+        __pyx_L12_try_end:;
       }
-      __pyx_L12_return:;
-      if (PY_MAJOR_VERSION >= 3) {
-        __Pyx_XGIVEREF(__pyx_t_13);
-        __Pyx_XGIVEREF(__pyx_t_14);
-        __Pyx_XGIVEREF(__pyx_t_15);
-        __Pyx_ExceptionReset(__pyx_t_13, __pyx_t_14, __pyx_t_15);
+    }
+    /*finally:*/ {
+      /*normal exit:*/{
+        if (__pyx_t_2) {
+          __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__2, NULL);
+          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+          if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 260, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        }
+        goto __pyx_L6;
       }
-      __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
-      __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
-      __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
-      __pyx_t_13 = 0; __pyx_t_14 = 0; __pyx_t_15 = 0;
-      goto __pyx_L0;
+      __pyx_L6:;
     }
+    goto __pyx_L37;
+    __pyx_L3_error:;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    goto __pyx_L1_error;
+    __pyx_L37:;
   }
 
-  /* "quipubase.pyx":137
+  /* "quipubase.pyx":282
+ *             finally:
+ *                 del it
+ *         return results             # <<<<<<<<<<<<<<
  * 
+ *     def scan_prefix(self, str prefix, bool keys_only=False):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_results);
+  __pyx_r = __pyx_v_results;
+  goto __pyx_L0;
+
+  /* "quipubase.pyx":256
+ *         return results
  * 
- *     def scan_docs(self, int limit, int offset, bool keys_only=False):             # <<<<<<<<<<<<<<
+ *     def find_docs(self,  int limit, int offset, object kwargs):             # <<<<<<<<<<<<<<
+ *         # `offset` counts matching documents, as when paging across shards
  *         cdef list results = []
- *         cdef Iterator* it = self.db.NewIterator(ReadOptions())
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_AddTraceback("quipubase.Quipu.scan_docs", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_14);
+  __Pyx_AddTraceback("quipubase.Quipu.find_docs", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XDECREF(__pyx_v_results);
+  __Pyx_XDECREF(__pyx_v_view);
+  __Pyx_XDECREF(__pyx_v_doc);
+  __Pyx_XDECREF(__pyx_v_key);
+  __Pyx_XDECREF(__pyx_v_value);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "quipubase.pyx":156
- *             return results
+/* "quipubase.pyx":284
+ *         return results
  * 
- *     def find_docs(self,  int limit, int offset, object kwargs):             # <<<<<<<<<<<<<<
- *         cdef list results = []
- *         cdef Iterator* it = self.db.NewIterator(ReadOptions())
+ *     def scan_prefix(self, str prefix, bool keys_only=False):             # <<<<<<<<<<<<<<
+ *         """
+ *         The `(key, document)` pairs, or the keys, of the documents whose key
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9quipubase_5Quipu_23find_docs(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_9quipubase_5Quipu_29scan_prefix(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_9quipubase_5Quipu_23find_docs = {"find_docs", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_23find_docs, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9quipubase_5Quipu_23find_docs(PyObject *__pyx_v_self, 
+PyDoc_STRVAR(__pyx_doc_9quipubase_5Quipu_28scan_prefix, "\n        The `(key, document)` pairs, or the keys, of the documents whose key\n        starts with `prefix`, in key order.\n        ");
+static PyMethodDef __pyx_mdef_9quipubase_5Quipu_29scan_prefix = {"scan_prefix", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_29scan_prefix, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9quipubase_5Quipu_28scan_prefix};
+static PyObject *__pyx_pw_9quipubase_5Quipu_29scan_prefix(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  int __pyx_v_limit;
-  int __pyx_v_offset;
-  PyObject *__pyx_v_kwargs = 0;
+  PyObject *__pyx_v_prefix = 0;
+  bool __pyx_v_keys_only;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[3] = {0,0,0};
+  PyObject* values[2] = {0,0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("find_docs (wrapper)", 0);
+  __Pyx_RefNannySetupContext("scan_prefix (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_MACROS
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -6728,12 +9476,10 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_limit,&__pyx_n_s_offset,&__pyx_n_s_kwargs,0};
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_prefix,&__pyx_n_s_keys_only,0};
     if (__pyx_kwds) {
       Py_ssize_t kw_args;
       switch (__pyx_nargs) {
-        case  3: values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
-        CYTHON_FALLTHROUGH;
         case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
         CYTHON_FALLTHROUGH;
         case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
@@ -6744,51 +9490,43 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
       switch (__pyx_nargs) {
         case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_limit)) != 0)) {
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_prefix)) != 0)) {
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 156, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 284, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
-        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_offset)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 156, __pyx_L3_error)
-        else {
-          __Pyx_RaiseArgtupleInvalid("find_docs", 1, 3, 3, 1); __PYX_ERR(0, 156, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  2:
-        if (likely((values[2] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_kwargs)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[2]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 156, __pyx_L3_error)
-        else {
-          __Pyx_RaiseArgtupleInvalid("find_docs", 1, 3, 3, 2); __PYX_ERR(0, 156, __pyx_L3_error)
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_keys_only);
+          if (value) { values[1] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 284, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "find_docs") < 0)) __PYX_ERR(0, 156, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "scan_prefix") < 0)) __PYX_ERR(1, 284, __pyx_L3_error)
       }
-    } else if (unlikely(__pyx_nargs != 3)) {
-      goto __pyx_L5_argtuple_error;
     } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-      values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+      switch (__pyx_nargs) {
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_prefix = ((PyObject*)values[0]);
+    if (values[1]) {
+      __pyx_v_keys_only = __Pyx_PyObject_IsTrue(values[1]); if (unlikely((__pyx_v_keys_only == ((bool)-1)) && PyErr_Occurred())) __PYX_ERR(1, 284, __pyx_L3_error)
+    } else {
+      __pyx_v_keys_only = ((bool)0);
     }
-    __pyx_v_limit = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_limit == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 156, __pyx_L3_error)
-    __pyx_v_offset = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_offset == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 156, __pyx_L3_error)
-    __pyx_v_kwargs = values[2];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("find_docs", 1, 3, 3, __pyx_nargs); __PYX_ERR(0, 156, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("scan_prefix", 0, 1, 2, __pyx_nargs); __PYX_ERR(1, 284, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -6798,13 +9536,18 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
   }
-  __Pyx_AddTraceback("quipubase.Quipu.find_docs", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("quipubase.Quipu.scan_prefix", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9quipubase_5Quipu_22find_docs(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_limit, __pyx_v_offset, __pyx_v_kwargs);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_prefix), (&PyString_Type), 1, "prefix", 1))) __PYX_ERR(1, 284, __pyx_L1_error)
+  __pyx_r = __pyx_pf_9quipubase_5Quipu_28scan_prefix(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_prefix, __pyx_v_keys_only);
 
   /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
   {
     Py_ssize_t __pyx_temp;
     for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
@@ -6815,419 +9558,607 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9quipubase_5Quipu_22find_docs(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, int __pyx_v_limit, int __pyx_v_offset, PyObject *__pyx_v_kwargs) {
+static PyObject *__pyx_pf_9quipubase_5Quipu_28scan_prefix(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_prefix, bool __pyx_v_keys_only) {
   PyObject *__pyx_v_results = 0;
+  PyObject *__pyx_v_bprefix = 0;
+  std::string __pyx_v_cprefix;
   rocksdb::Iterator *__pyx_v_it;
-  PyObject *__pyx_v_doc = NULL;
   PyObject *__pyx_v_key = NULL;
-  PyObject *__pyx_v_value = NULL;
+  PyObject *__pyx_v_view = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  Py_ssize_t __pyx_t_4;
+  std::string __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_6;
   PyObject *__pyx_t_7 = NULL;
-  int __pyx_t_8;
-  Py_ssize_t __pyx_t_9;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
   int __pyx_t_10;
   int __pyx_t_11;
-  PyObject *__pyx_t_12 = NULL;
+  int __pyx_t_12;
   PyObject *__pyx_t_13 = NULL;
-  PyObject *__pyx_t_14 = NULL;
-  PyObject *__pyx_t_15 = NULL;
+  int __pyx_t_14;
+  char const *__pyx_t_15;
   PyObject *__pyx_t_16 = NULL;
   PyObject *__pyx_t_17 = NULL;
+  PyObject *__pyx_t_18 = NULL;
+  PyObject *__pyx_t_19 = NULL;
+  PyObject *__pyx_t_20 = NULL;
+  PyObject *__pyx_t_21 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("find_docs", 1);
+  __Pyx_RefNannySetupContext("scan_prefix", 1);
 
-  /* "quipubase.pyx":157
- * 
- *     def find_docs(self,  int limit, int offset, object kwargs):
+  /* "quipubase.pyx":289
+ *         starts with `prefix`, in key order.
+ *         """
  *         cdef list results = []             # <<<<<<<<<<<<<<
- *         cdef Iterator* it = self.db.NewIterator(ReadOptions())
- *         it.SeekToFirst()
+ *         cdef bytes bprefix = prefix.encode()
+ *         cdef string cprefix = bprefix
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 157, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 289, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_results = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "quipubase.pyx":158
- *     def find_docs(self,  int limit, int offset, object kwargs):
+  /* "quipubase.pyx":290
+ *         """
  *         cdef list results = []
- *         cdef Iterator* it = self.db.NewIterator(ReadOptions())             # <<<<<<<<<<<<<<
- *         it.SeekToFirst()
- *         try:
+ *         cdef bytes bprefix = prefix.encode()             # <<<<<<<<<<<<<<
+ *         cdef string cprefix = bprefix
+ *         cdef Iterator* it
  */
-  __pyx_v_it = __pyx_v_self->db->NewIterator(rocksdb::ReadOptions());
+  __pyx_t_1 = __Pyx_CallUnboundCMethod0(&__pyx_umethod_PyString_Type_encode, __pyx_v_prefix); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 290, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(PyBytes_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_1))) __PYX_ERR(1, 290, __pyx_L1_error)
+  __pyx_v_bprefix = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
 
-  /* "quipubase.pyx":159
+  /* "quipubase.pyx":291
  *         cdef list results = []
- *         cdef Iterator* it = self.db.NewIterator(ReadOptions())
- *         it.SeekToFirst()             # <<<<<<<<<<<<<<
- *         try:
- *             while it.Valid() and len(results) < limit:
- */
-  __pyx_v_it->SeekToFirst();
-
-  /* "quipubase.pyx":160
- *         cdef Iterator* it = self.db.NewIterator(ReadOptions())
- *         it.SeekToFirst()
- *         try:             # <<<<<<<<<<<<<<
- *             while it.Valid() and len(results) < limit:
- *                 if offset > 0:
- */
-  /*try:*/ {
-
-    /* "quipubase.pyx":161
- *         it.SeekToFirst()
- *         try:
- *             while it.Valid() and len(results) < limit:             # <<<<<<<<<<<<<<
- *                 if offset > 0:
- *                     offset -= 1
- */
-    while (1) {
-      __pyx_t_3 = (__pyx_v_it->Valid() != 0);
-      if (__pyx_t_3) {
-      } else {
-        __pyx_t_2 = __pyx_t_3;
-        goto __pyx_L8_bool_binop_done;
-      }
-      __pyx_t_4 = __Pyx_PyList_GET_SIZE(__pyx_v_results); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(0, 161, __pyx_L4_error)
-      __pyx_t_3 = (__pyx_t_4 < __pyx_v_limit);
-      __pyx_t_2 = __pyx_t_3;
-      __pyx_L8_bool_binop_done:;
-      if (!__pyx_t_2) break;
-
-      /* "quipubase.pyx":162
- *         try:
- *             while it.Valid() and len(results) < limit:
- *                 if offset > 0:             # <<<<<<<<<<<<<<
- *                     offset -= 1
- *                     it.Next()
+ *         cdef bytes bprefix = prefix.encode()
+ *         cdef string cprefix = bprefix             # <<<<<<<<<<<<<<
+ *         cdef Iterator* it
+ *         with self.lock:
  */
-      __pyx_t_2 = (__pyx_v_offset > 0);
-      if (__pyx_t_2) {
+  __pyx_t_2 = __pyx_convert_string_from_py_6libcpp_6string_std__in_string(__pyx_v_bprefix); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 291, __pyx_L1_error)
+  __pyx_v_cprefix = __PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2);
 
-        /* "quipubase.pyx":163
- *             while it.Valid() and len(results) < limit:
- *                 if offset > 0:
- *                     offset -= 1             # <<<<<<<<<<<<<<
- *                     it.Next()
- *                     continue
+  /* "quipubase.pyx":293
+ *         cdef string cprefix = bprefix
+ *         cdef Iterator* it
+ *         with self.lock:             # <<<<<<<<<<<<<<
+ *             self.ensure_open()
+ *             it = self.db.NewIterator(self.read_options)
  */
-        __pyx_v_offset = (__pyx_v_offset - 1);
+  /*with:*/ {
+    __pyx_t_3 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_exit); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 293, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyObject_LookupSpecial(__pyx_v_self->lock, __pyx_n_s_enter); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 293, __pyx_L3_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    __pyx_t_6 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+        __pyx_t_6 = 1;
+      }
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_5, NULL};
+      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_6, 0+__pyx_t_6);
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 293, __pyx_L3_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    /*try:*/ {
+      {
+        __Pyx_PyThreadState_declare
+        __Pyx_PyThreadState_assign
+        __Pyx_ExceptionSave(&__pyx_t_7, &__pyx_t_8, &__pyx_t_9);
+        __Pyx_XGOTREF(__pyx_t_7);
+        __Pyx_XGOTREF(__pyx_t_8);
+        __Pyx_XGOTREF(__pyx_t_9);
+        /*try:*/ {
 
-        /* "quipubase.pyx":164
- *                 if offset > 0:
- *                     offset -= 1
- *                     it.Next()             # <<<<<<<<<<<<<<
- *                     continue
- *                 doc = orjson.loads((<bytes>it.value().data())[:it.value().size()])
+          /* "quipubase.pyx":294
+ *         cdef Iterator* it
+ *         with self.lock:
+ *             self.ensure_open()             # <<<<<<<<<<<<<<
+ *             it = self.db.NewIterator(self.read_options)
+ *             with nogil:
  */
-        __pyx_v_it->Next();
+          __pyx_t_6 = ((struct __pyx_vtabstruct_9quipubase_Quipu *)__pyx_v_self->__pyx_vtab)->ensure_open(__pyx_v_self); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(1, 294, __pyx_L7_error)
 
-        /* "quipubase.pyx":165
- *                     offset -= 1
- *                     it.Next()
- *                     continue             # <<<<<<<<<<<<<<
- *                 doc = orjson.loads((<bytes>it.value().data())[:it.value().size()])
- *                 for key, value in kwargs.items():
+          /* "quipubase.pyx":295
+ *         with self.lock:
+ *             self.ensure_open()
+ *             it = self.db.NewIterator(self.read_options)             # <<<<<<<<<<<<<<
+ *             with nogil:
+ *                 it.Seek(Slice(cprefix))
  */
-        goto __pyx_L6_continue;
-
-        /* "quipubase.pyx":162
- *         try:
- *             while it.Valid() and len(results) < limit:
- *                 if offset > 0:             # <<<<<<<<<<<<<<
- *                     offset -= 1
- *                     it.Next()
+          __pyx_v_it = __pyx_v_self->db->NewIterator(__pyx_v_self->read_options);
+
+          /* "quipubase.pyx":296
+ *             self.ensure_open()
+ *             it = self.db.NewIterator(self.read_options)
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 it.Seek(Slice(cprefix))
+ *             try:
  */
-      }
+          {
+              #ifdef WITH_THREAD
+              PyThreadState *_save;
+              _save = NULL;
+              Py_UNBLOCK_THREADS
+              __Pyx_FastGIL_Remember();
+              #endif
+              /*try:*/ {
+
+                /* "quipubase.pyx":297
+ *             it = self.db.NewIterator(self.read_options)
+ *             with nogil:
+ *                 it.Seek(Slice(cprefix))             # <<<<<<<<<<<<<<
+ *             try:
+ *                 while it.Valid():
+ */
+                __pyx_v_it->Seek(rocksdb::Slice(__pyx_v_cprefix));
+              }
+
+              /* "quipubase.pyx":296
+ *             self.ensure_open()
+ *             it = self.db.NewIterator(self.read_options)
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 it.Seek(Slice(cprefix))
+ *             try:
+ */
+              /*finally:*/ {
+                /*normal exit:*/{
+                  #ifdef WITH_THREAD
+                  __Pyx_FastGIL_Forget();
+                  Py_BLOCK_THREADS
+                  #endif
+                  goto __pyx_L15;
+                }
+                __pyx_L15:;
+              }
+          }
 
-      /* "quipubase.pyx":166
- *                     it.Next()
- *                     continue
- *                 doc = orjson.loads((<bytes>it.value().data())[:it.value().size()])             # <<<<<<<<<<<<<<
- *                 for key, value in kwargs.items():
- *                     if doc.get(key) != value:
- */
-      __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_orjson); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 166, __pyx_L4_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_loads); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 166, __pyx_L4_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_t_5 = __Pyx_PyBytes_FromString(__pyx_v_it->value().data()); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 166, __pyx_L4_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      if (unlikely(__pyx_t_5 == Py_None)) {
-        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-        __PYX_ERR(0, 166, __pyx_L4_error)
-      }
-      __pyx_t_7 = PySequence_GetSlice(((PyObject*)__pyx_t_5), 0, __pyx_v_it->value().size()); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 166, __pyx_L4_error)
-      __Pyx_GOTREF(__pyx_t_7);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_t_5 = NULL;
-      __pyx_t_8 = 0;
-      #if CYTHON_UNPACK_METHODS
-      if (unlikely(PyMethod_Check(__pyx_t_6))) {
-        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_6);
-        if (likely(__pyx_t_5)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
-          __Pyx_INCREF(__pyx_t_5);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_6, function);
-          __pyx_t_8 = 1;
-        }
-      }
-      #endif
-      {
-        PyObject *__pyx_callargs[2] = {__pyx_t_5, __pyx_t_7};
-        __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_6, __pyx_callargs+1-__pyx_t_8, 1+__pyx_t_8);
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 166, __pyx_L4_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      }
-      __Pyx_XDECREF_SET(__pyx_v_doc, __pyx_t_1);
-      __pyx_t_1 = 0;
-
-      /* "quipubase.pyx":167
- *                     continue
- *                 doc = orjson.loads((<bytes>it.value().data())[:it.value().size()])
- *                 for key, value in kwargs.items():             # <<<<<<<<<<<<<<
- *                     if doc.get(key) != value:
+          /* "quipubase.pyx":298
+ *             with nogil:
+ *                 it.Seek(Slice(cprefix))
+ *             try:             # <<<<<<<<<<<<<<
+ *                 while it.Valid():
+ *                     key = it.key().data()[:it.key().size()]
+ */
+          /*try:*/ {
+
+            /* "quipubase.pyx":299
+ *                 it.Seek(Slice(cprefix))
+ *             try:
+ *                 while it.Valid():             # <<<<<<<<<<<<<<
+ *                     key = it.key().data()[:it.key().size()]
+ *                     if not key.startswith(bprefix):
+ */
+            while (1) {
+              __pyx_t_10 = (__pyx_v_it->Valid() != 0);
+              if (!__pyx_t_10) break;
+
+              /* "quipubase.pyx":300
+ *             try:
+ *                 while it.Valid():
+ *                     key = it.key().data()[:it.key().size()]             # <<<<<<<<<<<<<<
+ *                     if not key.startswith(bprefix):
  *                         break
  */
-      __pyx_t_4 = 0;
-      if (unlikely(__pyx_v_kwargs == Py_None)) {
-        PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "items");
-        __PYX_ERR(0, 167, __pyx_L4_error)
-      }
-      __pyx_t_6 = __Pyx_dict_iterator(__pyx_v_kwargs, 0, __pyx_n_s_items, (&__pyx_t_9), (&__pyx_t_8)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 167, __pyx_L4_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_XDECREF(__pyx_t_1);
-      __pyx_t_1 = __pyx_t_6;
-      __pyx_t_6 = 0;
-      while (1) {
-        __pyx_t_10 = __Pyx_dict_iter_next(__pyx_t_1, __pyx_t_9, &__pyx_t_4, &__pyx_t_6, &__pyx_t_7, NULL, __pyx_t_8);
-        if (unlikely(__pyx_t_10 == 0)) break;
-        if (unlikely(__pyx_t_10 == -1)) __PYX_ERR(0, 167, __pyx_L4_error)
-        __Pyx_GOTREF(__pyx_t_6);
-        __Pyx_GOTREF(__pyx_t_7);
-        __Pyx_XDECREF_SET(__pyx_v_key, __pyx_t_6);
-        __pyx_t_6 = 0;
-        __Pyx_XDECREF_SET(__pyx_v_value, __pyx_t_7);
-        __pyx_t_7 = 0;
-
-        /* "quipubase.pyx":168
- *                 doc = orjson.loads((<bytes>it.value().data())[:it.value().size()])
- *                 for key, value in kwargs.items():
- *                     if doc.get(key) != value:             # <<<<<<<<<<<<<<
+              __pyx_t_1 = __Pyx_PyBytes_FromStringAndSize(__pyx_v_it->key().data() + 0, __pyx_v_it->key().size() - 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 300, __pyx_L17_error)
+              __Pyx_GOTREF(__pyx_t_1);
+              __Pyx_XDECREF_SET(__pyx_v_key, ((PyObject*)__pyx_t_1));
+              __pyx_t_1 = 0;
+
+              /* "quipubase.pyx":301
+ *                 while it.Valid():
+ *                     key = it.key().data()[:it.key().size()]
+ *                     if not key.startswith(bprefix):             # <<<<<<<<<<<<<<
  *                         break
- *                 else:
- */
-        __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_doc, __pyx_n_s_get); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 168, __pyx_L4_error)
-        __Pyx_GOTREF(__pyx_t_6);
-        __pyx_t_5 = NULL;
-        __pyx_t_10 = 0;
-        #if CYTHON_UNPACK_METHODS
-        if (likely(PyMethod_Check(__pyx_t_6))) {
-          __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_6);
-          if (likely(__pyx_t_5)) {
-            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
-            __Pyx_INCREF(__pyx_t_5);
-            __Pyx_INCREF(function);
-            __Pyx_DECREF_SET(__pyx_t_6, function);
-            __pyx_t_10 = 1;
-          }
-        }
-        #endif
-        {
-          PyObject *__pyx_callargs[2] = {__pyx_t_5, __pyx_v_key};
-          __pyx_t_7 = __Pyx_PyObject_FastCall(__pyx_t_6, __pyx_callargs+1-__pyx_t_10, 1+__pyx_t_10);
-          __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-          if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 168, __pyx_L4_error)
-          __Pyx_GOTREF(__pyx_t_7);
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        }
-        __pyx_t_6 = PyObject_RichCompare(__pyx_t_7, __pyx_v_value, Py_NE); __Pyx_XGOTREF(__pyx_t_6); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 168, __pyx_L4_error)
-        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-        __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 168, __pyx_L4_error)
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        if (__pyx_t_2) {
+ *                     if keys_only:
+ */
+              __pyx_t_10 = __Pyx_PyBytes_Tailmatch(__pyx_v_key, __pyx_v_bprefix, 0, PY_SSIZE_T_MAX, -1); if (unlikely(__pyx_t_10 == ((int)-1))) __PYX_ERR(1, 301, __pyx_L17_error)
+              __pyx_t_11 = (!__pyx_t_10);
+              if (__pyx_t_11) {
 
-          /* "quipubase.pyx":169
- *                 for key, value in kwargs.items():
- *                     if doc.get(key) != value:
+                /* "quipubase.pyx":302
+ *                     key = it.key().data()[:it.key().size()]
+ *                     if not key.startswith(bprefix):
  *                         break             # <<<<<<<<<<<<<<
- *                 else:
- *                     results.append(doc)
+ *                     if keys_only:
+ *                         results.append(key.decode())
  */
-          goto __pyx_L12_break;
+                goto __pyx_L20_break;
 
-          /* "quipubase.pyx":168
- *                 doc = orjson.loads((<bytes>it.value().data())[:it.value().size()])
- *                 for key, value in kwargs.items():
- *                     if doc.get(key) != value:             # <<<<<<<<<<<<<<
+                /* "quipubase.pyx":301
+ *                 while it.Valid():
+ *                     key = it.key().data()[:it.key().size()]
+ *                     if not key.startswith(bprefix):             # <<<<<<<<<<<<<<
  *                         break
- *                 else:
+ *                     if keys_only:
  */
-        }
-      }
+              }
 
-      /* "quipubase.pyx":171
+              /* "quipubase.pyx":303
+ *                     if not key.startswith(bprefix):
  *                         break
- *                 else:
- *                     results.append(doc)             # <<<<<<<<<<<<<<
- *                 it.Next()
- *         finally:
+ *                     if keys_only:             # <<<<<<<<<<<<<<
+ *                         results.append(key.decode())
+ *                     else:
  */
-      /*else*/ {
-        __pyx_t_11 = __Pyx_PyList_Append(__pyx_v_results, __pyx_v_doc); if (unlikely(__pyx_t_11 == ((int)-1))) __PYX_ERR(0, 171, __pyx_L4_error)
-      }
-      __pyx_L12_break:;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+              __pyx_t_11 = (__pyx_v_keys_only != 0);
+              if (__pyx_t_11) {
 
-      /* "quipubase.pyx":172
- *                 else:
- *                     results.append(doc)
- *                 it.Next()             # <<<<<<<<<<<<<<
- *         finally:
- *             del it
+                /* "quipubase.pyx":304
+ *                         break
+ *                     if keys_only:
+ *                         results.append(key.decode())             # <<<<<<<<<<<<<<
+ *                     else:
+ *                         view = slice_view(it.value().data(), it.value().size())
  */
-      __pyx_v_it->Next();
-      __pyx_L6_continue:;
-    }
-  }
+                __pyx_t_1 = __Pyx_decode_bytes(__pyx_v_key, 0, PY_SSIZE_T_MAX, NULL, NULL, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 304, __pyx_L17_error)
+                __Pyx_GOTREF(__pyx_t_1);
+                __pyx_t_12 = __Pyx_PyList_Append(__pyx_v_results, __pyx_t_1); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(1, 304, __pyx_L17_error)
+                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "quipubase.pyx":174
- *                 it.Next()
- *         finally:
- *             del it             # <<<<<<<<<<<<<<
- *             return results
- * 
+                /* "quipubase.pyx":303
+ *                     if not key.startswith(bprefix):
+ *                         break
+ *                     if keys_only:             # <<<<<<<<<<<<<<
+ *                         results.append(key.decode())
+ *                     else:
  */
-  /*finally:*/ {
-    /*normal exit:*/{
-      delete __pyx_v_it;
-
-      /* "quipubase.pyx":175
- *         finally:
- *             del it
- *             return results             # <<<<<<<<<<<<<<
- * 
- *     def merge_doc(self, str key, dict[str,Any] value):
+                goto __pyx_L22;
+              }
+
+              /* "quipubase.pyx":306
+ *                         results.append(key.decode())
+ *                     else:
+ *                         view = slice_view(it.value().data(), it.value().size())             # <<<<<<<<<<<<<<
+ *                         results.append((key.decode(), orjson.loads(view)))
+ *                         view.release()
  */
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_v_results);
-      __pyx_r = __pyx_v_results;
-      goto __pyx_L0;
-    }
-    __pyx_L4_error:;
-    /*exception exit:*/{
-      __Pyx_PyThreadState_declare
-      __Pyx_PyThreadState_assign
-      __pyx_t_12 = 0; __pyx_t_13 = 0; __pyx_t_14 = 0; __pyx_t_15 = 0; __pyx_t_16 = 0; __pyx_t_17 = 0;
-      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_15, &__pyx_t_16, &__pyx_t_17);
-      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_12, &__pyx_t_13, &__pyx_t_14) < 0)) __Pyx_ErrFetch(&__pyx_t_12, &__pyx_t_13, &__pyx_t_14);
-      __Pyx_XGOTREF(__pyx_t_12);
-      __Pyx_XGOTREF(__pyx_t_13);
-      __Pyx_XGOTREF(__pyx_t_14);
-      __Pyx_XGOTREF(__pyx_t_15);
-      __Pyx_XGOTREF(__pyx_t_16);
-      __Pyx_XGOTREF(__pyx_t_17);
-      {
+              /*else*/ {
+                __pyx_t_1 = __pyx_f_9quipubase_slice_view(__pyx_v_it->value().data(), __pyx_v_it->value().size()); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 306, __pyx_L17_error)
+                __Pyx_GOTREF(__pyx_t_1);
+                __Pyx_XDECREF_SET(__pyx_v_view, __pyx_t_1);
+                __pyx_t_1 = 0;
+
+                /* "quipubase.pyx":307
+ *                     else:
+ *                         view = slice_view(it.value().data(), it.value().size())
+ *                         results.append((key.decode(), orjson.loads(view)))             # <<<<<<<<<<<<<<
+ *                         view.release()
+ *                     with nogil:
+ */
+                __pyx_t_1 = __Pyx_decode_bytes(__pyx_v_key, 0, PY_SSIZE_T_MAX, NULL, NULL, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 307, __pyx_L17_error)
+                __Pyx_GOTREF(__pyx_t_1);
+                __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_orjson); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 307, __pyx_L17_error)
+                __Pyx_GOTREF(__pyx_t_5);
+                __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_loads); if (unlikely(!__pyx_t_13)) __PYX_ERR(1, 307, __pyx_L17_error)
+                __Pyx_GOTREF(__pyx_t_13);
+                __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+                __pyx_t_5 = NULL;
+                __pyx_t_6 = 0;
+                #if CYTHON_UNPACK_METHODS
+                if (unlikely(PyMethod_Check(__pyx_t_13))) {
+                  __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_13);
+                  if (likely(__pyx_t_5)) {
+                    PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_13);
+                    __Pyx_INCREF(__pyx_t_5);
+                    __Pyx_INCREF(function);
+                    __Pyx_DECREF_SET(__pyx_t_13, function);
+                    __pyx_t_6 = 1;
+                  }
+                }
+                #endif
+                {
+                  PyObject *__pyx_callargs[2] = {__pyx_t_5, __pyx_v_view};
+                  __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_13, __pyx_callargs+1-__pyx_t_6, 1+__pyx_t_6);
+                  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+                  if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 307, __pyx_L17_error)
+                  __Pyx_GOTREF(__pyx_t_4);
+                  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+                }
+                __pyx_t_13 = PyTuple_New(2); if (unlikely(!__pyx_t_13)) __PYX_ERR(1, 307, __pyx_L17_error)
+                __Pyx_GOTREF(__pyx_t_13);
+                __Pyx_GIVEREF(__pyx_t_1);
+                if (__Pyx_PyTuple_SET_ITEM(__pyx_t_13, 0, __pyx_t_1)) __PYX_ERR(1, 307, __pyx_L17_error);
+                __Pyx_GIVEREF(__pyx_t_4);
+                if (__Pyx_PyTuple_SET_ITEM(__pyx_t_13, 1, __pyx_t_4)) __PYX_ERR(1, 307, __pyx_L17_error);
+                __pyx_t_1 = 0;
+                __pyx_t_4 = 0;
+                __pyx_t_12 = __Pyx_PyList_Append(__pyx_v_results, __pyx_t_13); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(1, 307, __pyx_L17_error)
+                __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+
+                /* "quipubase.pyx":308
+ *                         view = slice_view(it.value().data(), it.value().size())
+ *                         results.append((key.decode(), orjson.loads(view)))
+ *                         view.release()             # <<<<<<<<<<<<<<
+ *                     with nogil:
+ *                         it.Next()
+ */
+                __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_view, __pyx_n_s_release); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 308, __pyx_L17_error)
+                __Pyx_GOTREF(__pyx_t_4);
+                __pyx_t_1 = NULL;
+                __pyx_t_6 = 0;
+                #if CYTHON_UNPACK_METHODS
+                if (likely(PyMethod_Check(__pyx_t_4))) {
+                  __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_4);
+                  if (likely(__pyx_t_1)) {
+                    PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+                    __Pyx_INCREF(__pyx_t_1);
+                    __Pyx_INCREF(function);
+                    __Pyx_DECREF_SET(__pyx_t_4, function);
+                    __pyx_t_6 = 1;
+                  }
+                }
+                #endif
+                {
+                  PyObject *__pyx_callargs[2] = {__pyx_t_1, NULL};
+                  __pyx_t_13 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_6, 0+__pyx_t_6);
+                  __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+                  if (unlikely(!__pyx_t_13)) __PYX_ERR(1, 308, __pyx_L17_error)
+                  __Pyx_GOTREF(__pyx_t_13);
+                  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+                }
+                __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+              }
+              __pyx_L22:;
+
+              /* "quipubase.pyx":309
+ *                         results.append((key.decode(), orjson.loads(view)))
+ *                         view.release()
+ *                     with nogil:             # <<<<<<<<<<<<<<
+ *                         it.Next()
+ *             finally:
+ */
+              {
+                  #ifdef WITH_THREAD
+                  PyThreadState *_save;
+                  _save = NULL;
+                  Py_UNBLOCK_THREADS
+                  __Pyx_FastGIL_Remember();
+                  #endif
+                  /*try:*/ {
+
+                    /* "quipubase.pyx":310
+ *                         view.release()
+ *                     with nogil:
+ *                         it.Next()             # <<<<<<<<<<<<<<
+ *             finally:
+ *                 del it
+ */
+                    __pyx_v_it->Next();
+                  }
+
+                  /* "quipubase.pyx":309
+ *                         results.append((key.decode(), orjson.loads(view)))
+ *                         view.release()
+ *                     with nogil:             # <<<<<<<<<<<<<<
+ *                         it.Next()
+ *             finally:
+ */
+                  /*finally:*/ {
+                    /*normal exit:*/{
+                      #ifdef WITH_THREAD
+                      __Pyx_FastGIL_Forget();
+                      Py_BLOCK_THREADS
+                      #endif
+                      goto __pyx_L27;
+                    }
+                    __pyx_L27:;
+                  }
+              }
+            }
+            __pyx_L20_break:;
+          }
 
-        /* "quipubase.pyx":174
- *                 it.Next()
- *         finally:
- *             del it             # <<<<<<<<<<<<<<
- *             return results
+          /* "quipubase.pyx":312
+ *                         it.Next()
+ *             finally:
+ *                 del it             # <<<<<<<<<<<<<<
+ *         return results
  * 
  */
-        delete __pyx_v_it;
+          /*finally:*/ {
+            /*normal exit:*/{
+              delete __pyx_v_it;
+              goto __pyx_L18;
+            }
+            __pyx_L17_error:;
+            /*exception exit:*/{
+              __Pyx_PyThreadState_declare
+              __Pyx_PyThreadState_assign
+              __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0; __pyx_t_20 = 0; __pyx_t_21 = 0;
+              __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+              __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
+              __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+              __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+              if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_19, &__pyx_t_20, &__pyx_t_21);
+              if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_16, &__pyx_t_17, &__pyx_t_18) < 0)) __Pyx_ErrFetch(&__pyx_t_16, &__pyx_t_17, &__pyx_t_18);
+              __Pyx_XGOTREF(__pyx_t_16);
+              __Pyx_XGOTREF(__pyx_t_17);
+              __Pyx_XGOTREF(__pyx_t_18);
+              __Pyx_XGOTREF(__pyx_t_19);
+              __Pyx_XGOTREF(__pyx_t_20);
+              __Pyx_XGOTREF(__pyx_t_21);
+              __pyx_t_6 = __pyx_lineno; __pyx_t_14 = __pyx_clineno; __pyx_t_15 = __pyx_filename;
+              {
+                delete __pyx_v_it;
+              }
+              if (PY_MAJOR_VERSION >= 3) {
+                __Pyx_XGIVEREF(__pyx_t_19);
+                __Pyx_XGIVEREF(__pyx_t_20);
+                __Pyx_XGIVEREF(__pyx_t_21);
+                __Pyx_ExceptionReset(__pyx_t_19, __pyx_t_20, __pyx_t_21);
+              }
+              __Pyx_XGIVEREF(__pyx_t_16);
+              __Pyx_XGIVEREF(__pyx_t_17);
+              __Pyx_XGIVEREF(__pyx_t_18);
+              __Pyx_ErrRestore(__pyx_t_16, __pyx_t_17, __pyx_t_18);
+              __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0; __pyx_t_20 = 0; __pyx_t_21 = 0;
+              __pyx_lineno = __pyx_t_6; __pyx_clineno = __pyx_t_14; __pyx_filename = __pyx_t_15;
+              goto __pyx_L7_error;
+            }
+            __pyx_L18:;
+          }
 
-        /* "quipubase.pyx":175
- *         finally:
- *             del it
- *             return results             # <<<<<<<<<<<<<<
- * 
- *     def merge_doc(self, str key, dict[str,Any] value):
+          /* "quipubase.pyx":293
+ *         cdef string cprefix = bprefix
+ *         cdef Iterator* it
+ *         with self.lock:             # <<<<<<<<<<<<<<
+ *             self.ensure_open()
+ *             it = self.db.NewIterator(self.read_options)
  */
-        __Pyx_XDECREF(__pyx_r);
-        __Pyx_INCREF(__pyx_v_results);
-        __pyx_r = __pyx_v_results;
-        goto __pyx_L14_return;
+        }
+        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+        goto __pyx_L12_try_end;
+        __pyx_L7_error:;
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        /*except:*/ {
+          __Pyx_AddTraceback("quipubase.Quipu.scan_prefix", __pyx_clineno, __pyx_lineno, __pyx_filename);
+          if (__Pyx_GetException(&__pyx_t_13, &__pyx_t_4, &__pyx_t_1) < 0) __PYX_ERR(1, 293, __pyx_L9_except_error)
+          __Pyx_XGOTREF(__pyx_t_13);
+          __Pyx_XGOTREF(__pyx_t_4);
+          __Pyx_XGOTREF(__pyx_t_1);
+          __pyx_t_5 = PyTuple_Pack(3, __pyx_t_13, __pyx_t_4, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 293, __pyx_L9_except_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          __pyx_t_21 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+          if (unlikely(!__pyx_t_21)) __PYX_ERR(1, 293, __pyx_L9_except_error)
+          __Pyx_GOTREF(__pyx_t_21);
+          __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_t_21);
+          __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
+          if (__pyx_t_11 < 0) __PYX_ERR(1, 293, __pyx_L9_except_error)
+          __pyx_t_10 = (!__pyx_t_11);
+          if (unlikely(__pyx_t_10)) {
+            __Pyx_GIVEREF(__pyx_t_13);
+            __Pyx_GIVEREF(__pyx_t_4);
+            __Pyx_XGIVEREF(__pyx_t_1);
+            __Pyx_ErrRestoreWithState(__pyx_t_13, __pyx_t_4, __pyx_t_1);
+            __pyx_t_13 = 0; __pyx_t_4 = 0; __pyx_t_1 = 0; 
+            __PYX_ERR(1, 293, __pyx_L9_except_error)
+          }
+          __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
+          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+          goto __pyx_L8_exception_handled;
+        }
+        __pyx_L9_except_error:;
+        __Pyx_XGIVEREF(__pyx_t_7);
+        __Pyx_XGIVEREF(__pyx_t_8);
+        __Pyx_XGIVEREF(__pyx_t_9);
+        __Pyx_ExceptionReset(__pyx_t_7, __pyx_t_8, __pyx_t_9);
+        goto __pyx_L1_error;
+        __pyx_L8_exception_handled:;
+        __Pyx_XGIVEREF(__pyx_t_7);
+        __Pyx_XGIVEREF(__pyx_t_8);
+        __Pyx_XGIVEREF(__pyx_t_9);
+        __Pyx_ExceptionReset(__pyx_t_7, __pyx_t_8, __pyx_t_9);
+        __pyx_L12_try_end:;
       }
-      __pyx_L14_return:;
-      if (PY_MAJOR_VERSION >= 3) {
-        __Pyx_XGIVEREF(__pyx_t_15);
-        __Pyx_XGIVEREF(__pyx_t_16);
-        __Pyx_XGIVEREF(__pyx_t_17);
-        __Pyx_ExceptionReset(__pyx_t_15, __pyx_t_16, __pyx_t_17);
+    }
+    /*finally:*/ {
+      /*normal exit:*/{
+        if (__pyx_t_3) {
+          __pyx_t_9 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_tuple__2, NULL);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 293, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        }
+        goto __pyx_L6;
       }
-      __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
-      __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
-      __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
-      __pyx_t_15 = 0; __pyx_t_16 = 0; __pyx_t_17 = 0;
-      goto __pyx_L0;
+      __pyx_L6:;
     }
+    goto __pyx_L33;
+    __pyx_L3_error:;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L1_error;
+    __pyx_L33:;
   }
 
-  /* "quipubase.pyx":156
- *             return results
+  /* "quipubase.pyx":313
+ *             finally:
+ *                 del it
+ *         return results             # <<<<<<<<<<<<<<
  * 
- *     def find_docs(self,  int limit, int offset, object kwargs):             # <<<<<<<<<<<<<<
- *         cdef list results = []
- *         cdef Iterator* it = self.db.NewIterator(ReadOptions())
+ *     def merge_doc(self, str key, dict[str,Any] value):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_results);
+  __pyx_r = __pyx_v_results;
+  goto __pyx_L0;
+
+  /* "quipubase.pyx":284
+ *         return results
+ * 
+ *     def scan_prefix(self, str prefix, bool keys_only=False):             # <<<<<<<<<<<<<<
+ *         """
+ *         The `(key, document)` pairs, or the keys, of the documents whose key
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("quipubase.Quipu.find_docs", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_AddTraceback("quipubase.Quipu.scan_prefix", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XDECREF(__pyx_v_results);
-  __Pyx_XDECREF(__pyx_v_doc);
+  __Pyx_XDECREF(__pyx_v_bprefix);
   __Pyx_XDECREF(__pyx_v_key);
-  __Pyx_XDECREF(__pyx_v_value);
+  __Pyx_XDECREF(__pyx_v_view);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "quipubase.pyx":177
- *             return results
+/* "quipubase.pyx":315
+ *         return results
  * 
  *     def merge_doc(self, str key, dict[str,Any] value):             # <<<<<<<<<<<<<<
- *         cdef bytes existing
- *         existing = self.get(key)
+ *         existing = self.get_view(key)
+ *         if existing is None:
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9quipubase_5Quipu_25merge_doc(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_9quipubase_5Quipu_31merge_doc(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_9quipubase_5Quipu_25merge_doc = {"merge_doc", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_25merge_doc, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9quipubase_5Quipu_25merge_doc(PyObject *__pyx_v_self, 
+static PyMethodDef __pyx_mdef_9quipubase_5Quipu_31merge_doc = {"merge_doc", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_31merge_doc, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9quipubase_5Quipu_31merge_doc(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -7274,7 +10205,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 177, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 315, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
@@ -7282,14 +10213,14 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 177, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 315, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("merge_doc", 1, 2, 2, 1); __PYX_ERR(0, 177, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("merge_doc", 1, 2, 2, 1); __PYX_ERR(1, 315, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "merge_doc") < 0)) __PYX_ERR(0, 177, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "merge_doc") < 0)) __PYX_ERR(1, 315, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 2)) {
       goto __pyx_L5_argtuple_error;
@@ -7302,7 +10233,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("merge_doc", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 177, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("merge_doc", 1, 2, 2, __pyx_nargs); __PYX_ERR(1, 315, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -7316,9 +10247,9 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_key), (&PyString_Type), 1, "key", 1))) __PYX_ERR(0, 177, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_value), (&PyDict_Type), 1, "value", 1))) __PYX_ERR(0, 177, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9quipubase_5Quipu_24merge_doc(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_key, __pyx_v_value);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_key), (&PyString_Type), 1, "key", 1))) __PYX_ERR(1, 315, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_value), (&PyDict_Type), 1, "value", 1))) __PYX_ERR(1, 315, __pyx_L1_error)
+  __pyx_r = __pyx_pf_9quipubase_5Quipu_30merge_doc(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v_key, __pyx_v_value);
 
   /* function exit code */
   goto __pyx_L0;
@@ -7335,8 +10266,8 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9quipubase_5Quipu_24merge_doc(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key, PyObject *__pyx_v_value) {
-  PyObject *__pyx_v_existing = 0;
+static PyObject *__pyx_pf_9quipubase_5Quipu_30merge_doc(struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, PyObject *__pyx_v_key, PyObject *__pyx_v_value) {
+  PyObject *__pyx_v_existing = NULL;
   PyObject *__pyx_v_existing_dict = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -7354,14 +10285,14 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_24merge_doc(struct __pyx_obj_9quipub
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("merge_doc", 1);
 
-  /* "quipubase.pyx":179
+  /* "quipubase.pyx":316
+ * 
  *     def merge_doc(self, str key, dict[str,Any] value):
- *         cdef bytes existing
- *         existing = self.get(key)             # <<<<<<<<<<<<<<
+ *         existing = self.get_view(key)             # <<<<<<<<<<<<<<
  *         if existing is None:
  *             self.put_doc(key, value)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 179, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get_view); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 316, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   __pyx_t_4 = 0;
@@ -7381,32 +10312,31 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_24merge_doc(struct __pyx_obj_9quipub
     PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_key};
     __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 1+__pyx_t_4);
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 179, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 316, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   }
-  if (!(likely(PyBytes_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_1))) __PYX_ERR(0, 179, __pyx_L1_error)
-  __pyx_v_existing = ((PyObject*)__pyx_t_1);
+  __pyx_v_existing = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "quipubase.pyx":180
- *         cdef bytes existing
- *         existing = self.get(key)
+  /* "quipubase.pyx":317
+ *     def merge_doc(self, str key, dict[str,Any] value):
+ *         existing = self.get_view(key)
  *         if existing is None:             # <<<<<<<<<<<<<<
  *             self.put_doc(key, value)
  *             return
  */
-  __pyx_t_5 = (__pyx_v_existing == ((PyObject*)Py_None));
+  __pyx_t_5 = (__pyx_v_existing == Py_None);
   if (__pyx_t_5) {
 
-    /* "quipubase.pyx":181
- *         existing = self.get(key)
+    /* "quipubase.pyx":318
+ *         existing = self.get_view(key)
  *         if existing is None:
  *             self.put_doc(key, value)             # <<<<<<<<<<<<<<
  *             return
  *         existing_dict = orjson.loads(existing)
  */
-    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_put_doc); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 181, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_put_doc); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 318, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_t_3 = NULL;
     __pyx_t_4 = 0;
@@ -7426,13 +10356,13 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_24merge_doc(struct __pyx_obj_9quipub
       PyObject *__pyx_callargs[3] = {__pyx_t_3, __pyx_v_key, __pyx_v_value};
       __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 2+__pyx_t_4);
       __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 181, __pyx_L1_error)
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 318, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     }
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "quipubase.pyx":182
+    /* "quipubase.pyx":319
  *         if existing is None:
  *             self.put_doc(key, value)
  *             return             # <<<<<<<<<<<<<<
@@ -7443,25 +10373,25 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_24merge_doc(struct __pyx_obj_9quipub
     __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
 
-    /* "quipubase.pyx":180
- *         cdef bytes existing
- *         existing = self.get(key)
+    /* "quipubase.pyx":317
+ *     def merge_doc(self, str key, dict[str,Any] value):
+ *         existing = self.get_view(key)
  *         if existing is None:             # <<<<<<<<<<<<<<
  *             self.put_doc(key, value)
  *             return
  */
   }
 
-  /* "quipubase.pyx":183
+  /* "quipubase.pyx":320
  *             self.put_doc(key, value)
  *             return
  *         existing_dict = orjson.loads(existing)             # <<<<<<<<<<<<<<
  *         existing_dict.update(value)
  *         self.put(key, orjson.dumps(existing_dict, option=orjson.OPT_SERIALIZE_NUMPY))
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_orjson); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 183, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_orjson); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 320, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_loads); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 183, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_loads); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 320, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_t_2 = NULL;
@@ -7482,20 +10412,20 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_24merge_doc(struct __pyx_obj_9quipub
     PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_v_existing};
     __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_4, 1+__pyx_t_4);
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 183, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 320, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   }
   __pyx_v_existing_dict = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "quipubase.pyx":184
+  /* "quipubase.pyx":321
  *             return
  *         existing_dict = orjson.loads(existing)
  *         existing_dict.update(value)             # <<<<<<<<<<<<<<
  *         self.put(key, orjson.dumps(existing_dict, option=orjson.OPT_SERIALIZE_NUMPY))
  */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_existing_dict, __pyx_n_s_update); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 184, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_existing_dict, __pyx_n_s_update); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 321, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_2 = NULL;
   __pyx_t_4 = 0;
@@ -7515,39 +10445,39 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_24merge_doc(struct __pyx_obj_9quipub
     PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_v_value};
     __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_4, 1+__pyx_t_4);
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 184, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 321, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "quipubase.pyx":185
+  /* "quipubase.pyx":322
  *         existing_dict = orjson.loads(existing)
  *         existing_dict.update(value)
  *         self.put(key, orjson.dumps(existing_dict, option=orjson.OPT_SERIALIZE_NUMPY))             # <<<<<<<<<<<<<<
  */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_put); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 185, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_put); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 322, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_orjson); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 185, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_orjson); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 322, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_dumps); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 185, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_dumps); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 322, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 185, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 322, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(__pyx_v_existing_dict);
   __Pyx_GIVEREF(__pyx_v_existing_dict);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_existing_dict)) __PYX_ERR(0, 185, __pyx_L1_error);
-  __pyx_t_7 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 185, __pyx_L1_error)
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_existing_dict)) __PYX_ERR(1, 322, __pyx_L1_error);
+  __pyx_t_7 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 322, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_n_s_orjson); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 185, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_n_s_orjson); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 322, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
-  __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_OPT_SERIALIZE_NUMPY); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 185, __pyx_L1_error)
+  __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_OPT_SERIALIZE_NUMPY); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 322, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_9);
   __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  if (PyDict_SetItem(__pyx_t_7, __pyx_n_s_option, __pyx_t_9) < 0) __PYX_ERR(0, 185, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_7, __pyx_n_s_option, __pyx_t_9) < 0) __PYX_ERR(1, 322, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-  __pyx_t_9 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_2, __pyx_t_7); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 185, __pyx_L1_error)
+  __pyx_t_9 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_2, __pyx_t_7); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 322, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_9);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -7571,18 +10501,18 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_24merge_doc(struct __pyx_obj_9quipub
     __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_4, 2+__pyx_t_4);
     __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
     __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 185, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 322, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "quipubase.pyx":177
- *             return results
+  /* "quipubase.pyx":315
+ *         return results
  * 
  *     def merge_doc(self, str key, dict[str,Any] value):             # <<<<<<<<<<<<<<
- *         cdef bytes existing
- *         existing = self.get(key)
+ *         existing = self.get_view(key)
+ *         if existing is None:
  */
 
   /* function exit code */
@@ -7613,15 +10543,15 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_24merge_doc(struct __pyx_obj_9quipub
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9quipubase_5Quipu_27__reduce_cython__(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_9quipubase_5Quipu_33__reduce_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_9quipubase_5Quipu_27__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_27__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9quipubase_5Quipu_27__reduce_cython__(PyObject *__pyx_v_self, 
+static PyMethodDef __pyx_mdef_9quipubase_5Quipu_33__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_33__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9quipubase_5Quipu_33__reduce_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -7646,14 +10576,14 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   if (unlikely(__pyx_nargs > 0)) {
     __Pyx_RaiseArgtupleInvalid("__reduce_cython__", 1, 0, 0, __pyx_nargs); return NULL;}
   if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__reduce_cython__", 0))) return NULL;
-  __pyx_r = __pyx_pf_9quipubase_5Quipu_26__reduce_cython__(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self));
+  __pyx_r = __pyx_pf_9quipubase_5Quipu_32__reduce_cython__(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9quipubase_5Quipu_26__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_9quipubase_Quipu *__pyx_v_self) {
+static PyObject *__pyx_pf_9quipubase_5Quipu_32__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_9quipubase_Quipu *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_lineno = 0;
@@ -7668,7 +10598,7 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_26__reduce_cython__(CYTHON_UNUSED st
  *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
  */
   __Pyx_Raise(__pyx_builtin_TypeError, __pyx_kp_s_no_default___reduce___due_to_non, 0, 0);
-  __PYX_ERR(1, 2, __pyx_L1_error)
+  __PYX_ERR(0, 2, __pyx_L1_error)
 
   /* "(tree fragment)":1
  * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
@@ -7693,15 +10623,15 @@ static PyObject *__pyx_pf_9quipubase_5Quipu_26__reduce_cython__(CYTHON_UNUSED st
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9quipubase_5Quipu_29__setstate_cython__(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_9quipubase_5Quipu_35__setstate_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_9quipubase_5Quipu_29__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_29__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9quipubase_5Quipu_29__setstate_cython__(PyObject *__pyx_v_self, 
+static PyMethodDef __pyx_mdef_9quipubase_5Quipu_35__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_35__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9quipubase_5Quipu_35__setstate_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -7745,12 +10675,12 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 3, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 3, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__setstate_cython__") < 0)) __PYX_ERR(1, 3, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__setstate_cython__") < 0)) __PYX_ERR(0, 3, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
@@ -7761,7 +10691,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__setstate_cython__", 1, 1, 1, __pyx_nargs); __PYX_ERR(1, 3, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__setstate_cython__", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 3, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -7775,7 +10705,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9quipubase_5Quipu_28__setstate_cython__(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v___pyx_state);
+  __pyx_r = __pyx_pf_9quipubase_5Quipu_34__setstate_cython__(((struct __pyx_obj_9quipubase_Quipu *)__pyx_v_self), __pyx_v___pyx_state);
 
   /* function exit code */
   {
@@ -7788,37 +10718,276 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9quipubase_5Quipu_28__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__setstate_cython__", 1);
+static PyObject *__pyx_pf_9quipubase_5Quipu_34__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_9quipubase_Quipu *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 1);
+
+  /* "(tree fragment)":4
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"             # <<<<<<<<<<<<<<
+ */
+  __Pyx_Raise(__pyx_builtin_TypeError, __pyx_kp_s_no_default___reduce___due_to_non, 0, 0);
+  __PYX_ERR(0, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("quipubase.Quipu.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_tp_new_9quipubase_PinnedValue(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_9quipubase_PinnedValue *p;
+  PyObject *o;
+  #if CYTHON_COMPILING_IN_LIMITED_API
+  allocfunc alloc_func = (allocfunc)PyType_GetSlot(t, Py_tp_alloc);
+  o = alloc_func(t, 0);
+  #else
+  if (likely(!__Pyx_PyType_HasFeature(t, Py_TPFLAGS_IS_ABSTRACT))) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  #endif
+  p = ((struct __pyx_obj_9quipubase_PinnedValue *)o);
+  p->owner = Py_None; Py_INCREF(Py_None);
+  if (unlikely(__pyx_pw_9quipubase_11PinnedValue_1__cinit__(o, __pyx_empty_tuple, NULL) < 0)) goto bad;
+  return o;
+  bad:
+  Py_DECREF(o); o = 0;
+  return NULL;
+}
+
+static void __pyx_tp_dealloc_9quipubase_PinnedValue(PyObject *o) {
+  struct __pyx_obj_9quipubase_PinnedValue *p = (struct __pyx_obj_9quipubase_PinnedValue *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely((PY_VERSION_HEX >= 0x03080000 || __Pyx_PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE)) && __Pyx_PyObject_GetSlot(o, tp_finalize, destructor)) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (__Pyx_PyObject_GetSlot(o, tp_dealloc, destructor) == __pyx_tp_dealloc_9quipubase_PinnedValue) {
+      if (PyObject_CallFinalizerFromDealloc(o)) return;
+    }
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  {
+    PyObject *etype, *eval, *etb;
+    PyErr_Fetch(&etype, &eval, &etb);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
+    __pyx_pw_9quipubase_11PinnedValue_3__dealloc__(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
+    PyErr_Restore(etype, eval, etb);
+  }
+  Py_CLEAR(p->owner);
+  #if CYTHON_USE_TYPE_SLOTS || CYTHON_COMPILING_IN_PYPY
+  (*Py_TYPE(o)->tp_free)(o);
+  #else
+  {
+    freefunc tp_free = (freefunc)PyType_GetSlot(Py_TYPE(o), Py_tp_free);
+    if (tp_free) tp_free(o);
+  }
+  #endif
+}
+
+static int __pyx_tp_traverse_9quipubase_PinnedValue(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_9quipubase_PinnedValue *p = (struct __pyx_obj_9quipubase_PinnedValue *)o;
+  if (p->owner) {
+    e = (*v)(p->owner, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_9quipubase_PinnedValue(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_9quipubase_PinnedValue *p = (struct __pyx_obj_9quipubase_PinnedValue *)o;
+  tmp = ((PyObject*)p->owner);
+  p->owner = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyMethodDef __pyx_methods_9quipubase_PinnedValue[] = {
+  {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_11PinnedValue_11__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_11PinnedValue_13__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {0, 0, 0, 0}
+};
+#if CYTHON_USE_TYPE_SPECS
+#if !CYTHON_COMPILING_IN_LIMITED_API
 
-  /* "(tree fragment)":4
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"             # <<<<<<<<<<<<<<
- */
-  __Pyx_Raise(__pyx_builtin_TypeError, __pyx_kp_s_no_default___reduce___due_to_non, 0, 0);
-  __PYX_ERR(1, 4, __pyx_L1_error)
+static PyBufferProcs __pyx_tp_as_buffer_PinnedValue = {
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getreadbuffer*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getwritebuffer*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getsegcount*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getcharbuffer*/
+  #endif
+  __pyx_pw_9quipubase_11PinnedValue_7__getbuffer__, /*bf_getbuffer*/
+  __pyx_pw_9quipubase_11PinnedValue_9__releasebuffer__, /*bf_releasebuffer*/
+};
+#endif
+static PyType_Slot __pyx_type_9quipubase_PinnedValue_slots[] = {
+  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_9quipubase_PinnedValue},
+  {Py_sq_length, (void *)__pyx_pw_9quipubase_11PinnedValue_5__len__},
+  {Py_mp_length, (void *)__pyx_pw_9quipubase_11PinnedValue_5__len__},
+  #if defined(Py_bf_getbuffer)
+  {Py_bf_getbuffer, (void *)__pyx_pw_9quipubase_11PinnedValue_7__getbuffer__},
+  #endif
+  #if defined(Py_bf_releasebuffer)
+  {Py_bf_releasebuffer, (void *)__pyx_pw_9quipubase_11PinnedValue_9__releasebuffer__},
+  #endif
+  {Py_tp_doc, (void *)PyDoc_STR("\n    Read-only buffer over a value pinned in the RocksDB block cache.\n\n    The underlying `PinnableSlice` keeps the block alive until this object\n    is released (holding a reference to the owning `Quipu` so the database\n    outlives the view), so `memoryview`, `orjson.loads` and `numpy.frombuffer` can\n    consume the value without copying it into a `bytes` object first.\n    ")},
+  {Py_tp_traverse, (void *)__pyx_tp_traverse_9quipubase_PinnedValue},
+  {Py_tp_clear, (void *)__pyx_tp_clear_9quipubase_PinnedValue},
+  {Py_tp_methods, (void *)__pyx_methods_9quipubase_PinnedValue},
+  {Py_tp_new, (void *)__pyx_tp_new_9quipubase_PinnedValue},
+  {0, 0},
+};
+static PyType_Spec __pyx_type_9quipubase_PinnedValue_spec = {
+  "quipubase.PinnedValue",
+  sizeof(struct __pyx_obj_9quipubase_PinnedValue),
+  0,
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC,
+  __pyx_type_9quipubase_PinnedValue_slots,
+};
+#else
 
-  /* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
- */
+static PySequenceMethods __pyx_tp_as_sequence_PinnedValue = {
+  __pyx_pw_9quipubase_11PinnedValue_5__len__, /*sq_length*/
+  0, /*sq_concat*/
+  0, /*sq_repeat*/
+  0, /*sq_item*/
+  0, /*sq_slice*/
+  0, /*sq_ass_item*/
+  0, /*sq_ass_slice*/
+  0, /*sq_contains*/
+  0, /*sq_inplace_concat*/
+  0, /*sq_inplace_repeat*/
+};
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_AddTraceback("quipubase.Quipu.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+static PyMappingMethods __pyx_tp_as_mapping_PinnedValue = {
+  __pyx_pw_9quipubase_11PinnedValue_5__len__, /*mp_length*/
+  0, /*mp_subscript*/
+  0, /*mp_ass_subscript*/
+};
+
+static PyBufferProcs __pyx_tp_as_buffer_PinnedValue = {
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getreadbuffer*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getwritebuffer*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getsegcount*/
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  0, /*bf_getcharbuffer*/
+  #endif
+  __pyx_pw_9quipubase_11PinnedValue_7__getbuffer__, /*bf_getbuffer*/
+  __pyx_pw_9quipubase_11PinnedValue_9__releasebuffer__, /*bf_releasebuffer*/
+};
+
+static PyTypeObject __pyx_type_9quipubase_PinnedValue = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "quipubase.""PinnedValue", /*tp_name*/
+  sizeof(struct __pyx_obj_9quipubase_PinnedValue), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_9quipubase_PinnedValue, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  &__pyx_tp_as_sequence_PinnedValue, /*tp_as_sequence*/
+  &__pyx_tp_as_mapping_PinnedValue, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  &__pyx_tp_as_buffer_PinnedValue, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  PyDoc_STR("\n    Read-only buffer over a value pinned in the RocksDB block cache.\n\n    The underlying `PinnableSlice` keeps the block alive until this object\n    is released (holding a reference to the owning `Quipu` so the database\n    outlives the view), so `memoryview`, `orjson.loads` and `numpy.frombuffer` can\n    consume the value without copying it into a `bytes` object first.\n    "), /*tp_doc*/
+  __pyx_tp_traverse_9quipubase_PinnedValue, /*tp_traverse*/
+  __pyx_tp_clear_9quipubase_PinnedValue, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_9quipubase_PinnedValue, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  #if !CYTHON_USE_TYPE_SPECS
+  0, /*tp_dictoffset*/
+  #endif
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_9quipubase_PinnedValue, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  #if CYTHON_USE_TP_FINALIZE
+  0, /*tp_finalize*/
+  #else
+  NULL, /*tp_finalize*/
+  #endif
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if __PYX_NEED_TP_PRINT_SLOT == 1
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030C0000
+  0, /*tp_watched*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+#endif
 static struct __pyx_vtabstruct_9quipubase_Quipu __pyx_vtable_9quipubase_Quipu;
 
 static PyObject *__pyx_tp_new_9quipubase_Quipu(PyTypeObject *t, PyObject *a, PyObject *k) {
@@ -7902,28 +11071,41 @@ static int __pyx_tp_clear_9quipubase_Quipu(PyObject *o) {
   return 0;
 }
 
+static PyObject *__pyx_getprop_9quipubase_5Quipu_closed(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_9quipubase_5Quipu_6closed_1__get__(o);
+}
+
 static PyMethodDef __pyx_methods_9quipubase_Quipu[] = {
-  {"put", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_5put, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"get", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_7get, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"delete", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_9delete, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"exists", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_11exists, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"count", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_13count, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"get_doc", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_15get_doc, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"put_doc", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_17put_doc, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"delete_doc", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_19delete_doc, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"scan_docs", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_21scan_docs, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"find_docs", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_23find_docs, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"merge_doc", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_25merge_doc, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_27__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_29__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"close", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_5close, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9quipubase_5Quipu_4close},
+  {"put", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_7put, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"get", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_9get, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"get_view", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_11get_view, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"delete", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_13delete, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"exists", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_15exists, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"count", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_17count, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"get_doc", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_19get_doc, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"put_doc", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_21put_doc, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"delete_doc", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_23delete_doc, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"scan_docs", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_25scan_docs, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"find_docs", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_27find_docs, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"scan_prefix", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_29scan_prefix, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9quipubase_5Quipu_28scan_prefix},
+  {"merge_doc", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_31merge_doc, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_33__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9quipubase_5Quipu_35__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
   {0, 0, 0, 0}
 };
+
+static struct PyGetSetDef __pyx_getsets_9quipubase_Quipu[] = {
+  {(char *)"closed", __pyx_getprop_9quipubase_5Quipu_closed, 0, (char *)0, 0},
+  {0, 0, 0, 0, 0}
+};
 #if CYTHON_USE_TYPE_SPECS
 static PyType_Slot __pyx_type_9quipubase_Quipu_slots[] = {
   {Py_tp_dealloc, (void *)__pyx_tp_dealloc_9quipubase_Quipu},
   {Py_tp_traverse, (void *)__pyx_tp_traverse_9quipubase_Quipu},
   {Py_tp_clear, (void *)__pyx_tp_clear_9quipubase_Quipu},
   {Py_tp_methods, (void *)__pyx_methods_9quipubase_Quipu},
+  {Py_tp_getset, (void *)__pyx_getsets_9quipubase_Quipu},
   {Py_tp_new, (void *)__pyx_tp_new_9quipubase_Quipu},
   {0, 0},
 };
@@ -7976,7 +11158,7 @@ static PyTypeObject __pyx_type_9quipubase_Quipu = {
   0, /*tp_iternext*/
   __pyx_methods_9quipubase_Quipu, /*tp_methods*/
   0, /*tp_members*/
-  0, /*tp_getset*/
+  __pyx_getsets_9quipubase_Quipu, /*tp_getset*/
   0, /*tp_base*/
   0, /*tp_dict*/
   0, /*tp_descr_get*/
@@ -8034,13 +11216,18 @@ static PyMethodDef __pyx_methods[] = {
 
 static int __Pyx_CreateStringTabAndInitStrings(void) {
   __Pyx_StringTabEntry __pyx_string_tab[] = {
+    {&__pyx_kp_s_Database_is_closed, __pyx_k_Database_is_closed, sizeof(__pyx_k_Database_is_closed), 0, 0, 1, 0},
     {&__pyx_kp_u_Failed_to_open_database, __pyx_k_Failed_to_open_database, sizeof(__pyx_k_Failed_to_open_database), 0, 1, 0, 0},
     {&__pyx_n_s_Lock, __pyx_k_Lock, sizeof(__pyx_k_Lock), 0, 0, 1, 1},
     {&__pyx_n_s_OPT_SERIALIZE_NUMPY, __pyx_k_OPT_SERIALIZE_NUMPY, sizeof(__pyx_k_OPT_SERIALIZE_NUMPY), 0, 0, 1, 1},
     {&__pyx_kp_u_Object_with_id, __pyx_k_Object_with_id, sizeof(__pyx_k_Object_with_id), 0, 1, 0, 0},
+    {&__pyx_n_s_PinnedValue, __pyx_k_PinnedValue, sizeof(__pyx_k_PinnedValue), 0, 0, 1, 1},
+    {&__pyx_n_s_PinnedValue___reduce_cython, __pyx_k_PinnedValue___reduce_cython, sizeof(__pyx_k_PinnedValue___reduce_cython), 0, 0, 1, 1},
+    {&__pyx_n_s_PinnedValue___setstate_cython, __pyx_k_PinnedValue___setstate_cython, sizeof(__pyx_k_PinnedValue___setstate_cython), 0, 0, 1, 1},
     {&__pyx_n_s_Quipu, __pyx_k_Quipu, sizeof(__pyx_k_Quipu), 0, 0, 1, 1},
     {&__pyx_n_s_Quipu___reduce_cython, __pyx_k_Quipu___reduce_cython, sizeof(__pyx_k_Quipu___reduce_cython), 0, 0, 1, 1},
     {&__pyx_n_s_Quipu___setstate_cython, __pyx_k_Quipu___setstate_cython, sizeof(__pyx_k_Quipu___setstate_cython), 0, 0, 1, 1},
+    {&__pyx_n_s_Quipu_close, __pyx_k_Quipu_close, sizeof(__pyx_k_Quipu_close), 0, 0, 1, 1},
     {&__pyx_n_s_Quipu_count, __pyx_k_Quipu_count, sizeof(__pyx_k_Quipu_count), 0, 0, 1, 1},
     {&__pyx_n_s_Quipu_delete, __pyx_k_Quipu_delete, sizeof(__pyx_k_Quipu_delete), 0, 0, 1, 1},
     {&__pyx_n_s_Quipu_delete_doc, __pyx_k_Quipu_delete_doc, sizeof(__pyx_k_Quipu_delete_doc), 0, 0, 1, 1},
@@ -8048,20 +11235,27 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_Quipu_find_docs, __pyx_k_Quipu_find_docs, sizeof(__pyx_k_Quipu_find_docs), 0, 0, 1, 1},
     {&__pyx_n_s_Quipu_get, __pyx_k_Quipu_get, sizeof(__pyx_k_Quipu_get), 0, 0, 1, 1},
     {&__pyx_n_s_Quipu_get_doc, __pyx_k_Quipu_get_doc, sizeof(__pyx_k_Quipu_get_doc), 0, 0, 1, 1},
+    {&__pyx_n_s_Quipu_get_view, __pyx_k_Quipu_get_view, sizeof(__pyx_k_Quipu_get_view), 0, 0, 1, 1},
     {&__pyx_n_s_Quipu_merge_doc, __pyx_k_Quipu_merge_doc, sizeof(__pyx_k_Quipu_merge_doc), 0, 0, 1, 1},
     {&__pyx_n_s_Quipu_put, __pyx_k_Quipu_put, sizeof(__pyx_k_Quipu_put), 0, 0, 1, 1},
     {&__pyx_n_s_Quipu_put_doc, __pyx_k_Quipu_put_doc, sizeof(__pyx_k_Quipu_put_doc), 0, 0, 1, 1},
     {&__pyx_n_s_Quipu_scan_docs, __pyx_k_Quipu_scan_docs, sizeof(__pyx_k_Quipu_scan_docs), 0, 0, 1, 1},
+    {&__pyx_n_s_Quipu_scan_prefix, __pyx_k_Quipu_scan_prefix, sizeof(__pyx_k_Quipu_scan_prefix), 0, 0, 1, 1},
     {&__pyx_n_s_RuntimeError, __pyx_k_RuntimeError, sizeof(__pyx_k_RuntimeError), 0, 0, 1, 1},
     {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
     {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
-    {&__pyx_n_s__27, __pyx_k__27, sizeof(__pyx_k__27), 0, 0, 1, 1},
-    {&__pyx_kp_u__3, __pyx_k__3, sizeof(__pyx_k__3), 0, 1, 0, 0},
-    {&__pyx_n_s__4, __pyx_k__4, sizeof(__pyx_k__4), 0, 0, 1, 1},
+    {&__pyx_n_s__38, __pyx_k__38, sizeof(__pyx_k__38), 0, 0, 1, 1},
+    {&__pyx_kp_u__4, __pyx_k__4, sizeof(__pyx_k__4), 0, 1, 0, 0},
+    {&__pyx_n_s__5, __pyx_k__5, sizeof(__pyx_k__5), 0, 0, 1, 1},
     {&__pyx_n_s_asyncio_coroutines, __pyx_k_asyncio_coroutines, sizeof(__pyx_k_asyncio_coroutines), 0, 0, 1, 1},
     {&__pyx_n_s_bool, __pyx_k_bool, sizeof(__pyx_k_bool), 0, 0, 1, 1},
+    {&__pyx_n_s_bprefix, __pyx_k_bprefix, sizeof(__pyx_k_bprefix), 0, 0, 1, 1},
+    {&__pyx_n_s_ckey, __pyx_k_ckey, sizeof(__pyx_k_ckey), 0, 0, 1, 1},
     {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+    {&__pyx_n_s_close, __pyx_k_close, sizeof(__pyx_k_close), 0, 0, 1, 1},
     {&__pyx_n_s_count, __pyx_k_count, sizeof(__pyx_k_count), 0, 0, 1, 1},
+    {&__pyx_n_s_cprefix, __pyx_k_cprefix, sizeof(__pyx_k_cprefix), 0, 0, 1, 1},
+    {&__pyx_n_s_cvalue, __pyx_k_cvalue, sizeof(__pyx_k_cvalue), 0, 0, 1, 1},
     {&__pyx_n_s_db_path, __pyx_k_db_path, sizeof(__pyx_k_db_path), 0, 0, 1, 1},
     {&__pyx_kp_s_db_path_must_be_provided, __pyx_k_db_path_must_be_provided, sizeof(__pyx_k_db_path_must_be_provided), 0, 0, 1, 0},
     {&__pyx_n_s_delete, __pyx_k_delete, sizeof(__pyx_k_delete), 0, 0, 1, 1},
@@ -8080,6 +11274,7 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_kp_u_gc, __pyx_k_gc, sizeof(__pyx_k_gc), 0, 1, 0, 0},
     {&__pyx_n_s_get, __pyx_k_get, sizeof(__pyx_k_get), 0, 0, 1, 1},
     {&__pyx_n_s_get_doc, __pyx_k_get_doc, sizeof(__pyx_k_get_doc), 0, 0, 1, 1},
+    {&__pyx_n_s_get_view, __pyx_k_get_view, sizeof(__pyx_k_get_view), 0, 0, 1, 1},
     {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
     {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
     {&__pyx_n_s_initializing, __pyx_k_initializing, sizeof(__pyx_k_initializing), 0, 0, 1, 1},
@@ -8102,6 +11297,8 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_offset, __pyx_k_offset, sizeof(__pyx_k_offset), 0, 0, 1, 1},
     {&__pyx_n_s_option, __pyx_k_option, sizeof(__pyx_k_option), 0, 0, 1, 1},
     {&__pyx_n_s_orjson, __pyx_k_orjson, sizeof(__pyx_k_orjson), 0, 0, 1, 1},
+    {&__pyx_n_s_pinned, __pyx_k_pinned, sizeof(__pyx_k_pinned), 0, 0, 1, 1},
+    {&__pyx_n_s_prefix, __pyx_k_prefix, sizeof(__pyx_k_prefix), 0, 0, 1, 1},
     {&__pyx_n_s_put, __pyx_k_put, sizeof(__pyx_k_put), 0, 0, 1, 1},
     {&__pyx_n_s_put_doc, __pyx_k_put_doc, sizeof(__pyx_k_put_doc), 0, 0, 1, 1},
     {&__pyx_n_s_pyx_state, __pyx_k_pyx_state, sizeof(__pyx_k_pyx_state), 0, 0, 1, 1},
@@ -8111,9 +11308,11 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
     {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
     {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+    {&__pyx_n_s_release, __pyx_k_release, sizeof(__pyx_k_release), 0, 0, 1, 1},
     {&__pyx_n_s_results, __pyx_k_results, sizeof(__pyx_k_results), 0, 0, 1, 1},
     {&__pyx_n_s_return, __pyx_k_return, sizeof(__pyx_k_return), 0, 0, 1, 1},
     {&__pyx_n_s_scan_docs, __pyx_k_scan_docs, sizeof(__pyx_k_scan_docs), 0, 0, 1, 1},
+    {&__pyx_n_s_scan_prefix, __pyx_k_scan_prefix, sizeof(__pyx_k_scan_prefix), 0, 0, 1, 1},
     {&__pyx_n_s_self, __pyx_k_self, sizeof(__pyx_k_self), 0, 0, 1, 1},
     {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
     {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
@@ -8123,15 +11322,16 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_threading, __pyx_k_threading, sizeof(__pyx_k_threading), 0, 0, 1, 1},
     {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
     {&__pyx_n_s_value, __pyx_k_value, sizeof(__pyx_k_value), 0, 0, 1, 1},
+    {&__pyx_n_s_view, __pyx_k_view, sizeof(__pyx_k_view), 0, 0, 1, 1},
     {0, 0, 0, 0, 0, 0, 0}
   };
   return __Pyx_InitStrings(__pyx_string_tab);
 }
 /* #### Code section: cached_builtins ### */
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 62, __pyx_L1_error)
-  __pyx_builtin_RuntimeError = __Pyx_GetBuiltinName(__pyx_n_s_RuntimeError); if (!__pyx_builtin_RuntimeError) __PYX_ERR(0, 75, __pyx_L1_error)
-  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(1, 2, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 2, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(1, 113, __pyx_L1_error)
+  __pyx_builtin_RuntimeError = __Pyx_GetBuiltinName(__pyx_n_s_RuntimeError); if (!__pyx_builtin_RuntimeError) __PYX_ERR(1, 126, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -8142,157 +11342,228 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "quipubase.pyx":62
+  /* "quipubase.pyx":113
  *     def __cinit__(self, str db_path):
  *         if not db_path:
  *             raise ValueError("db_path must be provided")             # <<<<<<<<<<<<<<
  *         self.options = Options()
  *         self.options.create_if_missing = True
  */
-  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_db_path_must_be_provided); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 62, __pyx_L1_error)
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_db_path_must_be_provided); if (unlikely(!__pyx_tuple_)) __PYX_ERR(1, 113, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple_);
   __Pyx_GIVEREF(__pyx_tuple_);
 
-  /* "quipubase.pyx":72
+  /* "quipubase.pyx":123
  * 
  *     cdef void open_db(self):
  *         with self.lock:             # <<<<<<<<<<<<<<
  *             self.status = DB.Open(self.options, self.db_path, &self.db)
  *             if not self.status.ok():
  */
-  __pyx_tuple__2 = PyTuple_Pack(3, Py_None, Py_None, Py_None); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 72, __pyx_L1_error)
+  __pyx_tuple__2 = PyTuple_Pack(3, Py_None, Py_None, Py_None); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(1, 123, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__2);
   __Pyx_GIVEREF(__pyx_tuple__2);
 
-  /* "quipubase.pyx":87
+  /* "quipubase.pyx":138
+ *         # Called with `self.lock` held, so the database can't close underneath.
+ *         if self.db == NULL:
+ *             raise RuntimeError("Database is closed")             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_s_Database_is_closed); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(1, 138, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+ */
+  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+  __pyx_codeobj__7 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__6, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_reduce_cython, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__7)) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ */
+  __pyx_tuple__8 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_pyx_state); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 3, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
+  __pyx_codeobj__9 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__8, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 3, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__9)) __PYX_ERR(0, 3, __pyx_L1_error)
+
+  /* "quipubase.pyx":144
+ *         self.close_db()
+ * 
+ *     def close(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Flush and close the database, releasing its memtables, background
+ */
+  __pyx_codeobj__10 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__6, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_close, 144, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__10)) __PYX_ERR(1, 144, __pyx_L1_error)
+
+  /* "quipubase.pyx":156
  * 
  * 
  *     def put(self, str key, bytes value):             # <<<<<<<<<<<<<<
- *         with self.lock:
- *             self.db.Put(self.write_options, key.encode(), value)
+ *         cdef string ckey = key.encode()
+ *         cdef string cvalue = value
  */
-  __pyx_tuple__5 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_key, __pyx_n_s_value); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 87, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__5);
-  __Pyx_GIVEREF(__pyx_tuple__5);
-  __pyx_codeobj__6 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__5, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_put, 87, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__6)) __PYX_ERR(0, 87, __pyx_L1_error)
+  __pyx_tuple__11 = PyTuple_Pack(5, __pyx_n_s_self, __pyx_n_s_key, __pyx_n_s_value, __pyx_n_s_ckey, __pyx_n_s_cvalue); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(1, 156, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
+  __pyx_codeobj__12 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__11, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_put, 156, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__12)) __PYX_ERR(1, 156, __pyx_L1_error)
 
-  /* "quipubase.pyx":91
- *             self.db.Put(self.write_options, key.encode(), value)
+  /* "quipubase.pyx":164
+ *                 self.db.Put(self.write_options, ckey, cvalue)
  * 
  *     def get(self, str key):             # <<<<<<<<<<<<<<
+ *         cdef string ckey = key.encode()
  *         cdef string value
- *         with self.lock:
  */
-  __pyx_codeobj__7 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__5, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_get, 91, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__7)) __PYX_ERR(0, 91, __pyx_L1_error)
+  __pyx_tuple__13 = PyTuple_Pack(4, __pyx_n_s_self, __pyx_n_s_key, __pyx_n_s_ckey, __pyx_n_s_value); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(1, 164, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
+  __pyx_codeobj__14 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_get, 164, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__14)) __PYX_ERR(1, 164, __pyx_L1_error)
 
-  /* "quipubase.pyx":99
+  /* "quipubase.pyx":175
  *             return value
  * 
+ *     def get_view(self, str key):             # <<<<<<<<<<<<<<
+ *         cdef PinnedValue pinned = PinnedValue()
+ *         cdef string ckey = key.encode()
+ */
+  __pyx_tuple__15 = PyTuple_Pack(4, __pyx_n_s_self, __pyx_n_s_key, __pyx_n_s_pinned, __pyx_n_s_ckey); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(1, 175, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__15);
+  __Pyx_GIVEREF(__pyx_tuple__15);
+  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__15, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_get_view, 175, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) __PYX_ERR(1, 175, __pyx_L1_error)
+
+  /* "quipubase.pyx":189
+ *         return memoryview(pinned)
+ * 
  *     def delete(self, str key):             # <<<<<<<<<<<<<<
+ *         cdef string ckey = key.encode()
  *         with self.lock:
- *             self.db.Delete(self.write_options, key.encode())
  */
-  __pyx_tuple__8 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_key); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 99, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__8);
-  __Pyx_GIVEREF(__pyx_tuple__8);
-  __pyx_codeobj__9 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__8, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_delete, 99, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__9)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __pyx_tuple__17 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_key, __pyx_n_s_ckey); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(1, 189, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__17);
+  __Pyx_GIVEREF(__pyx_tuple__17);
+  __pyx_codeobj__18 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__17, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_delete, 189, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__18)) __PYX_ERR(1, 189, __pyx_L1_error)
 
-  /* "quipubase.pyx":104
+  /* "quipubase.pyx":197
  * 
  * 
  *     def exists(self, str key)->bool:             # <<<<<<<<<<<<<<
- *         return self.get(key) is not None
+ *         return self.get_view(key) is not None
  * 
  */
-  __pyx_codeobj__10 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__8, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_exists, 104, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__10)) __PYX_ERR(0, 104, __pyx_L1_error)
+  __pyx_tuple__19 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_key); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(1, 197, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__19);
+  __Pyx_GIVEREF(__pyx_tuple__19);
+  __pyx_codeobj__20 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_exists, 197, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__20)) __PYX_ERR(1, 197, __pyx_L1_error)
 
-  /* "quipubase.pyx":107
- *         return self.get(key) is not None
+  /* "quipubase.pyx":200
+ *         return self.get_view(key) is not None
  * 
  *     def count(self)->int:             # <<<<<<<<<<<<<<
  *         cdef int count = 0
- *         cdef Iterator* it = self.db.NewIterator(self.read_options)
+ *         cdef Iterator* it
  */
-  __pyx_tuple__11 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_count, __pyx_n_s_it); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 107, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__11);
-  __Pyx_GIVEREF(__pyx_tuple__11);
-  __pyx_codeobj__12 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__11, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_count, 107, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__12)) __PYX_ERR(0, 107, __pyx_L1_error)
+  __pyx_tuple__21 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_count, __pyx_n_s_it); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(1, 200, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__21);
+  __Pyx_GIVEREF(__pyx_tuple__21);
+  __pyx_codeobj__22 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__21, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_count, 200, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__22)) __PYX_ERR(1, 200, __pyx_L1_error)
 
-  /* "quipubase.pyx":121
+  /* "quipubase.pyx":216
  * 
  * 
  *     def get_doc(self, str key):             # <<<<<<<<<<<<<<
- *         cdef bytes value
- *         value = self.get(key)
+ *         value = self.get_view(key)
+ *         if value is None:
  */
-  __pyx_codeobj__13 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__5, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_get_doc, 121, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__13)) __PYX_ERR(0, 121, __pyx_L1_error)
+  __pyx_tuple__23 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_key, __pyx_n_s_value); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(1, 216, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__23);
+  __Pyx_GIVEREF(__pyx_tuple__23);
+  __pyx_codeobj__24 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__23, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_get_doc, 216, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__24)) __PYX_ERR(1, 216, __pyx_L1_error)
 
-  /* "quipubase.pyx":128
+  /* "quipubase.pyx":222
  *         return orjson.loads(value)
  * 
  *     def put_doc(self, str key, dict[str,Any] value):             # <<<<<<<<<<<<<<
  *         self.put(key, orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY))
  * 
  */
-  __pyx_codeobj__14 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__5, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_put_doc, 128, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__14)) __PYX_ERR(0, 128, __pyx_L1_error)
+  __pyx_codeobj__25 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__23, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_put_doc, 222, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__25)) __PYX_ERR(1, 222, __pyx_L1_error)
 
-  /* "quipubase.pyx":131
+  /* "quipubase.pyx":225
  *         self.put(key, orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY))
  * 
  *     def delete_doc(self, str key):             # <<<<<<<<<<<<<<
  *         if not self.exists(key):
  *             raise ValueError(f"Object with id {key} not found")
  */
-  __pyx_codeobj__15 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__8, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_delete_doc, 131, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__15)) __PYX_ERR(0, 131, __pyx_L1_error)
+  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_delete_doc, 225, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) __PYX_ERR(1, 225, __pyx_L1_error)
 
-  /* "quipubase.pyx":137
+  /* "quipubase.pyx":231
  * 
  * 
  *     def scan_docs(self, int limit, int offset, bool keys_only=False):             # <<<<<<<<<<<<<<
  *         cdef list results = []
- *         cdef Iterator* it = self.db.NewIterator(ReadOptions())
+ *         cdef Iterator* it
  */
-  __pyx_tuple__16 = PyTuple_Pack(6, __pyx_n_s_self, __pyx_n_s_limit, __pyx_n_s_offset, __pyx_n_s_keys_only, __pyx_n_s_results, __pyx_n_s_it); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(0, 137, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__16);
-  __Pyx_GIVEREF(__pyx_tuple__16);
-  __pyx_codeobj__17 = (PyObject*)__Pyx_PyCode_New(4, 0, 0, 6, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__16, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_scan_docs, 137, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__17)) __PYX_ERR(0, 137, __pyx_L1_error)
-  __pyx_tuple__18 = PyTuple_Pack(1, Py_False); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(0, 137, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__18);
-  __Pyx_GIVEREF(__pyx_tuple__18);
-
-  /* "quipubase.pyx":156
- *             return results
+  __pyx_tuple__27 = PyTuple_Pack(7, __pyx_n_s_self, __pyx_n_s_limit, __pyx_n_s_offset, __pyx_n_s_keys_only, __pyx_n_s_results, __pyx_n_s_it, __pyx_n_s_view); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(1, 231, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__27);
+  __Pyx_GIVEREF(__pyx_tuple__27);
+  __pyx_codeobj__28 = (PyObject*)__Pyx_PyCode_New(4, 0, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__27, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_scan_docs, 231, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__28)) __PYX_ERR(1, 231, __pyx_L1_error)
+  __pyx_tuple__29 = PyTuple_Pack(1, Py_False); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(1, 231, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__29);
+  __Pyx_GIVEREF(__pyx_tuple__29);
+
+  /* "quipubase.pyx":256
+ *         return results
  * 
  *     def find_docs(self,  int limit, int offset, object kwargs):             # <<<<<<<<<<<<<<
+ *         # `offset` counts matching documents, as when paging across shards
  *         cdef list results = []
- *         cdef Iterator* it = self.db.NewIterator(ReadOptions())
  */
-  __pyx_tuple__19 = PyTuple_Pack(9, __pyx_n_s_self, __pyx_n_s_limit, __pyx_n_s_offset, __pyx_n_s_kwargs, __pyx_n_s_results, __pyx_n_s_it, __pyx_n_s_doc, __pyx_n_s_key, __pyx_n_s_value); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(0, 156, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__19);
-  __Pyx_GIVEREF(__pyx_tuple__19);
-  __pyx_codeobj__20 = (PyObject*)__Pyx_PyCode_New(4, 0, 0, 9, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_find_docs, 156, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__20)) __PYX_ERR(0, 156, __pyx_L1_error)
+  __pyx_tuple__30 = PyTuple_Pack(10, __pyx_n_s_self, __pyx_n_s_limit, __pyx_n_s_offset, __pyx_n_s_kwargs, __pyx_n_s_results, __pyx_n_s_it, __pyx_n_s_view, __pyx_n_s_doc, __pyx_n_s_key, __pyx_n_s_value); if (unlikely(!__pyx_tuple__30)) __PYX_ERR(1, 256, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__30);
+  __Pyx_GIVEREF(__pyx_tuple__30);
+  __pyx_codeobj__31 = (PyObject*)__Pyx_PyCode_New(4, 0, 0, 10, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__30, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_find_docs, 256, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__31)) __PYX_ERR(1, 256, __pyx_L1_error)
 
-  /* "quipubase.pyx":177
- *             return results
+  /* "quipubase.pyx":284
+ *         return results
+ * 
+ *     def scan_prefix(self, str prefix, bool keys_only=False):             # <<<<<<<<<<<<<<
+ *         """
+ *         The `(key, document)` pairs, or the keys, of the documents whose key
+ */
+  __pyx_tuple__32 = PyTuple_Pack(9, __pyx_n_s_self, __pyx_n_s_prefix, __pyx_n_s_keys_only, __pyx_n_s_results, __pyx_n_s_bprefix, __pyx_n_s_cprefix, __pyx_n_s_it, __pyx_n_s_key, __pyx_n_s_view); if (unlikely(!__pyx_tuple__32)) __PYX_ERR(1, 284, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__32);
+  __Pyx_GIVEREF(__pyx_tuple__32);
+  __pyx_codeobj__33 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 9, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__32, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_scan_prefix, 284, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__33)) __PYX_ERR(1, 284, __pyx_L1_error)
+
+  /* "quipubase.pyx":315
+ *         return results
  * 
  *     def merge_doc(self, str key, dict[str,Any] value):             # <<<<<<<<<<<<<<
- *         cdef bytes existing
- *         existing = self.get(key)
+ *         existing = self.get_view(key)
+ *         if existing is None:
  */
-  __pyx_tuple__21 = PyTuple_Pack(5, __pyx_n_s_self, __pyx_n_s_key, __pyx_n_s_value, __pyx_n_s_existing, __pyx_n_s_existing_dict); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(0, 177, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__21);
-  __Pyx_GIVEREF(__pyx_tuple__21);
-  __pyx_codeobj__22 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__21, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_merge_doc, 177, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__22)) __PYX_ERR(0, 177, __pyx_L1_error)
+  __pyx_tuple__34 = PyTuple_Pack(5, __pyx_n_s_self, __pyx_n_s_key, __pyx_n_s_value, __pyx_n_s_existing, __pyx_n_s_existing_dict); if (unlikely(!__pyx_tuple__34)) __PYX_ERR(1, 315, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__34);
+  __Pyx_GIVEREF(__pyx_tuple__34);
+  __pyx_codeobj__35 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__34, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_quipubase_pyx, __pyx_n_s_merge_doc, 315, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__35)) __PYX_ERR(1, 315, __pyx_L1_error)
 
   /* "(tree fragment)":1
  * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
  *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
  * def __setstate_cython__(self, __pyx_state):
  */
-  __pyx_tuple__23 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__23);
-  __Pyx_GIVEREF(__pyx_tuple__23);
-  __pyx_codeobj__24 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__23, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_reduce_cython, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__24)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_codeobj__36 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__6, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_reduce_cython, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__36)) __PYX_ERR(0, 1, __pyx_L1_error)
 
   /* "(tree fragment)":3
  * def __reduce_cython__(self):
@@ -8300,10 +11571,7 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
  */
-  __pyx_tuple__25 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_pyx_state); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(1, 3, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__25);
-  __Pyx_GIVEREF(__pyx_tuple__25);
-  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__25, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 3, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) __PYX_ERR(1, 3, __pyx_L1_error)
+  __pyx_codeobj__37 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__8, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 3, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__37)) __PYX_ERR(0, 3, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -8315,7 +11583,7 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
 static CYTHON_SMALL_CODE int __Pyx_InitConstants(void) {
   __pyx_umethod_PyString_Type_encode.type = (PyObject*)&PyString_Type;
   __pyx_umethod_PyString_Type_encode.method_name = &__pyx_n_s_encode;
-  if (__Pyx_CreateStringTabAndInitStrings() < 0) __PYX_ERR(0, 1, __pyx_L1_error);
+  if (__Pyx_CreateStringTabAndInitStrings() < 0) __PYX_ERR(1, 1, __pyx_L1_error);
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -8366,19 +11634,52 @@ static int __Pyx_modinit_type_init_code(void) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
   /*--- Type init code ---*/
+  #if CYTHON_USE_TYPE_SPECS
+  __pyx_ptype_9quipubase_PinnedValue = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_9quipubase_PinnedValue_spec, NULL); if (unlikely(!__pyx_ptype_9quipubase_PinnedValue)) __PYX_ERR(1, 65, __pyx_L1_error)
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  __pyx_ptype_9quipubase_PinnedValue->tp_as_buffer = &__pyx_tp_as_buffer_PinnedValue;
+  #elif defined(Py_bf_getbuffer) && defined(Py_bf_releasebuffer)
+  /* PY_VERSION_HEX >= 0x03090000 || Py_LIMITED_API >= 0x030B0000 */
+  #elif defined(_MSC_VER)
+  #pragma message ("The buffer protocol is not supported in the Limited C-API < 3.11.")
+  #else
+  #warning "The buffer protocol is not supported in the Limited C-API < 3.11."
+  #endif
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_9quipubase_PinnedValue_spec, __pyx_ptype_9quipubase_PinnedValue) < 0) __PYX_ERR(1, 65, __pyx_L1_error)
+  #else
+  __pyx_ptype_9quipubase_PinnedValue = &__pyx_type_9quipubase_PinnedValue;
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  #endif
+  #if !CYTHON_USE_TYPE_SPECS
+  if (__Pyx_PyType_Ready(__pyx_ptype_9quipubase_PinnedValue) < 0) __PYX_ERR(1, 65, __pyx_L1_error)
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  __pyx_ptype_9quipubase_PinnedValue->tp_print = 0;
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_ptype_9quipubase_PinnedValue->tp_dictoffset && __pyx_ptype_9quipubase_PinnedValue->tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_ptype_9quipubase_PinnedValue->tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  #endif
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_PinnedValue, (PyObject *) __pyx_ptype_9quipubase_PinnedValue) < 0) __PYX_ERR(1, 65, __pyx_L1_error)
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  if (__Pyx_setup_reduce((PyObject *) __pyx_ptype_9quipubase_PinnedValue) < 0) __PYX_ERR(1, 65, __pyx_L1_error)
+  #endif
   __pyx_vtabptr_9quipubase_Quipu = &__pyx_vtable_9quipubase_Quipu;
   __pyx_vtable_9quipubase_Quipu.open_db = (void (*)(struct __pyx_obj_9quipubase_Quipu *))__pyx_f_9quipubase_5Quipu_open_db;
   __pyx_vtable_9quipubase_Quipu.close_db = (void (*)(struct __pyx_obj_9quipubase_Quipu *))__pyx_f_9quipubase_5Quipu_close_db;
+  __pyx_vtable_9quipubase_Quipu.ensure_open = (int (*)(struct __pyx_obj_9quipubase_Quipu *))__pyx_f_9quipubase_5Quipu_ensure_open;
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_ptype_9quipubase_Quipu = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_9quipubase_Quipu_spec, NULL); if (unlikely(!__pyx_ptype_9quipubase_Quipu)) __PYX_ERR(0, 51, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_9quipubase_Quipu_spec, __pyx_ptype_9quipubase_Quipu) < 0) __PYX_ERR(0, 51, __pyx_L1_error)
+  __pyx_ptype_9quipubase_Quipu = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_9quipubase_Quipu_spec, NULL); if (unlikely(!__pyx_ptype_9quipubase_Quipu)) __PYX_ERR(1, 102, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_9quipubase_Quipu_spec, __pyx_ptype_9quipubase_Quipu) < 0) __PYX_ERR(1, 102, __pyx_L1_error)
   #else
   __pyx_ptype_9quipubase_Quipu = &__pyx_type_9quipubase_Quipu;
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_ptype_9quipubase_Quipu) < 0) __PYX_ERR(0, 51, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_ptype_9quipubase_Quipu) < 0) __PYX_ERR(1, 102, __pyx_L1_error)
   #endif
   #if PY_MAJOR_VERSION < 3
   __pyx_ptype_9quipubase_Quipu->tp_print = 0;
@@ -8388,13 +11689,13 @@ static int __Pyx_modinit_type_init_code(void) {
     __pyx_ptype_9quipubase_Quipu->tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
   #endif
-  if (__Pyx_SetVtable(__pyx_ptype_9quipubase_Quipu, __pyx_vtabptr_9quipubase_Quipu) < 0) __PYX_ERR(0, 51, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_ptype_9quipubase_Quipu, __pyx_vtabptr_9quipubase_Quipu) < 0) __PYX_ERR(1, 102, __pyx_L1_error)
   #if !CYTHON_COMPILING_IN_LIMITED_API
-  if (__Pyx_MergeVtables(__pyx_ptype_9quipubase_Quipu) < 0) __PYX_ERR(0, 51, __pyx_L1_error)
+  if (__Pyx_MergeVtables(__pyx_ptype_9quipubase_Quipu) < 0) __PYX_ERR(1, 102, __pyx_L1_error)
   #endif
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Quipu, (PyObject *) __pyx_ptype_9quipubase_Quipu) < 0) __PYX_ERR(0, 51, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Quipu, (PyObject *) __pyx_ptype_9quipubase_Quipu) < 0) __PYX_ERR(1, 102, __pyx_L1_error)
   #if !CYTHON_COMPILING_IN_LIMITED_API
-  if (__Pyx_setup_reduce((PyObject *) __pyx_ptype_9quipubase_Quipu) < 0) __PYX_ERR(0, 51, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject *) __pyx_ptype_9quipubase_Quipu) < 0) __PYX_ERR(1, 102, __pyx_L1_error)
   #endif
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -8611,26 +11912,26 @@ static CYTHON_SMALL_CODE int __pyx_pymod_exec_quipubase(PyObject *__pyx_pyinit_m
   #else
   #if PY_MAJOR_VERSION < 3
   __pyx_m = Py_InitModule4("quipubase", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
-  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely(!__pyx_m)) __PYX_ERR(1, 1, __pyx_L1_error)
   #elif CYTHON_USE_MODULE_STATE
-  __pyx_t_1 = PyModule_Create(&__pyx_moduledef); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_t_1 = PyModule_Create(&__pyx_moduledef); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
   {
     int add_module_result = PyState_AddModule(__pyx_t_1, &__pyx_moduledef);
     __pyx_t_1 = 0; /* transfer ownership from __pyx_t_1 to "quipubase" pseudovariable */
-    if (unlikely((add_module_result < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (unlikely((add_module_result < 0))) __PYX_ERR(1, 1, __pyx_L1_error)
     pystate_addmodule_run = 1;
   }
   #else
   __pyx_m = PyModule_Create(&__pyx_moduledef);
-  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely(!__pyx_m)) __PYX_ERR(1, 1, __pyx_L1_error)
   #endif
   #endif
   CYTHON_UNUSED_VAR(__pyx_t_1);
-  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(1, 1, __pyx_L1_error)
   Py_INCREF(__pyx_d);
-  __pyx_b = __Pyx_PyImport_AddModuleRef(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_cython_runtime = __Pyx_PyImport_AddModuleRef((const char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
-  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_b = __Pyx_PyImport_AddModuleRef(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_cython_runtime = __Pyx_PyImport_AddModuleRef((const char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   #if CYTHON_REFNANNY
 __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
 if (!__Pyx_RefNanny) {
@@ -8641,30 +11942,30 @@ if (!__Pyx_RefNanny) {
 }
 #endif
   __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit_quipubase(void)", 0);
-  if (__Pyx_check_binary_version(__PYX_LIMITED_VERSION_HEX, __Pyx_get_runtime_version(), CYTHON_COMPILING_IN_LIMITED_API) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_check_binary_version(__PYX_LIMITED_VERSION_HEX, __Pyx_get_runtime_version(), CYTHON_COMPILING_IN_LIMITED_API) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   #ifdef __Pxy_PyFrame_Initialize_Offsets
   __Pxy_PyFrame_Initialize_Offsets();
   #endif
-  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(1, 1, __pyx_L1_error)
   #ifdef __Pyx_CyFunction_USED
-  if (__pyx_CyFunction_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__pyx_CyFunction_init(__pyx_m) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   #endif
   #ifdef __Pyx_FusedFunction_USED
-  if (__pyx_FusedFunction_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__pyx_FusedFunction_init(__pyx_m) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   #endif
   #ifdef __Pyx_Coroutine_USED
-  if (__pyx_Coroutine_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__pyx_Coroutine_init(__pyx_m) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   #endif
   #ifdef __Pyx_Generator_USED
-  if (__pyx_Generator_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__pyx_Generator_init(__pyx_m) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   #endif
   #ifdef __Pyx_AsyncGen_USED
-  if (__pyx_AsyncGen_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__pyx_AsyncGen_init(__pyx_m) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   #endif
   #ifdef __Pyx_StopAsyncIteration_USED
-  if (__pyx_StopAsyncIteration_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__pyx_StopAsyncIteration_init(__pyx_m) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   #endif
   /*--- Library function declarations ---*/
   /*--- Threads initialization code ---*/
@@ -8672,38 +11973,38 @@ if (!__Pyx_RefNanny) {
   PyEval_InitThreads();
   #endif
   /*--- Initialize various global constants etc. ---*/
-  if (__Pyx_InitConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_InitConstants() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   stringtab_initialized = 1;
-  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
-  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   #endif
   if (__pyx_module_is_main_quipubase) {
-    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   }
   #if PY_MAJOR_VERSION >= 3
   {
-    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(1, 1, __pyx_L1_error)
     if (!PyDict_GetItemString(modules, "quipubase")) {
-      if (unlikely((PyDict_SetItemString(modules, "quipubase", __pyx_m) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+      if (unlikely((PyDict_SetItemString(modules, "quipubase", __pyx_m) < 0))) __PYX_ERR(1, 1, __pyx_L1_error)
     }
   }
   #endif
   /*--- Builtin init code ---*/
-  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   /*--- Constants init code ---*/
-  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   /*--- Global type/function init code ---*/
   (void)__Pyx_modinit_global_init_code();
   (void)__Pyx_modinit_variable_export_code();
   (void)__Pyx_modinit_function_export_code();
-  if (unlikely((__Pyx_modinit_type_init_code() < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely((__Pyx_modinit_type_init_code() < 0))) __PYX_ERR(1, 1, __pyx_L1_error)
   (void)__Pyx_modinit_type_import_code();
   (void)__Pyx_modinit_variable_import_code();
   (void)__Pyx_modinit_function_import_code();
   /*--- Execution code ---*/
   #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
-  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   #endif
 
   /* "quipubase.pyx":2
@@ -8712,17 +12013,17 @@ if (!__Pyx_RefNanny) {
  * 
  * import orjson
  */
-  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 2, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(__pyx_n_s_Lock);
   __Pyx_GIVEREF(__pyx_n_s_Lock);
-  if (__Pyx_PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_Lock)) __PYX_ERR(0, 2, __pyx_L1_error);
-  __pyx_t_3 = __Pyx_Import(__pyx_n_s_threading, __pyx_t_2, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 2, __pyx_L1_error)
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_Lock)) __PYX_ERR(1, 2, __pyx_L1_error);
+  __pyx_t_3 = __Pyx_Import(__pyx_n_s_threading, __pyx_t_2, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 2, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_n_s_Lock); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_n_s_Lock); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 2, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_mutex, __pyx_t_2) < 0) __PYX_ERR(0, 2, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_mutex, __pyx_t_2) < 0) __PYX_ERR(1, 2, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
@@ -8731,164 +12032,225 @@ if (!__Pyx_RefNanny) {
  * 
  * import orjson             # <<<<<<<<<<<<<<
  * 
- * from libcpp cimport bool
+ * from cpython.buffer cimport PyBUF_READ, PyBuffer_FillInfo
  */
-  __pyx_t_3 = __Pyx_ImportDottedModule(__pyx_n_s_orjson, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 4, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_ImportDottedModule(__pyx_n_s_orjson, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_orjson, __pyx_t_3) < 0) __PYX_ERR(0, 4, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_orjson, __pyx_t_3) < 0) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "quipubase.pyx":87
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+ */
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_11PinnedValue_11__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_PinnedValue___reduce_cython, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__7)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_reduce_cython, __pyx_t_3) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ */
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_11PinnedValue_13__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_PinnedValue___setstate_cython, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__9)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 3, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_setstate_cython, __pyx_t_3) < 0) __PYX_ERR(0, 3, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "quipubase.pyx":144
+ *         self.close_db()
+ * 
+ *     def close(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Flush and close the database, releasing its memtables, background
+ */
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_5close, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_close, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__10)); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 144, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_close, __pyx_t_3) < 0) __PYX_ERR(1, 144, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_9quipubase_Quipu);
+
+  /* "quipubase.pyx":156
  * 
  * 
  *     def put(self, str key, bytes value):             # <<<<<<<<<<<<<<
- *         with self.lock:
- *             self.db.Put(self.write_options, key.encode(), value)
+ *         cdef string ckey = key.encode()
+ *         cdef string cvalue = value
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_5put, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_put, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__6)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 87, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_7put, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_put, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__12)); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 156, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_put, __pyx_t_3) < 0) __PYX_ERR(0, 87, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_put, __pyx_t_3) < 0) __PYX_ERR(1, 156, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_9quipubase_Quipu);
 
-  /* "quipubase.pyx":91
- *             self.db.Put(self.write_options, key.encode(), value)
+  /* "quipubase.pyx":164
+ *                 self.db.Put(self.write_options, ckey, cvalue)
  * 
  *     def get(self, str key):             # <<<<<<<<<<<<<<
+ *         cdef string ckey = key.encode()
  *         cdef string value
- *         with self.lock:
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_7get, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_get, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__7)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 91, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_9get, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_get, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__14)); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 164, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_get, __pyx_t_3) < 0) __PYX_ERR(0, 91, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_get, __pyx_t_3) < 0) __PYX_ERR(1, 164, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_9quipubase_Quipu);
 
-  /* "quipubase.pyx":99
+  /* "quipubase.pyx":175
  *             return value
  * 
+ *     def get_view(self, str key):             # <<<<<<<<<<<<<<
+ *         cdef PinnedValue pinned = PinnedValue()
+ *         cdef string ckey = key.encode()
+ */
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_11get_view, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_get_view, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__16)); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 175, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_get_view, __pyx_t_3) < 0) __PYX_ERR(1, 175, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_9quipubase_Quipu);
+
+  /* "quipubase.pyx":189
+ *         return memoryview(pinned)
+ * 
  *     def delete(self, str key):             # <<<<<<<<<<<<<<
+ *         cdef string ckey = key.encode()
  *         with self.lock:
- *             self.db.Delete(self.write_options, key.encode())
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_9delete, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_delete, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__9)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_13delete, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_delete, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__18)); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 189, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_delete, __pyx_t_3) < 0) __PYX_ERR(0, 99, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_delete, __pyx_t_3) < 0) __PYX_ERR(1, 189, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_9quipubase_Quipu);
 
-  /* "quipubase.pyx":104
+  /* "quipubase.pyx":197
  * 
  * 
  *     def exists(self, str key)->bool:             # <<<<<<<<<<<<<<
- *         return self.get(key) is not None
+ *         return self.get_view(key) is not None
  * 
  */
-  __pyx_t_3 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 104, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 197, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_return, __pyx_n_s_bool) < 0) __PYX_ERR(0, 104, __pyx_L1_error)
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_11exists, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_exists, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__10)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 104, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_return, __pyx_n_s_bool) < 0) __PYX_ERR(1, 197, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_15exists, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_exists, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__20)); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 197, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_CyFunction_SetAnnotationsDict(__pyx_t_2, __pyx_t_3);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_exists, __pyx_t_2) < 0) __PYX_ERR(0, 104, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_exists, __pyx_t_2) < 0) __PYX_ERR(1, 197, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   PyType_Modified(__pyx_ptype_9quipubase_Quipu);
 
-  /* "quipubase.pyx":107
- *         return self.get(key) is not None
+  /* "quipubase.pyx":200
+ *         return self.get_view(key) is not None
  * 
  *     def count(self)->int:             # <<<<<<<<<<<<<<
  *         cdef int count = 0
- *         cdef Iterator* it = self.db.NewIterator(self.read_options)
+ *         cdef Iterator* it
  */
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 107, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 200, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_return, __pyx_n_s_int) < 0) __PYX_ERR(0, 107, __pyx_L1_error)
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_13count, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_count, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__12)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 107, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_return, __pyx_n_s_int) < 0) __PYX_ERR(1, 200, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_17count, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_count, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__22)); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 200, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_CyFunction_SetAnnotationsDict(__pyx_t_3, __pyx_t_2);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_count, __pyx_t_3) < 0) __PYX_ERR(0, 107, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_count, __pyx_t_3) < 0) __PYX_ERR(1, 200, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_9quipubase_Quipu);
 
-  /* "quipubase.pyx":121
+  /* "quipubase.pyx":216
  * 
  * 
  *     def get_doc(self, str key):             # <<<<<<<<<<<<<<
- *         cdef bytes value
- *         value = self.get(key)
+ *         value = self.get_view(key)
+ *         if value is None:
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_15get_doc, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_get_doc, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__13)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 121, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_19get_doc, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_get_doc, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__24)); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 216, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_get_doc, __pyx_t_3) < 0) __PYX_ERR(0, 121, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_get_doc, __pyx_t_3) < 0) __PYX_ERR(1, 216, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_9quipubase_Quipu);
 
-  /* "quipubase.pyx":128
+  /* "quipubase.pyx":222
  *         return orjson.loads(value)
  * 
  *     def put_doc(self, str key, dict[str,Any] value):             # <<<<<<<<<<<<<<
  *         self.put(key, orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY))
  * 
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_17put_doc, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_put_doc, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__14)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 128, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_21put_doc, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_put_doc, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__25)); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 222, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_put_doc, __pyx_t_3) < 0) __PYX_ERR(0, 128, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_put_doc, __pyx_t_3) < 0) __PYX_ERR(1, 222, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_9quipubase_Quipu);
 
-  /* "quipubase.pyx":131
+  /* "quipubase.pyx":225
  *         self.put(key, orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY))
  * 
  *     def delete_doc(self, str key):             # <<<<<<<<<<<<<<
  *         if not self.exists(key):
  *             raise ValueError(f"Object with id {key} not found")
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_19delete_doc, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_delete_doc, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__15)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 131, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_23delete_doc, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_delete_doc, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__26)); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 225, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_delete_doc, __pyx_t_3) < 0) __PYX_ERR(0, 131, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_delete_doc, __pyx_t_3) < 0) __PYX_ERR(1, 225, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_9quipubase_Quipu);
 
-  /* "quipubase.pyx":137
+  /* "quipubase.pyx":231
+ * 
  * 
+ *     def scan_docs(self, int limit, int offset, bool keys_only=False):             # <<<<<<<<<<<<<<
+ *         cdef list results = []
+ *         cdef Iterator* it
+ */
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_25scan_docs, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_scan_docs, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__28)); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 231, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_3, __pyx_tuple__29);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_scan_docs, __pyx_t_3) < 0) __PYX_ERR(1, 231, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_9quipubase_Quipu);
+
+  /* "quipubase.pyx":256
+ *         return results
  * 
- *     def scan_docs(self, int limit, int offset, bool keys_only=False):             # <<<<<<<<<<<<<<
+ *     def find_docs(self,  int limit, int offset, object kwargs):             # <<<<<<<<<<<<<<
+ *         # `offset` counts matching documents, as when paging across shards
  *         cdef list results = []
- *         cdef Iterator* it = self.db.NewIterator(ReadOptions())
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_21scan_docs, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_scan_docs, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__17)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_27find_docs, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_find_docs, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__31)); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 256, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_3, __pyx_tuple__18);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_scan_docs, __pyx_t_3) < 0) __PYX_ERR(0, 137, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_find_docs, __pyx_t_3) < 0) __PYX_ERR(1, 256, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_9quipubase_Quipu);
 
-  /* "quipubase.pyx":156
- *             return results
+  /* "quipubase.pyx":284
+ *         return results
  * 
- *     def find_docs(self,  int limit, int offset, object kwargs):             # <<<<<<<<<<<<<<
- *         cdef list results = []
- *         cdef Iterator* it = self.db.NewIterator(ReadOptions())
+ *     def scan_prefix(self, str prefix, bool keys_only=False):             # <<<<<<<<<<<<<<
+ *         """
+ *         The `(key, document)` pairs, or the keys, of the documents whose key
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_23find_docs, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_find_docs, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__20)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 156, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_29scan_prefix, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_scan_prefix, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__33)); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 284, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_find_docs, __pyx_t_3) < 0) __PYX_ERR(0, 156, __pyx_L1_error)
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_3, __pyx_tuple__29);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_scan_prefix, __pyx_t_3) < 0) __PYX_ERR(1, 284, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_9quipubase_Quipu);
 
-  /* "quipubase.pyx":177
- *             return results
+  /* "quipubase.pyx":315
+ *         return results
  * 
  *     def merge_doc(self, str key, dict[str,Any] value):             # <<<<<<<<<<<<<<
- *         cdef bytes existing
- *         existing = self.get(key)
+ *         existing = self.get_view(key)
+ *         if existing is None:
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_25merge_doc, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_merge_doc, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__22)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 177, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_31merge_doc, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu_merge_doc, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__35)); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 315, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_merge_doc, __pyx_t_3) < 0) __PYX_ERR(0, 177, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_9quipubase_Quipu, __pyx_n_s_merge_doc, __pyx_t_3) < 0) __PYX_ERR(1, 315, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_9quipubase_Quipu);
 
@@ -8897,9 +12259,9 @@ if (!__Pyx_RefNanny) {
  *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
  * def __setstate_cython__(self, __pyx_state):
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_27__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu___reduce_cython, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__24)); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_33__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu___reduce_cython, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__36)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_reduce_cython, __pyx_t_3) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_reduce_cython, __pyx_t_3) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
   /* "(tree fragment)":3
@@ -8908,9 +12270,9 @@ if (!__Pyx_RefNanny) {
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_29__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu___setstate_cython, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__26)); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 3, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_9quipubase_5Quipu_35__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Quipu___setstate_cython, NULL, __pyx_n_s_quipubase, __pyx_d, ((PyObject *)__pyx_codeobj__37)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 3, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_setstate_cython, __pyx_t_3) < 0) __PYX_ERR(1, 3, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_setstate_cython, __pyx_t_3) < 0) __PYX_ERR(0, 3, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
   /* "quipubase.pyx":1
@@ -8918,9 +12280,9 @@ if (!__Pyx_RefNanny) {
  * from threading import Lock as mutex
  * 
  */
-  __pyx_t_3 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_3) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_3) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
   /*--- Wrapped vars code ---*/
@@ -9354,27 +12716,288 @@ static CYTHON_INLINE PyObject * __Pyx_GetKwValue_FASTCALL(PyObject *kwnames, PyO
             return kwvalues[i];
         }
     }
-    return NULL;
-}
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000
-CYTHON_UNUSED static PyObject *__Pyx_KwargsAsDict_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues) {
-    Py_ssize_t i, nkwargs = PyTuple_GET_SIZE(kwnames);
-    PyObject *dict;
-    dict = PyDict_New();
-    if (unlikely(!dict))
-        return NULL;
-    for (i=0; i<nkwargs; i++) {
-        PyObject *key = PyTuple_GET_ITEM(kwnames, i);
-        if (unlikely(PyDict_SetItem(dict, key, kwvalues[i]) < 0))
-            goto bad;
+    return NULL;
+}
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000
+CYTHON_UNUSED static PyObject *__Pyx_KwargsAsDict_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues) {
+    Py_ssize_t i, nkwargs = PyTuple_GET_SIZE(kwnames);
+    PyObject *dict;
+    dict = PyDict_New();
+    if (unlikely(!dict))
+        return NULL;
+    for (i=0; i<nkwargs; i++) {
+        PyObject *key = PyTuple_GET_ITEM(kwnames, i);
+        if (unlikely(PyDict_SetItem(dict, key, kwvalues[i]) < 0))
+            goto bad;
+    }
+    return dict;
+bad:
+    Py_DECREF(dict);
+    return NULL;
+}
+#endif
+#endif
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* KeywordStringCheck */
+static int __Pyx_CheckKeywordStrings(
+    PyObject *kw,
+    const char* function_name,
+    int kw_allowed)
+{
+    PyObject* key = 0;
+    Py_ssize_t pos = 0;
+#if CYTHON_COMPILING_IN_PYPY
+    if (!kw_allowed && PyDict_Next(kw, &pos, &key, 0))
+        goto invalid_keyword;
+    return 1;
+#else
+    if (CYTHON_METH_FASTCALL && likely(PyTuple_Check(kw))) {
+        Py_ssize_t kwsize;
+#if CYTHON_ASSUME_SAFE_MACROS
+        kwsize = PyTuple_GET_SIZE(kw);
+#else
+        kwsize = PyTuple_Size(kw);
+        if (kwsize < 0) return 0;
+#endif
+        if (unlikely(kwsize == 0))
+            return 1;
+        if (!kw_allowed) {
+#if CYTHON_ASSUME_SAFE_MACROS
+            key = PyTuple_GET_ITEM(kw, 0);
+#else
+            key = PyTuple_GetItem(kw, pos);
+            if (!key) return 0;
+#endif
+            goto invalid_keyword;
+        }
+#if PY_VERSION_HEX < 0x03090000
+        for (pos = 0; pos < kwsize; pos++) {
+#if CYTHON_ASSUME_SAFE_MACROS
+            key = PyTuple_GET_ITEM(kw, pos);
+#else
+            key = PyTuple_GetItem(kw, pos);
+            if (!key) return 0;
+#endif
+            if (unlikely(!PyUnicode_Check(key)))
+                goto invalid_keyword_type;
+        }
+#endif
+        return 1;
+    }
+    while (PyDict_Next(kw, &pos, &key, 0)) {
+        #if PY_MAJOR_VERSION < 3
+        if (unlikely(!PyString_Check(key)))
+        #endif
+            if (unlikely(!PyUnicode_Check(key)))
+                goto invalid_keyword_type;
+    }
+    if (!kw_allowed && unlikely(key))
+        goto invalid_keyword;
+    return 1;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    return 0;
+#endif
+invalid_keyword:
+    #if PY_MAJOR_VERSION < 3
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+    PyErr_Format(PyExc_TypeError,
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+    return 0;
+}
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    CYTHON_UNUSED_VAR(cause);
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+      #if PY_VERSION_HEX >= 0x030C00A6
+        PyException_SetTraceback(value, tb);
+      #elif CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
     }
-    return dict;
 bad:
-    Py_DECREF(dict);
-    return NULL;
+    Py_XDECREF(owned_instance);
+    return;
 }
 #endif
-#endif
 
 /* RaiseDoubleKeywords */
 static void __Pyx_RaiseDoubleKeywordsError(
@@ -9499,289 +13122,102 @@ static int __Pyx_ParseOptionalKeywords(
                 name++;
             }
             if (*name) continue;
-            else {
-                PyObject*** argname = argnames;
-                while (argname != first_kw_arg) {
-                    int cmp = (**argname == key) ? 0 :
-                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
-                    #endif
-                        PyUnicode_Compare(**argname, key);
-                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
-                    if (cmp == 0) goto arg_passed_twice;
-                    argname++;
-                }
-            }
-        } else
-            goto invalid_keyword_type;
-        if (kwds2) {
-            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
-        } else {
-            goto invalid_keyword;
-        }
-    }
-    Py_XDECREF(key);
-    Py_XDECREF(value);
-    return 0;
-arg_passed_twice:
-    __Pyx_RaiseDoubleKeywordsError(function_name, key);
-    goto bad;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%.200s() keywords must be strings", function_name);
-    goto bad;
-invalid_keyword:
-    #if PY_MAJOR_VERSION < 3
-    PyErr_Format(PyExc_TypeError,
-        "%.200s() got an unexpected keyword argument '%.200s'",
-        function_name, PyString_AsString(key));
-    #else
-    PyErr_Format(PyExc_TypeError,
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
-    #endif
-bad:
-    Py_XDECREF(key);
-    Py_XDECREF(value);
-    return -1;
-}
-
-/* RaiseArgTupleInvalid */
-static void __Pyx_RaiseArgtupleInvalid(
-    const char* func_name,
-    int exact,
-    Py_ssize_t num_min,
-    Py_ssize_t num_max,
-    Py_ssize_t num_found)
-{
-    Py_ssize_t num_expected;
-    const char *more_or_less;
-    if (num_found < num_min) {
-        num_expected = num_min;
-        more_or_less = "at least";
-    } else {
-        num_expected = num_max;
-        more_or_less = "at most";
-    }
-    if (exact) {
-        more_or_less = "exactly";
-    }
-    PyErr_Format(PyExc_TypeError,
-                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
-                 func_name, more_or_less, num_expected,
-                 (num_expected == 1) ? "" : "s", num_found);
-}
-
-/* ArgTypeTest */
-static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
-{
-    __Pyx_TypeName type_name;
-    __Pyx_TypeName obj_type_name;
-    if (unlikely(!type)) {
-        PyErr_SetString(PyExc_SystemError, "Missing type object");
-        return 0;
-    }
-    else if (exact) {
-        #if PY_MAJOR_VERSION == 2
-        if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
-        #endif
-    }
-    else {
-        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
-    }
-    type_name = __Pyx_PyType_GetName(type);
-    obj_type_name = __Pyx_PyType_GetName(Py_TYPE(obj));
-    PyErr_Format(PyExc_TypeError,
-        "Argument '%.200s' has incorrect type (expected " __Pyx_FMT_TYPENAME
-        ", got " __Pyx_FMT_TYPENAME ")", name, type_name, obj_type_name);
-    __Pyx_DECREF_TypeName(type_name);
-    __Pyx_DECREF_TypeName(obj_type_name);
-    return 0;
-}
-
-/* PyObjectCall */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
-    PyObject *result;
-    ternaryfunc call = Py_TYPE(func)->tp_call;
-    if (unlikely(!call))
-        return PyObject_Call(func, arg, kw);
-    #if PY_MAJOR_VERSION < 3
-    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
-        return NULL;
-    #else
-    if (unlikely(Py_EnterRecursiveCall(" while calling a Python object")))
-        return NULL;
-    #endif
-    result = (*call)(func, arg, kw);
-    Py_LeaveRecursiveCall();
-    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
-        PyErr_SetString(
-            PyExc_SystemError,
-            "NULL result without error in PyObject_Call");
-    }
-    return result;
-}
-#endif
-
-/* RaiseException */
-#if PY_MAJOR_VERSION < 3
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
-    __Pyx_PyThreadState_declare
-    CYTHON_UNUSED_VAR(cause);
-    Py_XINCREF(type);
-    if (!value || value == Py_None)
-        value = NULL;
-    else
-        Py_INCREF(value);
-    if (!tb || tb == Py_None)
-        tb = NULL;
-    else {
-        Py_INCREF(tb);
-        if (!PyTraceBack_Check(tb)) {
-            PyErr_SetString(PyExc_TypeError,
-                "raise: arg 3 must be a traceback or None");
-            goto raise_error;
-        }
-    }
-    if (PyType_Check(type)) {
-#if CYTHON_COMPILING_IN_PYPY
-        if (!value) {
-            Py_INCREF(Py_None);
-            value = Py_None;
-        }
-#endif
-        PyErr_NormalizeException(&type, &value, &tb);
-    } else {
-        if (value) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto raise_error;
-        }
-        value = type;
-        type = (PyObject*) Py_TYPE(type);
-        Py_INCREF(type);
-        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
-            PyErr_SetString(PyExc_TypeError,
-                "raise: exception class must be a subclass of BaseException");
-            goto raise_error;
-        }
-    }
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrRestore(type, value, tb);
-    return;
-raise_error:
-    Py_XDECREF(value);
-    Py_XDECREF(type);
-    Py_XDECREF(tb);
-    return;
-}
-#else
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
-    PyObject* owned_instance = NULL;
-    if (tb == Py_None) {
-        tb = 0;
-    } else if (tb && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto bad;
-    }
-    if (value == Py_None)
-        value = 0;
-    if (PyExceptionInstance_Check(type)) {
-        if (value) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto bad;
-        }
-        value = type;
-        type = (PyObject*) Py_TYPE(value);
-    } else if (PyExceptionClass_Check(type)) {
-        PyObject *instance_class = NULL;
-        if (value && PyExceptionInstance_Check(value)) {
-            instance_class = (PyObject*) Py_TYPE(value);
-            if (instance_class != type) {
-                int is_subclass = PyObject_IsSubclass(instance_class, type);
-                if (!is_subclass) {
-                    instance_class = NULL;
-                } else if (unlikely(is_subclass == -1)) {
-                    goto bad;
-                } else {
-                    type = instance_class;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
                 }
             }
-        }
-        if (!instance_class) {
-            PyObject *args;
-            if (!value)
-                args = PyTuple_New(0);
-            else if (PyTuple_Check(value)) {
-                Py_INCREF(value);
-                args = value;
-            } else
-                args = PyTuple_Pack(1, value);
-            if (!args)
-                goto bad;
-            owned_instance = PyObject_Call(type, args, NULL);
-            Py_DECREF(args);
-            if (!owned_instance)
-                goto bad;
-            value = owned_instance;
-            if (!PyExceptionInstance_Check(value)) {
-                PyErr_Format(PyExc_TypeError,
-                             "calling %R should have returned an instance of "
-                             "BaseException, not %R",
-                             type, Py_TYPE(value));
-                goto bad;
-            }
-        }
-    } else {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: exception class must be a subclass of BaseException");
-        goto bad;
-    }
-    if (cause) {
-        PyObject *fixed_cause;
-        if (cause == Py_None) {
-            fixed_cause = NULL;
-        } else if (PyExceptionClass_Check(cause)) {
-            fixed_cause = PyObject_CallObject(cause, NULL);
-            if (fixed_cause == NULL)
-                goto bad;
-        } else if (PyExceptionInstance_Check(cause)) {
-            fixed_cause = cause;
-            Py_INCREF(fixed_cause);
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
         } else {
-            PyErr_SetString(PyExc_TypeError,
-                            "exception causes must derive from "
-                            "BaseException");
-            goto bad;
-        }
-        PyException_SetCause(value, fixed_cause);
-    }
-    PyErr_SetObject(type, value);
-    if (tb) {
-      #if PY_VERSION_HEX >= 0x030C00A6
-        PyException_SetTraceback(value, tb);
-      #elif CYTHON_FAST_THREAD_STATE
-        PyThreadState *tstate = __Pyx_PyThreadState_Current;
-        PyObject* tmp_tb = tstate->curexc_traceback;
-        if (tb != tmp_tb) {
-            Py_INCREF(tb);
-            tstate->curexc_traceback = tb;
-            Py_XDECREF(tmp_tb);
+            goto invalid_keyword;
         }
-#else
-        PyObject *tmp_type, *tmp_value, *tmp_tb;
-        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
-        Py_INCREF(tb);
-        PyErr_Restore(tmp_type, tmp_value, tb);
-        Py_XDECREF(tmp_tb);
-#endif
     }
+    Py_XDECREF(key);
+    Py_XDECREF(value);
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    #if PY_MAJOR_VERSION < 3
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+    PyErr_Format(PyExc_TypeError,
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
 bad:
-    Py_XDECREF(owned_instance);
-    return;
+    Py_XDECREF(key);
+    Py_XDECREF(value);
+    return -1;
+}
+
+/* ArgTypeTest */
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
+{
+    __Pyx_TypeName type_name;
+    __Pyx_TypeName obj_type_name;
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    else if (exact) {
+        #if PY_MAJOR_VERSION == 2
+        if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
+        #endif
+    }
+    else {
+        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
+    }
+    type_name = __Pyx_PyType_GetName(type);
+    obj_type_name = __Pyx_PyType_GetName(Py_TYPE(obj));
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%.200s' has incorrect type (expected " __Pyx_FMT_TYPENAME
+        ", got " __Pyx_FMT_TYPENAME ")", name, type_name, obj_type_name);
+    __Pyx_DECREF_TypeName(type_name);
+    __Pyx_DECREF_TypeName(obj_type_name);
+    return 0;
+}
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    #if PY_MAJOR_VERSION < 3
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    #else
+    if (unlikely(Py_EnterRecursiveCall(" while calling a Python object")))
+        return NULL;
+    #endif
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
 }
 #endif
 
@@ -10401,116 +13837,48 @@ static void __Pyx_WriteUnraisable(const char *name, int clineno,
                                   int full_traceback, int nogil) {
     PyObject *old_exc, *old_val, *old_tb;
     PyObject *ctx;
-    __Pyx_PyThreadState_declare
-#ifdef WITH_THREAD
-    PyGILState_STATE state;
-    if (nogil)
-        state = PyGILState_Ensure();
-    else state = (PyGILState_STATE)0;
-#endif
-    CYTHON_UNUSED_VAR(clineno);
-    CYTHON_UNUSED_VAR(lineno);
-    CYTHON_UNUSED_VAR(filename);
-    CYTHON_MAYBE_UNUSED_VAR(nogil);
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
-    if (full_traceback) {
-        Py_XINCREF(old_exc);
-        Py_XINCREF(old_val);
-        Py_XINCREF(old_tb);
-        __Pyx_ErrRestore(old_exc, old_val, old_tb);
-        PyErr_PrintEx(1);
-    }
-    #if PY_MAJOR_VERSION < 3
-    ctx = PyString_FromString(name);
-    #else
-    ctx = PyUnicode_FromString(name);
-    #endif
-    __Pyx_ErrRestore(old_exc, old_val, old_tb);
-    if (!ctx) {
-        PyErr_WriteUnraisable(Py_None);
-    } else {
-        PyErr_WriteUnraisable(ctx);
-        Py_DECREF(ctx);
-    }
-#ifdef WITH_THREAD
-    if (nogil)
-        PyGILState_Release(state);
-#endif
-}
-
-/* KeywordStringCheck */
-static int __Pyx_CheckKeywordStrings(
-    PyObject *kw,
-    const char* function_name,
-    int kw_allowed)
-{
-    PyObject* key = 0;
-    Py_ssize_t pos = 0;
-#if CYTHON_COMPILING_IN_PYPY
-    if (!kw_allowed && PyDict_Next(kw, &pos, &key, 0))
-        goto invalid_keyword;
-    return 1;
-#else
-    if (CYTHON_METH_FASTCALL && likely(PyTuple_Check(kw))) {
-        Py_ssize_t kwsize;
-#if CYTHON_ASSUME_SAFE_MACROS
-        kwsize = PyTuple_GET_SIZE(kw);
-#else
-        kwsize = PyTuple_Size(kw);
-        if (kwsize < 0) return 0;
-#endif
-        if (unlikely(kwsize == 0))
-            return 1;
-        if (!kw_allowed) {
-#if CYTHON_ASSUME_SAFE_MACROS
-            key = PyTuple_GET_ITEM(kw, 0);
-#else
-            key = PyTuple_GetItem(kw, pos);
-            if (!key) return 0;
-#endif
-            goto invalid_keyword;
-        }
-#if PY_VERSION_HEX < 0x03090000
-        for (pos = 0; pos < kwsize; pos++) {
-#if CYTHON_ASSUME_SAFE_MACROS
-            key = PyTuple_GET_ITEM(kw, pos);
-#else
-            key = PyTuple_GetItem(kw, pos);
-            if (!key) return 0;
-#endif
-            if (unlikely(!PyUnicode_Check(key)))
-                goto invalid_keyword_type;
-        }
-#endif
-        return 1;
-    }
-    while (PyDict_Next(kw, &pos, &key, 0)) {
-        #if PY_MAJOR_VERSION < 3
-        if (unlikely(!PyString_Check(key)))
-        #endif
-            if (unlikely(!PyUnicode_Check(key)))
-                goto invalid_keyword_type;
-    }
-    if (!kw_allowed && unlikely(key))
-        goto invalid_keyword;
-    return 1;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%.200s() keywords must be strings", function_name);
-    return 0;
+    __Pyx_PyThreadState_declare
+#ifdef WITH_THREAD
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+    else state = (PyGILState_STATE)0;
 #endif
-invalid_keyword:
+    CYTHON_UNUSED_VAR(clineno);
+    CYTHON_UNUSED_VAR(lineno);
+    CYTHON_UNUSED_VAR(filename);
+    CYTHON_MAYBE_UNUSED_VAR(nogil);
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(1);
+    }
     #if PY_MAJOR_VERSION < 3
-    PyErr_Format(PyExc_TypeError,
-        "%.200s() got an unexpected keyword argument '%.200s'",
-        function_name, PyString_AsString(key));
+    ctx = PyString_FromString(name);
     #else
-    PyErr_Format(PyExc_TypeError,
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
+    ctx = PyUnicode_FromString(name);
     #endif
-    return 0;
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+#ifdef WITH_THREAD
+    if (nogil)
+        PyGILState_Release(state);
+#endif
+}
+
+/* PyObjectCallNoArg */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+    PyObject *arg[2] = {NULL, NULL};
+    return __Pyx_PyObject_FastCall(func, arg + 1, 0 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
 }
 
 /* RaiseUnexpectedTypeError */
@@ -10662,12 +14030,6 @@ static CYTHON_INLINE int __Pyx_IterFinish(void) {
     return 0;
 }
 
-/* PyObjectCallNoArg */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
-    PyObject *arg[2] = {NULL, NULL};
-    return __Pyx_PyObject_FastCall(func, arg + 1, 0 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
-}
-
 /* PyObjectGetMethod */
 static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method) {
     PyObject *attr;
@@ -10992,6 +14354,81 @@ static CYTHON_INLINE int __Pyx_dict_iter_next(
     return 1;
 }
 
+/* bytes_tailmatch */
+static int __Pyx_PyBytes_SingleTailmatch(PyObject* self, PyObject* arg,
+                                         Py_ssize_t start, Py_ssize_t end, int direction) {
+    const char* self_ptr = PyBytes_AS_STRING(self);
+    Py_ssize_t self_len = PyBytes_GET_SIZE(self);
+    const char* sub_ptr;
+    Py_ssize_t sub_len;
+    int retval;
+    Py_buffer view;
+    view.obj = NULL;
+    if ( PyBytes_Check(arg) ) {
+        sub_ptr = PyBytes_AS_STRING(arg);
+        sub_len = PyBytes_GET_SIZE(arg);
+    }
+#if PY_MAJOR_VERSION < 3
+    else if ( PyUnicode_Check(arg) ) {
+        return (int) PyUnicode_Tailmatch(self, arg, start, end, direction);
+    }
+#endif
+    else {
+        if (unlikely(PyObject_GetBuffer(self, &view, PyBUF_SIMPLE) == -1))
+            return -1;
+        sub_ptr = (const char*) view.buf;
+        sub_len = view.len;
+    }
+    if (end > self_len)
+        end = self_len;
+    else if (end < 0)
+        end += self_len;
+    if (end < 0)
+        end = 0;
+    if (start < 0)
+        start += self_len;
+    if (start < 0)
+        start = 0;
+    if (direction > 0) {
+        if (end-sub_len > start)
+            start = end - sub_len;
+    }
+    if (start + sub_len <= end)
+        retval = !memcmp(self_ptr+start, sub_ptr, (size_t)sub_len);
+    else
+        retval = 0;
+    if (view.obj)
+        PyBuffer_Release(&view);
+    return retval;
+}
+static int __Pyx_PyBytes_TailmatchTuple(PyObject* self, PyObject* substrings,
+                                        Py_ssize_t start, Py_ssize_t end, int direction) {
+    Py_ssize_t i, count = PyTuple_GET_SIZE(substrings);
+    for (i = 0; i < count; i++) {
+        int result;
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        result = __Pyx_PyBytes_SingleTailmatch(self, PyTuple_GET_ITEM(substrings, i),
+                                               start, end, direction);
+#else
+        PyObject* sub = PySequence_ITEM(substrings, i);
+        if (unlikely(!sub)) return -1;
+        result = __Pyx_PyBytes_SingleTailmatch(self, sub, start, end, direction);
+        Py_DECREF(sub);
+#endif
+        if (result) {
+            return result;
+        }
+    }
+    return 0;
+}
+static int __Pyx_PyBytes_Tailmatch(PyObject* self, PyObject* substr,
+                                   Py_ssize_t start, Py_ssize_t end, int direction) {
+    if (unlikely(PyTuple_Check(substr))) {
+        return __Pyx_PyBytes_TailmatchTuple(self, substr, start, end, direction);
+    }
+    return __Pyx_PyBytes_SingleTailmatch(self, substr, start, end, direction);
+}
+
 /* FixUpExtensionType */
 #if CYTHON_USE_TYPE_SPECS
 static int __Pyx_fix_up_extension_type_from_spec(PyType_Spec *spec, PyTypeObject *type) {
@@ -11284,97 +14721,6 @@ static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_nam
 }
 #endif
 
-/* SetVTable */
-static int __Pyx_SetVtable(PyTypeObject *type, void *vtable) {
-    PyObject *ob = PyCapsule_New(vtable, 0, 0);
-    if (unlikely(!ob))
-        goto bad;
-#if CYTHON_COMPILING_IN_LIMITED_API
-    if (unlikely(PyObject_SetAttr((PyObject *) type, __pyx_n_s_pyx_vtable, ob) < 0))
-#else
-    if (unlikely(PyDict_SetItem(type->tp_dict, __pyx_n_s_pyx_vtable, ob) < 0))
-#endif
-        goto bad;
-    Py_DECREF(ob);
-    return 0;
-bad:
-    Py_XDECREF(ob);
-    return -1;
-}
-
-/* GetVTable */
-static void* __Pyx_GetVtable(PyTypeObject *type) {
-    void* ptr;
-#if CYTHON_COMPILING_IN_LIMITED_API
-    PyObject *ob = PyObject_GetAttr((PyObject *)type, __pyx_n_s_pyx_vtable);
-#else
-    PyObject *ob = PyObject_GetItem(type->tp_dict, __pyx_n_s_pyx_vtable);
-#endif
-    if (!ob)
-        goto bad;
-    ptr = PyCapsule_GetPointer(ob, 0);
-    if (!ptr && !PyErr_Occurred())
-        PyErr_SetString(PyExc_RuntimeError, "invalid vtable found for imported type");
-    Py_DECREF(ob);
-    return ptr;
-bad:
-    Py_XDECREF(ob);
-    return NULL;
-}
-
-/* MergeVTables */
-#if !CYTHON_COMPILING_IN_LIMITED_API
-static int __Pyx_MergeVtables(PyTypeObject *type) {
-    int i;
-    void** base_vtables;
-    __Pyx_TypeName tp_base_name;
-    __Pyx_TypeName base_name;
-    void* unknown = (void*)-1;
-    PyObject* bases = type->tp_bases;
-    int base_depth = 0;
-    {
-        PyTypeObject* base = type->tp_base;
-        while (base) {
-            base_depth += 1;
-            base = base->tp_base;
-        }
-    }
-    base_vtables = (void**) malloc(sizeof(void*) * (size_t)(base_depth + 1));
-    base_vtables[0] = unknown;
-    for (i = 1; i < PyTuple_GET_SIZE(bases); i++) {
-        void* base_vtable = __Pyx_GetVtable(((PyTypeObject*)PyTuple_GET_ITEM(bases, i)));
-        if (base_vtable != NULL) {
-            int j;
-            PyTypeObject* base = type->tp_base;
-            for (j = 0; j < base_depth; j++) {
-                if (base_vtables[j] == unknown) {
-                    base_vtables[j] = __Pyx_GetVtable(base);
-                    base_vtables[j + 1] = unknown;
-                }
-                if (base_vtables[j] == base_vtable) {
-                    break;
-                } else if (base_vtables[j] == NULL) {
-                    goto bad;
-                }
-                base = base->tp_base;
-            }
-        }
-    }
-    PyErr_Clear();
-    free(base_vtables);
-    return 0;
-bad:
-    tp_base_name = __Pyx_PyType_GetName(type->tp_base);
-    base_name = __Pyx_PyType_GetName((PyTypeObject*)PyTuple_GET_ITEM(bases, i));
-    PyErr_Format(PyExc_TypeError,
-        "multiple bases have vtable conflict: '" __Pyx_FMT_TYPENAME "' and '" __Pyx_FMT_TYPENAME "'", tp_base_name, base_name);
-    __Pyx_DECREF_TypeName(tp_base_name);
-    __Pyx_DECREF_TypeName(base_name);
-    free(base_vtables);
-    return -1;
-}
-#endif
-
 /* SetupReduce */
 #if !CYTHON_COMPILING_IN_LIMITED_API
 static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
@@ -11486,6 +14832,97 @@ __PYX_GOOD:
 }
 #endif
 
+/* SetVTable */
+static int __Pyx_SetVtable(PyTypeObject *type, void *vtable) {
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+    if (unlikely(!ob))
+        goto bad;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    if (unlikely(PyObject_SetAttr((PyObject *) type, __pyx_n_s_pyx_vtable, ob) < 0))
+#else
+    if (unlikely(PyDict_SetItem(type->tp_dict, __pyx_n_s_pyx_vtable, ob) < 0))
+#endif
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
+/* GetVTable */
+static void* __Pyx_GetVtable(PyTypeObject *type) {
+    void* ptr;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *ob = PyObject_GetAttr((PyObject *)type, __pyx_n_s_pyx_vtable);
+#else
+    PyObject *ob = PyObject_GetItem(type->tp_dict, __pyx_n_s_pyx_vtable);
+#endif
+    if (!ob)
+        goto bad;
+    ptr = PyCapsule_GetPointer(ob, 0);
+    if (!ptr && !PyErr_Occurred())
+        PyErr_SetString(PyExc_RuntimeError, "invalid vtable found for imported type");
+    Py_DECREF(ob);
+    return ptr;
+bad:
+    Py_XDECREF(ob);
+    return NULL;
+}
+
+/* MergeVTables */
+#if !CYTHON_COMPILING_IN_LIMITED_API
+static int __Pyx_MergeVtables(PyTypeObject *type) {
+    int i;
+    void** base_vtables;
+    __Pyx_TypeName tp_base_name;
+    __Pyx_TypeName base_name;
+    void* unknown = (void*)-1;
+    PyObject* bases = type->tp_bases;
+    int base_depth = 0;
+    {
+        PyTypeObject* base = type->tp_base;
+        while (base) {
+            base_depth += 1;
+            base = base->tp_base;
+        }
+    }
+    base_vtables = (void**) malloc(sizeof(void*) * (size_t)(base_depth + 1));
+    base_vtables[0] = unknown;
+    for (i = 1; i < PyTuple_GET_SIZE(bases); i++) {
+        void* base_vtable = __Pyx_GetVtable(((PyTypeObject*)PyTuple_GET_ITEM(bases, i)));
+        if (base_vtable != NULL) {
+            int j;
+            PyTypeObject* base = type->tp_base;
+            for (j = 0; j < base_depth; j++) {
+                if (base_vtables[j] == unknown) {
+                    base_vtables[j] = __Pyx_GetVtable(base);
+                    base_vtables[j + 1] = unknown;
+                }
+                if (base_vtables[j] == base_vtable) {
+                    break;
+                } else if (base_vtables[j] == NULL) {
+                    goto bad;
+                }
+                base = base->tp_base;
+            }
+        }
+    }
+    PyErr_Clear();
+    free(base_vtables);
+    return 0;
+bad:
+    tp_base_name = __Pyx_PyType_GetName(type->tp_base);
+    base_name = __Pyx_PyType_GetName((PyTypeObject*)PyTuple_GET_ITEM(bases, i));
+    PyErr_Format(PyExc_TypeError,
+        "multiple bases have vtable conflict: '" __Pyx_FMT_TYPENAME "' and '" __Pyx_FMT_TYPENAME "'", tp_base_name, base_name);
+    __Pyx_DECREF_TypeName(tp_base_name);
+    __Pyx_DECREF_TypeName(base_name);
+    free(base_vtables);
+    return -1;
+}
+#endif
+
 /* Import */
 static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
     PyObject *module = 0;
@@ -11557,7 +14994,7 @@ static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
         if (unlikely(!module_name_str)) { goto modbad; }
         module_name = PyUnicode_FromString(module_name_str);
         if (unlikely(!module_name)) { goto modbad; }
-        module_dot = PyUnicode_Concat(module_name, __pyx_kp_u__3);
+        module_dot = PyUnicode_Concat(module_name, __pyx_kp_u__4);
         if (unlikely(!module_dot)) { goto modbad; }
         full_name = PyUnicode_Concat(module_dot, name);
         if (unlikely(!full_name)) { goto modbad; }
@@ -11665,7 +15102,7 @@ static PyObject *__Pyx_ImportDottedModule_WalkParts(PyObject *module, PyObject *
 #endif
 static PyObject *__Pyx__ImportDottedModule(PyObject *name, PyObject *parts_tuple) {
 #if PY_MAJOR_VERSION < 3
-    PyObject *module, *from_list, *star = __pyx_n_s__4;
+    PyObject *module, *from_list, *star = __pyx_n_s__5;
     CYTHON_UNUSED_VAR(parts_tuple);
     from_list = PyList_New(1);
     if (unlikely(!from_list))
@@ -13578,7 +17015,7 @@ __Pyx_PyType_GetName(PyTypeObject* tp)
     if (unlikely(name == NULL) || unlikely(!PyUnicode_Check(name))) {
         PyErr_Clear();
         Py_XDECREF(name);
-        name = __Pyx_NewRef(__pyx_n_s__27);
+        name = __Pyx_NewRef(__pyx_n_s__38);
     }
     return name;
 }
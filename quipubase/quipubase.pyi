@@ -2,6 +2,10 @@ from typing import Any
 
 class Quipu:
     def __init__(self, db_path: str) -> None: ...
+    def close(self) -> None: ...
+    @property
+    def closed(self) -> bool: ...
+    def get_view(self, key: str) -> memoryview | None: ...
     def exists(self, key: str) -> bool: ...
     @classmethod
     def count(cls) -> int: ...
@@ -18,4 +22,7 @@ class Quipu:
     def find_docs(
         cls, limit: int, offset: int, kwargs: dict[str, Any]
     ) -> tuple[str, dict[str, Any]]: ...
+    def scan_prefix(
+        self, prefix: str, keys_only: bool = False
+    ) -> list[tuple[str, dict[str, Any]]]: ...
     def merge_doc(self, key: str, value: dict[str, Any]) -> None: ...
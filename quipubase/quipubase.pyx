@@ -3,17 +3,21 @@ from threading import Lock as mutex
 
 import orjson
 
+from cpython.buffer cimport PyBUF_READ, PyBuffer_FillInfo
+from cpython.memoryview cimport PyMemoryView_FromMemory
 from libcpp cimport bool
 from libcpp.string cimport string
 
 
 
-cdef extern from "rocksdb/db.h" namespace "rocksdb":
+cdef extern from "rocksdb/db.h" namespace "rocksdb" nogil:
     cdef cppclass DB:
         @staticmethod
         Status Open(const Options&, const string&, DB**)
         void Put(const WriteOptions&, const string&, const string&)
         Status Get(const ReadOptions&, const string&, string*)
+        Status Get(const ReadOptions&, ColumnFamilyHandle*, const Slice&, PinnableSlice*)
+        ColumnFamilyHandle* DefaultColumnFamily()
         Status Delete(const WriteOptions&, const string&)
         Status Merge(const WriteOptions&, const string&, const string&)
         Iterator* NewIterator(const ReadOptions&)
@@ -36,6 +40,7 @@ cdef extern from "rocksdb/db.h" namespace "rocksdb":
 
     cdef cppclass Iterator:
         void SeekToFirst()
+        void Seek(const Slice&)
         void Next()
         bool Valid()
         Slice key()
@@ -43,9 +48,55 @@ cdef extern from "rocksdb/db.h" namespace "rocksdb":
         void Close()
 
     cdef cppclass Slice:
+        Slice(const string&)
         const char* data()
         size_t size()
-   
+
+    cdef cppclass PinnableSlice:
+        PinnableSlice()
+        const char* data()
+        size_t size()
+        void Reset()
+
+    cdef cppclass ColumnFamilyHandle:
+        pass
+
+
+cdef class PinnedValue:
+    """
+    Read-only buffer over a value pinned in the RocksDB block cache.
+
+    The underlying `PinnableSlice` keeps the block alive until this object
+    is released (holding a reference to the owning `Quipu` so the database
+    outlives the view), so `memoryview`, `orjson.loads` and `numpy.frombuffer` can
+    consume the value without copying it into a `bytes` object first.
+    """
+    cdef PinnableSlice* slice
+    cdef object owner
+
+    def __cinit__(self):
+        self.slice = new PinnableSlice()
+
+    def __dealloc__(self):
+        if self.slice != NULL:
+            self.slice.Reset()
+            del self.slice
+            self.slice = NULL
+
+    def __len__(self):
+        return self.slice.size()
+
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        PyBuffer_FillInfo(buffer, self, <void*>self.slice.data(), self.slice.size(), 1, flags)
+
+    def __releasebuffer__(self, Py_buffer* buffer):
+        pass
+
+
+cdef inline object slice_view(const char* data, size_t size):
+    # Borrowed view over an iterator slice, only valid until the iterator moves.
+    return PyMemoryView_FromMemory(<char*>data, size, PyBUF_READ)
+
 
 
 cdef class Quipu:
@@ -79,48 +130,91 @@ cdef class Quipu:
             if self.db:
                 self.db.Close()
                 del self.db
+                self.db = NULL
+
+    cdef int ensure_open(self) except -1:
+        # Called with `self.lock` held, so the database can't close underneath.
+        if self.db == NULL:
+            raise RuntimeError("Database is closed")
+        return 0
 
     def __dealloc__(self):
         self.close_db()
 
+    def close(self):
+        """
+        Flush and close the database, releasing its memtables, background
+        threads and file descriptors. The instance can't be used afterwards.
+        """
+        self.close_db()
+
+    @property
+    def closed(self)->bool:
+        return self.db == NULL
+
 
     def put(self, str key, bytes value):
+        cdef string ckey = key.encode()
+        cdef string cvalue = value
         with self.lock:
-            self.db.Put(self.write_options, key.encode(), value)
+            self.ensure_open()
+            with nogil:
+                self.db.Put(self.write_options, ckey, cvalue)
 
     def get(self, str key):
+        cdef string ckey = key.encode()
         cdef string value
         with self.lock:
-            self.status = self.db.Get(self.read_options, key.encode(), &value)
+            self.ensure_open()
+            with nogil:
+                self.status = self.db.Get(self.read_options, ckey, &value)
             if not self.status.ok():
                 return None
             return value
+
+    def get_view(self, str key):
+        cdef PinnedValue pinned = PinnedValue()
+        cdef string ckey = key.encode()
+        pinned.owner = self
+        with self.lock:
+            self.ensure_open()
+            with nogil:
+                self.status = self.db.Get(
+                    self.read_options, self.db.DefaultColumnFamily(), Slice(ckey), pinned.slice
+                )
+            if not self.status.ok():
+                return None
+        return memoryview(pinned)
   
     def delete(self, str key):
+        cdef string ckey = key.encode()
         with self.lock:
-            self.db.Delete(self.write_options, key.encode())
+            self.ensure_open()
+            with nogil:
+                self.db.Delete(self.write_options, ckey)
     
 
     def exists(self, str key)->bool:
-        return self.get(key) is not None
+        return self.get_view(key) is not None
   
     def count(self)->int:
         cdef int count = 0
-        cdef Iterator* it = self.db.NewIterator(self.read_options)
-        try:
-            it.SeekToFirst()
-            while it.Valid():
-                count += 1
-                it.Next()
-        finally:
-            del it
+        cdef Iterator* it
+        with self.lock:
+            self.ensure_open()
+            it = self.db.NewIterator(self.read_options)
+            with nogil:
+                it.SeekToFirst()
+                while it.Valid():
+                    count += 1
+                    it.Next()
+                del it
         return count
 
 
    
     def get_doc(self, str key):
-        cdef bytes value
-        value = self.get(key)
+        value = self.get_view(key)
         if value is None:
             return None
         return orjson.loads(value)
@@ -136,47 +230,90 @@ cdef class Quipu:
     
     def scan_docs(self, int limit, int offset, bool keys_only=False):
         cdef list results = []
-        cdef Iterator* it = self.db.NewIterator(ReadOptions())
-        it.SeekToFirst()
-        try:
-            while it.Valid() and len(results) < limit:
-                if offset > 0:
+        cdef Iterator* it
+        with self.lock:
+            self.ensure_open()
+            it = self.db.NewIterator(ReadOptions())
+            with nogil:
+                it.SeekToFirst()
+                while it.Valid() and offset > 0:
                     offset -= 1
                     it.Next()
-                    continue
-                if keys_only:
-                    results.append((<bytes>it.key().data())[:it.key().size()])
-                else:
-                    results.append(orjson.loads((<bytes>it.value().data())[:it.value().size()]))
-                it.Next()
-        finally:
-            del it
-            return results
+            try:
+                while it.Valid() and len(results) < limit:
+                    if keys_only:
+                        results.append(it.key().data()[:it.key().size()])
+                    else:
+                        view = slice_view(it.value().data(), it.value().size())
+                        results.append(orjson.loads(view))
+                        view.release()
+                    with nogil:
+                        it.Next()
+            finally:
+                del it
+        return results
       
     def find_docs(self,  int limit, int offset, object kwargs):
+        # `offset` counts matching documents, as when paging across shards
         cdef list results = []
-        cdef Iterator* it = self.db.NewIterator(ReadOptions())
-        it.SeekToFirst()
-        try:
-            while it.Valid() and len(results) < limit:
-                if offset > 0:
-                    offset -= 1
-                    it.Next()
-                    continue
-                doc = orjson.loads((<bytes>it.value().data())[:it.value().size()])
-                for key, value in kwargs.items():
-                    if doc.get(key) != value:
+        cdef Iterator* it
+        with self.lock:
+            self.ensure_open()
+            it = self.db.NewIterator(ReadOptions())
+            with nogil:
+                it.SeekToFirst()
+            try:
+                while it.Valid() and len(results) < limit:
+                    view = slice_view(it.value().data(), it.value().size())
+                    doc = orjson.loads(view)
+                    view.release()
+                    for key, value in kwargs.items():
+                        if doc.get(key) != value:
+                            break
+                    else:
+                        if offset > 0:
+                            offset -= 1
+                        else:
+                            results.append(doc)
+                    with nogil:
+                        it.Next()
+            finally:
+                del it
+        return results
+
+    def scan_prefix(self, str prefix, bool keys_only=False):
+        """
+        The `(key, document)` pairs, or the keys, of the documents whose key
+        starts with `prefix`, in key order.
+        """
+        cdef list results = []
+        cdef bytes bprefix = prefix.encode()
+        cdef string cprefix = bprefix
+        cdef Iterator* it
+        with self.lock:
+            self.ensure_open()
+            it = self.db.NewIterator(self.read_options)
+            with nogil:
+                it.Seek(Slice(cprefix))
+            try:
+                while it.Valid():
+                    key = it.key().data()[:it.key().size()]
+                    if not key.startswith(bprefix):
                         break
-                else:
-                    results.append(doc)
-                it.Next()
-        finally:
-            del it
-            return results
+                    if keys_only:
+                        results.append(key.decode())
+                    else:
+                        view = slice_view(it.value().data(), it.value().size())
+                        results.append((key.decode(), orjson.loads(view)))
+                        view.release()
+                    with nogil:
+                        it.Next()
+            finally:
+                del it
+        return results
 
     def merge_doc(self, str key, dict[str,Any] value):
-        cdef bytes existing
-        existing = self.get(key)
+        existing = self.get_view(key)
         if existing is None:
             self.put_doc(key, value)
             return
@@ -1,36 +1,85 @@
 import asyncio
-from functools import cached_property
-from typing import Literal, Optional
-import base64
-from uuid import uuid4
+from contextlib import contextmanager
+from typing import Any, ClassVar, Iterator, Literal, Optional
 from fastapi.responses import StreamingResponse
-import hnswlib
+from starlette.background import BackgroundTask
 import numpy as np
-from fastapi import APIRouter, Body, Query, UploadFile, File
+from fastapi import APIRouter, Body, File, HTTPException, Query, UploadFile
 from numpy.typing import NDArray
 from pydantic import Field
-from typing_extensions import Self, TypeVar, Union
-from pathlib import Path
-from itertools import filterfalse, islice
+from typing_extensions import TypeVar, Union
 
+from .qblob import BlobStore
+from .qdedup import ChunkDeduper, DedupMode
 from .qdoc import Base, CosimResult, QuipuDocument, Status
-from .qembed import QuipuEmbeddings
-from .qfiles import stream_file
-from .lib import to_base64
+from .qembed import EmbeddingProvider, QuipuEmbeddings, get_embeddings
+from .qfiles import parse_file, spool_upload
+from .qindex import VectorIndex
+from .qlexical import LexicalIndex, rrf
+from .qpipeline import IngestPipeline, Select
+from .qquant import QuantizationKind
+from .qtune import TUNE_K, TUNE_QUERIES, TUNE_RECALL, autotune
 
 Q = TypeVar("Q", bound=QuipuDocument)
 
+HYBRID_DEPTH = 4
 
-def wrap_img(base64: str):
-    return f'<img src="{base64}" style="width:100%;height:auto;">'
 
+def wrap_img(src: str):
+    return f'<img src="{src}" style="width:100%;height:auto;">'
 
-def b64_id():
-    return base64.urlsafe_b64encode(uuid4().bytes).decode("utf-8").rstrip("=")
+
+def as_text(content: Union[str, list[str]]) -> str:
+    return content if isinstance(content, str) else " ".join(content)
 
 
 class RagRequest(Base):
-    content: str
+    content: Union[str, list[str]]
+    key: Optional[str] = Field(
+        default=None,
+        description="The key of the vector replaced by an `upsert`, a new key is generated when omitted",
+    )
+    vectors: Optional[list[list[float]]] = Field(
+        default=None,
+        description="Raw query vectors for a `batch` query, used instead of embedding `content`",
+    )
+    metadata: Optional[dict[str, Any]] = Field(
+        default=None, description="Attributes stored with the vector on `upsert`"
+    )
+    where: Optional[dict[str, Any]] = Field(
+        default=None,
+        description="Only `query` vectors whose metadata equals every given attribute",
+    )
+
+
+class IndexSettings(Base):
+    quantization: Optional[QuantizationKind] = Field(
+        default=None,
+        description="Compress the namespace vectors with `int8` scalar or `pq` product quantization, `null` keeps full floats in an HNSW graph",
+    )
+    subspaces: Optional[int] = Field(
+        default=None, description="The number of `pq` subspaces (bytes per vector)"
+    )
+    provider: Optional[EmbeddingProvider] = Field(
+        default=None,
+        description="Embed the namespace with the `remote` API or the in-process `local` CPU model, only while it is empty",
+    )
+    m: Optional[int] = Field(
+        default=None, description="The HNSW graph degree, changing it rebuilds the graph"
+    )
+    ef_construction: Optional[int] = Field(
+        default=None, description="The HNSW build-time beam width, changing it rebuilds the graph"
+    )
+    ef: Optional[int] = Field(default=None, description="The HNSW query-time beam width")
+
+
+class TuneRequest(Base):
+    recall: float = Field(
+        default=TUNE_RECALL, ge=0, le=1, description="The recall@k to reach at the lowest latency"
+    )
+    k: int = Field(default=TUNE_K, description="The number of results the recall is measured on")
+    queries: int = Field(default=TUNE_QUERIES, description="The number of sampled queries")
+    apply: bool = Field(default=True, description="Switch the namespace to the chosen setting")
 
 
 class UpsertedCount(Base):
@@ -38,6 +87,7 @@ class UpsertedCount(Base):
 
 
 class QuipuVector(QuipuDocument):
+    _indexed: ClassVar[set[str]] = set()
     namespace: str = Field(
         ..., description="The namespace for the vector representation"
     )
@@ -45,58 +95,191 @@ class QuipuVector(QuipuDocument):
         ..., description="The sentences to be encoded into vector embeddings"
     )
     value: Optional[list[float]] = Field(
-        default=None, description="The computed vector embedding from the system"
+        default=None,
+        exclude=True,
+        description="The computed vector embedding from the system, persisted in the namespace vector store",
+    )
+    metadata: dict[str, Any] = Field(
+        default_factory=dict, description="Attributes used to filter `query` results"
     )
     top_k: int = Field(default=5, description="The number of top results to return")
     dim: Literal[384, 768] = Field(
         default=768, description="The dimension of the vector embeddings"
     )
 
-    @cached_property
-    def client(self):
-        return QuipuEmbeddings()
+    def client(self, namespace: str):
+        with self.index(namespace) as index:
+            return get_embeddings(index.provider)  # type: ignore
 
     async def embed(self, *, namespace: str, content: Union[str, list[str]]):
-        return await self.client.encode(content)
+        return await self.client(namespace).encode(content, dim=self.dim)
+
+    @classmethod
+    @contextmanager
+    def index(cls, namespace: str) -> Iterator[VectorIndex]:
+        """
+        Lease the persistent HNSW index of `namespace`, backfilling once
+        namespaces whose vectors were stored inside the documents before the
+        index existed and the lexical index of namespaces created before it.
+        """
+        with VectorIndex.lease(namespace) as index:
+            if namespace not in cls._indexed:
+                if not index.migrated:
+                    cls.migrate(namespace, index)
+                cls._indexed.add(namespace)
+            yield index
+
+    @classmethod
+    def migrate(cls, namespace: str, index: VectorIndex):
+        with LexicalIndex.lease(namespace) as lexicon:
+            if index.dim is None or not len(lexicon):
+                with cls.handle() as db:
+                    docs = db.find_docs(
+                        limit=2**31 - 1, offset=0, kwargs={"namespace": namespace}
+                    )
+                if index.dim is None:
+                    vectors = [doc for doc in docs if doc.get("value")]
+                    index.add_many(
+                        ((doc["key"], doc["value"]) for doc in vectors),
+                        (doc.get("metadata") or {} for doc in vectors),
+                    )
+                if not len(lexicon):
+                    for doc in docs:
+                        lexicon.add(doc["key"], as_text(doc["content"]))
+        index.mark_migrated()
 
     async def query(
-        self, *, namespace: str, value: NDArray[np.float32]
+        self,
+        *,
+        namespace: str,
+        value: NDArray[np.float32],
+        recall: Optional[float] = None,
+        where: Optional[dict[str, Any]] = None,
     ) -> list[CosimResult]:
         """
         Cosine similarity search
         * value: the query vector
+        * recall: the requested recall, `1` forces an exact search
+        * where: metadata the results must match
         * returns: a list of CosimResult
 
         **Steps**
-        1. Get all the vectors from the namespace
-        2. Create a hnswlib index and add all the vectors to it
-        3. Query the index with the query vector
+        1. Get the persistent index of the namespace
+        2. Query it with the query vector, exactly for small namespaces and
+           through the hnswlib graph for large ones
+        3. Fetch the matching documents by key
         4. Return the top k results
 
         """
-        world: list[Self] = await self.find_docs(limit=1000, offset=0, namespace=namespace)  # type: ignore
-        if not world:
-            return []
-        p = hnswlib.Index(space="cosine", dim=self.dim)  # type: ignore
-        p.init_index(max_elements=len(world), ef_construction=200, M=16)  # type: ignore
-        p.set_ef(50)  # type: ignore
-        items = [doc.value for doc in world]  # type: ignore
-        p.add_items(items)  # type: ignore
-        labels, distances = p.knn_query(value, k=min(self.top_k, len(world)))  # type: ignore
-        world = [world[label] for label in labels[0]]  # type: ignore
+        return (
+            await self.query_many(
+                namespace=namespace, values=np.atleast_2d(value), recall=recall, where=where
+            )
+        )[0]
+
+    async def query_many(
+        self,
+        *,
+        namespace: str,
+        values: NDArray[np.float32],
+        recall: Optional[float] = None,
+        where: Optional[dict[str, Any]] = None,
+    ) -> list[list[CosimResult]]:
+        """
+        Cosine similarity search for a batch of query vectors, answered with a
+        single matrix `knn_query` and hydrating each matching document once.
+        """
+        with self.index(namespace) as index:
+            batches = index.search_many(values, k=self.top_k, recall=recall, where=where)
+        return self.hydrate(batches, namespace)
+
+    async def hybrid(
+        self,
+        *,
+        namespace: str,
+        text: str,
+        value: NDArray[np.float32],
+        recall: Optional[float] = None,
+        where: Optional[dict[str, Any]] = None,
+    ) -> list[CosimResult]:
+        """
+        Hybrid search: the BM25 ranking of `text` over the lexical index and
+        the cosine ranking of `value` are fused with reciprocal rank fusion,
+        so exact terms (part numbers, names) and paraphrases both surface.
+        The score of every result is its fused score.
+        """
+        depth = self.top_k * HYBRID_DEPTH
+        allowed = None
+        with self.index(namespace) as index, LexicalIndex.lease(namespace) as lexicon:
+            if where:
+                allowed = {index.key_of(int(label)) for label in index.matching(where)}
+            semantic = index.search(value, k=depth, recall=recall, where=where)
+            lexical = lexicon.search(text, k=depth, allowed=allowed)  # type: ignore
+        return self.hydrate([rrf([semantic, lexical])[: self.top_k]], namespace)[0]
+
+    def stored(self, key: str, namespace: str) -> Optional[dict[str, Any]]:
+        """
+        The stored document `key` if it belongs to `namespace`.
+        """
+        with self.handle() as db:
+            doc = db.get_doc(key=key)
+        if doc is None or doc.get("namespace") != namespace:
+            return None
+        return doc
+
+    def hydrate(
+        self, batches: list[list[tuple[str, float]]], namespace: str
+    ) -> list[list[CosimResult]]:
+        docs: dict[str, Optional[dict[str, Any]]] = {}
+        for hits in batches:
+            for key, _ in hits:
+                if key not in docs:
+                    docs[key] = self.stored(key, namespace)
         return [
-            {
-                "score": 1 - distance,
-                "content": world[i].content,
-                "id": world[i].key,
-            }  # type: ignore
-            for i, distance in enumerate(distances[0])  # type: ignore
+            [
+                {"score": score, "content": docs[key]["content"], "id": key}  # type: ignore
+                for key, score in hits
+                if docs[key] is not None
+            ]
+            for hits in batches
         ]
 
+    async def delete(self, *, namespace: str, key: str) -> bool:
+        """
+        Remove the vector `key` from the namespace indexes and the document store.
+        """
+        with self.index(namespace) as index:
+            deleted = index.delete(key)
+        with LexicalIndex.lease(namespace) as lexicon:
+            lexicon.remove(key)
+        with ChunkDeduper.lease(namespace) as deduper:
+            deduper.remove(key)
+        if self.stored(key, namespace) is not None:
+            with self.handle() as db:
+                db.delete_doc(key=key)
+            deleted = True
+        return deleted
+
     async def upsert(self, *, namespace: str, request: RagRequest = Body(...)):
+        if request.key is not None:
+            with self.handle() as db:
+                existing = db.get_doc(key=request.key)
+            if existing is not None and existing.get("namespace") != namespace:
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Key {request.key} belongs to another namespace",
+                )
+            self.key = request.key
         embedding = await self.embed(namespace=namespace, content=request.content)
         self.value = embedding
-        return await self.put_doc()
+        if request.metadata is not None:
+            self.metadata = request.metadata
+        doc = await self.put_doc()
+        with self.index(namespace) as index:
+            index.add(self.key, embedding, self.metadata)
+        with LexicalIndex.lease(namespace) as lexicon:
+            lexicon.add(self.key, as_text(request.content))
+        return doc
 
 app = APIRouter(tags=["Vector Embeddings"])
 
@@ -105,24 +288,55 @@ app = APIRouter(tags=["Vector Embeddings"])
 async def use_embeddings(
     namespace: str,
     body: RagRequest = Body(...),
-    action: Literal["query", "upsert"] = Query(
-        "upsert", description="The action to perform can be `query`, `upsert`"
+    action: Literal["query", "upsert", "batch", "hybrid"] = Query(
+        "upsert",
+        description="The action to perform can be `query`, `upsert`, `batch` (one query per `content` item or `vectors` row) or `hybrid` (a `query` fused with keyword matches)",
     ),
     topK: Optional[int] = Query(
         None, description="The number of top results to return"
     ),
-) -> Optional[Union[list[CosimResult], Status]]:
+    recall: Optional[float] = Query(
+        None,
+        ge=0,
+        le=1,
+        description="The requested recall of a `query`, `1` forces an exact search",
+    ),
+) -> Optional[Union[list[CosimResult], list[list[CosimResult]], Status]]:
     """
 
 
     Returns:
         list[CosimResult]: A list of CosimResult objects representing the top similar results.
+        list[list[CosimResult]]: The results of every query of a `batch`, in order.
     """
     qvector = QuipuVector(content=body.content, top_k=topK or 5, namespace=namespace)
+    if action == "batch":
+        if body.vectors is not None:
+            values = body.vectors
+        else:
+            contents = [body.content] if isinstance(body.content, str) else body.content
+            values = await qvector.embed(namespace=namespace, content=contents)
+        return await qvector.query_many(
+            values=np.asarray(values, dtype=np.float32),
+            namespace=namespace,
+            recall=recall,
+            where=body.where,
+        )
+    assert isinstance(body.content, str), f"A single `content` must be provided for action `{action}`"
     if action == "query":
         return await qvector.query(
             value=await qvector.embed(namespace=namespace, content=body.content),
             namespace=namespace,
+            recall=recall,
+            where=body.where,
+        )
+    if action == "hybrid":
+        return await qvector.hybrid(
+            text=body.content,
+            value=await qvector.embed(namespace=namespace, content=body.content),
+            namespace=namespace,
+            recall=recall,
+            where=body.where,
         )
     await qvector.upsert(namespace=namespace, request=body)
     return Status(
@@ -133,30 +347,174 @@ async def use_embeddings(
     )
 
 
-async def callback(chunk: str, namespace: str):
-    vec = QuipuVector(content=chunk, namespace=namespace)
-    vector = await vec.embed(namespace=namespace, content=chunk)
-    vec.value = vector
-    return (await vec.put_doc()).key
+@app.delete("/vector/{namespace}/{key}")
+async def delete_vector(namespace: str, key: str) -> Status:
+    """
+    Delete a vector, its label is reused by the next upsert of the namespace.
+    """
+    deleted = await QuipuVector(content="", namespace=namespace).delete(
+        namespace=namespace, key=key
+    )
+    if not deleted:
+        raise HTTPException(
+            status_code=404, detail=f"Vector {key} not found in namespace {namespace}"
+        )
+    return Status(code=204, message="Vector deleted", key=key)
+
+
+@app.post("/vector/{namespace}/settings")
+async def configure_index(namespace: str, settings: IndexSettings = Body(...)) -> Status:
+    """
+    Configure how the vectors of a namespace are embedded and indexed.
+    """
+    fields = settings.model_fields_set
+    with QuipuVector.index(namespace) as index:
+        if "provider" in fields:
+            index.use_provider(settings.provider)
+        if fields & {"m", "ef_construction", "ef"}:
+            await asyncio.to_thread(
+                index.set_hnsw, settings.m, settings.ef_construction, settings.ef
+            )
+        if not fields or fields & {"quantization", "subspaces"}:
+            await asyncio.to_thread(index.configure, settings.quantization, settings.subspaces)
+    return Status(code=200, message="Index settings updated", key=namespace)
+
+
+@app.post("/vector/{namespace}/tune")
+async def tune_index(namespace: str, request: TuneRequest = Body(...)) -> dict[str, Any]:
+    """
+    Sweep the HNSW `m` and `ef` of a namespace against its exact results,
+    reporting recall@k with p50/p99 latency, and apply the fastest setting
+    reaching the requested recall.
+    """
+
+    def tune() -> dict[str, Any]:
+        with QuipuVector.index(namespace) as index:
+            return autotune(index, request.recall, request.k, request.queries, request.apply)
+
+    return await asyncio.to_thread(tune)
+
+
+@app.get("/embeddings/cache")
+async def embeddings_cache_stats() -> dict[str, float]:
+    """
+    Hit-rate metrics of the embedding cache and batching metrics of the embedding client.
+    """
+    return {**QuipuEmbeddings.cache().stats(), **QuipuEmbeddings().stats()}
+
+
+async def ingest(chunks: list[str], namespace: str) -> list[str]:
+    """
+    Embed `chunks` with a single call and index them, returning their keys.
+    """
+    if not chunks:
+        return []
+    vectors = await QuipuVector(content=chunks, namespace=namespace).embed(
+        namespace=namespace, content=chunks
+    )
+    return await write_chunks(chunks, vectors, namespace)
+
+
+async def write_chunks(
+    chunks: list[str],
+    vectors: list[list[float]],
+    namespace: str,
+    keys: Optional[list[str]] = None,
+) -> list[str]:
+    """
+    Store embedded `chunks` and add them to the namespace indexes in one batch.
+    Given `keys`, a batch written again (by a resumed job) replaces the
+    documents of the interrupted write instead of adding new ones.
+    """
+    docs = [QuipuVector(content=chunk, namespace=namespace) for chunk in chunks]
+    for doc, key in zip(docs, keys or []):
+        doc.key = key
+    for doc, vector in zip(docs, vectors):
+        doc.value = vector
+        await doc.put_doc()
+    with QuipuVector.index(namespace) as index:
+        index.add_many((doc.key, vector) for doc, vector in zip(docs, vectors))
+    with LexicalIndex.lease(namespace) as lexicon, ChunkDeduper.lease(namespace) as deduper:
+        for doc in docs:
+            lexicon.add(doc.key, doc.content)  # type: ignore
+            deduper.add(doc.content, doc.key)  # type: ignore
+    return [doc.key for doc in docs]
+
+
+def dedup_filter(namespace: str, mode: DedupMode) -> Optional[Select]:
+    """
+    Pipeline filter dropping the chunks already ingested into `namespace`, or
+    repeated within the same document.
+    """
+    if mode == "none":
+        return None
+    seen: set[str] = set()
+
+    def select(chunks: list[str]) -> list[str]:
+        with ChunkDeduper.lease(namespace) as deduper, QuipuVector.index(namespace) as index:
+            return deduper.select(
+                chunks, mode, lambda key: index.label_of(key) is not None, seen
+            )
+
+    return select
+
+
+@app.get("/ingest/metrics")
+async def ingest_metrics() -> dict[str, dict[str, float]]:
+    """
+    Items processed, busy time and throughput of every ingestion stage since startup.
+    """
+    return IngestPipeline.total_metrics()
 
 
 @app.post("/upload/{namespace}")
-async def upload_file(namespace: str, file: UploadFile = File(...)):
+async def upload_file(
+    namespace: str,
+    file: UploadFile = File(...),
+    chunkSize: int = Query(256, gt=0, description="The target size of a chunk in tokens"),
+    overlap: int = Query(32, ge=0, description="The tokens repeated between consecutive chunks"),
+    dedup: DedupMode = Query(
+        "exact", description="Skip chunks already ingested: none, exact or near duplicates"
+    ),
+):
     assert file.filename, "No file name provided"
-    _name = b64_id() + file.filename.split(".")[-1]
-    file_path = Path(f"/tmp/{_name}")
-    with file_path.open("wb") as f:
-        f.write(await file.read())
+    assert overlap < chunkSize, "The overlap must be smaller than the chunk size"
+    upload = await spool_upload(file)
+    try:
+        embedder = QuipuVector(content="", namespace=namespace)
+
+        async def embed(chunks: list[str]) -> list[list[float]]:
+            return await embedder.embed(namespace=namespace, content=chunks)
+
+        async def write(chunks: list[str], vectors: list[list[float]], positions: list[int]):
+            return await write_chunks(chunks, vectors, namespace)
+
+        pipeline = IngestPipeline(
+            embed,
+            write,
+            size=chunkSize,
+            overlap=overlap,
+            select=dedup_filter(namespace, dedup),
+        )
+    except BaseException:
+        upload.remove()
+        raise
 
     async def generator():
-        for instance in stream_file(
-            file=file,
-            file_path=file_path.as_posix(),
-        ):
-            if isinstance(instance, str):
-                await callback(instance, namespace)
-                yield instance
-            if isinstance(instance, bytes):
-                yield wrap_img(to_base64(instance, "png"))
-
-    return StreamingResponse(generator(), media_type="text/html")
+        try:
+            async for instance in pipeline.run(
+                parse_file(file=file, file_path=upload.path.as_posix(), size=chunkSize)
+            ):
+                if isinstance(instance, str):
+                    yield instance
+                if isinstance(instance, bytes):
+                    yield wrap_img(f"/api/blobs/{BlobStore.get().put(instance)}")
+        finally:
+            upload.remove()
+
+    return StreamingResponse(
+        generator(),
+        media_type="text/html",
+        background=BackgroundTask(upload.remove),
+        headers={"X-Content-SHA256": upload.sha256},
+    )
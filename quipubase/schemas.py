@@ -1,17 +1,26 @@
 from __future__ import annotations
 
+import hashlib
 import json
+from collections import OrderedDict
+from threading import RLock
 from typing import Any, Dict, List, Literal, Optional, Type, Union
 
 from pydantic import BaseModel, Field, create_model  # type: ignore
 from typing_extensions import TypeAlias, TypedDict, TypeVar
 
-from .const import MAPPING
+from .const import MAPPING, MODEL_CACHE_SIZE
 
 T = TypeVar("T", bound=BaseModel)
 
 
 Property: TypeAlias = Dict[str, object]
+Action: TypeAlias = Optional[
+    Literal["put", "get", "merge", "delete", "find", "query", "upsert"]
+]
+
+_models: OrderedDict[str, Type[BaseModel]] = OrderedDict()
+_models_lock = RLock()
 
 
 class JsonSchema(TypedDict, total=False):
@@ -73,18 +82,61 @@ def cast_to_type(namespace: str, schema: Dict[str, Any]) -> Any:
     return MAPPING.get(schema.get("type", "string"), str)
 
 
+def model_key(namespace: str, schema: JsonSchema, base: type, action: Action) -> str:
+    """
+    Canonical hash of the inputs of `create_class`: equal schemas produce the
+    same key regardless of the order of their properties.
+    """
+    canonical = json.dumps(
+        [namespace, schema, f"{base.__module__}.{base.__qualname__}", action],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def evict_model(model: Type[BaseModel]):
+    subclasses: Dict[str, type] = getattr(model, "_subclasses", {})
+    if subclasses.get(model.__name__) is model:
+        del subclasses[model.__name__]
+
+
 def create_class(
     *,
     namespace: str,
     schema: JsonSchema,
     base: Type[T],
-    action: Optional[
-        Literal["put", "get", "merge", "delete", "find", "query", "upsert"]
-    ],
+    action: Action,
 ) -> Type[T]:
     """
     Create a class based on the schema, base class, and action.
+
+    Models are compiled once and kept in a LRU cache of `MODEL_CACHE_SIZE`
+    entries keyed by `model_key`, so repeated requests reuse the validators
+    built by pydantic instead of compiling the schema again.
     """
+    key = model_key(namespace, schema, base, action)
+    with _models_lock:
+        if key in _models:
+            _models.move_to_end(key)
+            return _models[key]  # type: ignore
+    model = build_class(namespace=namespace, schema=schema, base=base, action=action)
+    with _models_lock:
+        _models[key] = model
+        while len(_models) > MODEL_CACHE_SIZE:
+            _, evicted = _models.popitem(last=False)
+            evict_model(evicted)
+    return model
+
+
+def build_class(
+    *,
+    namespace: str,
+    schema: JsonSchema,
+    base: Type[T],
+    action: Action,
+) -> Type[T]:
     name = schema.get("title", "Model")
     properties = schema.get("properties", {})
     attributes: Dict[str, Any] = {}
@@ -0,0 +1,46 @@
+import os
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from quipubase.qblob import BlobStore, app
+
+
+def test_blobs_are_deduplicated_and_read_by_range(tmp_path):
+    blobs = BlobStore(tmp_path.as_posix(), chunk_size=1000)
+    data = b"\x89PNG\r\n\x1a\n" + os.urandom(4500)
+    digest = blobs.put(data)
+    assert blobs.put(data) == digest
+    assert blobs.meta(digest) == {
+        "size": len(data),
+        "chunks": 5,
+        "chunk_size": 1000,
+        "media_type": "image/png",
+    }
+    assert b"".join(blobs.read(digest, 0, len(data) - 1)) == data
+    assert b"".join(blobs.read(digest, 995, 2004)) == data[995:2005]
+
+
+def test_blob_route_serves_ranges_and_cache_headers(tmp_path, monkeypatch):
+    blobs = BlobStore(tmp_path.as_posix(), chunk_size=1000)
+    monkeypatch.setattr(BlobStore, "_instance", blobs)
+    data = os.urandom(2500)
+    digest = blobs.put(data)
+    api = FastAPI()
+    api.include_router(app, prefix="/api")
+    client = TestClient(api)
+
+    response = client.get(f"/api/blobs/{digest}")
+    assert response.status_code == 200
+    assert response.content == data
+    assert response.headers["etag"] == f'"{digest}"'
+    assert "immutable" in response.headers["cache-control"]
+
+    response = client.get(f"/api/blobs/{digest}", headers={"Range": "bytes=1990-2010"})
+    assert response.status_code == 206
+    assert response.content == data[1990:2011]
+    assert response.headers["content-range"] == f"bytes 1990-2010/{len(data)}"
+    assert client.get(f"/api/blobs/{digest}", headers={"Range": "bytes=-10"}).content == data[-10:]
+    assert client.get(f"/api/blobs/{digest}", headers={"Range": "bytes=9000-"}).status_code == 416
+    assert client.get(f"/api/blobs/{digest}", headers={"If-None-Match": f'"{digest}"'}).status_code == 304
+    assert client.get("/api/blobs/missing").status_code == 404
@@ -0,0 +1,31 @@
+from quipubase.qchunk import Chunker, Record, count_tokens
+
+
+def test_chunker_merges_fragments_to_the_target_size():
+    chunker = Chunker(size=40, overlap=8)
+    chunks: list[str] = []
+    for i in range(30):
+        chunks.extend(chunker.feed(f"Paragraph {i} is short. It has two sentences."))
+    chunks.extend(chunker.flush())
+    assert 5 < len(chunks) < 30
+    assert all(count_tokens(chunk) <= 40 for chunk in chunks)
+    assert chunks[0].startswith("Paragraph 0 is short.")
+    assert "Paragraph 29" in chunks[-1]
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert chunk.split(". ")[0] in previous
+
+
+def test_chunker_splits_long_sentences_and_flushes_once():
+    chunker = Chunker(size=10, overlap=0)
+    chunks = chunker.feed(" ".join(f"word{i}" for i in range(35)))
+    chunks.extend(chunker.flush())
+    assert [count_tokens(chunk) for chunk in chunks] == [10, 10, 10, 5]
+    assert chunker.flush() == []
+
+
+def test_chunker_keeps_records_whole():
+    record = Record('{"sheet": "parts", "records": [{"sku": "AB-1", "note": "a: b. c"}]}')
+    chunker = Chunker(size=8, overlap=0)
+    chunks = chunker.feed("Some text.") + chunker.feed(record) + chunker.feed(record)
+    chunks.extend(chunker.flush())
+    assert chunks == ["Some text.", record, record]
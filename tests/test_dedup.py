@@ -0,0 +1,83 @@
+import pytest
+
+from quipubase.qdedup import ChunkDeduper, simhash
+from quipubase.qpipeline import IngestPipeline
+
+REVISED = (
+    "The pump must be inspected every six months by a certified technician, "
+    "who records the pressure, the seal wear and the bearing temperature in the log."
+)
+
+
+def test_simhash_keeps_small_edits_close():
+    edited = REVISED.replace("six", "three")
+    unrelated = "Quarterly revenue grew on strong demand for the new product line."
+    assert bin(simhash(REVISED) ^ simhash(edited)).count("1") <= 12
+    assert bin(simhash(REVISED) ^ simhash(unrelated)).count("1") > 12
+
+
+def test_select_skips_exact_and_near_duplicates(tmp_path):
+    deduper = ChunkDeduper("manuals", tmp_path.as_posix())
+    live = {"a"}
+    deduper.add(REVISED, "a")
+    deduper.add("Drain the tank before winter.", "b")
+
+    chunks = [
+        "  The pump must be inspected every six months by a certified technician, "
+        "who records the pressure, the seal wear and the bearing temperature in the log.",
+        REVISED + " ",
+        REVISED.replace("log", "logbook"),
+        "Drain the tank before winter.",
+        "Replace the filter yearly.",
+        "Replace the filter yearly.",
+    ]
+    exact = deduper.select(chunks, "exact", live.__contains__)
+    assert exact == [
+        REVISED.replace("log", "logbook"),
+        "Drain the tank before winter.",
+        "Replace the filter yearly.",
+    ]
+    near = deduper.select(chunks, "near", live.__contains__)
+    assert near == ["Drain the tank before winter.", "Replace the filter yearly."]
+    assert deduper.select(chunks, "none", live.__contains__) == chunks
+
+
+@pytest.mark.asyncio
+async def test_pipeline_does_not_embed_selected_out_chunks():
+    embedded: list[str] = []
+
+    async def source():
+        for text in ("Known chunk.", "New chunk.", "Known chunk."):
+            yield text
+
+    async def embed(chunks):
+        embedded.extend(chunks)
+        return [[1.0] for _ in chunks]
+
+    async def write(chunks, vectors, positions):
+        pass
+
+    pipeline = IngestPipeline(
+        embed,
+        write,
+        size=3,
+        overlap=0,
+        select=lambda chunks: [chunk for chunk in chunks if chunk != "Known chunk."],
+    )
+    output = [item async for item in pipeline.run(source())]
+    assert output == embedded == ["New chunk."]
+    assert pipeline.metrics()["dedup"]["items"] == 2
+
+
+def test_removed_chunks_leave_no_entries(tmp_path):
+    deduper = ChunkDeduper("manuals", tmp_path.as_posix())
+    deduper.add(REVISED, "a")
+    deduper.add(REVISED.replace("log", "logbook"), "b")
+    assert set(deduper.near(REVISED)) == {"a", "b"}
+    deduper.add("Drain the tank before winter.", "a")
+    assert deduper.exact(REVISED) is None
+    assert deduper.near(REVISED) == ["b"]
+    deduper.remove("b")
+    deduper.remove("a")
+    assert deduper.near(REVISED) == []
+    assert deduper.db.count() == 0
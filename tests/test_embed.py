@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from quipubase.qcache import EmbeddingCache
+from quipubase.qembed import MicroBatcher, QuipuEmbeddings, get_embeddings
+from quipubase.qlocal import LocalEmbeddings
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+    def json(self):
+        return {"content": self.content}
+
+
+class FakeClient:
+    def __init__(self):
+        self.requests = []
+
+    async def post(self, url, json):
+        self.requests.append(json["content"])
+        return FakeResponse([[float(len(text)), 1.0] for text in json["content"]])
+
+
+@pytest.mark.asyncio
+async def test_encode_serves_repeated_text_from_cache(tmp_path, monkeypatch):
+    client = FakeClient()
+    monkeypatch.setattr(QuipuEmbeddings, "_cache", EmbeddingCache(tmp_path.as_posix()))
+    monkeypatch.setattr(QuipuEmbeddings, "__load__", lambda self: client)
+    embeddings = QuipuEmbeddings()
+    assert await embeddings.encode("hello  world") == [11.0, 1.0]
+    assert await embeddings.encode(" hello world ") == [11.0, 1.0]
+    batch = await embeddings.encode(["hello world", "bye", "bye"])
+    assert batch == [[11.0, 1.0], [3.0, 1.0], [3.0, 1.0]]
+    assert client.requests == [["hello world"], ["bye"]]
+    stats = QuipuEmbeddings.cache().stats()
+    assert stats["misses"] == 2
+    assert stats["memory_hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_vectors_are_cut_to_the_requested_dimension(tmp_path, monkeypatch):
+    client = FakeClient()
+    monkeypatch.setattr(QuipuEmbeddings, "_cache", EmbeddingCache(tmp_path.as_posix()))
+    monkeypatch.setattr(QuipuEmbeddings, "__load__", lambda self: client)
+    embeddings = QuipuEmbeddings()
+    assert await embeddings.encode("hello", dim=1) == [1.0]
+    assert await embeddings.encode("hello") == [5.0, 1.0]
+    assert client.requests == [["hello"], ["hello"]]
+    with pytest.raises(ValueError):
+        await embeddings.encode("bye", dim=3)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_encodes_share_one_request(tmp_path, monkeypatch):
+    client = FakeClient()
+    monkeypatch.setattr(QuipuEmbeddings, "_cache", EmbeddingCache(tmp_path.as_posix()))
+    monkeypatch.setattr(QuipuEmbeddings, "__load__", lambda self: client)
+    texts = [f"page {i}" * (i + 1) for i in range(20)]
+    vectors = await asyncio.gather(*(QuipuEmbeddings().encode(t) for t in texts))
+    assert vectors == [[float(len(t)), 1.0] for t in texts]
+    assert client.requests == [texts]
+
+
+@pytest.mark.asyncio
+async def test_batches_are_capped_and_closed():
+    sent: list[list[str]] = []
+
+    async def send(texts):
+        sent.append(texts)
+        return [[float(len(text))] for text in texts]
+
+    batcher = MicroBatcher(send, window=0.01, max_batch=4)
+    texts = [f"text {i}" * (i + 1) for i in range(10)]
+    results = await asyncio.gather(batcher.submit(texts[:7]), batcher.submit(texts[7:]))
+    assert [v for result in results for v in result] == [[float(len(t))] for t in texts]
+    assert [len(batch) for batch in sent] == [4, 4, 2]
+    assert not batcher.tasks
+
+    waiting = asyncio.ensure_future(batcher.submit(["late"]))
+    await asyncio.sleep(0)
+    batcher.close()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+
+@pytest.mark.asyncio
+async def test_local_embeddings_are_deterministic_and_lexical():
+    embeddings = get_embeddings("local")
+    assert isinstance(embeddings, LocalEmbeddings)
+    texts = ["the quick brown fox", "a quick brown fox jumps", "tax return deadline"]
+    vectors = await embeddings.encode(texts * 50, dim=384)
+    assert len(vectors) == 150 and all(len(v) == 384 for v in vectors)
+    assert vectors[:3] == await embeddings.encode(texts, dim=384)
+    fox, jumps, tax = (sum(a * b for a, b in zip(vectors[0], v)) for v in vectors[:3])
+    assert fox == pytest.approx(1.0, abs=1e-5)
+    assert jumps > tax
+    assert len(await embeddings.encode("hello", dim=768)) == 768
@@ -0,0 +1,58 @@
+import hashlib
+import io
+import os
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from quipubase.qfiles import parse_file, spool_upload
+
+
+@pytest.mark.asyncio
+async def test_spool_upload_hashes_and_cleans_up():
+    data = os.urandom(3 * 1024 * 1024 + 17)
+    upload = await spool_upload(UploadFile(io.BytesIO(data), filename="report.pdf"))
+    assert upload.size == len(data)
+    assert upload.sha256 == hashlib.sha256(data).hexdigest()
+    assert upload.path.suffix == ".pdf"
+    assert upload.path.read_bytes() == data
+    upload.remove()
+    assert not upload.path.exists()
+
+
+@pytest.mark.asyncio
+async def test_spool_upload_rejects_oversized_files(tmp_path, monkeypatch):
+    monkeypatch.setattr("tempfile.tempdir", tmp_path.as_posix())
+    with pytest.raises(HTTPException) as error:
+        await spool_upload(
+            UploadFile(io.BytesIO(b"x" * 4096), filename="big.docx"), limit=1024
+        )
+    assert error.value.status_code == 413
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_parse_file_streams_pages_in_order(tmp_path):
+    from fitz import open as open_pdf  # type: ignore
+
+    pdf = open_pdf()
+    for i in range(20):
+        pdf.new_page().insert_text((72, 72), f"page {i}")
+    path = (tmp_path / "report.pdf").as_posix()
+    pdf.save(path)
+    file = UploadFile(io.BytesIO(b""), filename="report.pdf")
+    chunks = [chunk async for chunk in parse_file(file, path, pages_per_task=3)]
+    assert chunks == [f"page {i}" for i in range(20)]
+
+
+@pytest.mark.asyncio
+async def test_upload_is_removed_when_the_stream_never_runs(tmp_path, monkeypatch):
+    from quipubase.qvector import upload_file
+
+    monkeypatch.setattr("tempfile.tempdir", tmp_path.as_posix())
+    file = UploadFile(io.BytesIO(b"hello"), filename="notes.docx")
+    response = await upload_file("files", file, chunkSize=256, overlap=32, dedup="none")
+    assert len(list(tmp_path.iterdir())) == 1
+    assert response.background is not None
+    await response.background()
+    assert list(tmp_path.iterdir()) == []
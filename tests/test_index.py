@@ -0,0 +1,207 @@
+import time
+
+import numpy as np
+import pytest
+
+from quipubase.qindex import VectorIndex
+from quipubase.qtune import EF_GRID, M_GRID, autotune
+
+
+def test_index_persists_across_restarts(tmp_path):
+    rng = np.random.default_rng(42)
+    vectors = rng.normal(size=(100, 16)).astype(np.float32)
+    index = VectorIndex("dogs", root=tmp_path.as_posix())
+    index.add_many((f"dog-{i}", v) for i, v in enumerate(vectors))
+    assert len(index) == 100
+    assert index.search(vectors[7], k=1)[0][0] == "dog-7"
+    index.close()
+
+    reopened = VectorIndex("dogs", root=tmp_path.as_posix())
+    assert len(reopened) == 100
+    assert reopened.stale() == []
+    key, score = reopened.search(vectors[42], k=3)[0]
+    assert key == "dog-42"
+    assert score > 0.99
+
+
+def test_unsaved_rows_are_replayed_from_store(tmp_path):
+    rng = np.random.default_rng(7)
+    vectors = rng.normal(size=(20, 8)).astype(np.float32)
+    index = VectorIndex("cats", root=tmp_path.as_posix())
+    index.add_many((f"cat-{i}", v) for i, v in enumerate(vectors))
+    assert index.store is not None
+    assert index.store.matrix().shape == (20, 8)
+    np.testing.assert_allclose(np.linalg.norm(index.store.matrix(), axis=1), 1, rtol=1e-5)
+    index.labels.close()  # a crash: the database is released, the graph never saved
+
+    reopened = VectorIndex("cats", root=tmp_path.as_posix())
+    assert len(reopened) == 20
+    assert reopened.search(vectors[3], k=1)[0][0] == "cat-3"
+
+
+def test_exact_search_matches_brute_force(tmp_path):
+    rng = np.random.default_rng(3)
+    vectors = rng.normal(size=(500, 16)).astype(np.float32)
+    queries = rng.normal(size=(4, 16)).astype(np.float32)
+    index = VectorIndex("birds", root=tmp_path.as_posix())
+    index.add_many((f"bird-{i}", v) for i, v in enumerate(vectors))
+    assert index.plan() == "exact"
+    assert index.store is not None
+    labels, scores = index.store.search(queries, k=10, block=64)
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    expected = np.argsort(-(queries @ unit.T), axis=1)[:, :10]
+    np.testing.assert_array_equal(labels, expected)
+    assert np.all(np.diff(scores, axis=1) <= 0)
+
+
+def test_filtered_search_uses_metadata(tmp_path, monkeypatch):
+    rng = np.random.default_rng(11)
+    vectors = rng.normal(size=(300, 16)).astype(np.float32)
+    index = VectorIndex("fish", root=tmp_path.as_posix())
+    index.add_many(
+        ((f"fish-{i}", v) for i, v in enumerate(vectors)),
+        ({"color": "red" if i % 10 == 0 else "blue"} for i in range(300)),
+    )
+    red = {f"fish-{i}" for i in range(0, 300, 10)}
+    exact = index.search(vectors[20], k=5, where={"color": "red"})
+    assert exact[0][0] == "fish-20"
+    assert {key for key, _ in exact} <= red
+
+    monkeypatch.setattr("quipubase.qindex.EXACT_THRESHOLD", 0)
+    for where, expected in (({"color": "red"}, red), ({"color": "blue"}, None)):
+        hits = index.search(vectors[20 if expected else 21], k=5, where=where)
+        assert len(hits) == 5
+        assert all((key in red) == bool(expected) for key, _ in hits)
+    assert index.search(vectors[0], k=5, where={"color": "green"}) == []
+
+
+def test_search_many_answers_each_query(tmp_path, monkeypatch):
+    rng = np.random.default_rng(5)
+    vectors = rng.normal(size=(200, 16)).astype(np.float32)
+    index = VectorIndex("ants", root=tmp_path.as_posix())
+    index.add_many((f"ant-{i}", v) for i, v in enumerate(vectors))
+    for threshold in (50_000, 0):
+        monkeypatch.setattr("quipubase.qindex.EXACT_THRESHOLD", threshold)
+        results = index.search_many(vectors[[3, 30, 130]], k=2)
+        assert [hits[0][0] for hits in results] == ["ant-3", "ant-30", "ant-130"]
+        assert all(len(hits) == 2 for hits in results)
+
+
+def test_quantized_search_reranks_candidates(tmp_path, monkeypatch):
+    monkeypatch.setattr("quipubase.qindex.EXACT_THRESHOLD", 0)
+    monkeypatch.setattr("quipubase.qindex.TRAIN_THRESHOLD", 256)
+    rng = np.random.default_rng(9)
+    vectors = rng.normal(size=(600, 32)).astype(np.float32)
+    for quantization in ("int8", "pq"):
+        index = VectorIndex(quantization, root=tmp_path.as_posix())
+        index.configure(quantization, subspaces=8)
+        index.add_many((f"v-{i}", v) for i, v in enumerate(vectors))
+        assert index.plan() == "quantized"
+        assert index.hnsw is None
+        hits = index.search(vectors[123], k=3)
+        assert hits[0][0] == "v-123"
+        assert hits[0][1] > 0.99
+        index.close()
+        reopened = VectorIndex(quantization, root=tmp_path.as_posix())
+        assert reopened.search(vectors[321], k=1)[0][0] == "v-321"
+
+
+def test_provider_is_pinned_once_vectors_exist(tmp_path):
+    index = VectorIndex("pinned", tmp_path.as_posix())
+    index.use_provider("local")
+    index.add("a", np.ones(8, dtype=np.float32))
+    index.use_provider("local")
+    with pytest.raises(ValueError):
+        index.use_provider("remote")
+    index.close()
+    assert VectorIndex("pinned", tmp_path.as_posix()).provider == "local"
+
+
+def test_deleted_labels_are_reused_and_compacted(tmp_path, monkeypatch):
+    monkeypatch.setattr("quipubase.qindex.EXACT_THRESHOLD", 0)
+    rng = np.random.default_rng(3)
+    vectors = rng.normal(size=(50, 16)).astype(np.float32)
+    index = VectorIndex("trash", root=tmp_path.as_posix())
+    index.add_many((f"v-{i}", v) for i, v in enumerate(vectors))
+    assert index.delete("v-3")
+    assert not index.delete("v-3")
+    assert "v-3" not in [key for key, _ in index.search(vectors[3], k=5)]
+    assert "v-3" not in [key for key, _ in index.search(vectors[3], k=5, recall=1)]
+
+    index.add("fresh", vectors[3])
+    assert index.label_of("fresh") == 3
+    assert len(index) == 50
+    assert index.search(vectors[3], k=1)[0][0] == "fresh"
+
+    for i in range(10, 25):
+        index.delete(f"v-{i}")
+    while index.rebuilding:
+        time.sleep(0.01)
+    assert index.marked == set()
+    assert len(index.hnsw.get_ids_list()) == 35
+    assert index.search(vectors[30], k=1)[0][0] == "v-30"
+    assert len(index.search(vectors[30], k=50)) == 35
+    assert len(index.search(vectors[30], k=50, recall=1)) == 35
+    index.close()
+
+    reopened = VectorIndex("trash", root=tmp_path.as_posix())
+    assert reopened.free == set(range(10, 25))
+    assert reopened.stale() == []
+    assert reopened.search(vectors[12], k=1, recall=1)[0][0] != "v-12"
+
+
+def test_hnsw_settings_persist_and_autotune_reaches_recall(tmp_path):
+    rng = np.random.default_rng(9)
+    vectors = rng.normal(size=(400, 16)).astype(np.float32)
+    index = VectorIndex("tuned", root=tmp_path.as_posix())
+    index.add_many((f"t-{i}", v) for i, v in enumerate(vectors))
+    index.set_hnsw(m=8, ef=20)
+    assert index.search(vectors[5], k=1)[0][0] == "t-5"
+    index.close()
+    index = VectorIndex("tuned", root=tmp_path.as_posix())
+    assert index.meta["m"] == 8
+
+    result = autotune(index, recall=0.9, k=5, queries=50)
+    assert len(result["reports"]) == len(M_GRID) * len(EF_GRID)
+    assert result["chosen"]["recall"] >= 0.9
+    assert index.meta["ef"] == result["chosen"]["ef"]
+    assert index.meta["m"] == result["chosen"]["m"]
+
+
+def test_migration_marker_persists(tmp_path):
+    index = VectorIndex("empty", root=tmp_path.as_posix())
+    assert not index.migrated
+    index.mark_migrated()
+    index.close()
+    assert VectorIndex("empty", root=tmp_path.as_posix()).migrated
+
+
+def test_scans_mask_deleted_labels(tmp_path, monkeypatch):
+    monkeypatch.setattr("quipubase.qindex.TOMBSTONE_RATIO", 10)
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(40, 8)).astype(np.float32)
+    index = VectorIndex("masked", root=tmp_path.as_posix())
+    index.add_many((f"m-{i}", v) for i, v in enumerate(vectors))
+    for i in range(30):
+        index.delete(f"m-{i}")
+    assert index.tombstones().sum() == 30
+    labels, _ = index.store.search(vectors[:1], 5, exclude=index.tombstones())
+    assert set(labels[0]) <= set(range(30, 40))
+    hits = index.search(vectors[3], k=5, recall=1)
+    assert len(hits) == 5
+    assert all(int(key[2:]) >= 30 for key, _ in hits)
+
+
+def test_graph_saves_grow_geometrically(tmp_path, monkeypatch):
+    monkeypatch.setattr("quipubase.qindex.SAVE_EVERY", 10)
+    saves = []
+    save = VectorIndex.save
+    monkeypatch.setattr(VectorIndex, "save", lambda self: saves.append(len(self)) or save(self))
+    rng = np.random.default_rng(2)
+    vectors = rng.normal(size=(2000, 4)).astype(np.float32)
+    index = VectorIndex("growing", root=tmp_path.as_posix())
+    for i, vector in enumerate(vectors):
+        index.add(f"g-{i}", vector)
+    assert len(saves) < 50
+    index.close()
+    assert VectorIndex("growing", root=tmp_path.as_posix()).stale() == []
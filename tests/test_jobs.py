@@ -0,0 +1,156 @@
+import asyncio
+import io
+
+import pytest
+from fastapi import UploadFile
+
+from quipubase import qjobs
+from quipubase.qjobs import JobRunner
+
+
+def document(paragraphs: int) -> bytes:
+    from docx import Document
+
+    doc = Document()
+    for i in range(paragraphs):
+        doc.add_paragraph(f"Paragraph {i} describes pump {i}.")
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+class Crash(BaseException):
+    pass
+
+
+async def wait(runner: JobRunner, job_id: str):
+    while runner.tasks.get(job_id) is not None:
+        await asyncio.sleep(0.01)
+    return runner.status(job_id)
+
+
+@pytest.mark.asyncio
+async def test_jobs_resume_after_the_last_committed_chunk(tmp_path, monkeypatch):
+    written: list[list[str]] = []
+    failures = {"left": 1}
+
+    async def embed(self, *, namespace, content):
+        return [[1.0, 0.0] for _ in content]
+
+    async def write_chunks(chunks, vectors, namespace, keys):
+        assert keys == [f"{job['id']}-{sum(map(len, written)) + i}" for i in range(len(chunks))]
+        if len(written) == 1 and failures["left"]:
+            failures["left"] -= 1
+            raise Crash()
+        written.append(chunks)
+
+    monkeypatch.setattr(qjobs.QuipuVector, "embed", embed)
+    monkeypatch.setattr(qjobs, "write_chunks", write_chunks)
+    monkeypatch.setattr("quipubase.qpipeline.WRITE_GROUP", 1)
+    runner = JobRunner(tmp_path.as_posix())
+    upload = UploadFile(io.BytesIO(document(40)), filename="pumps.docx")
+    job = await runner.submit("pumps", upload, size=8, overlap=0, dedup="none")
+    with pytest.raises(Crash):
+        await runner.tasks[job["id"]]
+    interrupted = runner.status(job["id"])
+    assert interrupted["status"] == "running"
+    assert interrupted["chunks"] == len(written[0]) == 32
+    runner.close()
+
+    restarted = JobRunner(tmp_path.as_posix())
+    restarted.resume()
+    finished = await wait(restarted, job["id"])
+    chunks = [chunk for batch in written for chunk in batch]
+    assert finished["status"] == "done"
+    assert chunks == [f"Paragraph {i} describes pump {i}." for i in range(40)]
+    assert finished["chunks"] == 40
+    assert list((tmp_path / "files").iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_cancelled_jobs_stop_and_clean_up(tmp_path, monkeypatch):
+    async def embed(self, *, namespace, content):
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(qjobs.QuipuVector, "embed", embed)
+    runner = JobRunner(tmp_path.as_posix())
+    upload = UploadFile(io.BytesIO(document(5)), filename="pumps.docx")
+    job = await runner.submit("pumps", upload, size=8, overlap=0, dedup="none")
+    await asyncio.sleep(0.2)
+    assert runner.cancel(job["id"])["status"] == "cancelled"
+    cancelled = await wait(runner, job["id"])
+    assert cancelled["status"] == "cancelled"
+    assert list((tmp_path / "files").iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_identical_uploads_join_the_job_in_flight(tmp_path, monkeypatch):
+    async def embed(self, *, namespace, content):
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(qjobs.QuipuVector, "embed", embed)
+    runner = JobRunner(tmp_path.as_posix())
+    data = document(5)
+    first = await runner.submit(
+        "pumps", UploadFile(io.BytesIO(data), filename="a.docx"), size=8, overlap=0, dedup="none"
+    )
+    second = await runner.submit(
+        "pumps", UploadFile(io.BytesIO(data), filename="b.docx"), size=8, overlap=0, dedup="none"
+    )
+    assert second["id"] == first["id"]
+    assert len(list((tmp_path / "files").iterdir())) == 1
+    runner.cancel(first["id"])
+    await wait(runner, first["id"])
+    assert runner.active == {}
+    third = await runner.submit(
+        "pumps", UploadFile(io.BytesIO(data), filename="c.docx"), size=8, overlap=0, dedup="none"
+    )
+    assert third["id"] != first["id"]
+    runner.cancel(third["id"])
+    await wait(runner, third["id"])
+
+
+@pytest.mark.asyncio
+async def test_deduplicated_jobs_resume_without_shifting_keys(tmp_path, monkeypatch):
+    from quipubase.qshard import HandlePool
+
+    async def embed(self, *, namespace, content):
+        return [[1.0, float(len(text))] for text in content]
+
+    updates = {"left": 2}
+    update = JobRunner.update
+
+    def crash_on_second_commit(self, job, **changes):
+        if "cursor" in changes:
+            updates["left"] -= 1
+            if not updates["left"]:
+                raise Crash()
+        return update(self, job, **changes)
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(HandlePool, "_instance", None)
+    monkeypatch.setattr(qjobs.QuipuVector, "embed", embed)
+    monkeypatch.setattr(JobRunner, "update", crash_on_second_commit)
+    monkeypatch.setattr("quipubase.qpipeline.WRITE_GROUP", 1)
+    runner = JobRunner((tmp_path / "jobs").as_posix())
+    upload = UploadFile(io.BytesIO(document(100)), filename="pumps.docx")
+    job = await runner.submit("pumps", upload, size=8, overlap=0, dedup="exact")
+    with pytest.raises(Crash):
+        await runner.tasks[job["id"]]
+    assert runner.status(job["id"])["cursor"] == 32
+    runner.close()
+
+    monkeypatch.setattr(JobRunner, "update", update)
+    restarted = JobRunner((tmp_path / "jobs").as_posix())
+    restarted.resume()
+    finished = await wait(restarted, job["id"])
+    assert finished["status"] == "done"
+    assert finished["cursor"] == 100
+    reader = qjobs.QuipuVector(content="", namespace="pumps")
+    for i in range(100):
+        stored = reader.stored(f"{job['id']}-{i}", "pumps")
+        assert stored["content"] == f"Paragraph {i} describes pump {i}."
+    with qjobs.QuipuVector.index("pumps") as index:
+        assert len(index) == 100
+    restarted.close()
+    HandlePool.get().close_all()
@@ -0,0 +1,46 @@
+from quipubase.qlexical import LexicalIndex, rrf, tokenize
+
+
+def test_tokenize_keeps_part_numbers_whole():
+    assert tokenize("Replace filter AB-1234, see v2.1") == [
+        "replace",
+        "filter",
+        "ab-1234",
+        "see",
+        "v2.1",
+    ]
+
+
+def test_bm25_ranks_exact_terms_and_survives_restart(tmp_path):
+    lexicon = LexicalIndex("parts", tmp_path.as_posix())
+    lexicon.add("a", "oil filter for the AB-1234 pump")
+    lexicon.add("b", "air filter for the pump")
+    lexicon.add("c", "pump pump pump housing")
+    assert [key for key, _ in lexicon.search("ab-1234 filter", k=3)] == ["a", "b"]
+    assert lexicon.search("pump", k=1)[0][0] == "c"
+
+    lexicon.add("a", "water hose")
+    assert len(lexicon) == 3
+    assert lexicon.search("ab-1234", k=3) == []
+    lexicon.close()
+
+    reopened = LexicalIndex("parts", tmp_path.as_posix())
+    assert len(reopened) == 3
+    assert reopened.search("hose", k=3)[0][0] == "a"
+    assert reopened.search("filter", k=3, allowed={"c"}) == []
+
+
+def test_postings_cache_is_bounded(tmp_path):
+    lexicon = LexicalIndex("cache", tmp_path.as_posix(), capacity=2)
+    for i in range(5):
+        lexicon.add(f"k{i}", f"term{i} shared")
+        lexicon.search(f"term{i} shared", k=1)
+    assert len(lexicon.cache) == 2
+    assert lexicon.postings("shared") == {f"k{i}": (1, 2) for i in range(5)}
+    lexicon.remove("k0")
+    assert "k0" not in lexicon.postings("shared")
+
+
+def test_rrf_rewards_agreement():
+    fused = rrf([[("a", 0.9), ("b", 0.8)], [("b", 12.0), ("c", 3.0)]])
+    assert [key for key, _ in fused] == ["b", "a", "c"]
@@ -0,0 +1,125 @@
+import io
+
+from PIL import Image
+
+from quipubase.lib import DocxLoader, PdfLoader, PptxLoader
+
+
+def png() -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (4, 4), "red").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_pdf_loader_interleaves_text_and_images(tmp_path):
+    from fitz import Rect, open as open_pdf  # type: ignore
+
+    pdf = open_pdf()
+    for i in range(3):
+        page = pdf.new_page()
+        page.insert_text((72, 72), f"page {i}")
+        if i == 1:
+            page.insert_image(Rect(100, 100, 120, 120), stream=png())
+    path = (tmp_path / "report.pdf").as_posix()
+    pdf.save(path)
+    items = list(PdfLoader(file_path=path).extract())
+    assert [type(item) for item in items] == [str, str, bytes, str]
+    assert items[0] == "page 0" and items[3] == "page 2"
+    assert PdfLoader(file_path=path).extract_pages(1, 2) == items[1:3]
+    assert list(PdfLoader(file_path=path).extract_text()) == ["page 0", "page 1", "page 2"]
+
+
+def test_docx_and_pptx_loaders_extract_in_one_pass(tmp_path):
+    from docx import Document
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    image = tmp_path / "dot.png"
+    image.write_bytes(png())
+    doc = Document()
+    doc.add_paragraph("before")
+    doc.add_picture(image.as_posix())
+    doc.add_paragraph("after")
+    doc.save((tmp_path / "notes.docx").as_posix())
+    items = list(DocxLoader(file_path=(tmp_path / "notes.docx").as_posix()).extract())
+    assert items[0] == "before" and isinstance(items[1], bytes) and items[2] == "after"
+
+    prs = Presentation()
+    for title in ("one", "two"):
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = title
+        slide.shapes.add_picture(image.as_posix(), Inches(1), Inches(1))
+    prs.save((tmp_path / "deck.pptx").as_posix())
+    loader = PptxLoader(file_path=(tmp_path / "deck.pptx").as_posix())
+    items = list(loader.extract())
+    assert [item if isinstance(item, str) else bytes for item in items] == [
+        "one",
+        bytes,
+        "two",
+        bytes,
+    ]
+    assert loader.pages() == 2
+    assert loader.extract_pages(1, 2) == items[2:]
+
+
+def test_spreadsheets_stream_header_aware_row_records(tmp_path, monkeypatch):
+    import json
+
+    from openpyxl import Workbook
+
+    from quipubase.lib import CsvLoader, ExcelLoader, load_xlsx
+    from quipubase.qchunk import count_tokens
+
+    wb = Workbook()
+    sheet = wb.active
+    sheet.title = "parts"
+    sheet.append(["sku", "name", None, "name"])
+    for i in range(25):
+        sheet.append([f"AB-{i}", f"part {i}", i, None if i % 2 else "alt"])
+    wb.create_sheet("empty")
+    wb.save((tmp_path / "parts.xlsx").as_posix())
+    loader = ExcelLoader(file_path=(tmp_path / "parts.xlsx").as_posix(), chunk_tokens=120)
+    items = list(loader.extract())
+    assert all(count_tokens(item) <= 120 for item in items)
+    blocks = [json.loads(item) for item in items]
+    assert len(blocks) > 2
+    assert blocks[0]["rows"][0] == 2 and blocks[-1]["rows"][1] == 26
+    for previous, block in zip(blocks, blocks[1:]):
+        assert block["rows"][0] == previous["rows"][1] + 1
+    assert blocks[0]["records"][0] == {
+        "sku": "AB-0",
+        "name": "part 0",
+        "column_3": 0,
+        "name_2": "alt",
+    }
+    assert blocks[0]["records"][1] == {"sku": "AB-1", "name": "part 1", "column_3": 1}
+
+    monkeypatch.setattr(load_xlsx, "ROWS_PER_PAGE", 10)
+    assert loader.pages() >= 3
+    paged = [json.loads(item) for item in loader.extract_pages(0, 1)]
+    paged += [json.loads(item) for item in loader.extract_pages(1, loader.pages())]
+    assert paged[0]["rows"][0] == 2 and paged[-1]["rows"][1] == 26
+    assert all((block["rows"][0] - 1) // 10 == (block["rows"][1] - 1) // 10 for block in paged)
+    assert [row for block in paged for row in block["records"]] == [
+        row for block in blocks for row in block["records"]
+    ]
+
+    (tmp_path / "parts.csv").write_text("sku;qty\nAB-1;3\n\nAB-2;4\n")
+    loader = CsvLoader(file_path=(tmp_path / "parts.csv").as_posix())
+    assert loader.pages() == 1
+    assert [json.loads(item) for item in loader.extract()] == [
+        {
+            "sheet": "parts",
+            "rows": [2, 4],
+            "records": [{"sku": "AB-1", "qty": "3"}, {"sku": "AB-2", "qty": "4"}],
+        }
+    ]
+
+    (tmp_path / "many.csv").write_text("sku,qty\n" + "".join(f"AB-{i},{i}\n" for i in range(25)))
+    loader = CsvLoader(file_path=(tmp_path / "many.csv").as_posix())
+    assert loader.pages() == 3
+    assert [json.loads(item)["rows"] for item in loader.extract_pages(1, 2)] == [[11, 20]]
+    paged = [json.loads(item) for page in range(3) for item in loader.extract_pages(page, page + 1)]
+    assert [row for block in paged for row in block["records"]] == [
+        {"sku": f"AB-{i}", "qty": str(i)} for i in range(25)
+    ]
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from quipubase.qpipeline import IngestPipeline
+
+
+async def fragments(count: int):
+    for i in range(count):
+        await asyncio.sleep(0)
+        yield f"Fragment {i} talks about pumps."
+        if i % 10 == 0:
+            yield b"image"
+
+
+@pytest.mark.asyncio
+async def test_pipeline_writes_every_chunk_in_order():
+    written: list[str] = []
+    active = 0
+    peak = 0
+
+    async def embed(chunks):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return [[float(len(chunk))] for chunk in chunks]
+
+    async def write(chunks, vectors, positions):
+        assert [v[0] for v in vectors] == [float(len(c)) for c in chunks]
+        written.extend(chunks)
+
+    pipeline = IngestPipeline(embed, write, size=6, overlap=0, workers=3, batch=4)
+    output = [item async for item in pipeline.run(fragments(100))]
+    chunks = [item for item in output if isinstance(item, str)]
+    assert chunks == [f"Fragment {i} talks about pumps." for i in range(100)]
+    assert sorted(written) == sorted(chunks)
+    assert output.count(b"image") == 10
+    assert peak > 1
+    metrics = pipeline.metrics()
+    assert metrics["embed"]["items"] == metrics["write"]["items"] == 100
+
+
+@pytest.mark.asyncio
+async def test_pipeline_surfaces_stage_errors():
+    async def embed(chunks):
+        raise RuntimeError("embedding service down")
+
+    async def write(chunks, vectors, positions):
+        pass
+
+    pipeline = IngestPipeline(embed, write, size=12, overlap=0)
+    with pytest.raises(RuntimeError, match="embedding service down"):
+        [item async for item in pipeline.run(fragments(20))]
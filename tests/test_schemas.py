@@ -0,0 +1,36 @@
+from pydantic import BaseModel
+
+from quipubase import schemas
+from quipubase.schemas import create_class
+
+SCHEMA = {
+    "title": "Pet",
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "owner": {"type": "object", "properties": {"email": {"type": "string"}}},
+    },
+}
+
+
+def test_models_are_cached_by_canonical_schema():
+    reordered = {
+        "properties": dict(reversed(list(SCHEMA["properties"].items()))),
+        "type": "object",
+        "title": "Pet",
+    }
+    model = create_class(namespace="pets", schema=SCHEMA, base=BaseModel, action="put")
+    assert create_class(namespace="pets", schema=reordered, base=BaseModel, action="put") is model
+    assert create_class(namespace="pets", schema=SCHEMA, base=BaseModel, action="get") is not model
+    assert create_class(namespace="vets", schema=SCHEMA, base=BaseModel, action="put") is not model
+    assert model(name="Rex", owner={"email": "a@b.c"}).owner.email == "a@b.c"  # type: ignore
+
+
+def test_model_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(schemas, "MODEL_CACHE_SIZE", 3)
+    monkeypatch.setattr(schemas, "_models", schemas.OrderedDict())
+    first = create_class(namespace="t0", schema=SCHEMA, base=BaseModel, action="put")
+    for i in range(1, 4):
+        create_class(namespace=f"t{i}", schema=SCHEMA, base=BaseModel, action="put")
+    assert len(schemas._models) == 3
+    assert create_class(namespace="t0", schema=SCHEMA, base=BaseModel, action="put") is not first
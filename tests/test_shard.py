@@ -0,0 +1,146 @@
+import pytest
+
+from quipubase.qshard import HandlePool, InProcessNode, LocalShard, ShardedQuipu, shard_of
+
+
+def test_sharded_scatter_gather(tmp_path):
+    db = ShardedQuipu(
+        [
+            LocalShard((tmp_path / "a").as_posix()),
+            LocalShard((tmp_path / "b").as_posix()),
+            InProcessNode((tmp_path / "c").as_posix()),
+        ]
+    )
+    keys = [f"key-{i:02d}" for i in range(30)]
+    for i, key in enumerate(keys):
+        db.put_doc(key, {"key": key, "even": i % 2 == 0})
+    assert db.count() == 30
+    assert db.get_doc("key-07") == {"key": "key-07", "even": False}
+    assert db.shard("key-07") is db.shards[shard_of("key-07", 3)]
+    assert [doc["key"] for doc in db.scan_docs(5, 10)] == keys[10:15]
+    assert db.scan_docs(3, 0, keys_only=True) == [k.encode() for k in keys[:3]]
+    evens = db.find_docs(100, 0, {"even": True})
+    assert [doc["key"] for doc in evens] == keys[::2]
+    db.delete_doc("key-07")
+    assert not db.exists("key-07")
+
+
+def test_handle_pool_evicts_idle_namespaces(tmp_path):
+    closed: list[str] = []
+
+    class Recording(ShardedQuipu):
+        def close(self):
+            closed.append(self.name)
+            super().close()
+
+    def opener(name: str) -> ShardedQuipu:
+        db = Recording([LocalShard((tmp_path / name).as_posix())])
+        db.name = name  # type: ignore
+        return db
+
+    pool = HandlePool(max_open=2, opener=opener)
+    with pool.lease("a") as a:
+        a.put_doc("k", {"key": "k"})
+        for name in ("b", "c", "d"):
+            with pool.lease(name) as db:
+                db.put_doc("k", {"key": name})
+        assert closed == ["b", "c"]
+        assert a.get_doc("k") == {"key": "k"}
+        assert len(pool) == 2
+    with pool.lease("e"):
+        pass
+    assert closed == ["b", "c", "a"]
+    with pool.lease("b") as b:
+        assert b.get_doc("k") == {"key": "b"}
+    pool.close_all()
+    assert len(pool) == 0
+
+
+def test_find_docs_pages_matches_on_any_layout(tmp_path):
+    single = ShardedQuipu([LocalShard((tmp_path / "one").as_posix())])
+    sharded = ShardedQuipu(
+        [LocalShard((tmp_path / f"many-{i}").as_posix()) for i in range(3)]
+    )
+    for db in (single, sharded):
+        for i in range(20):
+            db.put_doc(f"key-{i:02d}", {"key": f"key-{i:02d}", "even": i % 2 == 0})
+    for db in (single, sharded):
+        page = db.find_docs(3, 2, {"even": True})
+        assert [doc["key"] for doc in page] == ["key-04", "key-06", "key-08"]
+
+
+def test_shard_count_is_fixed_at_creation(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    ShardedQuipu.open("legacy", shards=1).put_doc("k", {"key": "k"})
+    with pytest.raises(ValueError):
+        ShardedQuipu.open("legacy", shards=4)
+    assert len(ShardedQuipu.open("fresh", shards=4).shards) == 4
+    with pytest.raises(ValueError):
+        ShardedQuipu.open("fresh", shards=1)
+
+
+def test_closed_databases_raise(tmp_path):
+    db = ShardedQuipu([LocalShard((tmp_path / "closed").as_posix())])
+    db.put_doc("k", {"key": "k"})
+    db.close()
+    for call in (
+        lambda: db.get_doc("k"),
+        lambda: db.put_doc("k", {}),
+        lambda: db.count(),
+        lambda: db.scan_docs(1, 0),
+        lambda: db.find_docs(1, 0, {}),
+    ):
+        with pytest.raises(RuntimeError, match="closed"):
+            call()
+
+
+def test_handle_pool_budget_counts_databases(tmp_path):
+    def opener(name: str) -> ShardedQuipu:
+        return ShardedQuipu(
+            [LocalShard((tmp_path / name / f"shard-{i}").as_posix()) for i in range(3)]
+        )
+
+    pool = HandlePool(max_open=4, opener=opener)
+    with pool.lease("a"):
+        with pool.lease("b"):
+            assert pool.databases == 6
+        assert list(pool.handles) == ["a"]
+        single = lambda name: ShardedQuipu([LocalShard((tmp_path / name).as_posix())])
+        with pool.lease("single", single):
+            assert pool.databases == 4
+    with pool.lease("c"):
+        pass
+    assert list(pool.handles) == ["single", "c"]
+    assert pool.databases == 4
+    pool.close_all()
+    assert pool.databases == 0
+
+
+def test_handle_pool_closes_outside_the_lock():
+    import threading
+
+    closing, proceed = threading.Event(), threading.Event()
+
+    class Slow:
+        def __init__(self, name: str):
+            self.name = name
+
+        def close(self):
+            if self.name == "a":
+                closing.set()
+                proceed.wait(5)
+
+    def lease(name: str):
+        with pool.lease(name):
+            pass
+
+    pool = HandlePool(max_open=1, opener=Slow)
+    lease("a")
+    evicting = threading.Thread(target=lease, args=("b",))
+    evicting.start()
+    assert closing.wait(5)
+    with pool.lease("c"):
+        assert "a" in pool.pending
+    proceed.set()
+    evicting.join()
+    assert "a" not in pool.pending
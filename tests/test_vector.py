@@ -0,0 +1,62 @@
+import pytest
+from fastapi import HTTPException
+
+from quipubase.qlexical import LexicalIndex
+from quipubase.qshard import HandlePool
+from quipubase.qvector import QuipuVector, RagRequest
+
+
+@pytest.fixture
+def vectors(tmp_path, monkeypatch):
+    async def embed(self, *, namespace, content):
+        if isinstance(content, str):
+            return [1.0, float(len(content))]
+        return [[1.0, float(len(text))] for text in content]
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(HandlePool, "_instance", None)
+    monkeypatch.setattr(QuipuVector, "embed", embed)
+    yield
+    HandlePool.get().close_all()
+
+
+@pytest.mark.asyncio
+async def test_namespaces_cannot_touch_each_other(vectors):
+    owner = QuipuVector(content="secret", namespace="tenant-a")
+    await owner.upsert(namespace="tenant-a", request=RagRequest(content="secret", key="k1"))
+
+    other = QuipuVector(content="", namespace="tenant-b")
+    with pytest.raises(HTTPException):
+        await other.upsert(namespace="tenant-b", request=RagRequest(content="x", key="k1"))
+    assert not await other.delete(namespace="tenant-b", key="k1")
+    assert other.hydrate([[("k1", 1.0)]], "tenant-b") == [[]]
+    assert owner.hydrate([[("k1", 1.0)]], "tenant-a")[0][0]["content"] == "secret"
+    assert await owner.delete(namespace="tenant-a", key="k1")
+
+
+@pytest.mark.asyncio
+async def test_replayed_writes_reuse_their_keys(vectors):
+    from quipubase.qvector import write_chunks
+
+    chunks, values = ["first chunk", "second chunk"], [[1.0, 0.0], [0.0, 1.0]]
+    for _ in range(2):
+        keys = await write_chunks(chunks, values, "replayed", ["job-0", "job-1"])
+    assert keys == ["job-0", "job-1"]
+    with QuipuVector.index("replayed") as index, LexicalIndex.lease("replayed") as lexicon:
+        assert len(index) == len(lexicon) == 2
+    reader = QuipuVector(content="", namespace="replayed")
+    assert reader.stored("job-1", "replayed")["content"] == "second chunk"
+
+
+@pytest.mark.asyncio
+async def test_idle_namespace_indexes_are_closed(vectors, monkeypatch):
+    pool = HandlePool(max_open=5)
+    monkeypatch.setattr(HandlePool, "_instance", pool)
+    for namespace in ("a", "b", "c"):
+        doc = QuipuVector(content=namespace, namespace=namespace)
+        await doc.upsert(namespace=namespace, request=RagRequest(content=f"text {namespace}"))
+    assert pool.databases == 5
+    assert "index/a" not in pool.handles and "lexicon/a" not in pool.handles
+    assert {"index/c", "lexicon/c", "QuipuVector"} <= set(pool.handles)
+    with QuipuVector.index("a") as index:
+        assert len(index) == 1